@@ -4,11 +4,11 @@
 // SPDX-License-Identifier: MIT
 
 #include <stdio.h>
+#include <string.h>
 
 #include "py/binary.h"
 #include "py/objarray.h"
 #include "py/objlist.h"
-#include "py/objstringio.h"
 #include "py/parsenum.h"
 #include "py/runtime.h"
 #include "py/stream.h"
@@ -38,7 +38,7 @@ STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_ujson_dumps_obj, mod_ujson_dumps);
 // #define JSON_DEBUG(...) mp_printf(&mp_plat_print __VA_OPT__(,) __VA_ARGS__)
 
 
-// The function below implements a simple non-recursive JSON parser.
+// The functions below implement a simple non-recursive JSON parser.
 //
 // The JSON specification is at http://www.ietf.org/rfc/rfc4627.txt
 // The parser here will parse any valid JSON and return the correct
@@ -50,32 +50,53 @@ STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_ujson_dumps_obj, mod_ujson_dumps);
 // Most of the work is parsing the primitives (null, false, true, numbers,
 // strings).  It does 1 pass over the input stream.  It tries to be fast and
 // small in code size, while not using more RAM than necessary.
+//
+// ujson_next_token splits the input into tokens, ujson_build turns tokens
+// into objects for load/loads, and iterload walks the tokens without
+// building the whole document.
+
+// The parser works on a window of bytes, held in buf.  When parsing a str,
+// bytes or other object with the buffer protocol the window is the whole
+// input.  Otherwise it's a chunk of the stream that is refilled as needed,
+// so there is one read call per chunk rather than one per byte.
 
 typedef struct _ujson_stream_t {
+    const byte *buf;
+    size_t pos;
+    size_t len;
+    byte cur;
+    // used to refill buf, read is NULL when parsing a buffer
     mp_obj_t stream_obj;
     mp_uint_t (*read)(mp_obj_t obj, void *buf, mp_uint_t size, int *errcode);
-    int errcode;
+    byte *chunk;
+    size_t chunk_size;
     mp_obj_t python_readinto[2 + 1];
     mp_obj_array_t bytearray_obj;
-    size_t start;
-    size_t end;
-    byte cur;
 } ujson_stream_t;
 
 #define S_EOF (0) // null is not allowed in json stream so is ok as EOF marker
 #define S_END(s) ((s).cur == S_EOF)
 #define S_CUR(s) ((s).cur)
-#define S_NEXT(s) (ujson_stream_next(&(s)))
+#define S_NEXT(s) (++(s).pos < (s).len ? ((s).cur = (s).buf[(s).pos]) : ujson_stream_fill(&(s)))
+#define S_SEEK(s, p) ((s).pos = (p), (s).pos < (s).len ? ((s).cur = (s).buf[(s).pos]) : ujson_stream_fill(&(s)))
 
-STATIC byte ujson_stream_next(ujson_stream_t *s) {
-    mp_uint_t ret = s->read(s->stream_obj, &s->cur, 1, &s->errcode);
-    JSON_DEBUG("  usjon_stream_next err:%2d cur: %c \n", s->errcode, s->cur);
-    if (s->errcode != 0) {
-        mp_raise_OSError(s->errcode);
-    }
-    if (ret == 0) {
+// Called when the window is used up, to read the next chunk of the stream.
+STATIC byte ujson_stream_fill(ujson_stream_t *s) {
+    if (s->read == NULL) {
+        s->pos = s->len;
         s->cur = S_EOF;
+        return S_EOF;
     }
+    int errcode = 0;
+    mp_uint_t ret = s->read(s->stream_obj, s->chunk, s->chunk_size, &errcode);
+    JSON_DEBUG("  usjon_stream_fill err:%2d ret: %d \n", errcode, ret);
+    if (ret == MP_STREAM_ERROR) {
+        mp_raise_OSError(errcode);
+    }
+    s->buf = s->chunk;
+    s->pos = 0;
+    s->len = ret;
+    s->cur = ret == 0 ? S_EOF : s->chunk[0];
     return s->cur;
 }
 
@@ -85,159 +106,286 @@ STATIC byte ujson_stream_next(ujson_stream_t *s) {
 #define CIRCUITPY_JSON_READ_CHUNK_SIZE 64
 
 STATIC mp_uint_t ujson_python_readinto(mp_obj_t obj, void *buf, mp_uint_t size, int *errcode) {
-    (void) size; // Ignore size because we know it's always 1.
+    (void) buf; // The bytearray passed to readinto already wraps the chunk.
+    (void) size;
     ujson_stream_t* s = obj;
-
-    if (s->start == s->end) {
-        *errcode = 0;
-        mp_obj_t ret = mp_call_method_n_kw(1, 0, s->python_readinto);
-        if (ret == mp_const_none) {
-            *errcode = MP_EAGAIN;
-            return MP_STREAM_ERROR;
-        }
-        s->start = 0;
-        s->end = mp_obj_get_int(ret);
+    mp_obj_t ret = mp_call_method_n_kw(1, 0, s->python_readinto);
+    if (ret == mp_const_none) {
+        *errcode = MP_EAGAIN;
+        return MP_STREAM_ERROR;
     }
-
-    *((uint8_t *)buf) = ((uint8_t*) s->bytearray_obj.items)[s->start];
-    s->start++;
-    return 1;
+    return mp_obj_get_int(ret);
 }
 
-STATIC mp_obj_t _mod_ujson_load(mp_obj_t stream_obj, bool return_first_json) {
+// Set up s to read from stream_obj, using chunk to hold the data read.
+// Returns true if bytes read past the end of the JSON can be given back by
+// seeking the stream.
+STATIC bool ujson_stream_init(ujson_stream_t *s, mp_obj_t stream_obj, byte *chunk) {
+    bool seekable = false;
+    s->buf = chunk;
+    s->pos = 0;
+    s->len = 0;
+    s->chunk = chunk;
+    s->chunk_size = CIRCUITPY_JSON_READ_CHUNK_SIZE;
+    mp_buffer_info_t bufinfo;
     const mp_stream_p_t *stream_p = mp_proto_get(MP_QSTR_protocol_stream, stream_obj);
-    ujson_stream_t s;
-    uint8_t character_buffer[CIRCUITPY_JSON_READ_CHUNK_SIZE];
-    if (stream_p == NULL) {
-        s.start = 0;
-        s.end = 0;
-        mp_load_method(stream_obj, MP_QSTR_readinto, s.python_readinto);
-        s.bytearray_obj.base.type = &mp_type_bytearray;
-        s.bytearray_obj.typecode = BYTEARRAY_TYPECODE;
-        s.bytearray_obj.len = CIRCUITPY_JSON_READ_CHUNK_SIZE;
-        s.bytearray_obj.free = 0;
-        s.bytearray_obj.items = character_buffer;
-        s.python_readinto[2] = MP_OBJ_FROM_PTR(&s.bytearray_obj);
-        s.stream_obj = &s;
-        s.read = ujson_python_readinto;
+    if (stream_p == NULL && mp_get_buffer(stream_obj, &bufinfo, MP_BUFFER_READ)) {
+        // parse the buffer in place
+        s->buf = bufinfo.buf;
+        s->len = bufinfo.len;
+        s->read = NULL;
+    } else if (stream_p == NULL) {
+        mp_load_method(stream_obj, MP_QSTR_readinto, s->python_readinto);
+        s->bytearray_obj.base.type = &mp_type_bytearray;
+        s->bytearray_obj.typecode = BYTEARRAY_TYPECODE;
+        s->bytearray_obj.len = CIRCUITPY_JSON_READ_CHUNK_SIZE;
+        s->bytearray_obj.free = 0;
+        s->bytearray_obj.items = chunk;
+        s->python_readinto[2] = MP_OBJ_FROM_PTR(&s->bytearray_obj);
+        s->stream_obj = s;
+        s->read = ujson_python_readinto;
     } else {
         stream_p = mp_get_stream_raise(stream_obj, MP_STREAM_OP_READ);
-        s.stream_obj = stream_obj;
-        s.read = stream_p->read;
-        s.errcode = 0;
-        s.cur = 0;
+        s->stream_obj = stream_obj;
+        s->read = stream_p->read;
+        // Bytes read past the end of the JSON can only be given back to a
+        // seekable stream, so other streams (eg a UART) are read 1 byte at a time.
+        struct mp_stream_seek_t seek_s = {0, MP_SEEK_CUR};
+        int errcode;
+        seekable = stream_p->ioctl != NULL
+            && stream_p->ioctl(stream_obj, MP_STREAM_SEEK, (uintptr_t)&seek_s, &errcode) != MP_STREAM_ERROR;
+        if (!seekable) {
+            s->chunk_size = 1;
+        }
     }
+    S_SEEK(*s, 0);
+    return seekable;
+}
 
-    JSON_DEBUG("got JSON stream\n");
+// Give back the bytes that were read past the end of the JSON, for a
+// stream that ujson_stream_init found to be seekable.
+STATIC void ujson_stream_give_back(ujson_stream_t *s) {
+    if (s->pos < s->len) {
+        const mp_stream_p_t *stream_p = mp_get_stream(s->stream_obj);
+        struct mp_stream_seek_t seek_s = {-(mp_off_t)(s->len - s->pos), MP_SEEK_CUR};
+        int errcode;
+        if (stream_p->ioctl(s->stream_obj, MP_STREAM_SEEK, (uintptr_t)&seek_s, &errcode) == MP_STREAM_ERROR) {
+            mp_raise_OSError(errcode);
+        }
+        s->pos = s->len;
+    }
+}
+
+// Object keys are looked up in a small cache of recently seen keys before
+// creating a new string, which avoids searching the qstr pools for each key.
+
+#define UJSON_KEY_CACHE_SIZE (16)
+
+typedef struct _ujson_key_cache_t {
+    mp_uint_t hash[UJSON_KEY_CACHE_SIZE];
+    mp_obj_t key[UJSON_KEY_CACHE_SIZE];
+} ujson_key_cache_t;
+
+STATIC mp_obj_t ujson_new_key(ujson_key_cache_t *cache, const char *str, size_t len) {
+    mp_uint_t hash = qstr_compute_hash((const byte*)str, len);
+    size_t i = hash % UJSON_KEY_CACHE_SIZE;
+    mp_obj_t key = cache->key[i];
+    if (key != MP_OBJ_NULL && cache->hash[i] == hash) {
+        size_t key_len;
+        const char *key_str = mp_obj_str_get_data(key, &key_len);
+        if (key_len == len && memcmp(key_str, str, len) == 0) {
+            return key;
+        }
+    }
+    key = mp_obj_new_str(str, len);
+    cache->hash[i] = hash;
+    cache->key[i] = key;
+    return key;
+}
+
+typedef struct _ujson_parser_t {
+    ujson_stream_t s;
     vstr_t vstr;
-    vstr_init(&vstr, 8);
-    mp_obj_list_t stack; // we use a list as a simple stack for nested JSON
-    stack.len = 0;
-    stack.items = NULL;
-    mp_obj_t stack_top = MP_OBJ_NULL;
-    mp_obj_type_t *stack_top_type = NULL;
-    mp_obj_t stack_key = MP_OBJ_NULL;
-    S_NEXT(s);
+    ujson_key_cache_t key_cache;
+} ujson_parser_t;
+
+STATIC bool ujson_parser_init(ujson_parser_t *p, mp_obj_t stream_obj, byte *chunk) {
+    bool seekable = ujson_stream_init(&p->s, stream_obj, chunk);
+    vstr_init(&p->vstr, 8);
+    memset(p->key_cache.key, 0, sizeof(p->key_cache.key));
+    return seekable;
+}
+
+STATIC NORETURN void ujson_syntax_error(void) {
+    mp_raise_ValueError(translate("syntax error in JSON"));
+}
+
+// ujson_next_token returns a bracket character, or one of these.
+#define UJSON_TOK_EOF (0)
+#define UJSON_TOK_VALUE (1)
+
+// Read the next token.  For a value, *value is set to the object, unless
+// value is NULL in which case the value is skipped without allocating it.
+STATIC byte ujson_next_token(ujson_parser_t *p, bool is_key, mp_obj_t *value) {
+    ujson_stream_t *s = &p->s;
+    byte cur;
     for (;;) {
-        cont:
-        if (S_END(s)) {
+        if (S_END(*s)) {
+            return UJSON_TOK_EOF;
+        }
+        cur = S_CUR(*s);
+        S_NEXT(*s);
+        if (cur != ',' && cur != ':' && cur != ' ' && cur != '\t' && cur != '\n' && cur != '\r') {
             break;
         }
-        mp_obj_t next = MP_OBJ_NULL;
-        bool enter = false;
-        byte cur = S_CUR(s);
-        S_NEXT(s);
-        switch (cur) {
-            case ',':
-            case ':':
-            case ' ':
-            case '\t':
-            case '\n':
-            case '\r':
-                goto cont;
-            case 'n':
-                if (S_CUR(s) == 'u' && S_NEXT(s) == 'l' && S_NEXT(s) == 'l') {
-                    S_NEXT(s);
-                    next = mp_const_none;
-                } else {
-                    goto fail;
-                }
-                break;
-            case 'f':
-                if (S_CUR(s) == 'a' && S_NEXT(s) == 'l' && S_NEXT(s) == 's' && S_NEXT(s) == 'e') {
-                    S_NEXT(s);
-                    next = mp_const_false;
-                } else {
-                    goto fail;
-                }
-                break;
-            case 't':
-                if (S_CUR(s) == 'r' && S_NEXT(s) == 'u' && S_NEXT(s) == 'e') {
-                    S_NEXT(s);
-                    next = mp_const_true;
-                } else {
-                    goto fail;
-                }
-                break;
-            case '"':
-                vstr_reset(&vstr);
-                for (; !S_END(s) && S_CUR(s) != '"';) {
-                    byte c = S_CUR(s);
-                    if (c == '\\') {
-                        c = S_NEXT(s);
-                        switch (c) {
-                            case 'b': c = 0x08; break;
-                            case 'f': c = 0x0c; break;
-                            case 'n': c = 0x0a; break;
-                            case 'r': c = 0x0d; break;
-                            case 't': c = 0x09; break;
-                            case 'u': {
-                                mp_uint_t num = 0;
-                                for (int i = 0; i < 4; i++) {
-                                    c = (S_NEXT(s) | 0x20) - '0';
-                                    if (c > 9) {
-                                        c -= ('a' - ('9' + 1));
-                                    }
-                                    num = (num << 4) | c;
+    }
+    mp_obj_t next = MP_OBJ_NULL;
+    switch (cur) {
+        case 'n':
+            if (S_CUR(*s) == 'u' && S_NEXT(*s) == 'l' && S_NEXT(*s) == 'l') {
+                S_NEXT(*s);
+                next = mp_const_none;
+            } else {
+                ujson_syntax_error();
+            }
+            break;
+        case 'f':
+            if (S_CUR(*s) == 'a' && S_NEXT(*s) == 'l' && S_NEXT(*s) == 's' && S_NEXT(*s) == 'e') {
+                S_NEXT(*s);
+                next = mp_const_false;
+            } else {
+                ujson_syntax_error();
+            }
+            break;
+        case 't':
+            if (S_CUR(*s) == 'r' && S_NEXT(*s) == 'u' && S_NEXT(*s) == 'e') {
+                S_NEXT(*s);
+                next = mp_const_true;
+            } else {
+                ujson_syntax_error();
+            }
+            break;
+        case '"': {
+            // Find the end of the string.  If it's within the window and has
+            // no escapes then it's used in place, otherwise it's built in vstr.
+            const byte *str = s->buf + s->pos;
+            const byte *top = s->buf + s->len;
+            const byte *q = str;
+            while (q < top && *q != '"' && *q != '\\' && *q != S_EOF) {
+                ++q;
+            }
+            size_t str_len = q - str;
+            bool in_place = q < top && *q == '"';
+            vstr_reset(&p->vstr);
+            if (!in_place && value != NULL) {
+                vstr_add_strn(&p->vstr, (const char*)str, str_len);
+            }
+            S_SEEK(*s, q - s->buf);
+            for (; !in_place && !S_END(*s) && S_CUR(*s) != '"';) {
+                byte c = S_CUR(*s);
+                if (c == '\\') {
+                    c = S_NEXT(*s);
+                    switch (c) {
+                        case 'b': c = 0x08; break;
+                        case 'f': c = 0x0c; break;
+                        case 'n': c = 0x0a; break;
+                        case 'r': c = 0x0d; break;
+                        case 't': c = 0x09; break;
+                        case 'u': {
+                            mp_uint_t num = 0;
+                            for (int i = 0; i < 4; i++) {
+                                c = (S_NEXT(*s) | 0x20) - '0';
+                                if (c > 9) {
+                                    c -= ('a' - ('9' + 1));
                                 }
-                                vstr_add_char(&vstr, num);
-                                goto str_cont;
+                                num = (num << 4) | c;
+                            }
+                            if (value != NULL) {
+                                vstr_add_char(&p->vstr, num);
                             }
+                            goto str_cont;
                         }
                     }
-                    vstr_add_byte(&vstr, c);
-                str_cont:
-                    S_NEXT(s);
                 }
-                if (S_END(s)) {
-                    goto fail;
+                if (value != NULL) {
+                    vstr_add_byte(&p->vstr, c);
                 }
-                S_NEXT(s);
-                next = mp_obj_new_str(vstr.buf, vstr.len);
-                break;
-            case '-':
-            case '0': case '1': case '2': case '3': case '4': case '5': case '6': case '7': case '8': case '9': {
-                bool flt = false;
-                vstr_reset(&vstr);
-                for (;;) {
-                    vstr_add_byte(&vstr, cur);
-                    cur = S_CUR(s);
-                    if (cur == '.' || cur == 'E' || cur == 'e') {
-                        flt = true;
-                    } else if (cur == '-' || unichar_isdigit(cur)) {
-                        // pass
-                    } else {
-                        break;
-                    }
-                    S_NEXT(s);
+            str_cont:
+                S_NEXT(*s);
+            }
+            if (S_END(*s)) {
+                ujson_syntax_error();
+            }
+            if (value != NULL) {
+                if (!in_place) {
+                    str = (const byte*)p->vstr.buf;
+                    str_len = p->vstr.len;
                 }
-                if (flt) {
-                    next = mp_parse_num_decimal(vstr.buf, vstr.len, false, false, NULL);
+                // make the object before moving on, which may refill the window
+                if (is_key) {
+                    next = ujson_new_key(&p->key_cache, (const char*)str, str_len);
                 } else {
-                    next = mp_parse_num_integer(vstr.buf, vstr.len, 10, NULL);
+                    next = mp_obj_new_str((const char*)str, str_len);
                 }
-                break;
             }
+            S_NEXT(*s);
+            break;
+        }
+        case '-':
+        case '0': case '1': case '2': case '3': case '4': case '5': case '6': case '7': case '8': case '9': {
+            bool flt = false;
+            vstr_reset(&p->vstr);
+            for (;;) {
+                if (value != NULL) {
+                    vstr_add_byte(&p->vstr, cur);
+                }
+                cur = S_CUR(*s);
+                if (cur == '.' || cur == 'E' || cur == 'e') {
+                    flt = true;
+                } else if (cur == '-' || unichar_isdigit(cur)) {
+                    // pass
+                } else {
+                    break;
+                }
+                S_NEXT(*s);
+            }
+            if (value == NULL) {
+                // skipped
+            } else if (flt) {
+                next = mp_parse_num_decimal(p->vstr.buf, p->vstr.len, false, false, NULL);
+            } else {
+                next = mp_parse_num_integer(p->vstr.buf, p->vstr.len, 10, NULL);
+            }
+            break;
+        }
+        case '[':
+        case '{':
+        case ']':
+        case '}':
+            return cur;
+        default:
+            ujson_syntax_error();
+    }
+    if (value != NULL) {
+        *value = next;
+    }
+    return UJSON_TOK_VALUE;
+}
+
+// Build the object that starts with the token tok (with value next if tok is
+// UJSON_TOK_VALUE), reading the rest of it if it's a list or dict.
+STATIC mp_obj_t ujson_build(ujson_parser_t *p, byte tok, mp_obj_t next) {
+    mp_obj_list_t stack; // we use a list as a simple stack for nested JSON
+    stack.len = 0;
+    stack.items = NULL;
+    mp_obj_t stack_top = MP_OBJ_NULL;
+    mp_obj_type_t *stack_top_type = NULL;
+    mp_obj_t stack_key = MP_OBJ_NULL;
+    for (;;) {
+        bool enter = false;
+        switch (tok) {
+            case UJSON_TOK_VALUE:
+                break;
             case '[':
                 next = mp_obj_new_list(0, NULL);
                 enter = true;
@@ -250,26 +398,27 @@ STATIC mp_obj_t _mod_ujson_load(mp_obj_t stream_obj, bool return_first_json) {
             case ']': {
                 if (stack_top == MP_OBJ_NULL) {
                     // no object at all
-                    goto fail;
+                    ujson_syntax_error();
                 }
                 if (stack.len == 0) {
                     // finished; compound object
-                    goto success;
+                    return stack_top;
                 }
                 stack.len -= 1;
                 stack_top = stack.items[stack.len];
                 stack_top_type = mp_obj_get_type(stack_top);
-                goto cont;
+                goto next_token;
             }
             default:
-                goto fail;
+                // end of input inside an object, or no object at all
+                ujson_syntax_error();
         }
         if (stack_top == MP_OBJ_NULL) {
             stack_top = next;
             stack_top_type = mp_obj_get_type(stack_top);
             if (!enter) {
                 // finished; single primitive only
-                goto success;
+                return stack_top;
             }
         } else {
             // append to list or dict
@@ -279,7 +428,7 @@ STATIC mp_obj_t _mod_ujson_load(mp_obj_t stream_obj, bool return_first_json) {
                 if (stack_key == MP_OBJ_NULL) {
                     stack_key = next;
                     if (enter) {
-                        goto fail;
+                        ujson_syntax_error();
                     }
                 } else {
                     mp_obj_dict_store(stack_top, stack_key, next);
@@ -297,30 +446,39 @@ STATIC mp_obj_t _mod_ujson_load(mp_obj_t stream_obj, bool return_first_json) {
                 stack_top_type = mp_obj_get_type(stack_top);
             }
         }
+    next_token:
+        tok = ujson_next_token(p, stack_top_type == &mp_type_dict && stack_key == MP_OBJ_NULL, &next);
     }
-    success:
+}
+
+STATIC mp_obj_t _mod_ujson_load(mp_obj_t stream_obj, bool return_first_json) {
+    ujson_parser_t p;
+    uint8_t character_buffer[CIRCUITPY_JSON_READ_CHUNK_SIZE];
+    bool seekable = ujson_parser_init(&p, stream_obj, character_buffer);
+    JSON_DEBUG("got JSON stream\n");
+
+    mp_obj_t next = MP_OBJ_NULL;
+    byte tok = ujson_next_token(&p, false, &next);
+    mp_obj_t result = ujson_build(&p, tok, next);
+
     // It is legal for a stream to have contents after JSON.
     // E.g., A UART is not closed after receiving an object; in load() we will
     //   return the first complete JSON object, while in loads() we will retain
     //   strict adherence to the buffer's complete semantic.
     if (!return_first_json) {
-        while (unichar_isspace(S_CUR(s))) {
-            S_NEXT(s);
+        while (unichar_isspace(S_CUR(p.s))) {
+            S_NEXT(p.s);
         }
-        if (!S_END(s)) {
+        if (!S_END(p.s)) {
             // unexpected chars
-            goto fail;
+            ujson_syntax_error();
         }
     }
-    if (stack_top == MP_OBJ_NULL || stack.len != 0) {
-        // not exactly 1 object
-        goto fail;
+    if (seekable) {
+        ujson_stream_give_back(&p.s);
     }
-    vstr_clear(&vstr);
-    return stack_top;
-
-    fail:
-    mp_raise_ValueError(translate("syntax error in JSON"));
+    vstr_clear(&p.vstr);
+    return result;
 }
 
 STATIC mp_obj_t mod_ujson_load(mp_obj_t stream_obj) {
@@ -329,14 +487,251 @@ STATIC mp_obj_t mod_ujson_load(mp_obj_t stream_obj) {
 STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_ujson_load_obj, mod_ujson_load);
 
 STATIC mp_obj_t mod_ujson_loads(mp_obj_t obj) {
-    size_t len;
-    const char *buf = mp_obj_str_get_data(obj, &len);
-    vstr_t vstr = {len, len, (char*)buf, true};
-    mp_obj_stringio_t sio = {{&mp_type_stringio}, &vstr, 0, MP_OBJ_NULL};
-    return _mod_ujson_load(MP_OBJ_FROM_PTR(&sio), false);
+    // check the type here; the data itself is parsed in place by _mod_ujson_load
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(obj, &bufinfo, MP_BUFFER_READ);
+    return _mod_ujson_load(obj, false);
 }
 STATIC MP_DEFINE_CONST_FUN_OBJ_1(mod_ujson_loads_obj, mod_ujson_loads);
 
+#if MICROPY_PY_UJSON_ITERLOAD
+
+// iterload(stream) yields (event, value) pairs as the JSON is read, and
+// iterload(stream, path) yields only the values at the given path, so that
+// at most one of those values is held in memory at a time.
+
+// One open list or dict, and the position in it of the value being read.
+typedef struct _ujson_level_t {
+    bool is_dict;
+    bool have_key;
+    mp_obj_t key;
+    mp_int_t index;
+} ujson_level_t;
+
+// One component of a path: a dict key (which may be "*"), or a list index
+// (which is -1 for "[*]") if key is MP_OBJ_NULL.
+typedef struct _ujson_path_elem_t {
+    mp_obj_t key;
+    mp_int_t index;
+} ujson_path_elem_t;
+
+typedef struct _ujson_iterload_t {
+    mp_obj_base_t base;
+    ujson_parser_t p;
+    bool seekable;
+    bool done;
+    size_t depth;
+    size_t alloc;
+    ujson_level_t *levels;
+    size_t path_len;
+    ujson_path_elem_t *path; // NULL when yielding events
+    byte chunk[CIRCUITPY_JSON_READ_CHUNK_SIZE];
+} ujson_iterload_t;
+
+// Parse a path like "list[*].main.temp".
+STATIC void ujson_iterload_parse_path(ujson_iterload_t *self, mp_obj_t path_in) {
+    size_t len;
+    const char *path = mp_obj_str_get_data(path_in, &len);
+    const char *top = path + len;
+    size_t n = 0;
+    for (const char *c = path; c < top; c++) {
+        n += *c == '.' || *c == '[';
+    }
+    self->path = m_new(ujson_path_elem_t, n + 1);
+    self->path_len = 0;
+    for (const char *c = path; c < top;) {
+        ujson_path_elem_t *elem = &self->path[self->path_len++];
+        if (*c == '[') {
+            const char *start = ++c;
+            while (c < top && *c != ']') {
+                ++c;
+            }
+            if (c == top || c == start) {
+                goto bad_path;
+            }
+            if (c - start == 1 && *start == '*') {
+                elem->index = -1;
+            } else {
+                elem->index = 0;
+                for (const char *d = start; d < c; d++) {
+                    if (!unichar_isdigit(*d)) {
+                        goto bad_path;
+                    }
+                    elem->index = elem->index * 10 + *d - '0';
+                }
+            }
+            elem->key = MP_OBJ_NULL;
+            ++c;
+        } else {
+            if (*c == '.' && self->path_len > 1) {
+                ++c;
+            }
+            const char *start = c;
+            while (c < top && *c != '.' && *c != '[') {
+                ++c;
+            }
+            if (c == start) {
+                goto bad_path;
+            }
+            elem->key = mp_obj_new_str(start, c - start);
+        }
+    }
+    return;
+
+bad_path:
+    mp_raise_ValueError(translate("invalid path"));
+}
+
+// Whether the first n levels are on the path, where levels[i] must match path[i].
+STATIC bool ujson_iterload_on_path(ujson_iterload_t *self, size_t n) {
+    if (n > self->path_len) {
+        return false;
+    }
+    for (size_t i = 0; i < n; i++) {
+        ujson_level_t *level = &self->levels[i];
+        ujson_path_elem_t *elem = &self->path[i];
+        if (elem->key == MP_OBJ_NULL) {
+            if (level->is_dict || (elem->index >= 0 && elem->index != level->index)) {
+                return false;
+            }
+        } else {
+            if (!level->is_dict
+                || (elem->key != MP_OBJ_NEW_QSTR(MP_QSTR__star_) && !mp_obj_equal(elem->key, level->key))) {
+                return false;
+            }
+        }
+    }
+    return true;
+}
+
+// Move past a value in the innermost list or dict.
+STATIC void ujson_iterload_value_done(ujson_iterload_t *self) {
+    if (self->depth == 0) {
+        self->done = true;
+        if (self->seekable) {
+            ujson_stream_give_back(&self->p.s);
+        }
+        return;
+    }
+    ujson_level_t *level = &self->levels[self->depth - 1];
+    if (level->is_dict) {
+        level->have_key = false;
+        level->key = MP_OBJ_NULL;
+    } else {
+        level->index += 1;
+    }
+}
+
+STATIC mp_obj_t ujson_iterload_event(qstr event, mp_obj_t value) {
+    mp_obj_t items[2] = {MP_OBJ_NEW_QSTR(event), value};
+    return mp_obj_new_tuple(2, items);
+}
+
+STATIC mp_obj_t ujson_iterload_iternext(mp_obj_t self_in) {
+    ujson_iterload_t *self = MP_OBJ_TO_PTR(self_in);
+    while (!self->done) {
+        ujson_level_t *level = self->depth == 0 ? NULL : &self->levels[self->depth - 1];
+        bool is_key = level != NULL && level->is_dict && !level->have_key;
+        // Work out whether the next value is selected by the path, and
+        // whether it is needed at all; values that aren't are skipped.
+        bool selected = false;
+        bool wanted = true;
+        if (self->path != NULL) {
+            if (is_key) {
+                wanted = ujson_iterload_on_path(self, self->depth - 1) && self->depth <= self->path_len;
+            } else {
+                selected = self->depth == self->path_len && ujson_iterload_on_path(self, self->depth);
+                wanted = selected;
+            }
+        }
+
+        mp_obj_t value = MP_OBJ_NULL;
+        byte tok = ujson_next_token(&self->p, is_key, wanted ? &value : NULL);
+        switch (tok) {
+            case UJSON_TOK_VALUE:
+                if (is_key) {
+                    level->key = value;
+                    level->have_key = true;
+                    if (self->path == NULL) {
+                        return ujson_iterload_event(MP_QSTR_map_key, value);
+                    }
+                } else {
+                    ujson_iterload_value_done(self);
+                    if (self->path == NULL) {
+                        return ujson_iterload_event(MP_QSTR_value, value);
+                    } else if (selected) {
+                        return value;
+                    }
+                }
+                break;
+            case '[':
+            case '{':
+                if (is_key) {
+                    ujson_syntax_error();
+                }
+                if (selected) {
+                    value = ujson_build(&self->p, tok, MP_OBJ_NULL);
+                    ujson_iterload_value_done(self);
+                    return value;
+                }
+                if (self->depth == self->alloc) {
+                    self->levels = m_renew(ujson_level_t, self->levels, self->alloc, self->alloc * 2);
+                    self->alloc *= 2;
+                }
+                level = &self->levels[self->depth++];
+                level->is_dict = tok == '{';
+                level->have_key = false;
+                level->key = MP_OBJ_NULL;
+                level->index = 0;
+                if (self->path == NULL) {
+                    return ujson_iterload_event(tok == '{' ? MP_QSTR_start_map : MP_QSTR_start_array, mp_const_none);
+                }
+                break;
+            case ']':
+            case '}':
+                if (level == NULL || level->is_dict != (tok == '}') || level->have_key) {
+                    ujson_syntax_error();
+                }
+                self->depth -= 1;
+                ujson_iterload_value_done(self);
+                if (self->path == NULL) {
+                    return ujson_iterload_event(tok == '}' ? MP_QSTR_end_map : MP_QSTR_end_array, mp_const_none);
+                }
+                break;
+            default:
+                // end of input before the end of the JSON
+                ujson_syntax_error();
+        }
+    }
+    return MP_OBJ_STOP_ITERATION;
+}
+
+STATIC const mp_obj_type_t ujson_iterload_type = {
+    { &mp_type_type },
+    .name = MP_QSTR_iterload,
+    .getiter = mp_identity_getiter,
+    .iternext = ujson_iterload_iternext,
+};
+
+STATIC mp_obj_t mod_ujson_iterload(size_t n_args, const mp_obj_t *args) {
+    ujson_iterload_t *self = m_new_obj(ujson_iterload_t);
+    self->base.type = &ujson_iterload_type;
+    self->done = false;
+    self->depth = 0;
+    self->alloc = 4;
+    self->levels = m_new(ujson_level_t, self->alloc);
+    self->path = NULL;
+    self->path_len = 0;
+    if (n_args > 1 && args[1] != mp_const_none) {
+        ujson_iterload_parse_path(self, args[1]);
+    }
+    self->seekable = ujson_parser_init(&self->p, args[0], self->chunk);
+    return MP_OBJ_FROM_PTR(self);
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(mod_ujson_iterload_obj, 1, 2, mod_ujson_iterload);
+
+#endif // MICROPY_PY_UJSON_ITERLOAD
+
 STATIC const mp_rom_map_elem_t mp_module_ujson_globals_table[] = {
 #if CIRCUITPY
     { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_json) },
@@ -347,6 +742,9 @@ STATIC const mp_rom_map_elem_t mp_module_ujson_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR_dumps), MP_ROM_PTR(&mod_ujson_dumps_obj) },
     { MP_ROM_QSTR(MP_QSTR_load), MP_ROM_PTR(&mod_ujson_load_obj) },
     { MP_ROM_QSTR(MP_QSTR_loads), MP_ROM_PTR(&mod_ujson_loads_obj) },
+    #if MICROPY_PY_UJSON_ITERLOAD
+    { MP_ROM_QSTR(MP_QSTR_iterload), MP_ROM_PTR(&mod_ujson_iterload_obj) },
+    #endif
 };
 
 STATIC MP_DEFINE_CONST_DICT(mp_module_ujson_globals, mp_module_ujson_globals_table);
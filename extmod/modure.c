@@ -19,9 +19,13 @@
 #include "re1.5/re1.5.h"
 
 #define FLAG_DEBUG 0x1000
+#define FLAG_NOBACKTRACK 0x2000
 
 typedef struct _mp_obj_re_t {
     mp_obj_base_t base;
+    #if MICROPY_PY_URE_PIKEVM
+    bool pikevm;
+    #endif
     ByteProg re;
 } mp_obj_re_t;
 
@@ -150,6 +154,22 @@ STATIC void re_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t
     mp_printf(print, "<re %p>", self);
 }
 
+// Matches a compiled regex against subj, with the Pike VM if it was chosen for the regex and
+// otherwise the backtracking matcher, and sets caps to the start and end of each group.
+STATIC int re_exec_prog(mp_obj_re_t *self, Subject *subj, const char **caps, int caps_num, bool is_anchored) {
+    #if MICROPY_PY_URE_PIKEVM
+    if (self->pikevm) {
+        // the work area only points into the subject, which the caller keeps alive
+        size_t size = re1_5_pikevm_worksize(&self->re, caps_num);
+        char *work = m_new_no_scan(char, size);
+        int res = re1_5_pikevm(&self->re, subj, caps, caps_num, is_anchored, work);
+        m_del(char, work, size);
+        return res;
+    }
+    #endif
+    return re1_5_recursiveloopprog(&self->re, subj, caps, caps_num, is_anchored);
+}
+
 STATIC mp_obj_t ure_exec(bool is_anchored, uint n_args, const mp_obj_t *args) {
     (void)n_args;
     mp_obj_re_t *self = MP_OBJ_TO_PTR(args[0]);
@@ -190,7 +210,7 @@ STATIC mp_obj_t ure_exec(bool is_anchored, uint n_args, const mp_obj_t *args) {
     mp_obj_match_t *match = m_new_obj_var(mp_obj_match_t, char*, caps_num);
     // cast is a workaround for a bug in msvc: it treats const char** as a const pointer instead of a pointer to pointer to const char
     memset((char*)match->caps, 0, caps_num * sizeof(char*));
-    int res = re1_5_recursiveloopprog(&self->re, &subj, match->caps, caps_num, is_anchored);
+    int res = re_exec_prog(self, &subj, match->caps, caps_num, is_anchored);
     if (res == 0) {
         m_del_var(mp_obj_match_t, char*, caps_num, match);
         return mp_const_none;
@@ -231,7 +251,7 @@ STATIC mp_obj_t re_split(size_t n_args, const mp_obj_t *args) {
     while (true) {
         // cast is a workaround for a bug in msvc: it treats const char** as a const pointer instead of a pointer to pointer to const char
         memset((char**)caps, 0, caps_num * sizeof(char*));
-        int res = re1_5_recursiveloopprog(&self->re, &subj, caps, caps_num, false);
+        int res = re_exec_prog(self, &subj, caps, caps_num, false);
 
         // if we didn't have a match, or had an empty match, it's time to stop
         if (!res || caps[0] == caps[1]) {
@@ -286,7 +306,7 @@ STATIC mp_obj_t re_sub_helper(mp_obj_t self_in, size_t n_args, const mp_obj_t *a
     for (;;) {
         // cast is a workaround for a bug in msvc: it treats const char** as a const pointer instead of a pointer to pointer to const char
         memset((char*)match->caps, 0, caps_num * sizeof(char*));
-        int res = re1_5_recursiveloopprog(&self->re, &subj, match->caps, caps_num, false);
+        int res = re_exec_prog(self, &subj, match->caps, caps_num, false);
 
         // If we didn't have a match, or had an empty match, it's time to stop
         if (!res || match->caps[0] == match->caps[1]) {
@@ -413,13 +433,68 @@ error:
     if (flags & FLAG_DEBUG) {
         re1_5_dumpcode(&o->re);
     }
+    #if MICROPY_PY_URE_PIKEVM
+    // loops around alternatives or other loops can take exponential time to backtrack
+    o->pikevm = (flags & FLAG_NOBACKTRACK) || o->re.nested > 0;
+    #endif
     return MP_OBJ_FROM_PTR(o);
 }
 MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(mod_re_compile_obj, 1, 2, mod_re_compile);
 
+#if MICROPY_PY_URE_CACHE_SIZE
+
+// Returns the compiled form of a pattern given to the module-level functions, reusing the one
+// made for a recent call with the same pattern.  Patterns are looked up by object first, which
+// finds literals since they're interned, and then by contents.
+STATIC mp_obj_t mod_re_compile_cached(mp_obj_t pattern) {
+    mp_obj_t *cache = MP_STATE_VM(ure_cache);
+    size_t n = 0;
+    while (n < MICROPY_PY_URE_CACHE_SIZE && cache[n * 2] != MP_OBJ_NULL && cache[n * 2] != pattern) {
+        n++;
+    }
+    size_t i = n;
+    if (n == MICROPY_PY_URE_CACHE_SIZE || cache[n * 2] == MP_OBJ_NULL) {
+        // n entries are in use and none is this object, so compare the contents
+        size_t len;
+        const char *str = mp_obj_str_get_data(pattern, &len);
+        for (i = 0; i < n; i++) {
+            size_t cached_len;
+            const char *cached_str = mp_obj_str_get_data(cache[i * 2], &cached_len);
+            if (cached_len == len && memcmp(cached_str, str, len) == 0) {
+                break;
+            }
+        }
+        if (i == n) {
+            // not cached, so take the first free entry or else the least recently used one
+            mp_obj_t re = mod_re_compile(1, &pattern);
+            i = MIN(n, MICROPY_PY_URE_CACHE_SIZE - 1);
+            cache[i * 2 + 1] = re;
+        }
+    }
+
+    // move the entry to the front
+    mp_obj_t re = cache[i * 2 + 1];
+    memmove(cache + 2, cache, i * 2 * sizeof(mp_obj_t));
+    cache[0] = pattern;
+    cache[1] = re;
+    return re;
+}
+
+STATIC mp_obj_t mod_re_purge(void) {
+    for (size_t i = 0; i < MICROPY_PY_URE_CACHE_SIZE * 2; i++) {
+        MP_STATE_VM(ure_cache[i]) = MP_OBJ_NULL;
+    }
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_0(mod_re_purge_obj, mod_re_purge);
+
+#else
+#define mod_re_compile_cached(pattern) mod_re_compile(1, &(pattern))
+#endif
+
 STATIC mp_obj_t mod_re_exec(bool is_anchored, uint n_args, const mp_obj_t *args) {
     (void)n_args;
-    mp_obj_t self = mod_re_compile(1, args);
+    mp_obj_t self = mod_re_compile_cached(args[0]);
 
     const mp_obj_t args2[] = {self, args[1]};
     mp_obj_t match = ure_exec(is_anchored, 2, args2);
@@ -438,7 +513,7 @@ MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(mod_re_search_obj, 2, 4, mod_re_search);
 
 #if MICROPY_PY_URE_SUB
 STATIC mp_obj_t mod_re_sub(size_t n_args, const mp_obj_t *args) {
-    mp_obj_t self = mod_re_compile(1, args);
+    mp_obj_t self = mod_re_compile_cached(args[0]);
     return re_sub_helper(self, n_args, args);
 }
 MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(mod_re_sub_obj, 3, 5, mod_re_sub);
@@ -456,7 +531,13 @@ STATIC const mp_rom_map_elem_t mp_module_re_globals_table[] = {
     #if MICROPY_PY_URE_SUB
     { MP_ROM_QSTR(MP_QSTR_sub), MP_ROM_PTR(&mod_re_sub_obj) },
     #endif
+    #if MICROPY_PY_URE_CACHE_SIZE
+    { MP_ROM_QSTR(MP_QSTR_purge), MP_ROM_PTR(&mod_re_purge_obj) },
+    #endif
     { MP_ROM_QSTR(MP_QSTR_DEBUG), MP_ROM_INT(FLAG_DEBUG) },
+    #if MICROPY_PY_URE_PIKEVM
+    { MP_ROM_QSTR(MP_QSTR_NOBACKTRACK), MP_ROM_INT(FLAG_NOBACKTRACK) },
+    #endif
 };
 
 STATIC MP_DEFINE_CONST_DICT(mp_module_re_globals, mp_module_re_globals_table);
@@ -474,5 +555,8 @@ const mp_obj_module_t mp_module_ure = {
 #include "re1.5/dumpcode.c"
 #include "re1.5/recursiveloop.c"
 #include "re1.5/charclass.c"
+#if MICROPY_PY_URE_PIKEVM
+#include "re1.5/pikevm.c"
+#endif
 
 #endif //MICROPY_PY_URE
@@ -33,11 +33,12 @@ static char unescape(char c) {
 }
 
 
-static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
+static const char *_compilecode(const char *re, ByteProg *prog, int sizecode, int *branches)
 {
     char *code = sizecode ? NULL : prog->insts;
     int start = PC;
     int term = PC;
+    int term_branches = 0;
     int alt_label = 0;
 
     for (; *re && *re != ')'; re++) {
@@ -46,6 +47,7 @@ static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
             re++;
             if (!*re) return NULL; // Trailing backslash
             term = PC;
+            term_branches = 0;
             if ((*re | 0x20) == 'd' || (*re | 0x20) == 's' || (*re | 0x20) == 'w') {
                 EMIT(PC++, NamedClass);
                 EMIT(PC++, *re);
@@ -57,18 +59,21 @@ static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
             break;
         default:
             term = PC;
+            term_branches = 0;
             EMIT(PC++, Char);
             EMIT(PC++, *re);
             prog->len++;
             break;
         case '.':
             term = PC;
+            term_branches = 0;
             EMIT(PC++, Any);
             prog->len++;
             break;
         case '[': {
             int cnt;
             term = PC;
+            term_branches = 0;
             re++;
             if (*re == '^') {
                 EMIT(PC++, ClassNot);
@@ -101,6 +106,7 @@ static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
         }
         case '(': {
             term = PC;
+            term_branches = 0;
             int sub = 0;
             int capture = re[1] != '?' || re[2] != ':';
 
@@ -113,8 +119,9 @@ static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
                     re += 2;
             }
 
-            re = _compilecode(re + 1, prog, sizecode);
+            re = _compilecode(re + 1, prog, sizecode, &term_branches);
             if (re == NULL || *re != ')') return NULL; // error, or no matching paren
+            *branches |= term_branches;
 
             if (capture) {
                 EMIT(PC++, Save);
@@ -136,9 +143,11 @@ static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
             EMIT(term + 1, REL(term, PC));
             prog->len++;
             term = PC;
+            *branches = 1;
             break;
         case '*':
             if (PC == term) return NULL; // nothing to repeat
+            prog->nested += term_branches;
             INSERT_CODE(term, 2, PC);
             EMIT(PC, Jmp);
             EMIT(PC + 1, REL(PC, term));
@@ -152,9 +161,11 @@ static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
             EMIT(term + 1, REL(term, PC));
             prog->len += 2;
             term = PC;
+            *branches = 1;
             break;
         case '+':
             if (PC == term) return NULL; // nothing to repeat
+            prog->nested += term_branches;
             if (re[1] == '?') {
                 EMIT(PC, Split);
                 re++;
@@ -165,6 +176,7 @@ static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
             PC += 2;
             prog->len++;
             term = PC;
+            *branches = 1;
             break;
         case '|':
             if (alt_label) {
@@ -177,6 +189,7 @@ static const char *_compilecode(const char *re, ByteProg *prog, int sizecode)
             EMIT(start + 1, REL(start, PC));
             prog->len += 2;
             term = PC;
+            *branches = 1;
             break;
         case '^':
             EMIT(PC++, Bol);
@@ -203,8 +216,9 @@ int re1_5_sizecode(const char *re)
          // Save 0, Save 1, Match; more bytes for "search" (vs "match") prefix code
         .bytelen = 5 + NON_ANCHORED_PREFIX
     };
+    int branches = 0;
 
-    if (_compilecode(re, &dummyprog, /*sizecode*/1) == NULL) return -1;
+    if (_compilecode(re, &dummyprog, /*sizecode*/1, &branches) == NULL) return -1;
 
     return dummyprog.bytelen;
 }
@@ -214,6 +228,7 @@ int re1_5_compilecode(ByteProg *prog, const char *re)
     prog->len = 0;
     prog->bytelen = 0;
     prog->sub = 0;
+    prog->nested = 0;
 
     // Add code to implement non-anchored operation ("search"),
     // for anchored operation ("match"), this code will be just skipped.
@@ -229,7 +244,8 @@ int re1_5_compilecode(ByteProg *prog, const char *re)
     prog->insts[prog->bytelen++] = 0;
     prog->len++;
 
-    re = _compilecode(re, prog, /*sizecode*/0);
+    int branches = 0;
+    re = _compilecode(re, prog, /*sizecode*/0, &branches);
     if (re == NULL || *re) return 1;
 
     prog->insts[prog->bytelen++] = Save;
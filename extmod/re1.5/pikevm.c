@@ -0,0 +1,182 @@
+// Copyright 2007-2009 Russ Cox.  All Rights Reserved.
+// Use of this source code is governed by a BSD-style
+// license that can be found in the LICENSE file.
+
+#include "re1.5.h"
+
+// Pike VM: runs all the threads of the program in step over the subject, one
+// character at a time, so the time taken is linear in the subject length
+// whatever the pattern. Threads are kept in priority order, the order in
+// which the backtracking matchers would try them, so the captures are the
+// same as theirs. Instead of recursing, the epsilon closure is followed
+// with an explicit stack, and all the memory used is in the work area
+// passed in by the caller, of re1_5_pikevm_worksize bytes.
+
+typedef struct PikeStack PikeStack;
+
+struct PikeStack
+{
+	char *pc;	// instruction to follow, or nil to restore a capture
+	int off;	// capture to restore
+	const char *sp;	// its previous value
+};
+
+typedef struct PikeList PikeList;
+
+struct PikeList
+{
+	int n;
+	// each thread is its pc followed by its nsubp captures
+	const char **t;
+};
+
+int
+re1_5_pikevm_worksize(ByteProg *prog, int nsubp)
+{
+	// marks for each byte of code, two thread lists, the captures of the
+	// thread being added and the stack
+	return prog->bytelen * sizeof(const char*)
+		+ 2 * prog->len * (1 + nsubp) * sizeof(const char*)
+		+ nsubp * sizeof(const char*)
+		+ (prog->len + 1) * sizeof(PikeStack);
+}
+
+// Adds the threads reached from pc without consuming input to l, in
+// priority order, each with the captures in cur updated on its way there.
+// marks records the position at which each instruction was last reached,
+// so none is followed twice for the same position.
+static void
+addthread(ByteProg *prog, PikeList *l, char *pc, const char *sp, Subject *input,
+	const char **cur, int nsubp, const char **marks, PikeStack *stack)
+{
+	int nstack = 0;
+	int off;
+
+	stack[nstack++].pc = pc;
+	while(nstack > 0) {
+		PikeStack *e = &stack[--nstack];
+		if(e->pc == nil) {
+			cur[e->off] = e->sp;
+			continue;
+		}
+		pc = e->pc;
+		for(;;) {
+			if(marks[pc - prog->insts] == sp)
+				break;
+			marks[pc - prog->insts] = sp;
+			switch(*pc) {
+			case Jmp:
+				off = (signed char)pc[1];
+				pc += 2 + off;
+				continue;
+			case Split:
+				off = (signed char)pc[1];
+				stack[nstack++].pc = pc + 2 + off;
+				pc += 2;
+				continue;
+			case RSplit:
+				off = (signed char)pc[1];
+				stack[nstack++].pc = pc + 2;
+				pc += 2 + off;
+				continue;
+			case Save:
+				off = (unsigned char)pc[1];
+				if(off < nsubp) {
+					e = &stack[nstack++];
+					e->pc = nil;
+					e->off = off;
+					e->sp = cur[off];
+					cur[off] = sp;
+				}
+				pc += 2;
+				continue;
+			case Bol:
+				if(sp == input->begin) {
+					pc++;
+					continue;
+				}
+				break;
+			case Eol:
+				if(sp == input->end) {
+					pc++;
+					continue;
+				}
+				break;
+			default: {
+				// a consumer or Match, which runs at the next step
+				const char **t = l->t + l->n++ * (1 + nsubp);
+				t[0] = pc;
+				memcpy(t + 1, cur, nsubp * sizeof(const char*));
+				break;
+			}
+			}
+			break;
+		}
+	}
+}
+
+int
+re1_5_pikevm(ByteProg *prog, Subject *input, const char **subp, int nsubp, int is_anchored, void *work)
+{
+	const char **marks = work;
+	PikeList lists[2];
+	lists[0].t = marks + prog->bytelen;
+	lists[1].t = lists[0].t + prog->len * (1 + nsubp);
+	const char **cur = lists[1].t + prog->len * (1 + nsubp);
+	PikeStack *stack = (PikeStack*)(cur + nsubp);
+	PikeList *clist = &lists[0];
+	PikeList *nlist = &lists[1];
+	const char *sp = input->begin;
+	int matched = 0;
+	int i;
+
+	// no instruction has been reached at any position yet
+	for(i = 0; i < prog->bytelen; i++)
+		marks[i] = nil;
+
+	clist->n = 0;
+	memcpy(cur, subp, nsubp * sizeof(const char*));
+	addthread(prog, clist, HANDLE_ANCHORED(prog->insts, is_anchored), sp, input, cur, nsubp, marks, stack);
+	for(; clist->n > 0; sp++) {
+		nlist->n = 0;
+		for(i = 0; i < clist->n; i++) {
+			const char **t = clist->t + i * (1 + nsubp);
+			const char *pc = t[0];
+			if(*pc == Match) {
+				// the threads after this one have lower priority, so drop them
+				memcpy(subp, t + 1, nsubp * sizeof(const char*));
+				matched = 1;
+				break;
+			}
+			if(sp >= input->end)
+				continue;
+			switch(*pc++) {
+			case Char:
+				if(*sp != *pc++)
+					continue;
+				break;
+			case Any:
+				break;
+			case Class:
+			case ClassNot:
+				if(!_re1_5_classmatch(pc, sp))
+					continue;
+				pc += *(unsigned char*)pc * 2 + 1;
+				break;
+			case NamedClass:
+				if(!_re1_5_namedclassmatch(pc, sp))
+					continue;
+				pc++;
+				break;
+			default:
+				re1_5_fatal("pikevm");
+			}
+			memcpy(cur, t + 1, nsubp * sizeof(const char*));
+			addthread(prog, nlist, (char*)pc, sp + 1, input, cur, nsubp, marks, stack);
+		}
+		PikeList *tmp = clist;
+		clist = nlist;
+		nlist = tmp;
+	}
+	return matched;
+}
@@ -64,6 +64,7 @@ struct ByteProg
 	int bytelen;
 	int len;
 	int sub;
+	int nested;	// loops around code that branches, which can backtrack exponentially
 	char insts[0];
 };
 
@@ -139,7 +140,8 @@ struct Subject {
 #define HANDLE_ANCHORED(bytecode, is_anchored) ((is_anchored) ? (bytecode) + NON_ANCHORED_PREFIX : (bytecode))
 
 int re1_5_backtrack(ByteProg*, Subject*, const char**, int, int);
-int re1_5_pikevm(ByteProg*, Subject*, const char**, int, int);
+int re1_5_pikevm(ByteProg*, Subject*, const char**, int, int, void*);
+int re1_5_pikevm_worksize(ByteProg*, int);
 int re1_5_recursiveloopprog(ByteProg*, Subject*, const char**, int, int);
 int re1_5_recursiveprog(ByteProg*, Subject*, const char**, int, int);
 int re1_5_thompsonvm(ByteProg*, Subject*, const char**, int, int);
@@ -3384,7 +3384,23 @@ FRESULT f_read (
             cc = btr / SS(fs);                  /* When remaining bytes >= sector size, */
             if (cc) {/* Read maximum contiguous sectors directly */
                 if (csect + cc > fs->csize) {   /* Clip at cluster boundary */
+                    UINT want = cc;
                     cc = fs->csize - csect;
+                    /* Carry on into the following clusters while they are contiguous on the volume */
+                    while (cc < want) {
+#if _USE_FASTSEEK
+                        if (fp->cltbl) {
+                            clst = clmt_clust(fp, fp->fptr + (FSIZE_t)cc * SS(fs));
+                        } else
+#endif
+                        {
+                            clst = get_fat(&fp->obj, fp->clust);
+                        }
+                        if (clst != fp->clust + 1) break;
+                        fp->clust = clst;
+                        cc += fs->csize;
+                    }
+                    if (cc > want) cc = want;
                 }
                 if (disk_read(fs->drv, rbuff, sect, cc) != RES_OK) ABORT(fs, FR_DISK_ERR);
 #if !_FS_READONLY && _FS_MINIMIZE <= 2          /* Replace one of the read sectors with cached data if it contains a dirty sector */
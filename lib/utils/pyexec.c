@@ -54,6 +54,7 @@ STATIC bool repl_display_debugging_info = 0;
 #define EXEC_FLAG_SOURCE_IS_RAW_CODE (8)
 #define EXEC_FLAG_SOURCE_IS_VSTR (16)
 #define EXEC_FLAG_SOURCE_IS_FILENAME (32)
+#define EXEC_FLAG_SOURCE_IS_READER (64)
 
 // parses, compiles and executes the code in the lexer
 // frees the lexer before returning
@@ -82,6 +83,8 @@ STATIC int parse_compile_execute(const void *source, mp_parse_input_kind_t input
             if (exec_flags & EXEC_FLAG_SOURCE_IS_VSTR) {
                 const vstr_t *vstr = source;
                 lex = mp_lexer_new_from_str_len(MP_QSTR__lt_stdin_gt_, vstr->buf, vstr->len, 0);
+            } else if (exec_flags & EXEC_FLAG_SOURCE_IS_READER) {
+                lex = mp_lexer_new(MP_QSTR__lt_stdin_gt_, *(mp_reader_t*)source);
             } else if (exec_flags & EXEC_FLAG_SOURCE_IS_FILENAME) {
                 lex = mp_lexer_new_from_file(source);
             } else {
@@ -95,7 +98,7 @@ STATIC int parse_compile_execute(const void *source, mp_parse_input_kind_t input
             mp_parse_tree_t parse_tree = mp_parse(lex, input_kind);
             module_fun = mp_compile(&parse_tree, source_name, MP_EMIT_OPT_NONE, exec_flags & EXEC_FLAG_IS_REPL);
             // Clear the parse tree because it has a heap pointer we don't need anymore.
-            *((uint32_t volatile*) &parse_tree.chunk) = 0;
+            *((struct _mp_parse_chunk_t * volatile *) &parse_tree.chunk) = NULL;
             #else
             mp_raise_msg(&mp_type_RuntimeError, translate("script compilation not supported"));
             #endif
@@ -124,6 +127,14 @@ STATIC int parse_compile_execute(const void *source, mp_parse_input_kind_t input
         // uncaught exception
         // FIXME it could be that an interrupt happens just before we disable it here
         mp_hal_set_interrupt_char(-1); // disable interrupt
+        #if MICROPY_ENABLE_COMPILER
+        if (exec_flags & EXEC_FLAG_SOURCE_IS_READER) {
+            // A syntax error leaves the lexer unfreed so close the reader here to consume the
+            // rest of the source before reporting the error.
+            const mp_reader_t *reader = source;
+            reader->close(reader->data);
+        }
+        #endif
         // print EOF after normal output
         if (exec_flags & EXEC_FLAG_PRINT_EOF) {
             mp_hal_stdout_tx_strn("\x04", 1);
@@ -170,7 +181,7 @@ STATIC int parse_compile_execute(const void *source, mp_parse_input_kind_t input
             qstr_pool_info(&n_pool, &n_qstr, &n_str_data_bytes, &n_total_bytes);
             printf("qstr:\n  n_pool=" UINT_FMT "\n  n_qstr=" UINT_FMT "\n  "
                    "n_str_data_bytes=" UINT_FMT "\n  n_total_bytes=" UINT_FMT "\n",
-                   (unsigned)n_pool, (unsigned)n_qstr, (unsigned)n_str_data_bytes, (unsigned)n_total_bytes);
+                   (mp_uint_t)n_pool, (mp_uint_t)n_qstr, (mp_uint_t)n_str_data_bytes, (mp_uint_t)n_total_bytes);
         }
 
         #if MICROPY_ENABLE_GC
@@ -355,6 +366,92 @@ int pyexec_event_repl_process_char(int c) {
 
 #else // MICROPY_REPL_EVENT_DRIVEN
 
+// Raw-paste mode streams the source straight into the lexer. The host may only send a window of
+// bytes at a time and waits for a 0x01 before sending the next one, so nothing is lost while
+// the board is busy compiling.
+typedef struct _mp_reader_stdin_t {
+    bool eof;
+    uint16_t window_max;
+    uint16_t window_remain;
+} mp_reader_stdin_t;
+
+STATIC mp_uint_t mp_reader_stdin_readbyte(void *data) {
+    mp_reader_stdin_t *reader = (mp_reader_stdin_t*)data;
+
+    if (reader->eof) {
+        return MP_READER_EOF;
+    }
+
+    int c = mp_hal_stdin_rx_chr();
+
+    if (c == CHAR_CTRL_C || c == CHAR_CTRL_D) {
+        reader->eof = true;
+        mp_hal_stdout_tx_strn("\x04", 1); // indicate end to host
+        if (c == CHAR_CTRL_C) {
+            #if MICROPY_KBD_EXCEPTION
+            MP_STATE_VM(mp_kbd_exception).traceback_data = NULL;
+            nlr_raise(MP_OBJ_FROM_PTR(&MP_STATE_VM(mp_kbd_exception)));
+            #else
+            nlr_raise(mp_obj_new_exception(&mp_type_KeyboardInterrupt));
+            #endif
+        }
+        return MP_READER_EOF;
+    }
+
+    if (--reader->window_remain == 0) {
+        mp_hal_stdout_tx_strn("\x01", 1); // indicate window available to host
+        reader->window_remain = reader->window_max;
+    }
+
+    return c;
+}
+
+STATIC void mp_reader_stdin_close(void *data) {
+    mp_reader_stdin_t *reader = (mp_reader_stdin_t*)data;
+    if (!reader->eof) {
+        // A compile error stopped the lexer early so discard the rest of the source.
+        reader->eof = true;
+        mp_hal_stdout_tx_strn("\x04", 1); // indicate end to host
+        for (;;) {
+            int c = mp_hal_stdin_rx_chr();
+            if (c == CHAR_CTRL_C || c == CHAR_CTRL_D) {
+                break;
+            }
+        }
+    }
+}
+
+STATIC void mp_reader_new_stdin(mp_reader_t *reader, mp_reader_stdin_t *reader_stdin, uint16_t buf_max) {
+    // The flow control window is half the buffer size. Sending the window size implicitly frees
+    // one window and the 0x01 that follows frees the second.
+    size_t window = buf_max / 2;
+    char reply[3] = { window & 0xff, window >> 8, 0x01 };
+    mp_hal_stdout_tx_strn(reply, sizeof(reply));
+
+    reader_stdin->eof = false;
+    reader_stdin->window_max = window;
+    reader_stdin->window_remain = window;
+    reader->data = reader_stdin;
+    reader->readbyte = mp_reader_stdin_readbyte;
+    reader->close = mp_reader_stdin_close;
+}
+
+STATIC int do_reader_stdin(int c) {
+    if (c != 'A') {
+        // Unsupported command.
+        mp_hal_stdout_tx_strn("R\x00", 2);
+        return 0;
+    }
+
+    // Indicate reception of command.
+    mp_hal_stdout_tx_strn("R\x01", 2);
+
+    mp_reader_t reader;
+    mp_reader_stdin_t reader_stdin;
+    mp_reader_new_stdin(&reader, &reader_stdin, MICROPY_REPL_STDIN_BUFFER_MAX);
+    return parse_compile_execute(&reader, MP_PARSE_FILE_INPUT, EXEC_FLAG_PRINT_EOF | EXEC_FLAG_SOURCE_IS_READER, NULL);
+}
+
 int pyexec_raw_repl(void) {
     vstr_t line;
     vstr_init(&line, 32);
@@ -368,6 +465,17 @@ raw_repl_reset:
         for (;;) {
             int c = mp_hal_stdin_rx_chr();
             if (c == CHAR_CTRL_A) {
+                // Ctrl-E followed by a command byte and Ctrl-A requests raw-paste mode. Older
+                // boards treat the Ctrl-A as a reset, which tells the host to fall back.
+                if (line.len == 2 && line.buf[0] == CHAR_CTRL_E) {
+                    int ret = do_reader_stdin(line.buf[1]);
+                    if (ret & PYEXEC_FORCED_EXIT) {
+                        return ret;
+                    }
+                    vstr_reset(&line);
+                    mp_hal_stdout_tx_str(">");
+                    continue;
+                }
                 // reset raw REPL
                 goto raw_repl_reset;
             } else if (c == CHAR_CTRL_B) {
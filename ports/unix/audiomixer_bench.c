@@ -0,0 +1,221 @@
+// Mixes looping RawSample voices through audiomixer_mixer_get_buffer, checks the result against a
+// straightforward per-sample mix and reports the CPU share needed to keep up at 22.05 and 44.1 kHz,
+// along with the time taken for each output frame of each voice.
+// Build with `make audiomixer_bench` and run as
+// `./audiomixer_bench [voices [bits_per_sample [signed [seconds [source_rate [source_channels [sinc]]]]]]]`.
+// The mixer runs at 22050 Hz in stereo. Samples at another rate or channel count go through the
+// voice resampler, linear unless sinc is 1; only the sinc resampler's output isn't checked.
+// The first voice plays at full level, the last one is muted when there are three or more, and
+// the rest play at 0.7.
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#if defined(__x86_64__) || defined(__i386__)
+#include <x86intrin.h>
+#endif
+
+#include "py/gc.h"
+#include "py/lexer.h"
+#include "py/nlr.h"
+#include "py/runtime.h"
+#include "py/stackctrl.h"
+#include "py/mpthread.h"
+#include "shared-bindings/audiocore/RawSample.h"
+#include "shared-bindings/audiomixer/Mixer.h"
+#include "shared-bindings/audiomixer/MixerVoice.h"
+
+#define CHANNEL_COUNT (2)
+#define SAMPLE_RATE (22050)
+#define BUFFER_SIZE (1024)
+#define CHECK_BUFFERS (64)
+
+STATIC const audiosample_p_t rawsample_proto = {
+    MP_PROTO_IMPLEMENT(MP_QSTR_protocol_audiosample)
+    .sample_rate = (audiosample_sample_rate_fun)common_hal_audioio_rawsample_get_sample_rate,
+    .bits_per_sample = (audiosample_bits_per_sample_fun)common_hal_audioio_rawsample_get_bits_per_sample,
+    .channel_count = (audiosample_channel_count_fun)common_hal_audioio_rawsample_get_channel_count,
+    .reset_buffer = (audiosample_reset_buffer_fun)audioio_rawsample_reset_buffer,
+    .get_buffer = (audiosample_get_buffer_fun)audioio_rawsample_get_buffer,
+    .get_buffer_structure = (audiosample_get_buffer_structure_fun)audioio_rawsample_get_buffer_structure,
+};
+
+STATIC const mp_obj_type_t rawsample_type = {
+    { &mp_type_type },
+    .name = MP_QSTR_object,
+    .protocol = &rawsample_proto,
+};
+
+STATIC void stderr_print_strn(void *env, const char *str, size_t len) {
+    fwrite(str, 1, len, stderr);
+}
+
+const mp_print_t mp_stderr_print = {NULL, stderr_print_strn};
+
+#if !MICROPY_VFS
+uint mp_import_stat(const char *path) {
+    return MP_IMPORT_STAT_NO_EXIST;
+}
+#endif
+
+void nlr_jump_fail(void *val) {
+    printf("FATAL: uncaught NLR %p\n", val);
+    exit(1);
+}
+
+STATIC double now(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+STATIC uint64_t cycles(void) {
+    #if defined(__x86_64__) || defined(__i386__)
+    return __rdtsc();
+    #else
+    return 0;
+    #endif
+}
+
+STATIC int32_t saturate(int32_t value, uint8_t bits) {
+    int32_t max = (1 << (bits - 1)) - 1;
+    return value > max ? max : value < -max - 1 ? -max - 1 : value;
+}
+
+// Reads sample i of a buffer as a signed value.
+STATIC int32_t get_sample(const uint8_t *buffer, size_t i, uint8_t bits, bool samples_signed) {
+    if (bits == 8) {
+        return samples_signed ? (int8_t)buffer[i] : buffer[i] - 0x80;
+    }
+    uint16_t value = ((const uint16_t *)buffer)[i];
+    return samples_signed ? (int16_t)value : value - 0x8000;
+}
+
+// Returns the sample of a voice for one output channel and frame, linearly
+// interpolated when its sample has a different rate.
+STATIC int32_t get_voice_sample(const audioio_rawsample_obj_t *sample, size_t frame_count, size_t frame,
+    uint8_t channel, uint32_t step, uint8_t bits, bool samples_signed) {
+    uint8_t channels = sample->channel_count;
+    if (channels != CHANNEL_COUNT) {
+        channel = channels == 1 ? 0 : channel;
+    }
+    if (step == 1 << 16 && channels == CHANNEL_COUNT) {
+        return get_sample(sample->buffer, (frame % frame_count) * channels + channel, bits, samples_signed);
+    }
+    // Converted voices are resampled at 16 bits.
+    uint64_t position = (uint64_t)frame * step;
+    size_t i = (position >> 16) % frame_count;
+    int32_t frac = (position & 0xffff) >> 1;
+    int32_t a = get_sample(sample->buffer, i * channels + channel, bits, samples_signed) << (16 - bits);
+    int32_t b = get_sample(sample->buffer, ((i + 1) % frame_count) * channels + channel, bits, samples_signed) << (16 - bits);
+    return (a + (((b - a) * frac) >> 15)) >> (16 - bits);
+}
+
+int main(int argc, char **argv) {
+    uint8_t voice_count = argc > 1 ? atoi(argv[1]) : 4;
+    uint8_t bits = argc > 2 ? atoi(argv[2]) : 16;
+    bool samples_signed = argc > 3 ? atoi(argv[3]) : true;
+    double seconds = argc > 4 ? atof(argv[4]) : 60;
+    uint32_t source_rate = argc > 5 ? atoi(argv[5]) : SAMPLE_RATE;
+    uint8_t source_channels = argc > 6 ? atoi(argv[6]) : CHANNEL_COUNT;
+    bool sinc = argc > 7 ? atoi(argv[7]) : false;
+
+    static char heap[4 * 1024 * 1024];
+    #if MICROPY_PY_THREAD
+    mp_thread_init();
+    #endif
+    mp_stack_ctrl_init();
+    gc_init(heap, heap + sizeof(heap));
+    mp_init();
+
+    nlr_buf_t nlr;
+    if (nlr_push(&nlr) != 0) {
+        mp_obj_print_exception(&mp_plat_print, MP_OBJ_FROM_PTR(nlr.ret_val));
+        return 1;
+    }
+
+    audiomixer_mixer_obj_t *mixer = m_new_obj_var(audiomixer_mixer_obj_t, mp_obj_t, voice_count);
+    common_hal_audiomixer_mixer_construct(mixer, voice_count, BUFFER_SIZE, bits, samples_signed,
+        CHANNEL_COUNT, SAMPLE_RATE, sinc);
+
+    // Give each voice a different length of noise so they wrap at different places.
+    audioio_rawsample_obj_t *samples = m_new(audioio_rawsample_obj_t, voice_count);
+    size_t *frame_counts = m_new(size_t, voice_count);
+    uint32_t seed = 1;
+    for (uint8_t v = 0; v < voice_count; v++) {
+        size_t len = 4096 + 1028 * v;
+        uint8_t *buffer = m_new(uint8_t, len);
+        for (size_t i = 0; i < len; i++) {
+            seed = seed * 1103515245 + 12345;
+            buffer[i] = seed >> 16;
+        }
+        frame_counts[v] = len / (bits / 8) / source_channels;
+        samples[v].base.type = &rawsample_type;
+        common_hal_audioio_rawsample_construct(&samples[v], buffer, len, bits / 8, samples_signed,
+            source_channels, source_rate);
+
+        audiomixer_mixervoice_obj_t *voice = m_new_obj(audiomixer_mixervoice_obj_t);
+        common_hal_audiomixer_mixervoice_construct(voice);
+        common_hal_audiomixer_mixervoice_set_parent(voice, mixer);
+        if (v == voice_count - 1 && voice_count >= 3) {
+            common_hal_audiomixer_mixervoice_set_level(voice, 0);
+        } else if (v > 0) {
+            common_hal_audiomixer_mixervoice_set_level(voice, 0.7);
+        }
+        common_hal_audiomixer_mixervoice_play(voice, MP_OBJ_FROM_PTR(&samples[v]), true);
+        mixer->voice[v] = MP_OBJ_FROM_PTR(voice);
+    }
+    nlr_pop();
+
+    // Compare the first buffers with mixing one sample at a time.
+    size_t lanes = mixer->len / (bits / 8);
+    uint32_t frames_per_buffer = lanes / CHANNEL_COUNT;
+    uint32_t step = ((uint64_t)source_rate << 16) / SAMPLE_RATE;
+    bool checked = !sinc || (step == 1 << 16 && source_channels == CHANNEL_COUNT);
+    size_t mismatches = 0;
+    for (uint32_t b = 0; b < CHECK_BUFFERS; b++) {
+        uint8_t *buffer;
+        uint32_t buffer_length;
+        audiomixer_mixer_get_buffer(mixer, false, 0, &buffer, &buffer_length);
+        for (size_t i = 0; checked && i < lanes; i++) {
+            size_t frame = b * frames_per_buffer + i / CHANNEL_COUNT;
+            int32_t expected = 0;
+            for (uint8_t v = 0; v < voice_count; v++) {
+                audiomixer_mixervoice_obj_t *voice = MP_OBJ_TO_PTR(mixer->voice[v]);
+                int32_t sample = get_voice_sample(&samples[v], frame_counts[v], frame, i % CHANNEL_COUNT,
+                    step, bits, samples_signed);
+                expected = saturate(expected + ((sample * voice->level) >> 15), bits);
+            }
+            if (get_sample(buffer, i, bits, samples_signed) != expected) {
+                mismatches++;
+            }
+        }
+    }
+
+    uint32_t buffers = seconds * SAMPLE_RATE / frames_per_buffer;
+    double start = now();
+    uint64_t start_cycles = cycles();
+    for (uint32_t b = 0; b < buffers; b++) {
+        uint8_t *buffer;
+        uint32_t buffer_length;
+        audiomixer_mixer_get_buffer(mixer, false, 0, &buffer, &buffer_length);
+    }
+    uint64_t elapsed_cycles = cycles() - start_cycles;
+    double elapsed = now() - start;
+
+    double frames_per_second = (double)buffers * frames_per_buffer / elapsed;
+    double voice_frames = (double)buffers * frames_per_buffer * voice_count;
+    printf("%d voices, %d-bit %s %s %d Hz to stereo %d Hz%s: %.0f frames/s, CPU share %.3f%% at 22.05 kHz, %.3f%% at 44.1 kHz\n",
+        voice_count, bits, samples_signed ? "signed" : "unsigned", source_channels == 1 ? "mono" : "stereo",
+        source_rate, SAMPLE_RATE, sinc ? " (sinc)" : "", frames_per_second,
+        100 * 22050 / frames_per_second, 100 * 44100 / frames_per_second);
+    printf("%.1f ns", elapsed * 1e9 / voice_frames);
+    if (elapsed_cycles != 0) {
+        printf(", %.1f cycles", elapsed_cycles / voice_frames);
+    }
+    printf(" per voice output frame (%s)\n",
+        !checked ? "output not checked" : mismatches == 0 ? "output ok" : "OUTPUT MISMATCH");
+    mp_deinit();
+    return mismatches != 0;
+}
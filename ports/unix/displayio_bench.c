@@ -0,0 +1,222 @@
+// Renders a BMP stored on a RAM backed FAT volume through displayio_tilegrid_fill_area and reports
+// pixels per second. Build with `make displayio_bench` and run as
+// `./displayio_bench [bits_per_pixel [width height [frames]]]`.
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "py/gc.h"
+#include "py/nlr.h"
+#include "py/runtime.h"
+#include "py/stackctrl.h"
+#include "py/mpthread.h"
+#include "lib/oofatfs/ff.h"
+#include "lib/oofatfs/diskio.h"
+#include "shared-bindings/displayio/ColorConverter.h"
+#include "shared-bindings/displayio/OnDiskBitmap.h"
+#include "shared-bindings/displayio/TileGrid.h"
+
+// Only the identity of the types matters to the renderer so the bindings aren't needed.
+const mp_obj_type_t displayio_bitmap_type = { { &mp_type_type } };
+const mp_obj_type_t displayio_colorconverter_type = { { &mp_type_type } };
+const mp_obj_type_t displayio_ondiskbitmap_type = { { &mp_type_type } };
+const mp_obj_type_t displayio_palette_type = { { &mp_type_type } };
+const mp_obj_type_t displayio_shape_type = { { &mp_type_type } };
+
+#define SECTOR_SIZE (512)
+#define SECTOR_COUNT (4096)
+
+STATIC uint8_t ramdisk[SECTOR_SIZE * SECTOR_COUNT];
+
+DRESULT disk_read(void *drv, BYTE *buff, DWORD sector, UINT count) {
+    memcpy(buff, ramdisk + sector * SECTOR_SIZE, count * SECTOR_SIZE);
+    return RES_OK;
+}
+
+DRESULT disk_write(void *drv, const BYTE *buff, DWORD sector, UINT count) {
+    memcpy(ramdisk + sector * SECTOR_SIZE, buff, count * SECTOR_SIZE);
+    return RES_OK;
+}
+
+DRESULT disk_ioctl(void *drv, BYTE cmd, void *buff) {
+    switch (cmd) {
+        case CTRL_SYNC:
+            return RES_OK;
+        case GET_SECTOR_COUNT:
+            *((DWORD*) buff) = SECTOR_COUNT;
+            return RES_OK;
+        case GET_SECTOR_SIZE:
+            *((WORD*) buff) = SECTOR_SIZE;
+            return RES_OK;
+        case GET_BLOCK_SIZE:
+            *((DWORD*) buff) = 1;
+            return RES_OK;
+        case IOCTL_INIT:
+        case IOCTL_STATUS:
+            *((DSTATUS*) buff) = 0;
+            return RES_OK;
+    }
+    return RES_PARERR;
+}
+
+STATIC void stderr_print_strn(void *env, const char *str, size_t len) {
+    fwrite(str, 1, len, stderr);
+}
+
+const mp_print_t mp_stderr_print = {NULL, stderr_print_strn};
+
+#if !MICROPY_VFS
+uint mp_import_stat(const char *path) {
+    return MP_IMPORT_STAT_NO_EXIST;
+}
+#endif
+
+void nlr_jump_fail(void *val) {
+    printf("FATAL: uncaught NLR %p\n", val);
+    exit(1);
+}
+
+STATIC void put16(uint8_t *p, uint16_t v) {
+    p[0] = v;
+    p[1] = v >> 8;
+}
+
+STATIC void put32(uint8_t *p, uint32_t v) {
+    put16(p, v);
+    put16(p + 2, v >> 16);
+}
+
+// Writes a bottom up BMP with a recognizable gradient to path.
+STATIC void write_bmp(FATFS *fatfs, const char *path, uint16_t width, uint16_t height, uint8_t bits_per_pixel) {
+    uint32_t colors = bits_per_pixel <= 8 ? 1 << bits_per_pixel : 0;
+    uint32_t stride = ((width * bits_per_pixel + 31) / 32) * 4;
+    uint32_t data_offset = 14 + 40 + colors * 4;
+    uint8_t header[14 + 40] = { 'B', 'M' };
+    put32(header + 2, data_offset + stride * height);
+    put32(header + 10, data_offset);
+    put32(header + 14, 40);
+    put32(header + 18, width);
+    put32(header + 22, height);
+    put16(header + 26, 1);
+    put16(header + 28, bits_per_pixel);
+    put32(header + 46, colors);
+
+    FIL fp;
+    UINT written;
+    f_open(fatfs, &fp, path, FA_WRITE | FA_CREATE_ALWAYS);
+    f_write(&fp, header, sizeof(header), &written);
+    for (uint32_t i = 0; i < colors; i++) {
+        uint8_t entry[4];
+        put32(entry, (i * 0x010203) & 0xffffff);
+        f_write(&fp, entry, 4, &written);
+    }
+    uint8_t *row = malloc(stride);
+    for (uint16_t y = 0; y < height; y++) {
+        memset(row, 0, stride);
+        for (uint16_t x = 0; x < width; x++) {
+            uint32_t value = x * 7 + y * 3;
+            if (bits_per_pixel < 8) {
+                uint8_t shift = 8 - bits_per_pixel - (x * bits_per_pixel) % 8;
+                row[x * bits_per_pixel / 8] |= (value & ((1 << bits_per_pixel) - 1)) << shift;
+            } else {
+                for (uint8_t b = 0; b < bits_per_pixel / 8; b++) {
+                    row[x * (bits_per_pixel / 8) + b] = value >> (8 * b);
+                }
+            }
+        }
+        f_write(&fp, row, stride, &written);
+    }
+    free(row);
+    f_close(&fp);
+}
+
+STATIC double now(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec / 1e9;
+}
+
+int main(int argc, char **argv) {
+    uint8_t bits_per_pixel = argc > 1 ? atoi(argv[1]) : 16;
+    uint16_t width = argc > 3 ? atoi(argv[2]) : 320;
+    uint16_t height = argc > 3 ? atoi(argv[3]) : 240;
+    uint32_t frames = argc > 4 ? atoi(argv[4]) : 10;
+
+    static char heap[4 * 1024 * 1024];
+    #if MICROPY_PY_THREAD
+    mp_thread_init();
+    #endif
+    mp_stack_ctrl_init();
+    gc_init(heap, heap + sizeof(heap));
+    mp_init();
+
+    static FATFS fatfs;
+    static uint8_t work[SECTOR_SIZE];
+    if (f_mkfs(&fatfs, FM_FAT | FM_SFD, 0, work, sizeof(work)) != FR_OK || f_mount(&fatfs) != FR_OK) {
+        printf("unable to create RAM disk\n");
+        return 1;
+    }
+    write_bmp(&fatfs, "/bench.bmp", width, height, bits_per_pixel);
+
+    pyb_file_obj_t file;
+    if (f_open(&fatfs, &file.fp, "/bench.bmp", FA_READ) != FR_OK) {
+        printf("unable to open bitmap\n");
+        return 1;
+    }
+
+    nlr_buf_t nlr;
+    if (nlr_push(&nlr) != 0) {
+        mp_obj_print_exception(&mp_plat_print, MP_OBJ_FROM_PTR(nlr.ret_val));
+        return 1;
+    }
+    displayio_ondiskbitmap_t bitmap;
+    bitmap.base.type = &displayio_ondiskbitmap_type;
+    common_hal_displayio_ondiskbitmap_construct(&bitmap, &file);
+
+    displayio_colorconverter_t converter;
+    converter.base.type = &displayio_colorconverter_type;
+    common_hal_displayio_colorconverter_construct(&converter, false);
+
+    displayio_tilegrid_t tilegrid;
+    common_hal_displayio_tilegrid_construct(&tilegrid, &bitmap, 1, 1, &converter, 1, 1,
+        width, height, 0, 0, 0);
+    nlr_pop();
+
+    displayio_buffer_transform_t transform = {
+        .x = 0, .y = 0, .dx = 1, .dy = 1, .scale = 1, .width = width, .height = height,
+    };
+    displayio_tilegrid_update_transform(&tilegrid, &transform);
+
+    _displayio_colorspace_t colorspace = { .depth = 16, .bytes_per_cell = 2 };
+
+    // Fill the screen a few rows at a time like a display with a small transfer buffer.
+    uint16_t rows_per_buffer = 8;
+    uint32_t buffer[width * rows_per_buffer / 2];
+    uint32_t mask[(width * rows_per_buffer + 31) / 32];
+    uint32_t checksum = 0;
+    double start = now();
+    for (uint32_t frame = 0; frame < frames; frame++) {
+        for (uint16_t y = 0; y < height; y += rows_per_buffer) {
+            displayio_area_t area = { .x1 = 0, .y1 = y, .x2 = width, .y2 = y + rows_per_buffer };
+            if (area.y2 > height) {
+                area.y2 = height;
+            }
+            memset(buffer, 0, sizeof(buffer));
+            memset(mask, 0, sizeof(mask));
+            displayio_tilegrid_fill_area(&tilegrid, &colorspace, &area, mask, buffer);
+            for (size_t i = 0; i < MP_ARRAY_SIZE(buffer); i++) {
+                checksum = checksum * 31 + buffer[i];
+            }
+        }
+    }
+    double elapsed = now() - start;
+
+    uint64_t pixels = (uint64_t) width * height * frames;
+    printf("%d bpp %dx%d: %u frames in %.3f s, %.0f pixels/s (checksum %08x)\n",
+        bits_per_pixel, width, height, (unsigned) frames, elapsed, pixels / elapsed, (unsigned) checksum);
+    f_close(&file.fp);
+    mp_deinit();
+    return 0;
+}
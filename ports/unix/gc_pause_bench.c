@@ -0,0 +1,161 @@
+// Churns a heap of tuples, lists, dicts and strs, timing every step, and prints a histogram of
+// the step times with the sweep done all at once after each collection and then a slice at a
+// time, along with the pauses recorded by the collector.
+// Build with `make gc_pause_bench` and run as
+// `./gc_pause_bench [heap_kib [live_objects [steps [sweep_budget]]]]`.
+// Each step replaces one of the live objects and makes a little garbage, so the heap fills up
+// and is collected every so often. The steps that run a collection or a slice of the sweep are
+// the slow ones.
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "py/gc.h"
+#include "py/lexer.h"
+#include "py/nlr.h"
+#include "py/runtime.h"
+#include "py/stackctrl.h"
+#include "py/mpthread.h"
+
+#define HISTOGRAM_BUCKETS (18)
+
+STATIC void stderr_print_strn(void *env, const char *str, size_t len) {
+    fwrite(str, 1, len, stderr);
+}
+
+const mp_print_t mp_stderr_print = {NULL, stderr_print_strn};
+
+#if !MICROPY_VFS
+uint mp_import_stat(const char *path) {
+    return MP_IMPORT_STAT_NO_EXIST;
+}
+#endif
+
+void nlr_jump_fail(void *val) {
+    printf("FATAL: uncaught NLR %p\n", val);
+    exit(1);
+}
+
+STATIC uint64_t now_ns(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec * 1000000000ull + ts.tv_nsec;
+}
+
+// Returns a new tuple of an int, a str, a list and a dict.
+STATIC mp_obj_t new_entry(uint32_t seed) {
+    char buf[48];
+    int len = snprintf(buf, sizeof(buf), "entry %08x with some text", (unsigned)seed);
+    mp_obj_t items[4] = {
+        mp_obj_new_int_from_uint(seed),
+        mp_obj_new_str(buf, len),
+        mp_obj_new_list(0, NULL),
+        mp_obj_new_dict(2),
+    };
+    for (int i = 0; i < 4; i++) {
+        mp_obj_list_append(items[2], mp_obj_new_int_from_uint(seed + i));
+    }
+    mp_obj_dict_store(items[3], MP_OBJ_NEW_SMALL_INT(0), items[1]);
+    mp_obj_dict_store(items[3], MP_OBJ_NEW_SMALL_INT(1), items[2]);
+    return mp_obj_new_tuple(4, items);
+}
+
+STATIC void run(mp_obj_t live, size_t live_objects, size_t steps, size_t budget) {
+    MP_STATE_MEM(gc_sweep_budget) = budget / BYTES_PER_BLOCK;
+    gc_collect();
+    gc_sweep_finish();
+    MP_STATE_MEM(gc_pause_count) = 0;
+    MP_STATE_MEM(gc_pause_max) = 0;
+    MP_STATE_MEM(gc_pause_total) = 0;
+    size_t collections = MP_STATE_MEM(gc_collection_count);
+
+    // bucket i counts the steps that took less than 2**i us, and the last one the rest
+    size_t histogram[HISTOGRAM_BUCKETS] = {0};
+    uint64_t max_ns = 0;
+    uint64_t total_ns = 0;
+    uint32_t seed = 1;
+    for (size_t step = 0; step < steps; step++) {
+        seed = seed * 1103515245 + 12345;
+        uint64_t start = now_ns();
+        mp_obj_t entry = new_entry(seed);
+        mp_obj_subscr(live, MP_OBJ_NEW_SMALL_INT((seed >> 8) % live_objects), entry);
+        char garbage[64];
+        memset(garbage, seed, sizeof(garbage));
+        mp_obj_new_bytes((const byte *)garbage, sizeof(garbage));
+        uint64_t elapsed = now_ns() - start;
+
+        total_ns += elapsed;
+        max_ns = MAX(max_ns, elapsed);
+        size_t bucket = 0;
+        while (bucket < HISTOGRAM_BUCKETS - 1 && elapsed >= (1000ull << bucket)) {
+            bucket++;
+        }
+        histogram[bucket]++;
+    }
+
+    if (budget == 0) {
+        printf("sweep all at once:\n");
+    } else {
+        printf("sweep %u bytes at a time:\n", (unsigned)budget);
+    }
+    for (size_t i = 0; i < HISTOGRAM_BUCKETS; i++) {
+        if (histogram[i] == 0) {
+            continue;
+        }
+        if (i == HISTOGRAM_BUCKETS - 1) {
+            printf("  >= %8u us: %u\n", 1u << (i - 1), (unsigned)histogram[i]);
+        } else {
+            printf("  <  %8u us: %u\n", 1u << i, (unsigned)histogram[i]);
+        }
+    }
+    printf("  %u steps, %.3f us per step, longest %.1f us; %u collections, %u pauses, longest %u us, total %u us\n",
+        (unsigned)steps, total_ns / 1e3 / steps, max_ns / 1e3,
+        (unsigned)(MP_STATE_MEM(gc_collection_count) - collections), (unsigned)MP_STATE_MEM(gc_pause_count),
+        (unsigned)MP_STATE_MEM(gc_pause_max), (unsigned)MP_STATE_MEM(gc_pause_total));
+}
+
+// Separate from main so that its locals are on the part of the stack that the collector scans.
+STATIC MP_NOINLINE void bench(size_t live_objects, size_t steps, size_t budget, size_t heap_kib) {
+    mp_obj_t live = mp_obj_new_list(live_objects, NULL);
+    for (size_t i = 0; i < live_objects; i++) {
+        mp_obj_subscr(live, MP_OBJ_NEW_SMALL_INT(i), new_entry(i));
+    }
+    gc_info_t info;
+    gc_collect();
+    gc_sweep_finish();
+    gc_info(&info);
+    printf("%u KiB heap, %u live objects using %u KiB\n", (unsigned)heap_kib, (unsigned)live_objects,
+        (unsigned)(info.used / 1024));
+
+    run(live, live_objects, steps, 0);
+    run(live, live_objects, steps, budget);
+}
+
+int main(int argc, char **argv) {
+    size_t heap_kib = argc > 1 ? atoi(argv[1]) : 4096;
+    size_t live_objects = argc > 2 ? atoi(argv[2]) : 4096;
+    size_t steps = argc > 3 ? atoi(argv[3]) : 1000000;
+    size_t budget = argc > 4 ? atoi(argv[4]) : MICROPY_GC_SWEEP_BUDGET;
+
+    char *heap = malloc(heap_kib * 1024);
+    #if MICROPY_PY_THREAD
+    mp_thread_init();
+    #endif
+    mp_stack_ctrl_init();
+    gc_init(heap, heap + heap_kib * 1024);
+    mp_init();
+
+    nlr_buf_t nlr;
+    if (nlr_push(&nlr) != 0) {
+        mp_obj_print_exception(&mp_plat_print, MP_OBJ_FROM_PTR(nlr.ret_val));
+        return 1;
+    }
+    bench(live_objects, steps, budget, heap_kib);
+    nlr_pop();
+
+    mp_deinit();
+    free(heap);
+    return 0;
+}
@@ -164,6 +164,7 @@ STATIC int execute_from_lexer(int source_kind, const void *source, mp_parse_inpu
 
 #if MICROPY_USE_READLINE == 1
 #include "lib/mp-readline/readline.h"
+#include "lib/utils/pyexec.h"
 #else
 STATIC char *strjoin(const char *s1, int sep_char, const char *s2) {
     int l1 = strlen(s1);
@@ -208,6 +209,21 @@ STATIC int do_repl(void) {
             mp_hal_stdio_mode_orig();
             vstr_clear(&line);
             return 0;
+        } else if (ret == CHAR_CTRL_A) {
+            // raw REPL, as used by tools/pyboard.py
+            mp_hal_stdout_tx_str("\r\n");
+            while (pyexec_raw_repl() & PYEXEC_FORCED_EXIT) {
+                if (mp_hal_stdin_eof()) {
+                    // the host has gone, and every read from now on would give another Ctrl-D
+                    mp_hal_stdio_mode_orig();
+                    vstr_clear(&line);
+                    return 0;
+                }
+                // Ctrl-D soft resets a board. There is nothing to reset here but acknowledge it
+                // the same way so that hosts can follow the usual handshake.
+                mp_hal_stdout_tx_str("soft reboot\r\n");
+            }
+            goto input_restart;
         } else if (ret == CHAR_CTRL_E) {
             // paste mode
             mp_hal_stdout_tx_str("\npaste mode; Ctrl-C to cancel, Ctrl-D to finish\n=== ");
@@ -70,10 +70,41 @@
 #ifndef MICROPY_OPT_CACHE_MAP_LOOKUP_IN_BYTECODE
 #define MICROPY_OPT_CACHE_MAP_LOOKUP_IN_BYTECODE (1)
 #endif
+#ifndef MICROPY_OPT_ATTR_INLINE_CACHE
+#define MICROPY_OPT_ATTR_INLINE_CACHE (1)
+#endif
+#ifndef MICROPY_OPT_STR_FIND_SKIP_TABLE
+#define MICROPY_OPT_STR_FIND_SKIP_TABLE (1)
+#endif
+#ifndef MICROPY_OPT_MPZ_KARATSUBA
+#define MICROPY_OPT_MPZ_KARATSUBA   (1)
+#endif
+#ifndef MICROPY_OPT_MPZ_MONTGOMERY
+#define MICROPY_OPT_MPZ_MONTGOMERY  (1)
+#endif
+#ifndef MICROPY_OPT_MPZ_AS_STR_SPLIT
+#define MICROPY_OPT_MPZ_AS_STR_SPLIT (1)
+#endif
+#ifndef MICROPY_QSTR_HASH_INDEX
+#define MICROPY_QSTR_HASH_INDEX     (1)
+#endif
+#ifndef MICROPY_GC_FREE_RUN_INDEX
+#define MICROPY_GC_FREE_RUN_INDEX   (1)
+#endif
+#ifndef MICROPY_GC_NO_SCAN
+#define MICROPY_GC_NO_SCAN          (1)
+#endif
+#ifndef MICROPY_GC_INCREMENTAL_SWEEP
+#define MICROPY_GC_INCREMENTAL_SWEEP (1)
+#endif
+#ifndef MICROPY_GC_FAST_SWEEP
+#define MICROPY_GC_FAST_SWEEP       (1)
+#endif
 #define MICROPY_CAN_OVERRIDE_BUILTINS (1)
 #define MICROPY_PY_FUNCTION_ATTRS   (1)
 #define MICROPY_PY_DESCRIPTORS      (1)
 #define MICROPY_PY_BUILTINS_STR_UNICODE (1)
+#define MICROPY_PY_BUILTINS_STR_UNICODE_INDEX (1)
 #define MICROPY_PY_BUILTINS_STR_CENTER (1)
 #define MICROPY_PY_BUILTINS_STR_PARTITION (1)
 #define MICROPY_PY_BUILTINS_STR_SPLITLINES (1)
@@ -95,6 +126,9 @@
 #else
     #define MICROPY_PY_SYS_PLATFORM  "linux"
 #endif
+// Names used in the version banner by lib/utils/pyexec.c.
+#define MICROPY_HW_BOARD_NAME       "unix"
+#define MICROPY_HW_MCU_NAME         MICROPY_PY_SYS_PLATFORM
 #define MICROPY_PY_SYS_MAXSIZE      (1)
 #define MICROPY_PY_SYS_STDFILES     (1)
 #define MICROPY_PY_SYS_EXC_INFO     (1)
@@ -120,7 +154,14 @@
 #define MICROPY_PY_UCTYPES          (1)
 #define MICROPY_PY_UZLIB            (1)
 #define MICROPY_PY_UJSON            (1)
+#define MICROPY_PY_UJSON_ITERLOAD   (1)
 #define MICROPY_PY_URE              (1)
+#ifndef MICROPY_PY_URE_PIKEVM
+#define MICROPY_PY_URE_PIKEVM       (1)
+#endif
+#ifndef MICROPY_PY_URE_CACHE_SIZE
+#define MICROPY_PY_URE_CACHE_SIZE   (8)
+#endif
 #define MICROPY_PY_UHEAPQ           (1)
 #define MICROPY_PY_UTIMEQ           (1)
 #define MICROPY_PY_UHASHLIB         (1)
@@ -36,6 +36,10 @@ bool mp_hal_is_interrupted(void);
 void mp_hal_stdio_mode_raw(void);
 void mp_hal_stdio_mode_orig(void);
 
+// Whether stdin has reached EOF or failed, after which mp_hal_stdin_rx_chr
+// returns Ctrl-D every time.
+bool mp_hal_stdin_eof(void);
+
 #if MICROPY_USE_READLINE == 1 && MICROPY_PY_BUILTINS_INPUT
 #include "py/misc.h"
 #include "lib/mp-readline/readline.h"
@@ -24,6 +24,7 @@
  * THE SOFTWARE.
  */
 
+#include <errno.h>
 #include <unistd.h>
 #include <stdlib.h>
 #include <string.h>
@@ -144,6 +145,12 @@ static int call_dupterm_read(size_t idx) {
 }
 #endif
 
+STATIC bool stdin_eof;
+
+bool mp_hal_stdin_eof(void) {
+    return stdin_eof;
+}
+
 int mp_hal_stdin_rx_chr(void) {
     unsigned char c;
 #if MICROPY_PY_OS_DUPTERM
@@ -163,9 +170,14 @@ int mp_hal_stdin_rx_chr(void) {
     } else {
         main_term:;
 #endif
-        int ret = read(0, &c, 1);
-        if (ret == 0) {
-            c = 4; // EOF, ctrl-D
+        int ret;
+        do {
+            ret = read(0, &c, 1);
+        } while (ret < 0 && errno == EINTR);
+        if (ret <= 0) {
+            // EOF, or an error such as the terminal hanging up
+            stdin_eof = true;
+            c = 4; // ctrl-D
         } else if (c == '\n') {
             c = '\r';
         }
@@ -174,6 +174,7 @@ STATIC void do_execute_raw_code(mp_obj_t module_obj, mp_raw_code_t *raw_code, co
     nlr_buf_t nlr;
     if (nlr_push(&nlr) == 0) {
         mp_obj_t module_fun = mp_make_function_from_raw_code(raw_code, MP_OBJ_NULL, MP_OBJ_NULL);
+        mp_map_reserve(&mod_globals->map, mod_globals->map.used + mp_obj_fun_get_names_hint(module_fun));
         mp_call_function_0(module_fun);
 
         // finish nlr block, restore context
@@ -464,6 +464,7 @@ SRC_SHARED_MODULE_ALL = \
 	audioio/__init__.c \
 	audiomixer/Mixer.c \
 	audiomixer/MixerVoice.c \
+	audiomixer/Resampler.c \
 	audiomixer/__init__.c \
 	audiomp3/MP3Decoder.c \
 	audiomp3/__init__.c \
@@ -493,6 +494,7 @@ SRC_SHARED_MODULE_ALL = \
 	displayio/Shape.c \
 	displayio/TileGrid.c \
 	displayio/__init__.c \
+	displayio/area.c \
 	fontio/BuiltinFont.c \
 	fontio/__init__.c \
 	framebufferio/FramebufferDisplay.c \
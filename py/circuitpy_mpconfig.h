@@ -96,6 +96,7 @@
 #define MICROPY_PY_BUILTINS_SLICE        (1)
 #define MICROPY_PY_BUILTINS_SLICE_ATTRS  (1)
 #define MICROPY_PY_BUILTINS_STR_UNICODE  (1)
+#define MICROPY_PY_BUILTINS_STR_UNICODE_INDEX (CIRCUITPY_FULL_BUILD)
 
 #define MICROPY_PY_CMATH                 (0)
 #define MICROPY_PY_COLLECTIONS           (1)
@@ -198,9 +199,23 @@ typedef long mp_off_t;
 #ifndef MICROPY_PY_COLLECTIONS_ORDEREDDICT
 #define MICROPY_PY_COLLECTIONS_ORDEREDDICT    (CIRCUITPY_FULL_BUILD)
 #endif
+#define MICROPY_GC_FREE_RUN_INDEX             (CIRCUITPY_FULL_BUILD)
+#define MICROPY_GC_NO_SCAN                    (CIRCUITPY_FULL_BUILD)
+#define MICROPY_GC_INCREMENTAL_SWEEP          (CIRCUITPY_FULL_BUILD)
+#define MICROPY_GC_FAST_SWEEP                 (CIRCUITPY_FULL_BUILD)
+#define MICROPY_GC_TICKS_US()                 supervisor_ticks_us32()
+#define MICROPY_QSTR_HASH_INDEX               (CIRCUITPY_FULL_BUILD)
+#define MICROPY_OPT_ATTR_INLINE_CACHE         (CIRCUITPY_FULL_BUILD)
+#define MICROPY_OPT_ATTR_INLINE_CACHE_SIZE    (32)
+#define MICROPY_OPT_STR_FIND_SKIP_TABLE       (CIRCUITPY_FULL_BUILD)
+#define MICROPY_OPT_MPZ_KARATSUBA             (CIRCUITPY_FULL_BUILD)
+#define MICROPY_OPT_MPZ_MONTGOMERY            (CIRCUITPY_FULL_BUILD)
+#define MICROPY_OPT_MPZ_AS_STR_SPLIT          (CIRCUITPY_FULL_BUILD)
 #define MICROPY_PY_URE_MATCH_GROUPS           (CIRCUITPY_RE)
 #define MICROPY_PY_URE_MATCH_SPAN_START_END   (CIRCUITPY_RE)
 #define MICROPY_PY_URE_SUB                    (CIRCUITPY_RE)
+#define MICROPY_PY_URE_PIKEVM                 (CIRCUITPY_FULL_BUILD)
+#define MICROPY_PY_URE_CACHE_SIZE             (CIRCUITPY_FULL_BUILD ? 8 : 0)
 
 // LONGINT_IMPL_xxx are defined in the Makefile.
 //
@@ -392,6 +407,10 @@ extern const struct _mp_obj_module_t terminalio_module;
 #ifndef CIRCUITPY_DISPLAY_LIMIT
 #define CIRCUITPY_DISPLAY_LIMIT (1)
 #endif
+// Number of decoded rows each OnDiskBitmap keeps in RAM. 0 reads every pixel from the file.
+#ifndef CIRCUITPY_ONDISKBITMAP_CACHE_ROWS
+#define CIRCUITPY_ONDISKBITMAP_CACHE_ROWS (CIRCUITPY_FULL_BUILD ? 2 : 1)
+#endif
 #else
 #define DISPLAYIO_MODULE
 #define CIRCUITPY_DISPLAY_LIMIT (0)
@@ -488,6 +507,7 @@ extern const struct _mp_obj_module_t ipaddress_module;
 
 #if CIRCUITPY_JSON
 #define MICROPY_PY_UJSON (1)
+#define MICROPY_PY_UJSON_ITERLOAD (CIRCUITPY_FULL_BUILD)
 #define MICROPY_PY_IO (1)
 #define JSON_MODULE            { MP_ROM_QSTR(MP_QSTR_json), MP_ROM_PTR(&mp_module_ujson) },
 #else
@@ -410,6 +410,20 @@ void mp_emit_bc_end_pass(emit_t *emit) {
 
     emit_write_code_info_byte(emit, 0); // end of line number info
 
+    if (emit->scope->kind == SCOPE_MODULE || emit->scope->kind == SCOPE_CLASS) {
+        // Write the number of names stored by this scope, so that the dict they
+        // go into can be allocated at its final size; see mp_obj_fun_get_names_hint.
+        size_t n_names = 0;
+        for (int i = 0; i < emit->scope->id_info_len; i++) {
+            id_info_t *id = &emit->scope->id_info[i];
+            if ((id->flags & ID_FLAG_IS_STORED) && (id->kind == ID_INFO_KIND_GLOBAL_IMPLICIT
+                || (emit->scope->kind == SCOPE_MODULE && id->kind == ID_INFO_KIND_GLOBAL_EXPLICIT))) {
+                n_names += 1;
+            }
+        }
+        emit_write_code_info_uint(emit, n_names);
+    }
+
     #if MICROPY_PERSISTENT_CODE
     assert(emit->pass <= MP_PASS_STACK_SIZE || (emit->ct_num_obj == emit->ct_cur_obj));
     emit->ct_num_obj = emit->ct_cur_obj;
@@ -53,6 +53,10 @@ void mp_emit_common_get_id_for_modification(scope_t *scope, qstr qst) {
         // rebind as a local variable
         id->kind = ID_INFO_KIND_LOCAL;
     }
+    if (!SCOPE_IS_FUNC_LIKE(scope->kind)) {
+        // used to size the dict that receives the names of a module or class
+        id->flags |= ID_FLAG_IS_STORED;
+    }
 }
 
 void mp_emit_common_id_op(emit_t *emit, const mp_emit_method_table_id_ops_t *emit_method_table, scope_t *scope, qstr qst) {
@@ -37,6 +37,15 @@
 #include "shared-module/memorymonitor/__init__.h"
 #endif
 
+#if MICROPY_GC_INCREMENTAL_SWEEP
+#if CIRCUITPY
+#include "supervisor/background_callback.h"
+#include "supervisor/shared/tick.h"
+#else
+#include "py/mphal.h"
+#endif
+#endif
+
 #if MICROPY_ENABLE_GC
 
 #if MICROPY_DEBUG_VERBOSE // print debugging info
@@ -78,6 +87,10 @@
 #define ATB_HEAD_TO_MARK(block) do { MP_STATE_MEM(gc_alloc_table_start)[(block) / BLOCKS_PER_ATB] |= (AT_MARK << BLOCK_SHIFT(block)); } while (0)
 #define ATB_MARK_TO_HEAD(block) do { MP_STATE_MEM(gc_alloc_table_start)[(block) / BLOCKS_PER_ATB] &= (~(AT_TAIL << BLOCK_SHIFT(block))); } while (0)
 
+// Whether the block is the head of a chain, marked or not.  Outside of a collection heads are
+// only marked when MICROPY_GC_INCREMENTAL_SWEEP has left them for a later slice of the sweep.
+#define ATB_IS_HEAD(block) ((ATB_GET_KIND(block) & AT_HEAD) != 0)
+
 #define BLOCK_FROM_PTR(ptr) (((byte*)(ptr) - MP_STATE_MEM(gc_pool_start)) / BYTES_PER_BLOCK)
 #define PTR_FROM_BLOCK(block) (((block) * BYTES_PER_BLOCK + (uintptr_t)MP_STATE_MEM(gc_pool_start)))
 #define ATB_FROM_BLOCK(bl) ((bl) / BLOCKS_PER_ATB)
@@ -93,6 +106,39 @@
 #define FTB_CLEAR(block) do { MP_STATE_MEM(gc_finaliser_table_start)[(block) / BLOCKS_PER_FTB] &= (~(1 << ((block) & 7))); } while (0)
 #endif
 
+#if MICROPY_GC_NO_SCAN
+// NTB = no-scan table byte
+// if set, then the corresponding head block and its tail hold no heap pointers and are
+// marked without being scanned; written on every allocation so it is only valid for heads
+
+#define BLOCKS_PER_NTB (8)
+
+#define NTB_GET(block) ((MP_STATE_MEM(gc_no_scan_table_start)[(block) / BLOCKS_PER_NTB] >> ((block) & 7)) & 1)
+#define NTB_SET(block) do { MP_STATE_MEM(gc_no_scan_table_start)[(block) / BLOCKS_PER_NTB] |= (1 << ((block) & 7)); } while (0)
+#define NTB_CLEAR(block) do { MP_STATE_MEM(gc_no_scan_table_start)[(block) / BLOCKS_PER_NTB] &= (~(1 << ((block) & 7))); } while (0)
+#endif
+
+#if MICROPY_GC_FREE_RUN_INDEX
+// ATW = allocation table word, the 4 ATBs (16 blocks) searched together by gc_alloc
+// FATW = full ATW table bit
+// if set, then none of the corresponding blocks are free; a full ATW may have its bit
+// clear (until it is rebuilt by a sweep) but a set bit is always correct
+
+#define BLOCKS_PER_ATW (16)
+#define ATW_BLOCK_BITS (0x55555555)
+
+#define FATW_GET(w) ((MP_STATE_MEM(gc_full_atw_table_start)[(w) / 32] >> ((w) & 31)) & 1)
+#define FATW_SET(w) do { MP_STATE_MEM(gc_full_atw_table_start)[(w) / 32] |= (1u << ((w) & 31)); } while (0)
+#define FATW_CLEAR(w) do { MP_STATE_MEM(gc_full_atw_table_start)[(w) / 32] &= (~(1u << ((w) & 31))); } while (0)
+#endif
+
+#if MICROPY_GC_INCREMENTAL_SWEEP
+// While a sweep is pending the blocks from gc_sweep_block onwards still carry the marks of the
+// last collection: marked heads are live and unmarked heads are garbage that hasn't been freed.
+// gc_alloc only allocates below gc_sweep_block, since a head allocated above it would be freed.
+#define GC_SWEEP_PENDING() (MP_STATE_MEM(gc_sweep_block) < MP_STATE_MEM(gc_alloc_table_byte_len) * BLOCKS_PER_ATB)
+#endif
+
 #if MICROPY_PY_THREAD && !MICROPY_PY_THREAD_GIL
 #define GC_ENTER() mp_thread_mutex_lock(&MP_STATE_MEM(gc_mutex), 1)
 #define GC_EXIT() mp_thread_mutex_unlock(&MP_STATE_MEM(gc_mutex))
@@ -112,22 +158,178 @@ void __attribute__ ((noinline)) gc_log_change(uint32_t start_block, uint32_t len
 #pragma GCC pop_options
 #endif
 
+#if MICROPY_GC_FREE_RUN_INDEX
+// Returns the low bit of the ATB entry of every used block in the given ATW.
+// Blocks past the end of the heap are reported as used.
+STATIC uint32_t gc_atw_used(size_t w) {
+    const byte *atb = MP_STATE_MEM(gc_alloc_table_start) + w * (BLOCKS_PER_ATW / BLOCKS_PER_ATB);
+    size_t n_atb = MP_STATE_MEM(gc_alloc_table_byte_len) - w * (BLOCKS_PER_ATW / BLOCKS_PER_ATB);
+    uint32_t a;
+    if (n_atb >= BLOCKS_PER_ATW / BLOCKS_PER_ATB) {
+        a = atb[0] | (uint32_t)atb[1] << 8 | (uint32_t)atb[2] << 16 | (uint32_t)atb[3] << 24;
+    } else {
+        a = 0xffffffff;
+        for (size_t i = 0; i < n_atb; i++) {
+            a &= ~((uint32_t)0xff << (8 * i));
+            a |= (uint32_t)atb[i] << (8 * i);
+        }
+    }
+    return (a | (a >> 1)) & ATW_BLOCK_BITS;
+}
+
+// Call after any of the blocks start..end (inclusive) went from free to used.
+STATIC void gc_atw_blocks_used(size_t start_block, size_t end_block) {
+    for (size_t w = start_block / BLOCKS_PER_ATW; w <= end_block / BLOCKS_PER_ATW; w++) {
+        if (gc_atw_used(w) == ATW_BLOCK_BITS) {
+            FATW_SET(w);
+        }
+    }
+}
+
+// Call after any of the blocks start..end (inclusive) were freed.
+STATIC void gc_atw_blocks_freed(size_t start_block, size_t end_block) {
+    for (size_t w = start_block / BLOCKS_PER_ATW; w <= end_block / BLOCKS_PER_ATW; w++) {
+        FATW_CLEAR(w);
+    }
+}
+
+// Call after the blocks start..end (exclusive) were swept.
+STATIC void gc_atw_rebuild(size_t start_block, size_t end_block) {
+    for (size_t w = start_block / BLOCKS_PER_ATW; w * BLOCKS_PER_ATW < end_block; w++) {
+        if (gc_atw_used(w) == ATW_BLOCK_BITS) {
+            FATW_SET(w);
+        } else {
+            FATW_CLEAR(w);
+        }
+    }
+}
+
+// Returns the ATW_BLOCK_BITS of the blocks of the ATW starting at base that lie
+// within lo..hi (inclusive).
+STATIC uint32_t gc_atw_in_range(size_t base, size_t lo, size_t hi) {
+    uint32_t in_range = ATW_BLOCK_BITS;
+    if (lo > base) {
+        in_range &= ~0u << (2 * (lo - base));
+    }
+    if (hi < base + BLOCKS_PER_ATW - 1) {
+        in_range &= (1u << (2 * (hi - base + 1))) - 1;
+    }
+    return in_range;
+}
+
+// Look for a run of n_blocks free blocks within the ATBs first_atb..last_atb, an ATW
+// at a time.  This finds the same run as the block by block search in gc_alloc:
+// searching up it returns the last block of the lowest run, searching down the first
+// block of the highest run.  If may_stop is set then meeting a used block on the far
+// side of crossover_block ends the search.  Returns SIZE_MAX if nothing was found.
+STATIC size_t gc_find_free_run(size_t first_atb, size_t last_atb, size_t n_blocks, int8_t direction, bool may_stop, size_t crossover_block) {
+    if (first_atb > last_atb) {
+        return SIZE_MAX;
+    }
+    size_t lo = first_atb * BLOCKS_PER_ATB;
+    size_t hi = last_atb * BLOCKS_PER_ATB + BLOCKS_PER_ATB - 1;
+    size_t n_free = 0;
+    if (direction == 1) {
+        for (size_t w = lo / BLOCKS_PER_ATW; w <= hi / BLOCKS_PER_ATW; w++) {
+            size_t base = w * BLOCKS_PER_ATW;
+            if (FATW_GET(w)) {
+                if (may_stop && MIN(hi, base + BLOCKS_PER_ATW - 1) >= crossover_block) {
+                    return SIZE_MAX;
+                }
+                n_free = 0;
+                continue;
+            }
+            uint32_t in_range = gc_atw_in_range(base, lo, hi);
+            uint32_t used_in_range = gc_atw_used(w) & in_range;
+            uint32_t used = used_in_range | (ATW_BLOCK_BITS & ~in_range);
+            for (size_t b = 0;;) {
+                // blocks b..t-1 of this ATW are free and block t is used
+                size_t t = used == 0 ? BLOCKS_PER_ATW : (size_t)__builtin_ctz(used) / 2;
+                if (n_free + (t - b) >= n_blocks) {
+                    return base + b + (n_blocks - n_free) - 1;
+                }
+                if (t == BLOCKS_PER_ATW) {
+                    n_free += t - b;
+                    break;
+                }
+                if (may_stop && ((used_in_range >> (2 * t)) & 1) && base + t >= crossover_block) {
+                    return SIZE_MAX;
+                }
+                n_free = 0;
+                b = t + 1;
+                used &= used - 1;
+            }
+        }
+    } else {
+        for (size_t w = hi / BLOCKS_PER_ATW + 1; w-- > lo / BLOCKS_PER_ATW;) {
+            size_t base = w * BLOCKS_PER_ATW;
+            if (FATW_GET(w)) {
+                if (may_stop && MAX(lo, base) < crossover_block) {
+                    return SIZE_MAX;
+                }
+                n_free = 0;
+                continue;
+            }
+            uint32_t in_range = gc_atw_in_range(base, lo, hi);
+            uint32_t used_in_range = gc_atw_used(w) & in_range;
+            uint32_t used = used_in_range | (ATW_BLOCK_BITS & ~in_range);
+            for (int b = BLOCKS_PER_ATW - 1;;) {
+                // blocks b down to t+1 of this ATW are free and block t is used
+                int t = used == 0 ? -1 : (31 - __builtin_clz(used)) / 2;
+                if (n_free + (b - t) >= n_blocks) {
+                    return base + b - (n_blocks - n_free) + 1;
+                }
+                if (t < 0) {
+                    n_free += b - t;
+                    break;
+                }
+                if (may_stop && ((used_in_range >> (2 * t)) & 1) && base + t < crossover_block) {
+                    return SIZE_MAX;
+                }
+                n_free = 0;
+                b = t - 1;
+                used &= ~(1u << (2 * t));
+            }
+        }
+    }
+    return SIZE_MAX;
+}
+#endif
+
 // TODO waste less memory; currently requires that all entries in alloc_table have a corresponding block in pool
 void gc_init(void *start, void *end) {
     // align end pointer on block boundary
     end = (void*)((uintptr_t)end & (~(BYTES_PER_BLOCK - 1)));
     DEBUG_printf("Initializing GC heap: %p..%p = " UINT_FMT " bytes\n", start, end, (byte*)end - (byte*)start);
 
-    // calculate parameters for GC (T=total, A=alloc table, F=finaliser table, P=pool; all in bytes):
-    // T = A + F + P
+    #if MICROPY_GC_FREE_RUN_INDEX
+    // put the full ATW table first, sized as if the whole area was pool
+    start = (void*)(((uintptr_t)start + sizeof(uint32_t) - 1) & ~(sizeof(uint32_t) - 1));
+    size_t gc_full_atw_table_word_len = ((byte*)end - (byte*)start) / BYTES_PER_BLOCK / BLOCKS_PER_ATW / 32 + 1;
+    MP_STATE_MEM(gc_full_atw_table_start) = (uint32_t*)start;
+    memset(start, 0, gc_full_atw_table_word_len * sizeof(uint32_t));
+    start = MP_STATE_MEM(gc_full_atw_table_start) + gc_full_atw_table_word_len;
+    #endif
+
+    // calculate parameters for GC (T=total, A=alloc table, F=finaliser table, N=no-scan table,
+    // P=pool; all in bytes):
+    // T = A + F + N + P
     //     F = A * BLOCKS_PER_ATB / BLOCKS_PER_FTB
+    //     N = A * BLOCKS_PER_ATB / BLOCKS_PER_NTB
     //     P = A * BLOCKS_PER_ATB * BYTES_PER_BLOCK
-    // => T = A * (1 + BLOCKS_PER_ATB / BLOCKS_PER_FTB + BLOCKS_PER_ATB * BYTES_PER_BLOCK)
+    // => T = A * (1 + BLOCKS_PER_ATB / BLOCKS_PER_FTB + BLOCKS_PER_ATB / BLOCKS_PER_NTB + BLOCKS_PER_ATB * BYTES_PER_BLOCK)
     size_t total_byte_len = (byte*)end - (byte*)start;
+    size_t bits_per_atb = BITS_PER_BYTE + BITS_PER_BYTE * BLOCKS_PER_ATB * BYTES_PER_BLOCK;
 #if MICROPY_ENABLE_FINALISER
-    MP_STATE_MEM(gc_alloc_table_byte_len) = total_byte_len * BITS_PER_BYTE / (BITS_PER_BYTE + BITS_PER_BYTE * BLOCKS_PER_ATB / BLOCKS_PER_FTB + BITS_PER_BYTE * BLOCKS_PER_ATB * BYTES_PER_BLOCK);
-#else
-    MP_STATE_MEM(gc_alloc_table_byte_len) = total_byte_len / (1 + BITS_PER_BYTE / 2 * BYTES_PER_BLOCK);
+    bits_per_atb += BITS_PER_BYTE * BLOCKS_PER_ATB / BLOCKS_PER_FTB;
+#endif
+#if MICROPY_GC_NO_SCAN
+    bits_per_atb += BITS_PER_BYTE * BLOCKS_PER_ATB / BLOCKS_PER_NTB;
+#endif
+    MP_STATE_MEM(gc_alloc_table_byte_len) = total_byte_len * BITS_PER_BYTE / bits_per_atb;
+#if MICROPY_GC_NO_SCAN
+    // Keep the FTBs and NTBs to whole bytes, otherwise rounding them up may leave no room.
+    MP_STATE_MEM(gc_alloc_table_byte_len) &= ~(size_t)1;
 #endif
 
     MP_STATE_MEM(gc_alloc_table_start) = (byte*)start;
@@ -137,6 +339,14 @@ void gc_init(void *start, void *end) {
     MP_STATE_MEM(gc_finaliser_table_start) = MP_STATE_MEM(gc_alloc_table_start) + MP_STATE_MEM(gc_alloc_table_byte_len);
 #endif
 
+#if MICROPY_GC_NO_SCAN
+    size_t gc_no_scan_table_byte_len = (MP_STATE_MEM(gc_alloc_table_byte_len) * BLOCKS_PER_ATB + BLOCKS_PER_NTB - 1) / BLOCKS_PER_NTB;
+    MP_STATE_MEM(gc_no_scan_table_start) = MP_STATE_MEM(gc_alloc_table_start) + MP_STATE_MEM(gc_alloc_table_byte_len);
+    #if MICROPY_ENABLE_FINALISER
+    MP_STATE_MEM(gc_no_scan_table_start) += gc_finaliser_table_byte_len;
+    #endif
+#endif
+
     size_t gc_pool_block_len = MP_STATE_MEM(gc_alloc_table_byte_len) * BLOCKS_PER_ATB;
     MP_STATE_MEM(gc_pool_start) = (byte*)end - gc_pool_block_len * BYTES_PER_BLOCK;
     MP_STATE_MEM(gc_pool_end) = end;
@@ -144,6 +354,9 @@ void gc_init(void *start, void *end) {
 #if MICROPY_ENABLE_FINALISER
     assert(MP_STATE_MEM(gc_pool_start) >= MP_STATE_MEM(gc_finaliser_table_start) + gc_finaliser_table_byte_len);
 #endif
+#if MICROPY_GC_NO_SCAN
+    assert(MP_STATE_MEM(gc_pool_start) >= MP_STATE_MEM(gc_no_scan_table_start) + gc_no_scan_table_byte_len);
+#endif
 
     // clear ATBs
     memset(MP_STATE_MEM(gc_alloc_table_start), 0, MP_STATE_MEM(gc_alloc_table_byte_len));
@@ -153,6 +366,11 @@ void gc_init(void *start, void *end) {
     memset(MP_STATE_MEM(gc_finaliser_table_start), 0, gc_finaliser_table_byte_len);
 #endif
 
+#if MICROPY_GC_NO_SCAN
+    // clear NTBs
+    memset(MP_STATE_MEM(gc_no_scan_table_start), 0, gc_no_scan_table_byte_len);
+#endif
+
     // Set first free ATB index to the start of the heap.
     for (size_t i = 0; i < MICROPY_ATB_INDICES; i++) {
         MP_STATE_MEM(gc_first_free_atb_index)[i] = 0;
@@ -164,6 +382,7 @@ void gc_init(void *start, void *end) {
     // Set the lowest long lived ptr to the end of the heap to start. This will be lowered as long
     // lived objects are allocated.
     MP_STATE_MEM(gc_lowest_long_lived_ptr) = (void*) PTR_FROM_BLOCK(MP_STATE_MEM(gc_alloc_table_byte_len * BLOCKS_PER_ATB));
+    MP_STATE_MEM(gc_collection_count)++;
 
     // unlock the GC
     MP_STATE_MEM(gc_lock_depth) = 0;
@@ -183,10 +402,21 @@ void gc_init(void *start, void *end) {
 
     MP_STATE_MEM(permanent_pointers) = NULL;
 
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    MP_STATE_MEM(gc_sweep_block) = gc_pool_block_len;
+    MP_STATE_MEM(gc_sweep_budget) = MICROPY_GC_SWEEP_BUDGET / BYTES_PER_BLOCK;
+    MP_STATE_MEM(gc_pause_max) = 0;
+    MP_STATE_MEM(gc_pause_total) = 0;
+    MP_STATE_MEM(gc_pause_count) = 0;
+    #endif
+
     DEBUG_printf("GC layout:\n");
     DEBUG_printf("  alloc table at %p, length " UINT_FMT " bytes, " UINT_FMT " blocks\n", MP_STATE_MEM(gc_alloc_table_start), MP_STATE_MEM(gc_alloc_table_byte_len), MP_STATE_MEM(gc_alloc_table_byte_len) * BLOCKS_PER_ATB);
 #if MICROPY_ENABLE_FINALISER
     DEBUG_printf("  finaliser table at %p, length " UINT_FMT " bytes, " UINT_FMT " blocks\n", MP_STATE_MEM(gc_finaliser_table_start), gc_finaliser_table_byte_len, gc_finaliser_table_byte_len * BLOCKS_PER_FTB);
+#endif
+#if MICROPY_GC_NO_SCAN
+    DEBUG_printf("  no-scan table at %p, length " UINT_FMT " bytes, " UINT_FMT " blocks\n", MP_STATE_MEM(gc_no_scan_table_start), gc_no_scan_table_byte_len, gc_no_scan_table_byte_len * BLOCKS_PER_NTB);
 #endif
     DEBUG_printf("  pool at %p, length " UINT_FMT " bytes, " UINT_FMT " blocks\n", MP_STATE_MEM(gc_pool_start), gc_pool_block_len * BYTES_PER_BLOCK, gc_pool_block_len);
 }
@@ -230,6 +460,13 @@ STATIC void gc_mark_subtree(size_t block) {
     // Start with the block passed in the argument.
     size_t sp = 0;
     for (;;) {
+        #if MICROPY_GC_NO_SCAN
+        // Blocks without pointers are only pushed by gc_deal_with_stack_overflow.
+        if (NTB_GET(block)) {
+            goto next;
+        }
+        #endif
+
         // work out number of consecutive blocks in the chain starting with this one
         size_t n_blocks = 0;
         do {
@@ -247,6 +484,12 @@ STATIC void gc_mark_subtree(size_t block) {
                     // an unmarked head, mark it, and push it on gc stack
                     TRACE_MARK(childblock, ptr);
                     ATB_HEAD_TO_MARK(childblock);
+                    #if MICROPY_GC_NO_SCAN
+                    // it has no children to check so marking it is enough
+                    if (NTB_GET(childblock)) {
+                        continue;
+                    }
+                    #endif
                     if (sp < MICROPY_ALLOC_GC_STACK_SIZE) {
                         MP_STATE_MEM(gc_stack)[sp++] = childblock;
                     } else {
@@ -256,6 +499,9 @@ STATIC void gc_mark_subtree(size_t block) {
             }
         }
 
+        #if MICROPY_GC_NO_SCAN
+    next:
+        #endif
         // Are there any blocks on the stack?
         if (sp == 0) {
             break; // No, stack is empty, we're done.
@@ -280,69 +526,211 @@ STATIC void gc_deal_with_stack_overflow(void) {
     }
 }
 
-STATIC void gc_sweep(void) {
+#if MICROPY_ENABLE_FINALISER
+// The __del__ methods of the last few types of object finalised by a sweep.  Only types that
+// aren't on the heap and have no attr handler are cached, since nothing can change how their
+// __del__ is looked up.
+#define GC_DEL_CACHE_SIZE (4)
+
+typedef struct _gc_del_cache_t {
+    const mp_obj_type_t *type[GC_DEL_CACHE_SIZE];
+    mp_obj_t del[GC_DEL_CACHE_SIZE]; // MP_OBJ_NULL if the type has no __del__
+    size_t next;
+} gc_del_cache_t;
+
+// Call the __del__ method of an object being freed, if it has one.  The cache is only used
+// with MICROPY_GC_FAST_SWEEP.
+STATIC void gc_finalise(mp_obj_base_t *obj, gc_del_cache_t *cache) {
+    const mp_obj_type_t *type = obj->type;
+    if (type == NULL) {
+        return;
+    }
+    mp_obj_t dest[2];
+    #if MICROPY_GC_FAST_SWEEP
+    size_t i = 0;
+    while (i < GC_DEL_CACHE_SIZE && cache->type[i] != type) {
+        i++;
+    }
+    if (i < GC_DEL_CACHE_SIZE) {
+        dest[0] = cache->del[i];
+        dest[1] = MP_OBJ_FROM_PTR(obj);
+    } else {
+        mp_load_method_maybe(MP_OBJ_FROM_PTR(obj), MP_QSTR___del__, dest);
+        bool on_heap = (byte*)type >= MP_STATE_MEM(gc_pool_start) && (byte*)type < MP_STATE_MEM(gc_pool_end);
+        // a __del__ that isn't a plain method is looked up each time
+        if (!on_heap && type->attr == NULL && (dest[0] == MP_OBJ_NULL || dest[1] == MP_OBJ_FROM_PTR(obj))) {
+            cache->type[cache->next] = type;
+            cache->del[cache->next] = dest[0];
+            cache->next = (cache->next + 1) % GC_DEL_CACHE_SIZE;
+        }
+    }
+    #else
+    (void)cache;
+    // if the object has a type then see if it has a __del__ method
+    mp_load_method_maybe(MP_OBJ_FROM_PTR(obj), MP_QSTR___del__, dest);
+    #endif
+    if (dest[0] != MP_OBJ_NULL) {
+        // load_method returned a method, execute it in a protected environment
+        #if MICROPY_ENABLE_SCHEDULER
+        mp_sched_lock();
+        #endif
+        mp_call_function_1_protected(dest[0], dest[1]);
+        #if MICROPY_ENABLE_SCHEDULER
+        mp_sched_unlock();
+        #endif
+    }
+}
+#endif
+
+// Free the unmarked heads and their tails, and unmark the marked heads, from start_block,
+// which must start an ATB, onwards.  Once n_blocks have been swept this stops at the next ATB
+// that doesn't start with a tail, so a chain is never split between slices, and returns the
+// block it stopped at.  The ATBs are updated a byte at a time.
+STATIC size_t gc_sweep(size_t start_block, size_t n_blocks) {
     #if MICROPY_PY_GC_COLLECT_RETVAL
-    MP_STATE_MEM(gc_collected) = 0;
+    if (start_block == 0) {
+        MP_STATE_MEM(gc_collected) = 0;
+    }
     #endif
+    #if MICROPY_ENABLE_FINALISER
+    gc_del_cache_t del_cache = {{NULL}, {MP_OBJ_NULL}, 0};
+    #endif
+    byte *atb = MP_STATE_MEM(gc_alloc_table_start);
+    size_t atb_len = MP_STATE_MEM(gc_alloc_table_byte_len);
+    size_t start_atb = start_block / BLOCKS_PER_ATB;
     // free unmarked heads and their tails
     int free_tail = 0;
-    for (size_t block = 0; block < MP_STATE_MEM(gc_alloc_table_byte_len) * BLOCKS_PER_ATB; block++) {
-        switch (ATB_GET_KIND(block)) {
-            case AT_HEAD:
-#if MICROPY_ENABLE_FINALISER
-                if (FTB_GET(block)) {
-                    mp_obj_base_t *obj = (mp_obj_base_t*)PTR_FROM_BLOCK(block);
-                    if (obj->type != NULL) {
-                        // if the object has a type then see if it has a __del__ method
-                        mp_obj_t dest[2];
-                        mp_load_method_maybe(MP_OBJ_FROM_PTR(obj), MP_QSTR___del__, dest);
-                        if (dest[0] != MP_OBJ_NULL) {
-                            // load_method returned a method, execute it in a protected environment
-                            #if MICROPY_ENABLE_SCHEDULER
-                            mp_sched_lock();
-                            #endif
-                            mp_call_function_1_protected(dest[0], dest[1]);
-                            #if MICROPY_ENABLE_SCHEDULER
-                            mp_sched_unlock();
-                            #endif
-                        }
-                    }
-                    // clear finaliser flag
-                    FTB_CLEAR(block);
-                }
-#endif
-                free_tail = 1;
-                ATB_ANY_TO_FREE(block);
+    size_t i = start_atb;
+    for (; i < atb_len; i++) {
+        if ((i - start_atb) * BLOCKS_PER_ATB >= n_blocks && (atb[i] & 3) != AT_TAIL) {
+            break;
+        }
+        #if MICROPY_GC_FAST_SWEEP
+        // Take four ATBs at a time when none of their blocks need freeing one by one: those
+        // with no unmarked heads, unless they start with the tail of a chain being freed, and
+        // those that are all the tail of a chain being freed.
+        if (i % 4 == 0 && atb_len - i >= 4) {
+            uint32_t a;
+            memcpy(&a, &atb[i], sizeof(a));
+            // the low bit of each block that is an unmarked head, and of each marked one
+            uint32_t heads = a & ~(a >> 1) & 0x55555555;
+            uint32_t marks = a & (a >> 1) & 0x55555555;
+            if (heads == 0 && !(free_tail && (atb[i] & 3) == AT_TAIL)) {
+                // turn marks into heads, keeping the tails and free blocks as they are
+                a &= ~(marks << 1);
+                memcpy(&atb[i], &a, sizeof(a));
+                free_tail = 0;
+                i += 3;
+                continue;
+            }
+            if (free_tail && a == 0xaaaaaaaa) {
+                memset(&atb[i], 0, sizeof(a));
                 #if CLEAR_ON_SWEEP
-                memset((void*)PTR_FROM_BLOCK(block), 0, BYTES_PER_BLOCK);
+                memset((void*)PTR_FROM_BLOCK(i * BLOCKS_PER_ATB), 0, 4 * BLOCKS_PER_ATB * BYTES_PER_BLOCK);
                 #endif
-                DEBUG_printf("gc_sweep(%x)\n", PTR_FROM_BLOCK(block));
-
-                #ifdef LOG_HEAP_ACTIVITY
-                gc_log_change(block, 0);
-                #endif
-                #if MICROPY_PY_GC_COLLECT_RETVAL
-                MP_STATE_MEM(gc_collected)++;
-                #endif
-                break;
-
-            case AT_TAIL:
-                if (free_tail) {
-                    ATB_ANY_TO_FREE(block);
+                i += 3;
+                continue;
+            }
+        }
+        #endif
+        byte a = atb[i];
+        for (size_t j = 0; j < BLOCKS_PER_ATB; j++) {
+            size_t block = i * BLOCKS_PER_ATB + j;
+            (void)block; // unused unless finalisers, CLEAR_ON_SWEEP or heap logging are enabled
+            switch ((a >> (2 * j)) & 3) {
+                case AT_HEAD:
+                    #if MICROPY_ENABLE_FINALISER
+                    // gc_free and gc_realloc do nothing while finalisers run, so a stays valid
+                    if (FTB_GET(block)) {
+                        gc_finalise((mp_obj_base_t*)PTR_FROM_BLOCK(block), &del_cache);
+                        // clear finaliser flag
+                        FTB_CLEAR(block);
+                    }
+                    #endif
+                    free_tail = 1;
+                    a &= ~(AT_MARK << (2 * j));
                     #if CLEAR_ON_SWEEP
                     memset((void*)PTR_FROM_BLOCK(block), 0, BYTES_PER_BLOCK);
                     #endif
-                }
-                break;
+                    DEBUG_printf("gc_sweep(%x)\n", PTR_FROM_BLOCK(block));
 
-            case AT_MARK:
-                ATB_MARK_TO_HEAD(block);
-                free_tail = 0;
-                break;
+                    #ifdef LOG_HEAP_ACTIVITY
+                    gc_log_change(block, 0);
+                    #endif
+                    #if MICROPY_PY_GC_COLLECT_RETVAL
+                    MP_STATE_MEM(gc_collected)++;
+                    #endif
+                    break;
+
+                case AT_TAIL:
+                    if (free_tail) {
+                        a &= ~(AT_MARK << (2 * j));
+                        #if CLEAR_ON_SWEEP
+                        memset((void*)PTR_FROM_BLOCK(block), 0, BYTES_PER_BLOCK);
+                        #endif
+                    }
+                    break;
+
+                case AT_MARK:
+                    a &= ~(AT_TAIL << (2 * j));
+                    free_tail = 0;
+                    break;
+            }
         }
+        atb[i] = a;
     }
+
+    #if MICROPY_GC_FREE_RUN_INDEX
+    gc_atw_rebuild(start_block, i * BLOCKS_PER_ATB);
+    #endif
+    return i * BLOCKS_PER_ATB;
 }
 
+#if MICROPY_GC_INCREMENTAL_SWEEP
+STATIC void gc_pause_end(mp_uint_t start) {
+    mp_uint_t pause = MICROPY_GC_TICKS_US() - start;
+    MP_STATE_MEM(gc_pause_count)++;
+    MP_STATE_MEM(gc_pause_total) += pause;
+    if (pause > MP_STATE_MEM(gc_pause_max)) {
+        MP_STATE_MEM(gc_pause_max) = pause;
+    }
+}
+
+// Sweep the next n_blocks (all of them if 0) of a pending sweep.  Returns false if there was
+// nothing to sweep or the GC is locked, which it also is while finalisers run.
+STATIC bool gc_sweep_slice(size_t n_blocks) {
+    GC_ENTER();
+    if (MP_STATE_MEM(gc_lock_depth) > 0 || !GC_SWEEP_PENDING()) {
+        GC_EXIT();
+        return false;
+    }
+    mp_uint_t start = MICROPY_GC_TICKS_US();
+    MP_STATE_MEM(gc_lock_depth)++;
+    MP_STATE_MEM(gc_sweep_block) = gc_sweep(MP_STATE_MEM(gc_sweep_block), n_blocks == 0 ? SIZE_MAX : n_blocks);
+    MP_STATE_MEM(gc_lock_depth)--;
+    gc_pause_end(start);
+    GC_EXIT();
+    return true;
+}
+
+void gc_sweep_finish(void) {
+    gc_sweep_slice(0);
+}
+
+#if CIRCUITPY
+STATIC background_callback_t gc_sweep_callback;
+
+// Sweep a slice each time background tasks run until the sweep is done, so that memory is
+// reclaimed and finalisers run while the VM is otherwise idle.
+STATIC void gc_sweep_background(void *data) {
+    gc_sweep_slice(MP_STATE_MEM(gc_sweep_budget));
+    if (GC_SWEEP_PENDING()) {
+        background_callback_add(&gc_sweep_callback, gc_sweep_background, NULL);
+    }
+}
+#endif
+#endif
+
 // Mark can handle NULL pointers because it verifies the pointer is within the heap bounds.
 STATIC void gc_mark(void* ptr) {
     if (VERIFY_PTR(ptr)) {
@@ -359,10 +747,18 @@ STATIC void gc_mark(void* ptr) {
 void gc_collect_start(void) {
     GC_ENTER();
     MP_STATE_MEM(gc_lock_depth)++;
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    MP_STATE_MEM(gc_pause_start) = MICROPY_GC_TICKS_US();
+    // Heads left marked by the last collection would be taken as reachable without being traced.
+    if (GC_SWEEP_PENDING()) {
+        MP_STATE_MEM(gc_sweep_block) = gc_sweep(MP_STATE_MEM(gc_sweep_block), SIZE_MAX);
+    }
+    #endif
     #if MICROPY_GC_ALLOC_THRESHOLD
     MP_STATE_MEM(gc_alloc_amount) = 0;
     #endif
     MP_STATE_MEM(gc_stack_overflow) = 0;
+    MP_STATE_MEM(gc_collection_count)++;
 
     // Trace root pointers.  This relies on the root pointers being organised
     // correctly in the mp_state_ctx structure.  We scan nlr_top, dict_locals,
@@ -392,22 +788,52 @@ void gc_collect_root(void **ptrs, size_t len) {
     }
 }
 
-void gc_collect_end(void) {
+// Sweep the first n_blocks (all of them if 0) of the heap, leaving the rest for later slices,
+// and finish the collection.
+STATIC void gc_collect_finish(size_t n_blocks) {
     gc_deal_with_stack_overflow();
-    gc_sweep();
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    MP_STATE_MEM(gc_sweep_block) = gc_sweep(0, n_blocks == 0 ? SIZE_MAX : n_blocks);
+    #else
+    (void)n_blocks;
+    gc_sweep(0, SIZE_MAX);
+    #endif
     for (size_t i = 0; i < MICROPY_ATB_INDICES; i++) {
         MP_STATE_MEM(gc_first_free_atb_index)[i] = 0;
     }
     MP_STATE_MEM(gc_last_free_atb_index) = MP_STATE_MEM(gc_alloc_table_byte_len) - 1;
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    gc_pause_end(MP_STATE_MEM(gc_pause_start));
+    #if CIRCUITPY
+    if (GC_SWEEP_PENDING()) {
+        background_callback_add(&gc_sweep_callback, gc_sweep_background, NULL);
+    }
+    #endif
+    #endif
     MP_STATE_MEM(gc_lock_depth)--;
     GC_EXIT();
 }
 
+void gc_collect_end(void) {
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    gc_collect_finish(MP_STATE_MEM(gc_sweep_budget));
+    #else
+    gc_collect_finish(0);
+    #endif
+}
+
 void gc_sweep_all(void) {
     GC_ENTER();
     MP_STATE_MEM(gc_lock_depth)++;
     MP_STATE_MEM(gc_stack_overflow) = 0;
-    gc_collect_end();
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    MP_STATE_MEM(gc_pause_start) = MICROPY_GC_TICKS_US();
+    // Unmark what the last collection left marked, so that everything is freed below.
+    if (GC_SWEEP_PENDING()) {
+        MP_STATE_MEM(gc_sweep_block) = gc_sweep(MP_STATE_MEM(gc_sweep_block), SIZE_MAX);
+    }
+    #endif
+    gc_collect_finish(0);
 }
 
 void gc_info(gc_info_t *info) {
@@ -430,6 +856,7 @@ void gc_info(gc_info_t *info) {
                 break;
 
             case AT_HEAD:
+            case AT_MARK:
                 info->used += 1;
                 len = 1;
                 break;
@@ -438,10 +865,6 @@ void gc_info(gc_info_t *info) {
                 info->used += 1;
                 len += 1;
                 break;
-
-            case AT_MARK:
-                // shouldn't happen
-                break;
         }
 
         block++;
@@ -451,7 +874,7 @@ void gc_info(gc_info_t *info) {
             kind = ATB_GET_KIND(block);
         }
 
-        if (finish || kind == AT_FREE || kind == AT_HEAD) {
+        if (finish || kind != AT_TAIL) {
             if (len == 1) {
                 info->num_1block += 1;
             } else if (len == 2) {
@@ -460,7 +883,7 @@ void gc_info(gc_info_t *info) {
             if (len > info->max_block) {
                 info->max_block = len;
             }
-            if (finish || kind == AT_HEAD) {
+            if (finish || kind != AT_FREE) {
                 if (len_free > info->max_free) {
                     info->max_free = len_free;
                 }
@@ -480,7 +903,7 @@ bool gc_alloc_possible(void) {
 
 // We place long lived objects at the end of the heap rather than the start. This reduces
 // fragmentation by localizing the heap churn to one portion of memory (the start of the heap.)
-void *gc_alloc(size_t n_bytes, bool has_finaliser, bool long_lived) {
+void *gc_alloc(size_t n_bytes, unsigned int alloc_flags, bool long_lived) {
     size_t n_blocks = ((n_bytes + BYTES_PER_BLOCK - 1) & (~(BYTES_PER_BLOCK - 1))) / BYTES_PER_BLOCK;
     DEBUG_printf("gc_alloc(" UINT_FMT " bytes -> " UINT_FMT " blocks)\n", n_bytes, n_blocks);
 
@@ -525,14 +948,36 @@ void *gc_alloc(size_t n_bytes, bool has_finaliser, bool long_lived) {
         int8_t direction = 1;
         size_t bucket = MIN(n_blocks, MICROPY_ATB_INDICES) - 1;
         size_t first_free = MP_STATE_MEM(gc_first_free_atb_index)[bucket];
+        size_t last_free = MP_STATE_MEM(gc_last_free_atb_index);
+        #if MICROPY_GC_INCREMENTAL_SWEEP
+        if (GC_SWEEP_PENDING()) {
+            if (long_lived) {
+                // Long lived objects go at the end of the heap, which is swept last.
+                GC_EXIT();
+                gc_sweep_finish();
+                GC_ENTER();
+                last_free = MP_STATE_MEM(gc_last_free_atb_index);
+            } else {
+                // Slices end on an ATB boundary, and the first one is swept by the collection.
+                last_free = MIN(last_free, MP_STATE_MEM(gc_sweep_block) / BLOCKS_PER_ATB - 1);
+            }
+        }
+        #endif
         size_t start = first_free;
         if (long_lived) {
             direction = -1;
-            start = MP_STATE_MEM(gc_last_free_atb_index);
+            start = last_free;
         }
         n_free = 0;
+        #if MICROPY_GC_FREE_RUN_INDEX
+        (void)start;
+        found_block = gc_find_free_run(first_free, last_free, n_blocks, direction, !collected, crossover_block);
+        if (found_block != SIZE_MAX) {
+            n_free = n_blocks;
+        }
+        #else
         // look for a run of n_blocks available blocks
-        for (size_t i = start; keep_looking && first_free <= i && i <= MP_STATE_MEM(gc_last_free_atb_index); i += direction) {
+        for (size_t i = start; keep_looking && first_free <= i && i <= last_free; i += direction) {
             byte a = MP_STATE_MEM(gc_alloc_table_start)[i];
             // Four ATB states are packed into a single byte.
             int j = 0;
@@ -557,11 +1002,20 @@ void *gc_alloc(size_t n_bytes, bool has_finaliser, bool long_lived) {
                 }
             }
         }
+        #endif
         if (n_free >= n_blocks) {
             break;
         }
 
         GC_EXIT();
+        #if MICROPY_GC_INCREMENTAL_SWEEP
+        // sweep some more of the heap before resorting to a collection
+        if (gc_sweep_slice(MP_STATE_MEM(gc_sweep_budget))) {
+            keep_looking = true;
+            GC_ENTER();
+            continue;
+        }
+        #endif
         // nothing found!
         if (collected) {
             return NULL;
@@ -604,12 +1058,25 @@ void *gc_alloc(size_t n_bytes, bool has_finaliser, bool long_lived) {
     // mark first block as used head
     ATB_FREE_TO_HEAD(start_block);
 
+    #if MICROPY_GC_NO_SCAN
+    // set or clear the flag here, rather than when the block is freed, so the sweep doesn't have to
+    if (alloc_flags & GC_ALLOC_FLAG_NO_SCAN) {
+        NTB_SET(start_block);
+    } else {
+        NTB_CLEAR(start_block);
+    }
+    #endif
+
     // mark rest of blocks as used tail
     // TODO for a run of many blocks can make this more efficient
     for (size_t bl = start_block + 1; bl <= end_block; bl++) {
         ATB_FREE_TO_TAIL(bl);
     }
 
+    #if MICROPY_GC_FREE_RUN_INDEX
+    gc_atw_blocks_used(start_block, end_block);
+    #endif
+
     // get pointer to first block
     // we must create this pointer before unlocking the GC so a collection can find it
     void *ret_ptr = (void*)(MP_STATE_MEM(gc_pool_start) + start_block * BYTES_PER_BLOCK);
@@ -641,7 +1108,7 @@ void *gc_alloc(size_t n_bytes, bool has_finaliser, bool long_lived) {
     #endif
 
     #if MICROPY_ENABLE_FINALISER
-    if (has_finaliser) {
+    if (alloc_flags & GC_ALLOC_FLAG_HAS_FINALISER) {
         // clear type pointer in case it is never set
         ((mp_obj_base_t*)ret_ptr)->type = NULL;
         // set mp_obj flag only if it has a finaliser
@@ -649,8 +1116,6 @@ void *gc_alloc(size_t n_bytes, bool has_finaliser, bool long_lived) {
         FTB_SET(start_block);
         GC_EXIT();
     }
-    #else
-    (void)has_finaliser;
     #endif
 
     #if EXTENSIVE_HEAP_PROFILING
@@ -695,7 +1160,7 @@ void gc_free(void *ptr) {
         // get the GC block number corresponding to this pointer
         assert(VERIFY_PTR(ptr));
         size_t start_block = BLOCK_FROM_PTR(ptr);
-        assert(ATB_GET_KIND(start_block) == AT_HEAD);
+        assert(ATB_IS_HEAD(start_block));
 
         #if MICROPY_ENABLE_FINALISER
         FTB_CLEAR(start_block);
@@ -711,6 +1176,10 @@ void gc_free(void *ptr) {
             block += 1;
         } while (ATB_GET_KIND(block) == AT_TAIL);
 
+        #if MICROPY_GC_FREE_RUN_INDEX
+        gc_atw_blocks_freed(start_block, block - 1);
+        #endif
+
         // Update the first free pointer for our size only. Not much calls gc_free directly so there
         // is decent chance we'll want to allocate this size again. By only updating the specific
         // size we don't risk something smaller fitting in.
@@ -737,7 +1206,7 @@ size_t gc_nbytes(const void *ptr) {
     GC_ENTER();
     if (VERIFY_PTR(ptr)) {
         size_t block = BLOCK_FROM_PTR(ptr);
-        if (ATB_GET_KIND(block) == AT_HEAD) {
+        if (ATB_IS_HEAD(block)) {
             // work out number of consecutive blocks in the chain starting with this on
             size_t n_blocks = 0;
             do {
@@ -753,6 +1222,23 @@ size_t gc_nbytes(const void *ptr) {
     return 0;
 }
 
+// Returns the flags to copy a head block with. Must be called with the GC entered.
+STATIC unsigned int gc_get_alloc_flags(size_t block) {
+    unsigned int alloc_flags = 0;
+    #if MICROPY_ENABLE_FINALISER
+    if (FTB_GET(block)) {
+        alloc_flags |= GC_ALLOC_FLAG_HAS_FINALISER;
+    }
+    #endif
+    #if MICROPY_GC_NO_SCAN
+    if (NTB_GET(block)) {
+        alloc_flags |= GC_ALLOC_FLAG_NO_SCAN;
+    }
+    #endif
+    (void)block;
+    return alloc_flags;
+}
+
 bool gc_has_finaliser(const void *ptr) {
 #if MICROPY_ENABLE_FINALISER
     GC_ENTER();
@@ -779,10 +1265,12 @@ void *gc_make_long_lived(void *old_ptr) {
     if (n_bytes == 0) {
         return old_ptr;
     }
-    bool has_finaliser = gc_has_finaliser(old_ptr);
+    GC_ENTER();
+    unsigned int alloc_flags = gc_get_alloc_flags(BLOCK_FROM_PTR(old_ptr));
+    GC_EXIT();
 
     // Try and find a new area in the long lived section to copy the memory to.
-    void* new_ptr = gc_alloc(n_bytes, has_finaliser, true);
+    void* new_ptr = gc_alloc(n_bytes, alloc_flags, true);
     if (new_ptr == NULL) {
         return old_ptr;
     } else if (old_ptr > new_ptr) {
@@ -850,7 +1338,7 @@ void *gc_realloc(void *ptr_in, size_t n_bytes, bool allow_move) {
     // get the GC block number corresponding to this pointer
     assert(VERIFY_PTR(ptr));
     size_t block = BLOCK_FROM_PTR(ptr);
-    assert(ATB_GET_KIND(block) == AT_HEAD);
+    assert(ATB_IS_HEAD(block));
 
     // compute number of new blocks that are requested
     size_t new_blocks = (n_bytes + BYTES_PER_BLOCK - 1) / BYTES_PER_BLOCK;
@@ -894,6 +1382,10 @@ void *gc_realloc(void *ptr_in, size_t n_bytes, bool allow_move) {
             ATB_ANY_TO_FREE(bl);
         }
 
+        #if MICROPY_GC_FREE_RUN_INDEX
+        gc_atw_blocks_freed(block + new_blocks, block + n_blocks - 1);
+        #endif
+
         // set the last_free pointer to end of this block if it's earlier in the heap
         size_t new_free_atb = (block + new_blocks) / BLOCKS_PER_ATB;
         size_t bucket = MIN(n_blocks - new_blocks, MICROPY_ATB_INDICES) - 1;
@@ -929,6 +1421,10 @@ void *gc_realloc(void *ptr_in, size_t n_bytes, bool allow_move) {
             ATB_FREE_TO_TAIL(bl);
         }
 
+        #if MICROPY_GC_FREE_RUN_INDEX
+        gc_atw_blocks_used(block + n_blocks, block + new_blocks - 1);
+        #endif
+
         GC_EXIT();
 
         #if MICROPY_GC_CONSERVATIVE_CLEAR
@@ -954,11 +1450,7 @@ void *gc_realloc(void *ptr_in, size_t n_bytes, bool allow_move) {
         return ptr_in;
     }
 
-    #if MICROPY_ENABLE_FINALISER
-    bool ftb_state = FTB_GET(block);
-    #else
-    bool ftb_state = false;
-    #endif
+    unsigned int alloc_flags = gc_get_alloc_flags(block);
 
     GC_EXIT();
 
@@ -968,7 +1460,7 @@ void *gc_realloc(void *ptr_in, size_t n_bytes, bool allow_move) {
     }
 
     // can't resize inplace; try to find a new contiguous chain
-    void *ptr_out = gc_alloc(n_bytes, ftb_state, false);
+    void *ptr_out = gc_alloc(n_bytes, alloc_flags, false);
 
     // check that the alloc succeeded
     if (ptr_out == NULL) {
@@ -60,11 +60,20 @@ void gc_collect_end(void);
 
 // Is the gc heap available?
 bool gc_alloc_possible(void);
-void *gc_alloc(size_t n_bytes, bool has_finaliser, bool long_lived);
+// Flags for gc_alloc.  HAS_FINALISER is 1 so that a bool has_finaliser can still be passed.
+#define GC_ALLOC_FLAG_HAS_FINALISER (1)
+#define GC_ALLOC_FLAG_NO_SCAN (2)
+
+void *gc_alloc(size_t n_bytes, unsigned int alloc_flags, bool long_lived);
 
 // Use this function to sweep the whole heap and run all finalisers
 void gc_sweep_all(void);
 
+#if MICROPY_GC_INCREMENTAL_SWEEP
+// Finish the sweep left pending by the last collection, freeing all that it found unreachable
+void gc_sweep_finish(void);
+#endif
+
 void gc_free(void *ptr); // does not call finaliser
 size_t gc_nbytes(const void *ptr);
 bool gc_has_finaliser(const void *ptr);
@@ -90,6 +90,41 @@ def compute_hash(qstr, bytes_hash):
     # Make sure that valid hash is never zero, zero means "hash not computed"
     return (hash & ((1 << (8 * bytes_hash)) - 1)) or 1
 
+# this must match qstr_compute_hash32 in qstr.c
+def compute_hash32(qstr):
+    hash = 5381
+    for b in qstr:
+        hash = ((hash * 33) ^ b) & 0xffffffff
+    return hash
+
+# this must match qstr_index_slot in qstr.c
+def index_slot(hash32, alloc):
+    hash32 ^= hash32 >> 16
+    hash32 = (hash32 * 0x45d9f3b) & 0xffffffff
+    hash32 ^= hash32 >> 16
+    return hash32 & (alloc - 1)
+
+def make_hash_index(qstrs):
+    """Build the open-addressed index searched by qstr_pool_index_find.
+
+    Slot values are the position of the qstr in its pool plus one, with zero
+    marking an empty slot; entries that are None (ie MP_QSTR_NULL) are left out.
+    The table is kept at most half full so that probe sequences stay short.
+    """
+    alloc = 2
+    while alloc < 2 * len(qstrs):
+        alloc *= 2
+    index = [0] * alloc
+    for n, qstr in enumerate(qstrs):
+        if qstr is None:
+            continue
+        i = index_slot(compute_hash32(bytes_cons(qstr, 'utf8')), alloc)
+        while index[i] != 0:
+            i = (i + 1) & (alloc - 1)
+        index[i] = n + 1
+    assert len(qstrs) < 0xffff
+    return index
+
 def translate(translation_file, i18ns):
     with open(translation_file, "rb") as f:
         table = gettext.GNUTranslations(f)
@@ -141,6 +176,107 @@ def iter_substrings(s, minlen, maxlen):
         for begin in range(0, len_s - n + 1):
             yield s[begin : begin + n]
 
+class NgramCounter:
+    """Counts the 2- to 9-grams of the parts of texts not covered by words.
+
+    The TextSplitter allows us to avoid considering parts of the text that are
+    already covered by a previously chosen word, for example if "the" is a word
+    then not only will "the" not be considered again, neither will "there" or
+    "wither", since they have "the" as substrings.
+
+    Rather than recounting everything after each new word, only the texts that
+    contain the word are split again, and only the n-grams of the uncovered
+    runs that changed are taken away from or added to the counts.
+    """
+
+    def __init__(self, texts):
+        self.counts = collections.Counter()
+        # by_length[n][occ] is the set of n-grams of length n seen occ times.
+        self.by_length = [collections.defaultdict(set) for _ in range(10)]
+        self.texts = texts
+        self.runs = []
+        extractor = TextSplitter([])
+        for t in texts:
+            runs = self.uncovered_runs(extractor, t)
+            self.runs.append(runs)
+            for run in runs:
+                self.counts.update(iter_substrings(run, minlen=2, maxlen=9))
+        for (s, occ) in self.counts.items():
+            self.by_length[len(s)][occ].add(s)
+
+    @staticmethod
+    def uncovered_runs(extractor, text):
+        return [word for (found, word) in extractor.iter_words(text) if not found]
+
+    def update(self, runs, delta):
+        counts = self.counts
+        by_length = self.by_length
+        for run in runs:
+            for s in iter_substrings(run, minlen=2, maxlen=9):
+                occs = by_length[len(s)]
+                occ = counts[s]
+                if occ:
+                    occs[occ].discard(s)
+                    if not occs[occ]:
+                        del occs[occ]
+                occ += delta
+                if occ:
+                    occs[occ].add(s)
+                    counts[s] = occ
+                else:
+                    del counts[s]
+
+    def add_word(self, words, word):
+        extractor = TextSplitter(words)
+        for (i, t) in enumerate(self.texts):
+            if word not in t:
+                continue
+            old_runs = self.runs[i]
+            new_runs = self.uncovered_runs(extractor, t)
+            if new_runs == old_runs:
+                continue
+            old_count = collections.Counter(old_runs)
+            new_count = collections.Counter(new_runs)
+            self.update((old_count - new_count).elements(), -1)
+            self.update((new_count - old_count).elements(), 1)
+            self.runs[i] = new_runs
+
+    def best_word(self):
+        # Score the candidates.  This is an empirical formula only, chosen for
+        # its effectiveness.  The score only grows with the number of
+        # occurrences so the best candidates of each length are the most
+        # common ones.
+        best_score = None
+        best = []
+        for (n, occs) in enumerate(self.by_length):
+            if not occs:
+                continue
+            occ = max(occs)
+            score = (n - 1) ** log(max(occ - 2, 1))
+            if best_score is None or score > best_score:
+                best_score = score
+                best = [occs[occ]]
+            elif score == best_score:
+                best.append(occs[occ])
+
+        # Do we have a "word" that got a score of at least 5?  Horray.  (A
+        # score that high means it occurred at least 5 times.)
+        if best_score is None or best_score < 5:
+            return None
+        candidates = set().union(*best)
+        if len(candidates) == 1:
+            return candidates.pop()
+
+        # Break ties the way a full count would: by the first candidate seen
+        # when going through each run's n-grams shortest first.
+        lengths = sorted(set(len(s) for s in candidates))
+        for runs in self.runs:
+            for run in runs:
+                for n in lengths:
+                    for begin in range(0, len(run) - n + 1):
+                        if run[begin : begin + n] in candidates:
+                            return run[begin : begin + n]
+
 def compute_huffman_coding(translations, compression_filename):
     texts = [t[1] for t in translations]
     words = []
@@ -160,44 +296,12 @@ def compute_huffman_coding(translations, compression_filename):
     max_words_len = 160 if max_ord > 255 else 255
 
     sum_len = 0
+    counter = NgramCounter(texts)
     while True:
         # Until the dictionary is filled to capacity, use a heuristic to find
-        # the best "word" (2- to 9-gram) to add to it.
-        #
-        # The TextSplitter allows us to avoid considering parts of the text
-        # that are already covered by a previously chosen word, for example
-        # if "the" is in words then not only will "the" not be considered
-        # again, neither will "there" or "wither", since they have "the"
-        # as substrings.
-        extractor = TextSplitter(words)
-        counter = collections.Counter()
-        for t in texts:
-            for (found, word) in extractor.iter_words(t):
-                if not found:
-                    for substr in iter_substrings(word, minlen=2, maxlen=9):
-                        counter[substr] += 1
-
-        # Score the candidates we found.  This is an empirical formula only,
-        # chosen for its effectiveness.
-        scores = sorted(
-            (
-                (s, (len(s) - 1) ** log(max(occ - 2, 1)), occ)
-                for (s, occ) in counter.items()
-            ),
-            key=lambda x: x[1],
-            reverse=True,
-        )
-
-        # Do we have a "word" that occurred 5 times and got a score of at least
-        # 5?  Horray.  Pick the one with the highest score.
-        word = None
-        for (s, score, occ) in scores:
-            if occ < 5:
-                continue
-            if score < 5:
-                break
-            word = s
-            break
+        # the best "word" (2- to 9-gram) to add to it.  See NgramCounter for
+        # how the candidates are counted and scored.
+        word = counter.best_word()
 
         # If we can successfully add it to the dictionary, do so.  Otherwise,
         # we've filled the dictionary to capacity and are done.
@@ -209,6 +313,7 @@ def compute_huffman_coding(translations, compression_filename):
             break
         words.append(word)
         sum_len += len(word) - 2
+        counter.add_word(words, word)
 
     extractor = TextSplitter(words)
     counter = collections.Counter()
@@ -474,6 +579,11 @@ def print_qstr_data(encoding_table, qcfgs, qstrs, i18ns):
         print('QDEF(MP_QSTR_%s, %s)' % (ident, qbytes))
         total_qstr_size += len(qstr)
 
+    # hash index of the pool, used with MICROPY_QSTR_HASH_INDEX
+    hash_index = make_hash_index([None] + [qstr for order, ident, qstr in sorted(qstrs.values(), key=lambda x: x[0])])
+    for i in range(0, len(hash_index), 16):
+        print('QINDEX(%s)' % ', '.join(str(n) for n in hash_index[i:i + 16]))
+
     total_text_size = 0
     total_text_compressed_size = 0
     max_translation_encoded_length = max(len(translation.encode("utf-8")) for original, translation in i18ns)
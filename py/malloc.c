@@ -57,7 +57,8 @@
 #undef free
 #undef realloc
 #define malloc_ll(b, ll) gc_alloc((b), false, (ll))
-#define malloc_with_finaliser(b, ll) gc_alloc((b), true, (ll))
+#define malloc_with_finaliser(b, ll) gc_alloc((b), GC_ALLOC_FLAG_HAS_FINALISER, (ll))
+#define malloc_no_scan(b, ll) gc_alloc((b), GC_ALLOC_FLAG_NO_SCAN, (ll))
 #define free gc_free
 #define realloc(ptr, n) gc_realloc(ptr, n, true)
 #define realloc_ext(ptr, n, mv) gc_realloc(ptr, n, mv)
@@ -118,6 +119,33 @@ void *m_malloc_with_finaliser(size_t num_bytes, bool long_lived) {
 }
 #endif
 
+#if MICROPY_GC_NO_SCAN
+void *m_malloc_no_scan(size_t num_bytes, bool long_lived) {
+    void *ptr = malloc_no_scan(num_bytes, long_lived);
+    if (ptr == NULL && num_bytes != 0) {
+        m_malloc_fail(num_bytes);
+    }
+#if MICROPY_MEM_STATS
+    MP_STATE_MEM(total_bytes_allocated) += num_bytes;
+    MP_STATE_MEM(current_bytes_allocated) += num_bytes;
+    UPDATE_PEAK();
+#endif
+    DEBUG_printf("malloc %d : %p\n", num_bytes, ptr);
+    return ptr;
+}
+
+void *m_malloc_no_scan_maybe(size_t num_bytes, bool long_lived) {
+    void *ptr = malloc_no_scan(num_bytes, long_lived);
+#if MICROPY_MEM_STATS
+    MP_STATE_MEM(total_bytes_allocated) += num_bytes;
+    MP_STATE_MEM(current_bytes_allocated) += num_bytes;
+    UPDATE_PEAK();
+#endif
+    DEBUG_printf("malloc %d : %p\n", num_bytes, ptr);
+    return ptr;
+}
+#endif
+
 void *m_malloc0(size_t num_bytes, bool long_lived) {
     void *ptr = m_malloc(num_bytes, long_lived);
     // If this config is set then the GC clears all memory, so we don't need to.
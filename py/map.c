@@ -32,6 +32,7 @@
 #include "py/mpconfig.h"
 #include "py/misc.h"
 #include "py/runtime.h"
+#include "py/objtype.h"
 
 #include "supervisor/linker.h"
 
@@ -90,6 +91,7 @@ void mp_map_init(mp_map_t *map, size_t n) {
     map->all_keys_are_qstrs = 1;
     map->is_fixed = 0;
     map->is_ordered = 0;
+    map->is_class_locals = 0;
 }
 
 void mp_map_init_fixed_table(mp_map_t *map, size_t n, const mp_obj_t *table) {
@@ -98,6 +100,7 @@ void mp_map_init_fixed_table(mp_map_t *map, size_t n, const mp_obj_t *table) {
     map->all_keys_are_qstrs = 1;
     map->is_fixed = 1;
     map->is_ordered = 1;
+    map->is_class_locals = 0;
     map->table = (mp_map_elem_t*)table;
 }
 
@@ -110,6 +113,11 @@ void mp_map_deinit(mp_map_t *map) {
 }
 
 void mp_map_clear(mp_map_t *map) {
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    if (map->is_class_locals) {
+        mp_obj_class_attr_cache_invalidate();
+    }
+    #endif
     if (!map->is_fixed) {
         m_del(mp_map_elem_t, map->table, map->alloc);
     }
@@ -120,25 +128,58 @@ void mp_map_clear(mp_map_t *map) {
     map->table = NULL;
 }
 
-STATIC void mp_map_rehash(mp_map_t *map) {
+// Move all elements into a new table of the given size.  The keys are already
+// known to be distinct so each one goes straight into the first free slot of
+// its probe sequence, without the equality checks that mp_map_lookup does.
+STATIC void mp_map_rehash(mp_map_t *map, size_t new_alloc) {
     size_t old_alloc = map->alloc;
-    size_t new_alloc = get_hash_alloc_greater_or_equal_to(map->alloc + 1);
     DEBUG_printf("mp_map_rehash(%p): " UINT_FMT " -> " UINT_FMT "\n", map, old_alloc, new_alloc);
     mp_map_elem_t *old_table = map->table;
     mp_map_elem_t *new_table = m_new0(mp_map_elem_t, new_alloc);
-    // If we reach this point, table resizing succeeded, now we can edit the old map.
-    map->alloc = new_alloc;
-    map->used = 0;
-    map->all_keys_are_qstrs = 1;
-    map->table = new_table;
+    bool all_keys_are_qstrs = true;
     for (size_t i = 0; i < old_alloc; i++) {
-        if (old_table[i].key != MP_OBJ_NULL && old_table[i].key != MP_OBJ_SENTINEL) {
-            mp_map_lookup(map, old_table[i].key, MP_MAP_LOOKUP_ADD_IF_NOT_FOUND)->value = old_table[i].value;
+        mp_obj_t key = old_table[i].key;
+        if (key == MP_OBJ_NULL || key == MP_OBJ_SENTINEL) {
+            continue;
+        }
+        mp_uint_t hash;
+        if (MP_OBJ_IS_QSTR(key)) {
+            hash = qstr_hash(MP_OBJ_QSTR_VALUE(key));
+        } else {
+            hash = MP_OBJ_SMALL_INT_VALUE(mp_unary_op(MP_UNARY_OP_HASH, key));
+            all_keys_are_qstrs = false;
+        }
+        size_t pos = hash % new_alloc;
+        while (new_table[pos].key != MP_OBJ_NULL) {
+            if (++pos == new_alloc) {
+                pos = 0;
+            }
         }
+        new_table[pos] = old_table[i];
     }
+    // If we reach this point, hashing all the keys succeeded, now we can edit the old map.
+    map->alloc = new_alloc;
+    map->all_keys_are_qstrs = all_keys_are_qstrs;
+    map->table = new_table;
     m_del(mp_map_elem_t, old_table, old_alloc);
 }
 
+// Make room for at least n elements in total, so that adding them doesn't
+// need to grow the table one step at a time.
+void mp_map_reserve(mp_map_t *map, size_t n) {
+    assert(!map->is_fixed);
+    if (n <= map->alloc) {
+        return;
+    }
+    if (map->is_ordered) {
+        map->table = m_renew(mp_map_elem_t, map->table, map->alloc, n);
+        mp_seq_clear(map->table, map->alloc, n, sizeof(*map->table));
+        map->alloc = n;
+    } else {
+        mp_map_rehash(map, get_hash_alloc_greater_or_equal_to(n));
+    }
+}
+
 // MP_MAP_LOOKUP behaviour:
 //  - returns NULL if not found, else the slot it was found in with key,value non-null
 // MP_MAP_LOOKUP_ADD_IF_NOT_FOUND behaviour:
@@ -149,6 +190,13 @@ mp_map_elem_t *PLACE_IN_ITCM(mp_map_lookup)(mp_map_t *map, mp_obj_t index, mp_ma
     // If the map is a fixed array then we must only be called for a lookup
     assert(!map->is_fixed || lookup_kind == MP_MAP_LOOKUP);
 
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    // the caller may be about to add, change or remove an attribute of a class
+    if (MP_UNLIKELY(map->is_class_locals) && lookup_kind != MP_MAP_LOOKUP) {
+        mp_obj_class_attr_cache_invalidate();
+    }
+    #endif
+
     // Work out if we can compare just pointers
     bool compare_only_ptrs = map->all_keys_are_qstrs;
     if (compare_only_ptrs) {
@@ -212,7 +260,7 @@ mp_map_elem_t *PLACE_IN_ITCM(mp_map_lookup)(mp_map_t *map, mp_obj_t index, mp_ma
 
     if (map->alloc == 0) {
         if (lookup_kind == MP_MAP_LOOKUP_ADD_IF_NOT_FOUND) {
-            mp_map_rehash(map);
+            mp_map_rehash(map, get_hash_alloc_greater_or_equal_to(map->alloc + 1));
         } else {
             return NULL;
         }
@@ -286,7 +334,7 @@ mp_map_elem_t *PLACE_IN_ITCM(mp_map_lookup)(mp_map_t *map, mp_obj_t index, mp_ma
                     return avail_slot;
                 } else {
                     // not enough room in table, rehash it
-                    mp_map_rehash(map);
+                    mp_map_rehash(map, get_hash_alloc_greater_or_equal_to(map->alloc + 1));
                     // restart the search for the new element
                     start_pos = pos = hash % map->alloc;
                 }
@@ -311,14 +359,24 @@ void mp_set_init(mp_set_t *set, size_t n) {
 STATIC void mp_set_rehash(mp_set_t *set) {
     size_t old_alloc = set->alloc;
     mp_obj_t *old_table = set->table;
-    set->alloc = get_hash_alloc_greater_or_equal_to(set->alloc + 1);
-    set->used = 0;
-    set->table = m_new0(mp_obj_t, set->alloc);
+    size_t new_alloc = get_hash_alloc_greater_or_equal_to(set->alloc + 1);
+    mp_obj_t *new_table = m_new0(mp_obj_t, new_alloc);
+    // as for mp_map_rehash, the elements are distinct so go into the first free slot
     for (size_t i = 0; i < old_alloc; i++) {
-        if (old_table[i] != MP_OBJ_NULL && old_table[i] != MP_OBJ_SENTINEL) {
-            mp_set_lookup(set, old_table[i], MP_MAP_LOOKUP_ADD_IF_NOT_FOUND);
+        mp_obj_t elem = old_table[i];
+        if (elem == MP_OBJ_NULL || elem == MP_OBJ_SENTINEL) {
+            continue;
+        }
+        size_t pos = MP_OBJ_SMALL_INT_VALUE(mp_unary_op(MP_UNARY_OP_HASH, elem)) % new_alloc;
+        while (new_table[pos] != MP_OBJ_NULL) {
+            if (++pos == new_alloc) {
+                pos = 0;
+            }
         }
+        new_table[pos] = elem;
     }
+    set->alloc = new_alloc;
+    set->table = new_table;
     m_del(mp_obj_t, old_table, old_alloc);
 }
 
@@ -80,6 +80,18 @@ typedef unsigned int uint;
 #define m_new_obj_var_with_finaliser(type, var_type, var_num) m_new_obj_var(type, var_type, var_num)
 #define m_new_ll_obj_with_finaliser(type) m_new_ll_obj(type)
 #endif
+// For memory that never holds pointers to the heap, so the GC doesn't scan it.
+#if MICROPY_GC_NO_SCAN
+#define m_new_no_scan(type, num) ((type*)(m_malloc_no_scan(sizeof(type) * (num), false)))
+#define m_new_ll_no_scan(type, num) ((type*)(m_malloc_no_scan(sizeof(type) * (num), true)))
+#define m_new_no_scan_maybe(type, num) ((type*)(m_malloc_no_scan_maybe(sizeof(type) * (num), false)))
+#else
+#define m_malloc_no_scan(num_bytes, long_lived) m_malloc((num_bytes), (long_lived))
+#define m_malloc_no_scan_maybe(num_bytes, long_lived) m_malloc_maybe((num_bytes), (long_lived))
+#define m_new_no_scan(type, num) m_new(type, num)
+#define m_new_ll_no_scan(type, num) m_new_ll(type, num)
+#define m_new_no_scan_maybe(type, num) m_new_maybe(type, num)
+#endif
 #if MICROPY_MALLOC_USES_ALLOCATED_SIZE
 #define m_renew(type, ptr, old_num, new_num) ((type*)(m_realloc((ptr), sizeof(type) * (old_num), sizeof(type) * (new_num))))
 #define m_renew_maybe(type, ptr, old_num, new_num, allow_move) ((type*)(m_realloc_maybe((ptr), sizeof(type) * (old_num), sizeof(type) * (new_num), (allow_move))))
@@ -96,6 +108,10 @@ typedef unsigned int uint;
 void *m_malloc(size_t num_bytes, bool long_lived);
 void *m_malloc_maybe(size_t num_bytes, bool long_lived);
 void *m_malloc_with_finaliser(size_t num_bytes, bool long_lived);
+#if MICROPY_GC_NO_SCAN
+void *m_malloc_no_scan(size_t num_bytes, bool long_lived);
+void *m_malloc_no_scan_maybe(size_t num_bytes, bool long_lived);
+#endif
 void *m_malloc0(size_t num_bytes, bool long_lived);
 #if MICROPY_MALLOC_USES_ALLOCATED_SIZE
 void *m_realloc(void *ptr, size_t old_num_bytes, size_t new_num_bytes);
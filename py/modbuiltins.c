@@ -53,7 +53,7 @@ STATIC mp_obj_t mp_builtin___build_class__(size_t n_args, const mp_obj_t *args)
 
     // set the new classes __locals__ object
     mp_obj_dict_t *old_locals = mp_locals_get();
-    mp_obj_t class_locals = mp_obj_new_dict(0);
+    mp_obj_t class_locals = mp_obj_new_dict(mp_obj_fun_get_names_hint(args[0]));
     mp_locals_set(MP_OBJ_TO_PTR(class_locals));
 
     // call the class code
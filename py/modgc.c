@@ -33,6 +33,10 @@
 // collect(): run a garbage collection
 STATIC mp_obj_t py_gc_collect(void) {
     gc_collect();
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    // an explicit collection frees everything it can before returning
+    gc_sweep_finish();
+    #endif
 #if MICROPY_PY_GC_COLLECT_RETVAL
     return MP_OBJ_NEW_SMALL_INT(MP_STATE_MEM(gc_collected));
 #else
@@ -95,6 +99,41 @@ STATIC mp_obj_t gc_threshold(size_t n_args, const mp_obj_t *args) {
 MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(gc_threshold_obj, 0, 1, gc_threshold);
 #endif
 
+#if MICROPY_GC_INCREMENTAL_SWEEP
+// sweep_budget([bytes]): get or set the number of bytes of heap swept at a time
+// after an automatic collection, 0 to sweep the whole heap at once
+STATIC mp_obj_t gc_sweep_budget(size_t n_args, const mp_obj_t *args) {
+    if (n_args == 0) {
+        return mp_obj_new_int(MP_STATE_MEM(gc_sweep_budget) * MICROPY_BYTES_PER_GC_BLOCK);
+    }
+    mp_int_t val = mp_obj_get_int(args[0]);
+    if (val <= 0) {
+        MP_STATE_MEM(gc_sweep_budget) = 0;
+    } else {
+        MP_STATE_MEM(gc_sweep_budget) = (val + MICROPY_BYTES_PER_GC_BLOCK - 1) / MICROPY_BYTES_PER_GC_BLOCK;
+    }
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(gc_sweep_budget_obj, 0, 1, gc_sweep_budget);
+
+// pause_stats([reset]): return the number of pauses taken by the collector and
+// the longest and total pause in microseconds, optionally resetting them
+STATIC mp_obj_t gc_pause_stats(size_t n_args, const mp_obj_t *args) {
+    mp_obj_t items[3] = {
+        mp_obj_new_int_from_uint(MP_STATE_MEM(gc_pause_count)),
+        mp_obj_new_int_from_uint(MP_STATE_MEM(gc_pause_max)),
+        mp_obj_new_int_from_uint(MP_STATE_MEM(gc_pause_total)),
+    };
+    if (n_args > 0 && mp_obj_is_true(args[0])) {
+        MP_STATE_MEM(gc_pause_count) = 0;
+        MP_STATE_MEM(gc_pause_max) = 0;
+        MP_STATE_MEM(gc_pause_total) = 0;
+    }
+    return mp_obj_new_tuple(3, items);
+}
+MP_DEFINE_CONST_FUN_OBJ_VAR_BETWEEN(gc_pause_stats_obj, 0, 1, gc_pause_stats);
+#endif
+
 STATIC const mp_rom_map_elem_t mp_module_gc_globals_table[] = {
     { MP_ROM_QSTR(MP_QSTR___name__), MP_ROM_QSTR(MP_QSTR_gc) },
     { MP_ROM_QSTR(MP_QSTR_collect), MP_ROM_PTR(&gc_collect_obj) },
@@ -106,6 +145,10 @@ STATIC const mp_rom_map_elem_t mp_module_gc_globals_table[] = {
     #if MICROPY_GC_ALLOC_THRESHOLD
     { MP_ROM_QSTR(MP_QSTR_threshold), MP_ROM_PTR(&gc_threshold_obj) },
     #endif
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    { MP_ROM_QSTR(MP_QSTR_sweep_budget), MP_ROM_PTR(&gc_sweep_budget_obj) },
+    { MP_ROM_QSTR(MP_QSTR_pause_stats), MP_ROM_PTR(&gc_pause_stats_obj) },
+    #endif
 };
 
 STATIC MP_DEFINE_CONST_DICT(mp_module_gc_globals, mp_module_gc_globals_table);
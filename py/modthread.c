@@ -164,6 +164,13 @@ STATIC void *thread_entry(void *args_in) {
     mp_state_thread_t ts;
     mp_thread_set_state(&ts);
 
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    memset(ts.attr_cache, 0, sizeof(ts.attr_cache));
+    #endif
+    #if MICROPY_PY_BUILTINS_STR_UNICODE_INDEX
+    memset(ts.str_index_cache, 0, sizeof(ts.str_index_cache));
+    #endif
+
     mp_stack_set_top(&ts + 1); // need to include ts in root-pointer scan
     mp_stack_set_limit(args->stack_size);
 
@@ -141,6 +141,14 @@
 #define MICROPY_QSTR_POOL_MAX_ENTRIES (64)
 #endif
 
+// Whether to keep hash indexes of the interned strings, so that looking up a
+// string does not scan every entry of every pool. The ROM pools get a table
+// precomputed by makeqstrdata.py/mpy-tool.py, and all dynamically allocated
+// pools share one open-addressed table that grows as strings are interned.
+#ifndef MICROPY_QSTR_HASH_INDEX
+#define MICROPY_QSTR_HASH_INDEX (0)
+#endif
+
 // Initial amount for lexer indentation level
 #ifndef MICROPY_ALLOC_LEXER_INDENT_INIT
 #define MICROPY_ALLOC_LEXER_INDENT_INIT (10)
@@ -252,6 +260,47 @@
 #define MICROPY_ATB_INDICES (8)
 #endif
 
+// Whether gc_alloc searches for free runs a whole ATB word (16 blocks) at a
+// time, using a bitmap of the words that have no free blocks to skip over
+// densely packed areas of the heap.  The bitmap costs one bit per 16 blocks.
+#ifndef MICROPY_GC_FREE_RUN_INDEX
+#define MICROPY_GC_FREE_RUN_INDEX (0)
+#endif
+
+// Whether blocks can be allocated as holding no heap pointers, so that the
+// mark phase doesn't scan them.  Used for the data of str, bytes, bytearray
+// and array objects and for pixel, display and audio buffers.  The flags cost
+// one bit per block.
+#ifndef MICROPY_GC_NO_SCAN
+#define MICROPY_GC_NO_SCAN (0)
+#endif
+
+// Whether the sweep that follows a collection is left for gc_alloc to do a
+// slice at a time, as it runs out of swept memory, instead of being done all
+// at once.  The mark phase still stops the world.  Also keeps statistics of
+// the pauses taken by the collector, for gc.pause_stats().
+#ifndef MICROPY_GC_INCREMENTAL_SWEEP
+#define MICROPY_GC_INCREMENTAL_SWEEP (0)
+#endif
+
+// Default number of bytes of heap swept per slice, changed with
+// gc.sweep_budget().  A budget of 0 sweeps the whole heap in one go.
+#ifndef MICROPY_GC_SWEEP_BUDGET
+#define MICROPY_GC_SWEEP_BUDGET (16384)
+#endif
+
+// Whether gc_sweep takes the allocation table 16 blocks at a time where there
+// is nothing to free, and caches the __del__ methods of the types of the
+// objects it finalises instead of looking them up for every object.
+#ifndef MICROPY_GC_FAST_SWEEP
+#define MICROPY_GC_FAST_SWEEP (0)
+#endif
+
+// Microsecond clock used to time the pauses taken by the collector.
+#ifndef MICROPY_GC_TICKS_US
+#define MICROPY_GC_TICKS_US() mp_hal_ticks_us()
+#endif
+
 /*****************************************************************************/
 /* MicroPython emitters                                                     */
 
@@ -420,12 +469,57 @@
 #define MICROPY_OPT_CACHE_MAP_LOOKUP_IN_BYTECODE (0)
 #endif
 
+// Whether to cache the class attribute found by LOAD_ATTR and LOAD_METHOD on
+// instances, per call site and keyed on the type.  Saves walking the MRO for
+// every method call.  Uses MICROPY_OPT_ATTR_INLINE_CACHE_SIZE entries of
+// 5 words each per thread, and works with bytecode in ROM.
+#ifndef MICROPY_OPT_ATTR_INLINE_CACHE
+#define MICROPY_OPT_ATTR_INLINE_CACHE (0)
+#endif
+
+// Number of call sites the attribute cache holds, must be a power of 2.
+#ifndef MICROPY_OPT_ATTR_INLINE_CACHE_SIZE
+#define MICROPY_OPT_ATTR_INLINE_CACHE_SIZE (64)
+#endif
+
+// Whether str/bytes find, count, split, replace and "in" use a
+// Boyer-Moore-Horspool search with a 256-byte skip table on the stack for
+// long haystacks, instead of comparing the needle at every position.
+#ifndef MICROPY_OPT_STR_FIND_SKIP_TABLE
+#define MICROPY_OPT_STR_FIND_SKIP_TABLE (0)
+#endif
+
 // Whether to use fast versions of bitwise operations (and, or, xor) when the
 // arguments are both positive.  Increases Thumb2 code size by about 250 bytes.
 #ifndef MICROPY_OPT_MPZ_BITWISE
 #define MICROPY_OPT_MPZ_BITWISE (0)
 #endif
 
+// Whether mpz multiplication uses Karatsuba's method when both numbers have at
+// least MICROPY_MPZ_KARATSUBA_THRESHOLD digits.  Needs scratch space on the heap
+// of about 4 times the digits of the longer number.
+#ifndef MICROPY_OPT_MPZ_KARATSUBA
+#define MICROPY_OPT_MPZ_KARATSUBA (0)
+#endif
+
+// Number of digits (see MPZ_DIG_SIZE) from which Karatsuba multiplication is
+// used, must be at least 4.
+#ifndef MICROPY_MPZ_KARATSUBA_THRESHOLD
+#define MICROPY_MPZ_KARATSUBA_THRESHOLD (32)
+#endif
+
+// Whether pow(x, y, m) uses Montgomery multiplication when m is odd, replacing
+// the long division after each step with a cheaper reduction.
+#ifndef MICROPY_OPT_MPZ_MONTGOMERY
+#define MICROPY_OPT_MPZ_MONTGOMERY (0)
+#endif
+
+// Whether converting a long mpz to a string splits it in halves by dividing by
+// powers of the base, instead of dividing the whole number for every character.
+#ifndef MICROPY_OPT_MPZ_AS_STR_SPLIT
+#define MICROPY_OPT_MPZ_AS_STR_SPLIT (0)
+#endif
+
 /*****************************************************************************/
 /* Python internal features                                                  */
 
@@ -540,6 +634,12 @@
 #define MICROPY_REPL_EVENT_DRIVEN (0)
 #endif
 
+// Bytes of flow control window the raw REPL offers to hosts in raw-paste mode (two windows of
+// half this size are advertised)
+#ifndef MICROPY_REPL_STDIN_BUFFER_MAX
+#define MICROPY_REPL_STDIN_BUFFER_MAX (256)
+#endif
+
 // Whether to include lexer helper function for unix
 #ifndef MICROPY_HELPER_LEXER_UNIX
 #define MICROPY_HELPER_LEXER_UNIX (0)
@@ -779,6 +879,13 @@ typedef double mp_float_t;
 #endif
 
 // Whether to check for valid UTF-8 when converting bytes to str
+// Whether to cache an index of character offsets for long str objects, so
+// that indexing, slicing and len() of non-ASCII strings don't have to walk
+// the UTF-8 from the start each time.  Uses a few words per thread.
+#ifndef MICROPY_PY_BUILTINS_STR_UNICODE_INDEX
+#define MICROPY_PY_BUILTINS_STR_UNICODE_INDEX (0)
+#endif
+
 #ifndef MICROPY_PY_BUILTINS_STR_UNICODE_CHECK
 #define MICROPY_PY_BUILTINS_STR_UNICODE_CHECK (MICROPY_PY_BUILTINS_STR_UNICODE)
 #endif
@@ -1178,6 +1285,11 @@ typedef double mp_float_t;
 #define MICROPY_PY_UJSON (0)
 #endif
 
+// Whether to provide ujson.iterload, to read JSON a piece at a time
+#ifndef MICROPY_PY_UJSON_ITERLOAD
+#define MICROPY_PY_UJSON_ITERLOAD (0)
+#endif
+
 #ifndef CIRCUITPY_ULAB
 #define CIRCUITPY_ULAB (0)
 #endif
@@ -1198,6 +1310,21 @@ typedef double mp_float_t;
 #define MICROPY_PY_URE_SUB (0)
 #endif
 
+// Whether ure matches patterns that loop around alternatives or other loops,
+// and those compiled with ure.NOBACKTRACK, with a Pike VM instead of by
+// backtracking.  It takes time linear in the length of the string and a
+// bounded amount of C stack, at the cost of a heap allocation per match.
+#ifndef MICROPY_PY_URE_PIKEVM
+#define MICROPY_PY_URE_PIKEVM (0)
+#endif
+
+// Number of patterns whose compiled form the module-level ure.match, search
+// and sub keep, so that using the same pattern again doesn't recompile it.
+// Each uses 2 words of state, and 0 disables the cache along with ure.purge.
+#ifndef MICROPY_PY_URE_CACHE_SIZE
+#define MICROPY_PY_URE_CACHE_SIZE (0)
+#endif
+
 #ifndef MICROPY_PY_UHEAPQ
 #define MICROPY_PY_UHEAPQ (0)
 #endif
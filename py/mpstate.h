@@ -73,6 +73,12 @@ typedef struct _mp_state_mem_t {
     #if MICROPY_ENABLE_FINALISER
     byte *gc_finaliser_table_start;
     #endif
+    #if MICROPY_GC_NO_SCAN
+    byte *gc_no_scan_table_start;
+    #endif
+    #if MICROPY_GC_FREE_RUN_INDEX
+    uint32_t *gc_full_atw_table_start;
+    #endif
     byte *gc_pool_start;
     byte *gc_pool_end;
 
@@ -99,14 +105,57 @@ typedef struct _mp_state_mem_t {
     size_t gc_collected;
     #endif
 
+    #if MICROPY_GC_INCREMENTAL_SWEEP
+    // The next block to be swept, or the number of blocks when no sweep is pending.
+    size_t gc_sweep_block;
+    // Number of blocks swept per slice, or 0 to sweep the whole heap at once.
+    size_t gc_sweep_budget;
+    // Statistics of the pauses taken by the collector, in microseconds.
+    mp_uint_t gc_pause_start;
+    mp_uint_t gc_pause_max;
+    mp_uint_t gc_pause_total;
+    size_t gc_pause_count;
+    #endif
+
     #if MICROPY_PY_THREAD
     // This is a global mutex used to make the GC thread-safe.
     mp_thread_mutex_t gc_mutex;
     #endif
 
+    // Incremented when the heap is initialised or collected, which are the
+    // only times memory is freed implicitly.  Caches of heap pointers held
+    // outside the heap use this to tell when their pointers may be stale.
+    size_t gc_collection_count;
+
     void** permanent_pointers;
 } mp_state_mem_t;
 
+#if MICROPY_OPT_ATTR_INLINE_CACHE
+// The result of looking up attr in the class of an instance of type.
+typedef struct _mp_attr_cache_entry_t {
+    const mp_obj_type_t *type;
+    size_t epoch;
+    qstr attr;
+    bool bind_self;
+    mp_obj_t value;
+    mp_obj_t self;
+} mp_attr_cache_entry_t;
+#endif
+
+#if MICROPY_PY_BUILTINS_STR_UNICODE_INDEX
+// The number of characters and the character offsets of a str.
+typedef struct _mp_str_index_entry_t {
+    const byte *data;
+    size_t len;
+    size_t char_len;
+    const size_t *offsets; // byte offset of every MP_STR_INDEX_STRIDE'th character, NULL if ASCII
+    size_t gc_collection_count;
+} mp_str_index_entry_t;
+
+#define MP_STR_INDEX_STRIDE (32)
+#define MP_STR_INDEX_CACHE_SIZE (4)
+#endif
+
 // This structure hold runtime and VM information.  It includes a section
 // which contains root pointers that must be scanned by the GC.
 typedef struct _mp_state_vm_t {
@@ -119,6 +168,13 @@ typedef struct _mp_state_vm_t {
 
     qstr_pool_t *last_pool;
 
+    #if MICROPY_QSTR_HASH_INDEX
+    // open-addressed index of the qstrs in all dynamically allocated pools
+    qstr *qstr_index;
+    // the dynamically allocated pools, oldest first
+    qstr_pool_t **qstr_pools;
+    #endif
+
     // non-heap memory for creating an exception if we can't allocate RAM
     mp_obj_exception_t mp_emergency_exception_obj;
 
@@ -177,6 +233,11 @@ typedef struct _mp_state_vm_t {
     vstr_t *repl_line;
     #endif
 
+    #if MICROPY_PY_URE && MICROPY_PY_URE_CACHE_SIZE
+    // pairs of pattern and compiled regex, most recently used first
+    mp_obj_t ure_cache[MICROPY_PY_URE_CACHE_SIZE * 2];
+    #endif
+
     #if MICROPY_PY_OS_DUPTERM
     mp_obj_t dupterm_objs[MICROPY_PY_OS_DUPTERM];
     mp_obj_t dupterm_arr_obj;
@@ -201,6 +262,13 @@ typedef struct _mp_state_vm_t {
     size_t qstr_last_alloc;
     size_t qstr_last_used;
 
+    #if MICROPY_QSTR_HASH_INDEX
+    size_t qstr_index_alloc;
+    size_t qstr_index_len;
+    size_t qstr_pools_alloc;
+    size_t qstr_pools_len;
+    #endif
+
     #if MICROPY_PY_THREAD
     // This is a global mutex used to make qstr interning thread-safe.
     mp_thread_mutex_t qstr_mutex;
@@ -210,6 +278,11 @@ typedef struct _mp_state_vm_t {
     mp_uint_t mp_optimise_value;
     #endif
 
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    // incremented whenever a class is created or changed, invalidating all attribute caches
+    size_t attr_cache_epoch;
+    #endif
+
     // size of the emergency exception buf, if it's dynamically allocated
     #if MICROPY_ENABLE_EMERGENCY_EXCEPTION_BUF && MICROPY_EMERGENCY_EXCEPTION_BUF_SIZE == 0
     mp_int_t mp_emergency_exception_buf_size;
@@ -246,6 +319,12 @@ typedef struct _mp_state_thread_t {
     uint8_t *pystack_cur;
     #endif
 
+    #if MICROPY_PY_BUILTINS_STR_UNICODE_INDEX
+    // Not scanned, so the offsets arrays are freed by the next collection,
+    // which is also when the entries stop being used.
+    mp_str_index_entry_t str_index_cache[MP_STR_INDEX_CACHE_SIZE];
+    #endif
+
     ////////////////////////////////////////////////////////////
     // START ROOT POINTER SECTION
     // Everything that needs GC scanning must start here, and
@@ -256,6 +335,12 @@ typedef struct _mp_state_thread_t {
     mp_obj_dict_t *dict_globals;
 
     nlr_buf_t *nlr_top;
+
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    // Kept per thread so that entries are never read while another thread writes them.
+    // Scanned so that an entry's value stays alive after it is removed from its class.
+    mp_attr_cache_entry_t attr_cache[MICROPY_OPT_ATTR_INLINE_CACHE_SIZE];
+    #endif
 } mp_state_thread_t;
 
 // This structure combines the above 3 structures.
@@ -453,6 +453,80 @@ STATIC size_t mpn_mul(mpz_dig_t *idig, mpz_dig_t *jdig, size_t jlen, mpz_dig_t *
     return ilen;
 }
 
+#if MICROPY_OPT_MPZ_KARATSUBA
+
+/* returns the number of digits of scratch space that mpn_mul_karatsuba needs
+   when neither operand is longer than n digits
+*/
+STATIC size_t mpn_mul_karatsuba_scratch(size_t n) {
+    size_t s = 0;
+    while (n >= MICROPY_MPZ_KARATSUBA_THRESHOLD) {
+        size_t h = (n + 1) / 2;
+        s += 4 * (h + 1);
+        n = h + 1;
+    }
+    return s;
+}
+
+/* computes i = j * k
+   writes all jlen + klen digits of i; j and k need not be normalised
+   tmp must have at least mpn_mul_karatsuba_scratch(max(jlen, klen)) digits
+   can have j, k point to same memory
+*/
+STATIC void mpn_mul_karatsuba(mpz_dig_t *idig, mpz_dig_t *jdig, size_t jlen, mpz_dig_t *kdig, size_t klen, mpz_dig_t *tmp) {
+    if (jlen < klen) {
+        mpz_dig_t *d = jdig; jdig = kdig; kdig = d;
+        size_t l = jlen; jlen = klen; klen = l;
+    }
+
+    if (klen < MICROPY_MPZ_KARATSUBA_THRESHOLD) {
+        memset(idig, 0, (jlen + klen) * sizeof(mpz_dig_t));
+        mpn_mul(idig, jdig, jlen, kdig, klen);
+        return;
+    }
+
+    // split j into a low half j0 of h digits and a high half j1
+    size_t h = (jlen + 1) / 2;
+
+    if (klen <= h) {
+        // k is too short to split: i = j0 * k + ((j1 * k) << h)
+        size_t len1 = jlen - h + klen;
+        mpn_mul_karatsuba(idig, jdig, h, kdig, klen, tmp);
+        memset(idig + h + klen, 0, (jlen - h) * sizeof(mpz_dig_t));
+        mpn_mul_karatsuba(tmp, jdig + h, jlen - h, kdig, klen, tmp + len1);
+        mpn_add(idig + h, idig + h, len1, tmp, len1);
+        return;
+    }
+
+    // z0 = j0 * k0 goes in the low 2h digits of i and z2 = j1 * k1 above it
+    size_t len2 = jlen + klen - 2 * h;
+    mpn_mul_karatsuba(idig, jdig, h, kdig, h, tmp);
+    mpn_mul_karatsuba(idig + 2 * h, jdig + h, jlen - h, kdig + h, klen - h, tmp);
+
+    // z1 = (j0 + j1) * (k0 + k1) - z0 - z2
+    mpz_dig_t *jsum = tmp;
+    mpz_dig_t *ksum = jsum + h + 1;
+    mpz_dig_t *z1 = ksum + h + 1;
+    jsum[h] = 0;
+    mpn_add(jsum, jdig, h, jdig + h, jlen - h);
+    ksum[h] = 0;
+    mpn_add(ksum, kdig, h, kdig + h, klen - h);
+    mpn_mul_karatsuba(z1, jsum, h + 1, ksum, h + 1, z1 + 2 * (h + 1));
+    size_t z1len = mpn_sub(z1, z1, 2 * (h + 1), idig, 2 * h);
+    len2 = mpn_remove_trailing_zeros(idig + 2 * h, idig + 2 * h + len2);
+    z1len = mpn_sub(z1, z1, z1len, idig + 2 * h, len2);
+
+    // i = z0 + (z1 << h) + (z2 << 2h)
+    mpn_add(idig + h, idig + h, jlen + klen - h, z1, z1len);
+
+    // check to prevent usb starvation
+    #ifdef RUN_BACKGROUND_TASKS
+    RUN_BACKGROUND_TASKS;
+    #endif
+}
+
+#endif
+
 /* natural_div - quo * den + new_num = old_num (ie num is replaced with rem)
    assumes den != 0
    assumes num_dig has enough memory to be extended by 1 digit
@@ -527,60 +601,37 @@ STATIC void mpn_div(mpz_dig_t *num_dig, size_t *num_len, const mpz_dig_t *den_di
         quo /= lead_den_digit;
 
         // Multiply quo by den and subtract from num to get remainder.
-        // We have different code here to handle different compile-time
-        // configurations of mpz:
-        //
-        //   1. DIG_SIZE is stricly less than half the number of bits
-        //      available in mpz_dbl_dig_t.  In this case we can use a
-        //      slightly more optimal (in time and space) routine that
-        //      uses the extra bits in mpz_dbl_dig_signed_t to store a
-        //      sign bit.
-        //
-        //   2. DIG_SIZE is exactly half the number of bits available in
-        //      mpz_dbl_dig_t.  In this (common) case we need to be careful
-        //      not to overflow the borrow variable.  And the shifting of
-        //      borrow needs some special logic (it's a shift right with
-        //      round up).
-        //
+        // Must be careful with overflow of the borrow variable.  Both
+        // borrow and low_digs are signed values and need signed right-shift,
+        // but x is unsigned and may take a full-range value.
         const mpz_dig_t *d = den_dig;
         mpz_dbl_dig_t d_norm = 0;
-        mpz_dbl_dig_t borrow = 0;
+        mpz_dbl_dig_signed_t borrow = 0;
         for (mpz_dig_t *n = num_dig - den_len; n < num_dig; ++n, ++d) {
+            // Get the next digit in (den).
             d_norm = ((mpz_dbl_dig_t)*d << norm_shift) | (d_norm >> DIG_SIZE);
+            // Multiply the next digit in (quo * den).
             mpz_dbl_dig_t x = (mpz_dbl_dig_t)quo * (d_norm & DIG_MASK);
-            #if DIG_SIZE < MPZ_DBL_DIG_SIZE / 2
-            borrow += (mpz_dbl_dig_t)*n - x; // will overflow if DIG_SIZE >= MPZ_DBL_DIG_SIZE/2
-            *n = borrow & DIG_MASK;
-            borrow = (mpz_dbl_dig_signed_t)borrow >> DIG_SIZE;
-            #else // DIG_SIZE == MPZ_DBL_DIG_SIZE / 2
-            if (x >= *n || *n - x <= borrow) {
-                borrow += x - (mpz_dbl_dig_t)*n;
-                *n = (-borrow) & DIG_MASK;
-                borrow = (borrow >> DIG_SIZE) + ((borrow & DIG_MASK) == 0 ? 0 : 1); // shift-right with round-up
-            } else {
-                *n = ((mpz_dbl_dig_t)*n - x - borrow) & DIG_MASK;
-                borrow = 0;
-            }
-            #endif
+            // Compute the low DIG_MASK bits of the next digit in (num - quo * den)
+            mpz_dbl_dig_signed_t low_digs = (borrow & DIG_MASK) + *n - (x & DIG_MASK);
+            // Store the digit result for (num).
+            *n = low_digs & DIG_MASK;
+            // Compute the borrow, shifted right before summing to avoid overflow.
+            borrow = (borrow >> DIG_SIZE) - (x >> DIG_SIZE) + (low_digs >> DIG_SIZE);
         }
 
-        #if DIG_SIZE < MPZ_DBL_DIG_SIZE / 2
-        // Borrow was negative in the above for-loop, make it positive for next if-block.
-        borrow = -borrow;
-        #endif
-
         // At this point we have either:
         //
         //   1. quo was the correct value and the most-sig-digit of num is exactly
-        //      cancelled by borrow (borrow == *num_dig).  In this case there is
+        //      cancelled by borrow (borrow + *num_dig == 0).  In this case there is
         //      nothing more to do.
         //
         //   2. quo was too large, we subtracted too many den from num, and the
-        //      most-sig-digit of num is 1 less than borrow (borrow == *num_dig + 1).
+        //      most-sig-digit of num is less than needed (borrow + *num_dig < 0).
         //      In this case we must reduce quo and add back den to num until the
         //      carry from this operation cancels out the borrow.
         //
-        borrow -= *num_dig;
+        borrow += *num_dig;
         for (; borrow != 0; --quo) {
             d = den_dig;
             d_norm = 0;
@@ -591,7 +642,7 @@ STATIC void mpn_div(mpz_dig_t *num_dig, size_t *num_len, const mpz_dig_t *den_di
                 *n = carry & DIG_MASK;
                 carry >>= DIG_SIZE;
             }
-            borrow -= carry;
+            borrow += carry;
         }
 
         // store this digit of the quotient
@@ -621,6 +672,57 @@ STATIC void mpn_div(mpz_dig_t *num_dig, size_t *num_len, const mpz_dig_t *den_di
     }
 }
 
+#if MICROPY_OPT_MPZ_MONTGOMERY
+
+/* computes -1 / m mod 2**DIG_SIZE
+   assumes m is odd
+*/
+STATIC mpz_dig_t mpn_montgomery_inv(mpz_dig_t m) {
+    // m * m == 1 mod 8, and each Newton step doubles the number of correct bits
+    mpz_dbl_dig_t x = m;
+    for (unsigned int bits = 3; bits < DIG_SIZE; bits *= 2) {
+        x = (x * (2 - (mpz_dbl_dig_t)m * x)) & DIG_MASK;
+    }
+    return -x & DIG_MASK;
+}
+
+/* computes i = i / 2**(DIG_SIZE * mlen) mod m (Montgomery reduction)
+   returns number of digits in i
+   assumes i < m * 2**(DIG_SIZE * mlen); assumes i has room for 2 * mlen + 1 digits
+   assumes m is odd and normalised, and minv = mpn_montgomery_inv(m[0])
+*/
+STATIC size_t mpn_montgomery_reduce(mpz_dig_t *idig, size_t ilen, const mpz_dig_t *mdig, size_t mlen, mpz_dig_t minv) {
+    memset(idig + ilen, 0, (2 * mlen + 1 - ilen) * sizeof(mpz_dig_t));
+
+    // add multiples of m to clear the low mlen digits of i, one digit at a time
+    for (size_t n = 0; n < mlen; ++n) {
+        mpz_dig_t u = ((mpz_dbl_dig_t)idig[n] * minv) & DIG_MASK;
+        mpz_dig_t *id = idig + n;
+        mpz_dbl_dig_t carry = 0;
+        for (const mpz_dig_t *md = mdig; md < mdig + mlen; ++md, ++id) {
+            carry += (mpz_dbl_dig_t)*id + (mpz_dbl_dig_t)u * (mpz_dbl_dig_t)*md; // will never overflow so long as DIG_SIZE <= 8*sizeof(mpz_dbl_dig_t)/2
+            *id = carry & DIG_MASK;
+            carry >>= DIG_SIZE;
+        }
+        for (; carry != 0; ++id) {
+            carry += *id;
+            *id = carry & DIG_MASK;
+            carry >>= DIG_SIZE;
+        }
+    }
+
+    // the result is in the high mlen + 1 digits and is less than 2 * m
+    mpz_dig_t *rdig = idig + mlen;
+    size_t rlen = mpn_remove_trailing_zeros(rdig, rdig + mlen + 1);
+    if (mpn_cmp(rdig, rlen, mdig, mlen) >= 0) {
+        rlen = mpn_sub(rdig, rdig, rlen, mdig, mlen);
+    }
+    memmove(idig, rdig, rlen * sizeof(mpz_dig_t));
+    return rlen;
+}
+
+#endif
+
 #define MIN_ALLOC (2)
 
 void mpz_init_zero(mpz_t *z) {
@@ -703,7 +805,11 @@ STATIC void mpz_need_dig(mpz_t *z, size_t need) {
         // if z has fixed digit buffer there's not much we can do as the caller will
         // be expecting a buffer with at least "need" bytes (but it shouldn't happen)
         assert(!z->fixed_dig);
-        z->dig = m_renew(mpz_dig_t, z->dig, z->alloc, need);
+        if (z->dig == NULL) {
+            z->dig = m_new_no_scan(mpz_dig_t, need);
+        } else {
+            z->dig = m_renew(mpz_dig_t, z->dig, z->alloc, need);
+        }
         z->alloc = need;
     }
 }
@@ -715,7 +821,7 @@ STATIC mpz_t *mpz_clone(const mpz_t *src) {
     z->fixed_dig = 0;
     z->alloc = src->alloc;
     z->len = src->len;
-    z->dig = m_new(mpz_dig_t, z->alloc);
+    z->dig = m_new_no_scan(mpz_dig_t, z->alloc);
     memcpy(z->dig, src->dig, src->alloc * sizeof(mpz_dig_t));
     return z;
 }
@@ -1317,8 +1423,19 @@ void mpz_mul_inpl(mpz_t *dest, const mpz_t *lhs, const mpz_t *rhs) {
     }
 
     mpz_need_dig(dest, lhs->len + rhs->len); // min mem l+r-1, max mem l+r
-    memset(dest->dig, 0, dest->alloc * sizeof(mpz_dig_t));
-    dest->len = mpn_mul(dest->dig, lhs->dig, lhs->len, rhs->dig, rhs->len);
+    #if MICROPY_OPT_MPZ_KARATSUBA
+    if (lhs->len >= MICROPY_MPZ_KARATSUBA_THRESHOLD && rhs->len >= MICROPY_MPZ_KARATSUBA_THRESHOLD) {
+        size_t tmp_len = mpn_mul_karatsuba_scratch(MAX(lhs->len, rhs->len));
+        mpz_dig_t *tmp = m_new_no_scan(mpz_dig_t, tmp_len);
+        mpn_mul_karatsuba(dest->dig, lhs->dig, lhs->len, rhs->dig, rhs->len, tmp);
+        m_del(mpz_dig_t, tmp, tmp_len);
+        dest->len = mpn_remove_trailing_zeros(dest->dig, dest->dig + lhs->len + rhs->len);
+    } else
+    #endif
+    {
+        memset(dest->dig, 0, dest->alloc * sizeof(mpz_dig_t));
+        dest->len = mpn_mul(dest->dig, lhs->dig, lhs->len, rhs->dig, rhs->len);
+    }
 
     if (lhs->neg == rhs->neg) {
         dest->neg = 0;
@@ -1363,6 +1480,68 @@ void mpz_pow_inpl(mpz_t *dest, const mpz_t *lhs, const mpz_t *rhs) {
     mpz_free(n);
 }
 
+#if MICROPY_OPT_MPZ_MONTGOMERY
+
+/* computes dest = lhs * rhs / 2**(DIG_SIZE * m->len) % m
+   assumes 0 <= lhs, rhs < m; uses t as scratch
+*/
+STATIC void mpz_montgomery_mul(mpz_t *dest, const mpz_t *lhs, const mpz_t *rhs, mpz_t *t, const mpz_t *m, mpz_dig_t minv) {
+    mpz_mul_inpl(t, lhs, rhs);
+    mpz_need_dig(t, 2 * m->len + 1);
+    t->len = mpn_montgomery_reduce(t->dig, t->len, m->dig, m->len, minv);
+    mpz_set(dest, t);
+}
+
+/* computes dest = (lhs ** rhs) % mod like mpz_pow3_inpl
+   assumes mod is odd, rhs > 0
+   Values are kept as x * 2**(DIG_SIZE * len(mod)) % mod so that each step needs a
+   Montgomery reduction instead of a long division.
+*/
+STATIC void mpz_pow3_montgomery(mpz_t *dest, const mpz_t *lhs, const mpz_t *rhs, const mpz_t *mod) {
+    // work modulo abs(mod), sharing its digits
+    mpz_t m = *mod;
+    m.neg = 0;
+    mpz_dig_t minv = mpn_montgomery_inv(m.dig[0]);
+    mp_uint_t shift = m.len * DIG_SIZE;
+
+    mpz_t *n = mpz_clone(rhs);
+    mpz_t quo; mpz_init_zero(&quo);
+    mpz_t t; mpz_init_zero(&t);
+
+    // convert lhs and 1 to Montgomery form
+    mpz_t x; mpz_init_zero(&x);
+    mpz_shl_inpl(&x, lhs, shift);
+    mpz_divmod_inpl(&quo, &x, &x, &m);
+    mpz_set_from_int(&t, 1);
+    mpz_shl_inpl(&t, &t, shift);
+    mpz_divmod_inpl(&quo, dest, &t, &m);
+
+    while (n->len > 0) {
+        if ((n->dig[0] & 1) != 0) {
+            mpz_montgomery_mul(dest, dest, &x, &t, &m, minv);
+        }
+        n->len = mpn_shr(n->dig, n->dig, n->len, 1);
+        if (n->len == 0) {
+            break;
+        }
+        mpz_montgomery_mul(&x, &x, &x, &t, &m, minv);
+    }
+
+    // convert the result back, and give it the sign of mod like Python does
+    mpz_need_dig(dest, 2 * m.len + 1);
+    dest->len = mpn_montgomery_reduce(dest->dig, dest->len, m.dig, m.len, minv);
+    if (mod->neg && dest->len != 0) {
+        mpz_sub_inpl(dest, dest, &m);
+    }
+
+    mpz_deinit(&x);
+    mpz_deinit(&t);
+    mpz_deinit(&quo);
+    mpz_free(n);
+}
+
+#endif
+
 /* computes dest = (lhs ** rhs) % mod
    can have dest, lhs, rhs the same; mod can't be the same as dest
 */
@@ -1378,6 +1557,13 @@ void mpz_pow3_inpl(mpz_t *dest, const mpz_t *lhs, const mpz_t *rhs, const mpz_t
         return;
     }
 
+    #if MICROPY_OPT_MPZ_MONTGOMERY
+    if ((mod->dig[0] & 1) != 0) {
+        mpz_pow3_montgomery(dest, lhs, rhs, mod);
+        return;
+    }
+    #endif
+
     mpz_t *x = mpz_clone(lhs);
     mpz_t *n = mpz_clone(rhs);
     mpz_t quo; mpz_init_zero(&quo);
@@ -1651,6 +1837,94 @@ char *mpz_as_str(const mpz_t *i, unsigned int base) {
 }
 #endif
 
+/* returns the largest power of base that fits in a digit, and its number of
+   characters in *chars
+*/
+STATIC mpz_dig_t mpn_as_str_chunk(unsigned int base, unsigned int *chars) {
+    mpz_dbl_dig_t chunk = base;
+    *chars = 1;
+    while (chunk * base <= DIG_MASK) {
+        chunk *= base;
+        ++(*chars);
+    }
+    return chunk;
+}
+
+/* writes the characters of the number i to str, least significant first,
+   padded with zeros to at least width characters
+   returns a pointer past the last character written; i is destroyed
+*/
+STATIC char *mpn_as_str(char *str, mpz_dig_t *idig, size_t ilen, unsigned int base, char base_char, size_t width) {
+    unsigned int chunk_chars;
+    mpz_dbl_dig_t chunk = mpn_as_str_chunk(base, &chunk_chars);
+    char *s = str;
+
+    // each pass divides by chunk, giving chunk_chars characters at a time
+    while (ilen > 0) {
+        mpz_dig_t *d = idig + ilen;
+        mpz_dbl_dig_t a = 0;
+
+        // compute next remainder
+        while (--d >= idig) {
+            a = (a << DIG_SIZE) | *d;
+            *d = a / chunk;
+            a %= chunk;
+        }
+        ilen = mpn_remove_trailing_zeros(idig, idig + ilen);
+
+        // convert to characters, without leading zeros for the last chunk
+        for (unsigned int n = 0; n < chunk_chars && (ilen > 0 || a != 0); ++n) {
+            mpz_dbl_dig_t c = a % base + '0';
+            a /= base;
+            if (c > '9') {
+                c += base_char - '9' - 1;
+            }
+            *s++ = c;
+        }
+    }
+
+    while ((size_t)(s - str) < width) {
+        *s++ = '0';
+    }
+
+    return s;
+}
+
+#if MICROPY_OPT_MPZ_AS_STR_SPLIT
+
+// numbers with at least this many digits are split in two before converting
+#define MPZ_AS_STR_SPLIT_THRESHOLD (32)
+
+/* like mpn_as_str, but for long numbers divides z by pows[e] and converts the
+   quotient and remainder separately, so most of the work is done on short numbers
+   pows[e] = chunk ** (2 ** e), as from mpn_as_str_chunk; assumes z < pows[e] ** 2
+   z is freed
+*/
+STATIC char *mpz_as_str_split(char *s, mpz_t *z, const mpz_t *pows, size_t e, size_t width,
+    unsigned int chunk_chars, unsigned int base, char base_char) {
+    if (z->len < MPZ_AS_STR_SPLIT_THRESHOLD) {
+        s = mpn_as_str(s, z->dig, z->len, base, base_char, width);
+        mpz_deinit(z);
+        return s;
+    }
+
+    while (mpz_cmp(z, &pows[e]) < 0) {
+        --e;
+    }
+    mpz_t quo, rem;
+    mpz_init_zero(&quo);
+    mpz_init_zero(&rem);
+    mpz_divmod_inpl(&quo, &rem, z, &pows[e]);
+    mpz_deinit(z);
+
+    // the remainder gets all its leading zeros
+    size_t low_width = (size_t)chunk_chars << e;
+    s = mpz_as_str_split(s, &rem, pows, e, low_width, chunk_chars, base, base_char);
+    return mpz_as_str_split(s, &quo, pows, e, width > low_width ? width - low_width : 0, chunk_chars, base, base_char);
+}
+
+#endif
+
 // assumes enough space in str as calculated by mp_int_format_size
 // base must be between 2 and 32 inclusive
 // returns length of string, not including null byte
@@ -1671,48 +1945,59 @@ size_t mpz_as_str_inpl(const mpz_t *i, unsigned int base, const char *prefix, ch
         return s - str;
     }
 
-    // make a copy of mpz digits, so we can do the div/mod calculation
-    mpz_dig_t *dig = m_new(mpz_dig_t, ilen);
-    memcpy(dig, i->dig, ilen * sizeof(mpz_dig_t));
-
-    // convert
-    char *last_comma = str;
-    bool done;
-    do {
-        mpz_dig_t *d = dig + ilen;
-        mpz_dbl_dig_t a = 0;
-
-        // compute next remainder
-        while (--d >= dig) {
-            a = (a << DIG_SIZE) | *d;
-            *d = a / base;
-            a %= base;
+    // convert, least significant character first
+    #if MICROPY_OPT_MPZ_AS_STR_SPLIT
+    if (ilen >= MPZ_AS_STR_SPLIT_THRESHOLD) {
+        unsigned int chunk_chars;
+        mpz_dig_t chunk = mpn_as_str_chunk(base, &chunk_chars);
+
+        // pows[e] = chunk ** (2 ** e), up to the first one whose square exceeds i
+        size_t pows_alloc = 8;
+        mpz_t *pows = m_new(mpz_t, pows_alloc);
+        size_t e = 0;
+        mpz_init_from_int(&pows[0], chunk);
+        while (ilen > 2 * pows[e].len - 2) {
+            if (e + 1 == pows_alloc) {
+                pows = m_renew(mpz_t, pows, pows_alloc, pows_alloc * 2);
+                pows_alloc *= 2;
+            }
+            mpz_init_zero(&pows[e + 1]);
+            mpz_mul_inpl(&pows[e + 1], &pows[e], &pows[e]);
+            ++e;
         }
 
-        // convert to character
-        a += '0';
-        if (a > '9') {
-            a += base_char - '9' - 1;
+        mpz_t z;
+        mpz_init_zero(&z);
+        mpz_abs_inpl(&z, i);
+        s = mpz_as_str_split(s, &z, pows, e, 0, chunk_chars, base, base_char);
+
+        for (size_t n = 0; n <= e; ++n) {
+            mpz_deinit(&pows[n]);
         }
-        *s++ = a;
-
-        // check if number is zero
-        done = true;
-        for (d = dig; d < dig + ilen; ++d) {
-            if (*d != 0) {
-                done = false;
-                break;
+        m_del(mpz_t, pows, pows_alloc);
+    } else
+    #endif
+    {
+        // make a copy of mpz digits, so we can do the div/mod calculation
+        mpz_dig_t *dig = m_new_no_scan(mpz_dig_t, ilen);
+        memcpy(dig, i->dig, ilen * sizeof(mpz_dig_t));
+        s = mpn_as_str(s, dig, ilen, base, base_char, 0);
+        m_del(mpz_dig_t, dig, ilen);
+    }
+
+    if (comma) {
+        // spread the characters out from the top to make room for a comma
+        // after every third one
+        size_t n = s - str;
+        s += (n - 1) / 3;
+        char *d = s;
+        while (n-- > 0) {
+            *--d = str[n];
+            if (n > 0 && n % 3 == 0) {
+                *--d = comma;
             }
         }
-        if (comma && (s - last_comma) == 3) {
-            *s++ = comma;
-            last_comma = s;
-        }
     }
-    while (!done);
-
-    // free the copy of the digits array
-    m_del(mpz_dig_t, dig, ilen);
 
     if (prefix) {
         const char *p = &prefix[strlen(prefix)];
@@ -391,7 +391,8 @@ typedef struct _mp_map_t {
     size_t is_ordered : 1;  // an ordered array
     size_t scanning : 1;    // true if we're in the middle of scanning linked dictionaries,
                             // e.g., make_dict_long_lived()
-    size_t used : (8 * sizeof(size_t) - 4);
+    size_t is_class_locals : 1; // the locals of a class, so changing it invalidates the attribute cache
+    size_t used : (8 * sizeof(size_t) - 5);
     size_t alloc;
     mp_map_elem_t *table;
 } mp_map_t;
@@ -414,6 +415,7 @@ mp_map_t *mp_map_new(size_t n);
 void mp_map_deinit(mp_map_t *map);
 void mp_map_free(mp_map_t *map);
 mp_map_elem_t *mp_map_lookup(mp_map_t *map, mp_obj_t index, mp_map_lookup_kind_t lookup_kind);
+void mp_map_reserve(mp_map_t *map, size_t n);
 void mp_map_clear(mp_map_t *map);
 void mp_map_dump(mp_map_t *map);
 
@@ -849,6 +851,7 @@ typedef struct _mp_obj_fun_builtin_var_t {
 
 qstr mp_obj_fun_get_name(mp_const_obj_t fun);
 qstr mp_obj_code_get_name(const byte *code_info);
+size_t mp_obj_fun_get_names_hint(mp_const_obj_t fun);
 
 mp_obj_t mp_identity(mp_obj_t self);
 MP_DECLARE_CONST_FUN_OBJ_1(mp_identity_obj);
@@ -96,6 +96,19 @@ STATIC void array_print(const mp_print_t *print, mp_obj_t o_in, mp_print_kind_t
 #endif
 
 #if MICROPY_PY_BUILTINS_BYTEARRAY || MICROPY_PY_ARRAY
+// Allocates or grows the items of an array.  They are allocated so that the GC
+// doesn't scan them, unless the typecode is one that holds objects or pointers.
+STATIC byte *array_renew_items(char typecode, byte *items, size_t old_len, size_t new_len) {
+    if (items == NULL
+        #if MICROPY_NONSTANDARD_TYPECODES
+        && typecode != 'O' && typecode != 'P' && typecode != 'S'
+        #endif
+        ) {
+        return m_new_no_scan(byte, new_len);
+    }
+    return m_renew(byte, items, old_len, new_len);
+}
+
 STATIC mp_obj_array_t *array_new(char typecode, size_t n) {
     if (typecode == 'x') {
         mp_raise_ValueError(translate("bad typecode"));
@@ -112,7 +125,7 @@ STATIC mp_obj_array_t *array_new(char typecode, size_t n) {
     o->typecode = typecode;
     o->free = 0;
     o->len = n;
-    o->items = m_new(byte, typecode_size * o->len);
+    o->items = array_renew_items(typecode, NULL, 0, typecode_size * o->len);
     return o;
 }
 #endif
@@ -287,7 +300,7 @@ STATIC mp_obj_t array_binary_op(mp_binary_op_t op, mp_obj_t lhs_in, mp_obj_t rhs
             if(inplace) {
                 res = lhs;
                 size_t item_sz = mp_binary_get_size('@', lhs->typecode, NULL);
-                lhs->items = m_renew(byte, lhs->items, (lhs->len + lhs->free) * item_sz, lhs->len * repeat * item_sz);
+                lhs->items = array_renew_items(lhs->typecode, lhs->items, (lhs->len + lhs->free) * item_sz, lhs->len * repeat * item_sz);
                 lhs->len = lhs->len * repeat;
                 lhs->free = 0;
                 if (!repeat)
@@ -381,7 +394,7 @@ STATIC mp_obj_t array_append(mp_obj_t self_in, mp_obj_t arg) {
         size_t item_sz = mp_binary_get_size('@', self->typecode, NULL);
         // TODO: alloc policy
         self->free = 8;
-        self->items = m_renew(byte, self->items, item_sz * self->len, item_sz * (self->len + self->free));
+        self->items = array_renew_items(self->typecode, self->items, item_sz * self->len, item_sz * (self->len + self->free));
         mp_seq_clear(self->items, self->len + 1, self->len + self->free, item_sz);
     }
     mp_binary_set_val_array(self->typecode, self->items, self->len, arg);
@@ -410,7 +423,7 @@ STATIC mp_obj_t array_extend(mp_obj_t self_in, mp_obj_t arg_in) {
     // make sure we have enough room to extend
     // TODO: alloc policy; at the moment we go conservative
     if (self->free < len) {
-        self->items = m_renew(byte, self->items, (self->len + self->free) * sz, (self->len + len) * sz);
+        self->items = array_renew_items(self->typecode, self->items, (self->len + self->free) * sz, (self->len + len) * sz);
         self->free = 0;
     } else {
         self->free -= len;
@@ -551,7 +564,7 @@ STATIC mp_obj_t array_subscr(mp_obj_t self_in, mp_obj_t index_in, mp_obj_t value
                 if (len_adj > 0) {
                     if ((mp_uint_t) len_adj > o->free) {
                         // TODO: alloc policy; at the moment we go conservative
-                        o->items = m_renew(byte, o->items, (o->len + o->free) * item_sz, (o->len + len_adj) * item_sz);
+                        o->items = array_renew_items(o->typecode, o->items, (o->len + o->free) * item_sz, (o->len + len_adj) * item_sz);
                         o->free = 0;
                         dest_items = o->items;
                     }
@@ -83,7 +83,12 @@ STATIC void dict_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_
 }
 
 STATIC mp_obj_t dict_make_new(const mp_obj_type_t *type, size_t n_args, const mp_obj_t *args, mp_map_t *kw_args) {
-    mp_obj_t dict_out = mp_obj_new_dict(0);
+    // allocate the result based on the number of entries it's known to receive
+    size_t n = kw_args != NULL ? kw_args->used : 0;
+    if (n_args > 0 && MP_OBJ_IS_DICT_TYPE(args[0])) {
+        n += mp_obj_dict_len(args[0]);
+    }
+    mp_obj_t dict_out = mp_obj_new_dict(n);
     mp_obj_dict_t *dict = MP_OBJ_TO_PTR(dict_out);
     dict->base.type = type;
     #if MICROPY_PY_COLLECTIONS_ORDEREDDICT
@@ -315,6 +320,11 @@ STATIC mp_obj_t dict_popitem(mp_obj_t self_in) {
     if (next == NULL) {
         mp_raise_msg_varg(&mp_type_KeyError, translate("pop from empty %q"), MP_QSTR_dict);
     }
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    if (self->map.is_class_locals) {
+        mp_obj_class_attr_cache_invalidate();
+    }
+    #endif
     self->map.used--;
     mp_obj_t items[] = {next->key, next->value};
     next->key = MP_OBJ_SENTINEL; // must mark key as sentinel to indicate that it was deleted
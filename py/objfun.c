@@ -172,6 +172,36 @@ qstr mp_obj_fun_get_name(mp_const_obj_t fun_in) {
     return mp_obj_code_get_name(bc);
 }
 
+// The compiler writes the number of names that a module or class body stores
+// after the end of the line-number info.  Returns 0 if there is no such count,
+// eg for native code, closures and bytecode from before the count was added.
+size_t mp_obj_fun_get_names_hint(mp_const_obj_t fun_in) {
+    if (!MP_OBJ_IS_TYPE(fun_in, &mp_type_fun_bc)) {
+        return 0;
+    }
+    const mp_obj_fun_bc_t *fun = MP_OBJ_TO_PTR(fun_in);
+    const byte *ip = fun->bytecode;
+    ip = mp_decode_uint_skip(ip); // skip n_state
+    ip = mp_decode_uint_skip(ip); // skip n_exc_stack
+    ip += 4; // skip scope_params, n_pos_args, n_kwonly_args, n_def_pos_args
+    const byte *code_info_end = ip + mp_decode_uint_value(ip);
+    ip = mp_decode_uint_skip(ip);
+    #if MICROPY_PERSISTENT_CODE
+    ip += 4; // skip block_name and source_file
+    #else
+    ip = mp_decode_uint_skip(ip); // skip block_name
+    ip = mp_decode_uint_skip(ip); // skip source_file
+    #endif
+    while (*ip) {
+        ip += (*ip & 0x80) ? 2 : 1;
+    }
+    ip++; // skip end of line number info
+    if (ip >= code_info_end) {
+        return 0;
+    }
+    return mp_decode_uint_value(ip);
+}
+
 #if MICROPY_CPYTHON_COMPAT
 STATIC void fun_bc_print(const mp_print_t *print, mp_obj_t o_in, mp_print_kind_t kind) {
     (void)kind;
@@ -284,10 +284,62 @@ wrong_args:
     mp_raise_TypeError(translate("wrong number of arguments"));
 }
 
+#if MICROPY_OPT_STR_FIND_SKIP_TABLE
+
+// Boyer-Moore-Horspool search, used by find_subbytes for long haystacks.
+// The skip table holds, for each byte value, how far the needle can move
+// when that byte is at the end (or start, searching backwards) of the
+// current window.  Shifts are capped at 255 so the table fits in 256 bytes,
+// which only makes the search take smaller (but still correct) steps for
+// needles longer than that.
+STATIC const byte *find_subbytes_horspool(const byte *haystack, size_t hlen, const byte *needle, size_t nlen, int direction) {
+    uint8_t skip[256];
+    memset(skip, MIN(nlen, 255), sizeof(skip));
+    if (direction > 0) {
+        for (size_t i = 0; i < nlen - 1; i++) {
+            skip[needle[i]] = MIN(nlen - 1 - i, 255);
+        }
+        byte last = needle[nlen - 1];
+        for (const byte *p = haystack, *top = haystack + hlen - nlen; p <= top;) {
+            byte c = p[nlen - 1];
+            if (c == last && memcmp(p, needle, nlen - 1) == 0) {
+                return p;
+            }
+            p += skip[c];
+        }
+    } else {
+        for (size_t i = nlen - 1; i > 0; i--) {
+            skip[needle[i]] = MIN(i, 255);
+        }
+        byte first = needle[0];
+        for (size_t pos = hlen - nlen;;) {
+            byte c = haystack[pos];
+            if (c == first && memcmp(haystack + pos + 1, needle + 1, nlen - 1) == 0) {
+                return haystack + pos;
+            }
+            if (pos < skip[c]) {
+                break;
+            }
+            pos -= skip[c];
+        }
+    }
+    return NULL;
+}
+
+#endif
+
 // like strstr but with specified length and allows \0 bytes
-// TODO replace with something more efficient/standard
 const byte *find_subbytes(const byte *haystack, size_t hlen, const byte *needle, size_t nlen, int direction) {
     if (hlen >= nlen) {
+        #if MICROPY_OPT_STR_FIND_SKIP_TABLE
+        if (nlen == 1 && direction > 0) {
+            return memchr(haystack, needle[0], hlen);
+        }
+        // building the skip table only pays off when there's enough to search
+        if (nlen >= 2 && hlen >= 64) {
+            return find_subbytes_horspool(haystack, hlen, needle, nlen, direction);
+        }
+        #endif
         size_t str_index, str_index_end;
         if (direction > 0) {
             str_index = 0;
@@ -568,14 +620,8 @@ mp_obj_t mp_obj_str_split(size_t n_args, const mp_obj_t *args) {
 
         for (;;) {
             const byte *start = s;
-            for (;;) {
-                if (splits == 0 || s + sep_len > top) {
-                    s = top;
-                    break;
-                } else if (memcmp(s, sep_str, sep_len) == 0) {
-                    break;
-                }
-                s++;
+            if (splits == 0 || (s = find_subbytes(s, top - s, (const byte*)sep_str, sep_len, 1)) == NULL) {
+                s = top;
             }
             mp_obj_list_append(res, mp_obj_new_str_of_type(self_type, start, s - start));
             if (s >= top) {
@@ -1740,13 +1786,12 @@ STATIC mp_obj_t str_count(size_t n_args, const mp_obj_t *args) {
 
     // count the occurrences
     mp_int_t num_occurrences = 0;
-    for (const byte *haystack_ptr = start; haystack_ptr + needle_len <= end;) {
-        if (memcmp(haystack_ptr, needle, needle_len) == 0) {
-            num_occurrences++;
-            haystack_ptr += needle_len;
-        } else {
-            haystack_ptr = utf8_next_char(haystack_ptr);
-        }
+    // a str needle starts with a whole character, so matches are only found
+    // at character boundaries even though the search works on bytes
+    for (const byte *haystack_ptr = start;
+        (haystack_ptr = find_subbytes(haystack_ptr, end - haystack_ptr, needle, needle_len, 1)) != NULL;
+        haystack_ptr += needle_len) {
+        num_occurrences++;
     }
 
     return MP_OBJ_NEW_SMALL_INT(num_occurrences);
@@ -2022,7 +2067,7 @@ mp_obj_t mp_obj_new_str_copy(const mp_obj_type_t *type, const byte* data, size_t
     o->len = len;
     if (data) {
         o->hash = qstr_compute_hash(data, len);
-        byte *p = m_new(byte, len + 1);
+        byte *p = m_new_no_scan(byte, len + 1);
         o->data = p;
         memcpy(p, data, len * sizeof(byte));
         p[len] = '\0'; // for now we add null for compatibility with C ASCIIZ strings
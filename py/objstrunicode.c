@@ -100,13 +100,64 @@ STATIC void uni_print(const mp_print_t *print, mp_obj_t self_in, mp_print_kind_t
     }
 }
 
+#if MICROPY_PY_BUILTINS_STR_UNICODE_INDEX
+
+// Strings shorter than this are quick enough to walk each time.
+#define STR_INDEX_MIN_LEN (64)
+
+// Get the number of characters and the character offsets of a long string,
+// from the cache or by scanning it once.  Returns NULL if the string is short
+// or there's no memory for the offsets, in which case the caller walks it.
+STATIC const mp_str_index_entry_t *str_index_get(const byte *data, size_t len) {
+    if (len < STR_INDEX_MIN_LEN) {
+        return NULL;
+    }
+    mp_str_index_entry_t *e = &MP_STATE_THREAD(str_index_cache)[((uintptr_t)data / sizeof(mp_uint_t)) % MP_STR_INDEX_CACHE_SIZE];
+    if (e->data == data && e->len == len && e->gc_collection_count == MP_STATE_MEM(gc_collection_count)) {
+        return e;
+    }
+    size_t char_len = utf8_charlen(data, len);
+    size_t *offsets = NULL;
+    if (char_len != len) {
+        offsets = m_new_no_scan_maybe(size_t, (char_len + MP_STR_INDEX_STRIDE - 1) / MP_STR_INDEX_STRIDE);
+        if (offsets == NULL) {
+            return NULL;
+        }
+        size_t i = 0;
+        for (const byte *s = data, *top = data + len; s < top; s++) {
+            if (!UTF8_IS_CONT(*s)) {
+                if (i % MP_STR_INDEX_STRIDE == 0) {
+                    offsets[i / MP_STR_INDEX_STRIDE] = s - data;
+                }
+                ++i;
+            }
+        }
+    }
+    e->data = data;
+    e->len = len;
+    e->char_len = char_len;
+    e->offsets = offsets;
+    // read after allocating, which may have collected
+    e->gc_collection_count = MP_STATE_MEM(gc_collection_count);
+    return e;
+}
+
+#endif
+
 STATIC mp_obj_t uni_unary_op(mp_unary_op_t op, mp_obj_t self_in) {
     GET_STR_DATA_LEN(self_in, str_data, str_len);
     switch (op) {
         case MP_UNARY_OP_BOOL:
             return mp_obj_new_bool(str_len != 0);
-        case MP_UNARY_OP_LEN:
+        case MP_UNARY_OP_LEN: {
+            #if MICROPY_PY_BUILTINS_STR_UNICODE_INDEX
+            const mp_str_index_entry_t *e = str_index_get(str_data, str_len);
+            if (e != NULL) {
+                return MP_OBJ_NEW_SMALL_INT(e->char_len);
+            }
+            #endif
             return MP_OBJ_NEW_SMALL_INT(utf8_charlen(str_data, str_len));
+        }
         default:
             return MP_OBJ_NULL; // op not supported
     }
@@ -124,6 +175,27 @@ size_t str_offset_to_index(const mp_obj_type_t *type, const byte *self_data, siz
 
     size_t index_val = 0;
     const byte *s = self_data;
+    #if MICROPY_PY_BUILTINS_STR_UNICODE_INDEX
+    const mp_str_index_entry_t *e = str_index_get(self_data, self_len);
+    if (e != NULL) {
+        if (e->offsets == NULL) {
+            return offset;
+        }
+        // find the last indexed character at or before offset, and count from there
+        size_t lo = 0, hi = (e->char_len - 1) / MP_STR_INDEX_STRIDE;
+        while (lo < hi) {
+            size_t mid = (lo + hi + 1) / 2;
+            if (e->offsets[mid] <= offset) {
+                lo = mid;
+            } else {
+                hi = mid - 1;
+            }
+        }
+        index_val = lo * MP_STR_INDEX_STRIDE;
+        s = self_data + e->offsets[lo];
+        offset -= e->offsets[lo];
+    }
+    #endif
     for (size_t i = 0; i < offset; i++, s++) {
         if (!UTF8_IS_CONT(*s)) {
             ++index_val;
@@ -154,6 +226,34 @@ const byte *str_index_to_ptr(const mp_obj_type_t *type, const byte *self_data, s
         mp_raise_TypeError_varg(translate("string indices must be integers, not %q"), mp_obj_get_type_qstr(index));
     }
     const byte *s, *top = self_data + self_len;
+    #if MICROPY_PY_BUILTINS_STR_UNICODE_INDEX
+    const mp_str_index_entry_t *e = str_index_get(self_data, self_len);
+    if (e != NULL) {
+        if (i < 0) {
+            i += e->char_len;
+            if (i < 0) {
+                if (is_slice) {
+                    return self_data;
+                }
+                mp_raise_IndexError_varg(translate("%q index out of range"), MP_QSTR_str);
+            }
+        }
+        if ((size_t)i >= e->char_len) {
+            if (is_slice) {
+                return top;
+            }
+            mp_raise_IndexError_varg(translate("%q index out of range"), MP_QSTR_str);
+        }
+        if (e->offsets == NULL) {
+            return self_data + i;
+        }
+        s = self_data + e->offsets[i / MP_STR_INDEX_STRIDE];
+        for (i %= MP_STR_INDEX_STRIDE; i > 0; --i) {
+            s = utf8_next_char(s);
+        }
+        return s;
+    }
+    #endif
     if (i < 0)
     {
         // Negative indexing is performed by counting from the end of the string.
@@ -686,6 +686,65 @@ STATIC void mp_obj_instance_load_attr(mp_obj_t self_in, qstr attr, mp_obj_t *des
     }
 }
 
+#if MICROPY_OPT_ATTR_INLINE_CACHE
+// Unless it has special accessors, what an instance finds in its class depends only on the
+// class and the attribute name.  The VM caches these lookups per call site, and this counter
+// invalidates all of them whenever any class is created or has its dict changed.
+void mp_obj_class_attr_cache_invalidate(void) {
+    MP_STATE_VM(attr_cache_epoch) += 1;
+}
+
+STATIC bool instance_attr_cache_fill(mp_obj_instance_t *self, qstr attr, mp_attr_cache_entry_t *entry) {
+    const mp_obj_type_t *type = self->base.type;
+    const mp_obj_type_t *native_base;
+    if ((type->flags & TYPE_FLAG_HAS_SPECIAL_ACCESSORS)
+        #if MICROPY_CPYTHON_COMPAT
+        || attr == MP_QSTR___dict__ || attr == MP_QSTR___class__
+        #endif
+        || attr == MP_QSTR___next__
+        || instance_count_native_bases(type, &native_base) != 0) {
+        return false;
+    }
+
+    mp_obj_t dest[2] = {MP_OBJ_NULL, MP_OBJ_NULL};
+    struct class_lookup_data lookup = {
+        .obj = self,
+        .attr = attr,
+        .meth_offset = 0,
+        .dest = dest,
+        .is_type = false,
+    };
+    mp_obj_class_lookup(&lookup, type);
+    if (dest[0] == MP_OBJ_NULL) {
+        // leave __getattr__ and the error to mp_load_method
+        return false;
+    }
+
+    entry->type = type;
+    entry->epoch = MP_STATE_VM(attr_cache_epoch);
+    entry->attr = attr;
+    entry->value = dest[0];
+    entry->bind_self = dest[1] == MP_OBJ_FROM_PTR(self);
+    entry->self = entry->bind_self ? MP_OBJ_NULL : dest[1];
+    return true;
+}
+
+// Does what mp_load_method does for an instance that doesn't have attr as a member, using the
+// cache entry for the call site.  Returns false if the lookup can't be cached.
+bool mp_obj_instance_load_method_cached(mp_obj_t self_in, qstr attr, mp_obj_t *dest, const void *site) {
+    mp_obj_instance_t *self = MP_OBJ_TO_PTR(self_in);
+    mp_attr_cache_entry_t *entry = &MP_STATE_THREAD(attr_cache)[(uintptr_t)site & (MICROPY_OPT_ATTR_INLINE_CACHE_SIZE - 1)];
+    if (entry->type != self->base.type || entry->attr != attr || entry->epoch != MP_STATE_VM(attr_cache_epoch)) {
+        if (!instance_attr_cache_fill(self, attr, entry)) {
+            return false;
+        }
+    }
+    dest[0] = entry->value;
+    dest[1] = entry->bind_self ? self_in : entry->self;
+    return true;
+}
+#endif
+
 STATIC bool mp_obj_instance_store_attr(mp_obj_t self_in, qstr attr, mp_obj_t value) {
     mp_obj_instance_t *self = MP_OBJ_TO_PTR(self_in);
 
@@ -1151,6 +1210,10 @@ mp_obj_t mp_obj_new_type(qstr name, mp_obj_t bases_tuple, mp_obj_t locals_dict)
 
     mp_obj_type_t *o = m_new0_ll(mp_obj_type_t, 1);
     o->base.type = &mp_type_type;
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    // the new type may be at the address of one that has been freed
+    mp_obj_class_attr_cache_invalidate();
+    #endif
     o->flags = base_flags;
     o->name = name;
     o->print = instance_print;
@@ -1183,6 +1246,10 @@ mp_obj_t mp_obj_new_type(qstr name, mp_obj_t bases_tuple, mp_obj_t locals_dict)
     }
 
     o->locals_dict = make_dict_long_lived(locals_dict, 10);
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    // however the class's locals are changed, cached lookups must see it
+    o->locals_dict->map.is_class_locals = 1;
+    #endif
 
 
     const mp_obj_type_t *native_base;
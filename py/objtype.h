@@ -49,6 +49,11 @@ bool mp_obj_instance_is_callable(mp_obj_t self_in);
 mp_obj_t mp_obj_instance_call(mp_obj_t self_in, size_t n_args, size_t n_kw, const mp_obj_t *args);
 
 #define mp_obj_is_instance_type(type) ((type)->make_new == mp_obj_instance_make_new)
+
+#if MICROPY_OPT_ATTR_INLINE_CACHE
+void mp_obj_class_attr_cache_invalidate(void);
+bool mp_obj_instance_load_method_cached(mp_obj_t self_in, qstr attr, mp_obj_t *dest, const void *site);
+#endif
 #define mp_obj_is_native_type(type) ((type)->make_new != mp_obj_instance_make_new)
 // this needs to be exposed for the above macros to work correctly
 mp_obj_t mp_obj_instance_make_new(const mp_obj_type_t *self_in, size_t n_args, const mp_obj_t *args, mp_map_t *kw_args);
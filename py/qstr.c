@@ -35,8 +35,8 @@
 
 #include "supervisor/linker.h"
 
-// NOTE: we are using linear arrays to store and search for qstr's (unique strings, interned strings)
-// ultimately we will replace this with a static hash table of some kind
+// NOTE: we are using linear arrays to store qstr's (unique strings, interned strings)
+// with MICROPY_QSTR_HASH_INDEX they are searched through hash tables, otherwise linearly
 // also probably need to include the length in the string data, to allow null bytes in the string
 
 #if MICROPY_DEBUG_VERBOSE // print debugging info
@@ -84,13 +84,17 @@
 #endif
 
 // this must match the equivalent function in makeqstrdata.py
-mp_uint_t qstr_compute_hash(const byte *data, size_t len) {
+STATIC uint32_t qstr_compute_hash32(const byte *data, size_t len) {
     // djb2 algorithm; see http://www.cse.yorku.ca/~oz/hash.html
-    mp_uint_t hash = 5381;
+    uint32_t hash = 5381;
     for (const byte *top = data + len; data < top; data++) {
         hash = ((hash << 5) + hash) ^ (*data); // hash * 33 ^ data
     }
-    hash &= Q_HASH_MASK;
+    return hash;
+}
+
+STATIC mp_uint_t qstr_hash_from_hash32(uint32_t hash32) {
+    mp_uint_t hash = hash32 & Q_HASH_MASK;
     // Make sure that valid hash is never zero, zero means "hash not computed"
     if (hash == 0) {
         hash++;
@@ -98,17 +102,52 @@ mp_uint_t qstr_compute_hash(const byte *data, size_t len) {
     return hash;
 }
 
+mp_uint_t qstr_compute_hash(const byte *data, size_t len) {
+    return qstr_hash_from_hash32(qstr_compute_hash32(data, len));
+}
+
+#if MICROPY_QSTR_HASH_INDEX
+// The stored hash is only 1 or 2 bytes, so the indexes are addressed by the full
+// 32-bit djb2 hash, mixed so that the low bits depend on the whole string.
+// This must match the equivalent function in makeqstrdata.py
+STATIC size_t qstr_index_slot(uint32_t hash32, size_t alloc) {
+    hash32 ^= hash32 >> 16;
+    hash32 *= 0x45d9f3b;
+    hash32 ^= hash32 >> 16;
+    return hash32 & (alloc - 1);
+}
+
+// precomputed by makeqstrdata.py, see qstr_pool_index_find
+STATIC const uint16_t mp_qstr_const_hash_index[] = {
+#ifndef NO_QSTR
+#define QDEF(id, str)
+#define QINDEX(...) __VA_ARGS__,
+#define TRANSLATION(id, length, compressed...)
+#include "genhdr/qstrdefs.generated.h"
+#undef TRANSLATION
+#undef QINDEX
+#undef QDEF
+#endif
+};
+#endif
+
 const qstr_pool_t mp_qstr_const_pool = {
     NULL,               // no previous pool
     0,                  // no previous pool
     10,                 // set so that the first dynamically allocated pool is twice this size; must be <= the len (just below)
     MP_QSTRnumber_of,   // corresponds to number of strings in array just below
+    #if MICROPY_QSTR_HASH_INDEX
+    mp_qstr_const_hash_index,
+    MP_ARRAY_SIZE(mp_qstr_const_hash_index),
+    #endif
     {
 #ifndef NO_QSTR
 #define QDEF(id, str) str,
+#define QINDEX(...)
 #define TRANSLATION(id, length, compressed...)
 #include "genhdr/qstrdefs.generated.h"
 #undef TRANSLATION
+#undef QINDEX
 #undef QDEF
 #endif
     },
@@ -125,6 +164,15 @@ void qstr_init(void) {
     MP_STATE_VM(last_pool) = (qstr_pool_t*)&CONST_POOL; // we won't modify the const_pool since it has no allocated room left
     MP_STATE_VM(qstr_last_chunk) = NULL;
 
+    #if MICROPY_QSTR_HASH_INDEX
+    MP_STATE_VM(qstr_index) = NULL;
+    MP_STATE_VM(qstr_index_alloc) = 0;
+    MP_STATE_VM(qstr_index_len) = 0;
+    MP_STATE_VM(qstr_pools) = NULL;
+    MP_STATE_VM(qstr_pools_alloc) = 0;
+    MP_STATE_VM(qstr_pools_len) = 0;
+    #endif
+
     #if MICROPY_PY_THREAD
     mp_thread_mutex_init(&MP_STATE_VM(qstr_mutex));
     #endif
@@ -134,6 +182,25 @@ STATIC const byte *find_qstr(qstr q) {
     // search pool for this qstr
     // total_prev_len==0 in the final pool, so the loop will always terminate
     qstr_pool_t *pool = MP_STATE_VM(last_pool);
+    #if MICROPY_QSTR_HASH_INDEX
+    // jump straight to the right pool instead of walking every dynamic one
+    if (q < CONST_POOL.total_prev_len + CONST_POOL.len) {
+        pool = (qstr_pool_t*)&CONST_POOL;
+    } else {
+        qstr_pool_t **pools = MP_STATE_VM(qstr_pools);
+        size_t lo = 0;
+        size_t hi = MP_STATE_VM(qstr_pools_len) - 1;
+        while (lo < hi) {
+            size_t mid = (lo + hi + 1) / 2;
+            if (q < pools[mid]->total_prev_len) {
+                hi = mid - 1;
+            } else {
+                lo = mid;
+            }
+        }
+        pool = pools[lo];
+    }
+    #endif
     while (q < pool->total_prev_len) {
         pool = pool->prev;
     }
@@ -141,6 +208,84 @@ STATIC const byte *find_qstr(qstr q) {
     return pool->qstrs[q - pool->total_prev_len];
 }
 
+STATIC bool qstr_data_equal(const byte *q, mp_uint_t hash, const char *str, size_t len) {
+    return Q_GET_HASH(q) == hash && Q_GET_LENGTH(q) == len && memcmp(Q_GET_DATA(q), str, len) == 0;
+}
+
+#if MICROPY_QSTR_HASH_INDEX
+
+// Search a ROM pool through the table generated for it alongside its qstrs.
+STATIC qstr qstr_pool_index_find(const qstr_pool_t *pool, uint32_t hash32, mp_uint_t hash, const char *str, size_t len) {
+    size_t mask = pool->hash_index_alloc - 1;
+    for (size_t i = qstr_index_slot(hash32, pool->hash_index_alloc);; i = (i + 1) & mask) {
+        size_t n = pool->hash_index[i];
+        if (n == 0) {
+            return 0;
+        }
+        if (qstr_data_equal(pool->qstrs[n - 1], hash, str, len)) {
+            return pool->total_prev_len + n - 1;
+        }
+    }
+}
+
+// Search all of the dynamically allocated pools through their shared index.
+STATIC qstr qstr_index_find(uint32_t hash32, mp_uint_t hash, const char *str, size_t len) {
+    size_t alloc = MP_STATE_VM(qstr_index_alloc);
+    if (alloc == 0) {
+        return 0;
+    }
+    const qstr *index = MP_STATE_VM(qstr_index);
+    for (size_t i = qstr_index_slot(hash32, alloc);; i = (i + 1) & (alloc - 1)) {
+        qstr q = index[i];
+        if (q == 0) {
+            return 0;
+        }
+        if (qstr_data_equal(find_qstr(q), hash, str, len)) {
+            return q;
+        }
+    }
+}
+
+STATIC void qstr_index_insert(qstr *index, size_t alloc, uint32_t hash32, qstr q) {
+    size_t i = qstr_index_slot(hash32, alloc);
+    while (index[i] != 0) {
+        i = (i + 1) & (alloc - 1);
+    }
+    index[i] = q;
+}
+
+// Make room in the shared index for one more qstr, keeping the load factor at
+// or below 1/2.  Returns false if there is no room and the index can't grow.
+// qstr_mutex must be taken while in this function
+STATIC bool qstr_index_reserve(void) {
+    size_t alloc = MP_STATE_VM(qstr_index_alloc);
+    if ((MP_STATE_VM(qstr_index_len) + 1) * 2 <= alloc) {
+        return true;
+    }
+    size_t new_alloc = alloc == 0 ? 32 : alloc * 2;
+    qstr *new_index = m_new_ll_maybe(qstr, new_alloc);
+    if (new_index == NULL) {
+        // a fuller index still works as long as one slot stays empty
+        return MP_STATE_VM(qstr_index_len) + 1 < alloc;
+    }
+    memset(new_index, 0, new_alloc * sizeof(qstr));
+    // re-insert every dynamically allocated qstr, walking the pools directly
+    for (qstr_pool_t *pool = MP_STATE_VM(last_pool); pool != &CONST_POOL; pool = pool->prev) {
+        for (size_t n = 0; n < pool->len; n++) {
+            const byte *q = pool->qstrs[n];
+            qstr_index_insert(new_index, new_alloc, qstr_compute_hash32(Q_GET_DATA(q), Q_GET_LENGTH(q)), pool->total_prev_len + n);
+        }
+    }
+    if (MP_STATE_VM(qstr_index) != NULL) {
+        m_del(qstr, MP_STATE_VM(qstr_index), alloc);
+    }
+    MP_STATE_VM(qstr_index) = new_index;
+    MP_STATE_VM(qstr_index_alloc) = new_alloc;
+    return true;
+}
+
+#endif
+
 // qstr_mutex must be taken while in this function
 STATIC qstr qstr_add(const byte *q_ptr) {
     DEBUG_printf("QSTR: add hash=%d len=%d data=%.*s\n", Q_GET_HASH(q_ptr), Q_GET_LENGTH(q_ptr), Q_GET_LENGTH(q_ptr), Q_GET_DATA(q_ptr));
@@ -151,6 +296,19 @@ STATIC qstr qstr_add(const byte *q_ptr) {
         if (new_pool_length > MICROPY_QSTR_POOL_MAX_ENTRIES) {
             new_pool_length = MICROPY_QSTR_POOL_MAX_ENTRIES;
         }
+        #if MICROPY_QSTR_HASH_INDEX
+        // make room to record the new pool, used by find_qstr
+        if (MP_STATE_VM(qstr_pools_len) >= MP_STATE_VM(qstr_pools_alloc)) {
+            size_t new_alloc = MP_STATE_VM(qstr_pools_alloc) == 0 ? 8 : MP_STATE_VM(qstr_pools_alloc) * 2;
+            qstr_pool_t **pools = m_renew_maybe(qstr_pool_t*, MP_STATE_VM(qstr_pools), MP_STATE_VM(qstr_pools_alloc), new_alloc, true);
+            if (pools == NULL) {
+                QSTR_EXIT();
+                m_malloc_fail(new_alloc * sizeof(qstr_pool_t*));
+            }
+            MP_STATE_VM(qstr_pools) = pools;
+            MP_STATE_VM(qstr_pools_alloc) = new_alloc;
+        }
+        #endif
         qstr_pool_t *pool = m_new_ll_obj_var_maybe(qstr_pool_t, const char*, new_pool_length);
         if (pool == NULL) {
             QSTR_EXIT();
@@ -160,25 +318,58 @@ STATIC qstr qstr_add(const byte *q_ptr) {
         pool->total_prev_len = MP_STATE_VM(last_pool)->total_prev_len + MP_STATE_VM(last_pool)->len;
         pool->alloc = new_pool_length;
         pool->len = 0;
+        #if MICROPY_QSTR_HASH_INDEX
+        pool->hash_index = NULL;
+        pool->hash_index_alloc = 0;
+        MP_STATE_VM(qstr_pools)[MP_STATE_VM(qstr_pools_len)++] = pool;
+        #endif
         MP_STATE_VM(last_pool) = pool;
         DEBUG_printf("QSTR: allocate new pool of size %d\n", MP_STATE_VM(last_pool)->alloc);
     }
 
+    #if MICROPY_QSTR_HASH_INDEX
+    if (!qstr_index_reserve()) {
+        QSTR_EXIT();
+        m_malloc_fail(MP_STATE_VM(qstr_index_alloc) * 2 * sizeof(qstr));
+    }
+    #endif
+
     // add the new qstr
     MP_STATE_VM(last_pool)->qstrs[MP_STATE_VM(last_pool)->len++] = q_ptr;
+    qstr q = MP_STATE_VM(last_pool)->total_prev_len + MP_STATE_VM(last_pool)->len - 1;
+
+    #if MICROPY_QSTR_HASH_INDEX
+    qstr_index_insert(MP_STATE_VM(qstr_index), MP_STATE_VM(qstr_index_alloc), qstr_compute_hash32(Q_GET_DATA(q_ptr), Q_GET_LENGTH(q_ptr)), q);
+    MP_STATE_VM(qstr_index_len) += 1;
+    #endif
 
     // return id for the newly-added qstr
-    return MP_STATE_VM(last_pool)->total_prev_len + MP_STATE_VM(last_pool)->len - 1;
+    return q;
 }
 
 qstr qstr_find_strn(const char *str, size_t str_len) {
     // work out hash of str
-    mp_uint_t str_hash = qstr_compute_hash((const byte*)str, str_len);
+    uint32_t str_hash32 = qstr_compute_hash32((const byte*)str, str_len);
+    mp_uint_t str_hash = qstr_hash_from_hash32(str_hash32);
+
+    #if MICROPY_QSTR_HASH_INDEX
+    // search the ROM pools, each through its own precomputed index
+    for (const qstr_pool_t *pool = &CONST_POOL; pool != NULL; pool = pool->prev) {
+        qstr q = qstr_pool_index_find(pool, str_hash32, str_hash, str, str_len);
+        if (q != 0) {
+            return q;
+        }
+    }
+
+    // search the dynamically allocated pools
+    return qstr_index_find(str_hash32, str_hash, str, str_len);
+    #else
+    (void)str_hash32;
 
     // search pools for the data
     for (qstr_pool_t *pool = MP_STATE_VM(last_pool); pool != NULL; pool = pool->prev) {
         for (const byte **q = pool->qstrs, **q_top = pool->qstrs + pool->len; q < q_top; q++) {
-            if (Q_GET_HASH(*q) == str_hash && Q_GET_LENGTH(*q) == str_len && memcmp(Q_GET_DATA(*q), str, str_len) == 0) {
+            if (qstr_data_equal(*q, str_hash, str, str_len)) {
                 return pool->total_prev_len + (q - pool->qstrs);
             }
         }
@@ -186,6 +377,7 @@ qstr qstr_find_strn(const char *str, size_t str_len) {
 
     // not found; return null qstr
     return 0;
+    #endif
 }
 
 qstr qstr_from_str(const char *str) {
@@ -289,6 +481,9 @@ void qstr_pool_info(size_t *n_pool, size_t *n_qstr, size_t *n_str_data_bytes, si
         *n_total_bytes += sizeof(qstr_pool_t) + sizeof(qstr) * pool->alloc;
         #endif
     }
+    #if MICROPY_QSTR_HASH_INDEX
+    *n_total_bytes += sizeof(qstr) * MP_STATE_VM(qstr_index_alloc);
+    #endif
     *n_total_bytes += *n_str_data_bytes;
     QSTR_EXIT();
 }
@@ -52,6 +52,12 @@ typedef struct _qstr_pool_t {
     size_t total_prev_len;
     size_t alloc;
     size_t len;
+    #if MICROPY_QSTR_HASH_INDEX
+    // For ROM pools, an open-addressed table of (local index + 1), 0 = empty.
+    // Dynamic pools have no table of their own; they share MP_STATE_VM(qstr_index).
+    const uint16_t *hash_index;
+    size_t hash_index_alloc; // always a power of 2
+    #endif
     const byte *qstrs[];
 } qstr_pool_t;
 
@@ -66,6 +66,11 @@ const mp_obj_module_t mp_module___main__ = {
 void mp_init(void) {
     qstr_init();
 
+    #if MICROPY_OPT_ATTR_INLINE_CACHE
+    // types from before a soft reset may share addresses with new ones
+    mp_obj_class_attr_cache_invalidate();
+    #endif
+
     // no pending exceptions to start with
     MP_STATE_VM(mp_pending_exception) = MP_OBJ_NULL;
     #if MICROPY_ENABLE_SCHEDULER
@@ -118,6 +123,13 @@ void mp_init(void) {
     MP_STATE_VM(mp_module_builtins_override_dict) = NULL;
     #endif
 
+    #if MICROPY_PY_URE && MICROPY_PY_URE_CACHE_SIZE
+    // no compiled patterns from before a soft reset
+    for (size_t i = 0; i < MICROPY_PY_URE_CACHE_SIZE * 2; ++i) {
+        MP_STATE_VM(ure_cache[i]) = MP_OBJ_NULL;
+    }
+    #endif
+
     #if MICROPY_PY_OS_DUPTERM
     for (size_t i = 0; i < MICROPY_PY_OS_DUPTERM; ++i) {
         MP_STATE_VM(dupterm_objs[i]) = MP_OBJ_NULL;
@@ -41,6 +41,7 @@ enum {
     ID_FLAG_IS_PARAM = 0x01,
     ID_FLAG_IS_STAR_PARAM = 0x02,
     ID_FLAG_IS_DBL_STAR_PARAM = 0x04,
+    ID_FLAG_IS_STORED = 0x08, // in a module or class, assigned or deleted by that scope
 };
 
 typedef struct _id_info_t {
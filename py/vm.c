@@ -112,6 +112,26 @@
     exc_sp--; /* pop back to previous exception handler */ \
     CLEAR_SYS_EXC_INFO() /* just clear sys.exc_info(), not compliant, but it shouldn't be used in 1st place */
 
+#if MICROPY_OPT_ATTR_INLINE_CACHE
+// Loads attr from base, which is an instance that doesn't have attr as a member, using the
+// attribute cache entry for the call site at ip.
+STATIC mp_obj_t load_class_attr_cached(mp_obj_t base, qstr attr, const byte *ip) {
+    mp_obj_t dest[2];
+    if (!mp_obj_instance_load_method_cached(base, attr, dest, ip)) {
+        return mp_load_attr(base, attr);
+    }
+    if (dest[1] == MP_OBJ_NULL) {
+        return dest[0];
+    }
+    return mp_obj_new_bound_meth(dest[0], dest[1]);
+}
+
+STATIC mp_map_elem_t *lookup_instance_member(mp_obj_t base, qstr attr) {
+    mp_obj_instance_t *self = MP_OBJ_TO_PTR(base);
+    return mp_map_lookup(&self->members, MP_OBJ_NEW_QSTR(attr), MP_MAP_LOOKUP);
+}
+#endif
+
 // fastn has items in reverse order (fastn[0] is local[0], fastn[-1] is local[1], etc)
 // sp points to bottom of stack which grows up
 // returns:
@@ -330,6 +350,14 @@ dispatch_loop:
                 ENTRY(MP_BC_LOAD_ATTR): {
                     MARK_EXC_IP_SELECTIVE();
                     DECODE_QSTR;
+                    #if MICROPY_OPT_ATTR_INLINE_CACHE
+                    mp_obj_t top = TOP();
+                    if (mp_obj_is_instance_type(mp_obj_get_type(top))) {
+                        mp_map_elem_t *elem = lookup_instance_member(top, qst);
+                        SET_TOP(elem != NULL ? elem->value : load_class_attr_cached(top, qst, ip));
+                        DISPATCH();
+                    }
+                    #endif
                     SET_TOP(mp_load_attr(TOP(), qst));
                     DISPATCH();
                 }
@@ -350,14 +378,22 @@ dispatch_loop:
                             if (elem != NULL) {
                                 *(byte*)ip = elem - &self->members.table[0];
                             } else {
+                                #if MICROPY_OPT_ATTR_INLINE_CACHE
+                                SET_TOP(load_class_attr_cached(top, qst, ip));
+                                ip++;
+                                DISPATCH();
+                                #else
                                 goto load_attr_cache_fail;
+                                #endif
                             }
                         }
                         SET_TOP(elem->value);
                         ip++;
                         DISPATCH();
                     }
+                #if !MICROPY_OPT_ATTR_INLINE_CACHE
                 load_attr_cache_fail:
+                #endif
                     SET_TOP(mp_load_attr(top, qst));
                     ip++;
                     DISPATCH();
@@ -367,6 +403,14 @@ dispatch_loop:
                 ENTRY(MP_BC_LOAD_METHOD): {
                     MARK_EXC_IP_SELECTIVE();
                     DECODE_QSTR;
+                    #if MICROPY_OPT_ATTR_INLINE_CACHE
+                    if (mp_obj_is_instance_type(mp_obj_get_type(*sp))
+                        && lookup_instance_member(*sp, qst) == NULL
+                        && mp_obj_instance_load_method_cached(*sp, qst, sp, ip)) {
+                        sp += 1;
+                        DISPATCH();
+                    }
+                    #endif
                     mp_load_method(*sp, qst, sp);
                     sp += 1;
                     DISPATCH();
@@ -43,7 +43,7 @@ void vstr_init(vstr_t *vstr, size_t alloc) {
     }
     vstr->alloc = alloc;
     vstr->len = 0;
-    vstr->buf = m_new(char, vstr->alloc);
+    vstr->buf = m_new_no_scan(char, vstr->alloc);
     vstr->fixed_buf = false;
 }
 
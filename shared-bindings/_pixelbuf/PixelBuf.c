@@ -34,6 +34,7 @@
 #include "py/runtime.h"
 #include "py/gc.h"
 
+#include <math.h>
 #include <string.h>
 
 #include "shared-bindings/_pixelbuf/PixelBuf.h"
@@ -47,15 +48,16 @@
 extern const int32_t colorwheel(float pos);
 
 static void parse_byteorder(mp_obj_t byteorder_obj, pixelbuf_byteorder_details_t* parsed);
+static mp_float_t validate_gamma(mp_obj_t gamma_obj);
 
 //| class PixelBuf:
 //|     """A fast RGB[W] pixel buffer for LED and similar devices."""
 //|
-//|     def __init__(self, size: int, *, byteorder: str = "BGR", brightness: float = 0, auto_write: bool = False, header: ReadableBuffer = b"", trailer: ReadableBuffer = b"") -> None:
+//|     def __init__(self, size: int, *, byteorder: str = "BGR", brightness: float = 0, gamma: float = 1.0, auto_write: bool = False, header: ReadableBuffer = b"", trailer: ReadableBuffer = b"") -> None:
 //|         """Create a PixelBuf object of the specified size, byteorder, and bits per pixel.
 //|
-//|         When brightness is less than 1.0, a second buffer will be used to store the color values
-//|         before they are adjusted for brightness.
+//|         When brightness is less than 1.0 or gamma isn't 1.0, a second buffer will be used to store
+//|         the color values before they are adjusted for brightness and gamma.
 //|
 //|         When ``P`` (PWM duration) is present as the 4th character of the byteorder
 //|         string, the 4th value in the tuple/list for a pixel is the individual pixel
@@ -65,6 +67,7 @@ static void parse_byteorder(mp_obj_t byteorder_obj, pixelbuf_byteorder_details_t
 //|         :param int size: Number of pixels
 //|         :param str byteorder: Byte order string (such as "RGB", "RGBW" or "PBGR")
 //|         :param float brightness: Brightness (0 to 1.0, default 1.0)
+//|         :param float gamma: Gamma correction exponent applied to each color value (default 1.0, no correction)
 //|         :param bool auto_write: Whether to automatically write pixels (Default False)
 //|         :param ~_typing.ReadableBuffer header: Sequence of bytes to always send before pixel values.
 //|         :param ~_typing.ReadableBuffer trailer: Sequence of bytes to always send after pixel values."""
@@ -72,11 +75,12 @@ static void parse_byteorder(mp_obj_t byteorder_obj, pixelbuf_byteorder_details_t
 //|
 STATIC mp_obj_t pixelbuf_pixelbuf_make_new(const mp_obj_type_t *type, size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
     mp_arg_check_num(n_args, kw_args, 1, MP_OBJ_FUN_ARGS_MAX, true);
-    enum { ARG_size, ARG_byteorder, ARG_brightness, ARG_auto_write, ARG_header, ARG_trailer };
+    enum { ARG_size, ARG_byteorder, ARG_brightness, ARG_gamma, ARG_auto_write, ARG_header, ARG_trailer };
     static const mp_arg_t allowed_args[] = {
         { MP_QSTR_size, MP_ARG_REQUIRED | MP_ARG_INT },
         { MP_QSTR_byteorder, MP_ARG_KW_ONLY | MP_ARG_OBJ, { .u_obj = MP_OBJ_NEW_QSTR(MP_QSTR_BGR) } },
         { MP_QSTR_brightness, MP_ARG_KW_ONLY | MP_ARG_OBJ, { .u_obj = mp_const_none } },
+        { MP_QSTR_gamma, MP_ARG_KW_ONLY | MP_ARG_OBJ, { .u_obj = mp_const_none } },
         { MP_QSTR_auto_write, MP_ARG_KW_ONLY | MP_ARG_BOOL, {.u_bool = false} },
         { MP_QSTR_header, MP_ARG_KW_ONLY | MP_ARG_OBJ, { .u_obj = mp_const_none } },
         { MP_QSTR_trailer, MP_ARG_KW_ONLY | MP_ARG_OBJ, { .u_obj = mp_const_none } },
@@ -109,16 +113,30 @@ STATIC mp_obj_t pixelbuf_pixelbuf_make_new(const mp_obj_type_t *type, size_t n_a
         }
     }
 
+    mp_float_t gamma = 1.0;
+    if (args[ARG_gamma].u_obj != mp_const_none) {
+        gamma = validate_gamma(args[ARG_gamma].u_obj);
+    }
+
     // Validation complete, allocate and populate object.
     pixelbuf_pixelbuf_obj_t *self = m_new_obj(pixelbuf_pixelbuf_obj_t);
     self->base.type = &pixelbuf_pixelbuf_type;
     common_hal__pixelbuf_pixelbuf_construct(self, args[ARG_size].u_int,
-    &byteorder_details, brightness, args[ARG_auto_write].u_bool, header_bufinfo.buf,
+    &byteorder_details, brightness, gamma, args[ARG_auto_write].u_bool, header_bufinfo.buf,
     header_bufinfo.len, trailer_bufinfo.buf, trailer_bufinfo.len);
 
     return MP_OBJ_FROM_PTR(self);
 }
 
+static mp_float_t validate_gamma(mp_obj_t gamma_obj) {
+    mp_float_t gamma = mp_obj_get_float(gamma_obj);
+    // Written so that NaN fails the test too.
+    if (!(gamma > 0) || isinf(gamma)) {
+        mp_raise_ValueError_varg(translate("%q out of range"), MP_QSTR_gamma);
+    }
+    return gamma;
+}
+
 static void parse_byteorder(mp_obj_t byteorder_obj, pixelbuf_byteorder_details_t* parsed) {
     if (!MP_OBJ_IS_STR(byteorder_obj)) {
         mp_raise_TypeError(translate("byteorder is not a string"));
@@ -203,6 +221,32 @@ const mp_obj_property_t pixelbuf_pixelbuf_brightness_obj = {
               (mp_obj_t)&mp_const_none_obj},
 };
 
+//|     gamma: float
+//|     """Gamma correction exponent. Each red, green, blue and white value is scaled as
+//|     ``255 * (value / 255) ** gamma`` before brightness is applied, and the DotStar per-pixel
+//|     brightness in the same way. Values read back from the pixels are not corrected.
+//|
+//|     As with brightness, a second buffer will be used when gamma isn't 1.0."""
+//|
+STATIC mp_obj_t pixelbuf_pixelbuf_obj_get_gamma(mp_obj_t self_in) {
+    return mp_obj_new_float(common_hal__pixelbuf_pixelbuf_get_gamma(self_in));
+}
+MP_DEFINE_CONST_FUN_OBJ_1(pixelbuf_pixelbuf_get_gamma_obj, pixelbuf_pixelbuf_obj_get_gamma);
+
+
+STATIC mp_obj_t pixelbuf_pixelbuf_obj_set_gamma(mp_obj_t self_in, mp_obj_t value) {
+    common_hal__pixelbuf_pixelbuf_set_gamma(self_in, validate_gamma(value));
+    return mp_const_none;
+}
+MP_DEFINE_CONST_FUN_OBJ_2(pixelbuf_pixelbuf_set_gamma_obj, pixelbuf_pixelbuf_obj_set_gamma);
+
+const mp_obj_property_t pixelbuf_pixelbuf_gamma_obj = {
+    .base.type = &mp_type_property,
+    .proxy = {(mp_obj_t)&pixelbuf_pixelbuf_get_gamma_obj,
+              (mp_obj_t)&pixelbuf_pixelbuf_set_gamma_obj,
+              (mp_obj_t)&mp_const_none_obj},
+};
+
 //|     auto_write: bool
 //|     """Whether to automatically write the pixels after each update."""
 //|
@@ -273,6 +317,83 @@ STATIC mp_obj_t pixelbuf_pixelbuf_fill(mp_obj_t self_in, mp_obj_t value) {
 }
 STATIC MP_DEFINE_CONST_FUN_OBJ_2(pixelbuf_pixelbuf_fill_obj, pixelbuf_pixelbuf_fill);
 
+//|     def set_pixels_from_buffer(self, start: int, buf: ReadableBuffer, format: str = "RGB888", step: int = 1) -> None:
+//|         """Sets consecutive pixels, or every ``step``-th one, from packed color data, starting at
+//|         pixel ``start``. This is much faster than assigning a sequence of tuples or ints because no
+//|         object is made for each pixel.
+//|
+//|         ``format`` gives the layout of each pixel in ``buf``:
+//|
+//|         * ``"RGB888"``: three bytes, red, green and blue
+//|         * ``"RGB565"``: a native byte order 16-bit value, as in an ``array('H')``
+//|         * ``"uint32"``: a native byte order 32-bit value packed like an integer color (0xRRGGBB),
+//|           as in an ``array('I')``
+//|
+//|         As with integer colors, RGBW pixels use their white LED when red, green and blue are equal
+//|         and DotStar pixels are set to full per-pixel brightness.
+//|
+//|         :param int start: Index of the first pixel to set
+//|         :param ~_typing.ReadableBuffer buf: Packed color data for one or more pixels
+//|         :param str format: Layout of the color data
+//|         :param int step: Distance between the pixels set"""
+//|         ...
+//|
+
+STATIC mp_obj_t pixelbuf_pixelbuf_set_pixels_from_buffer(size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_start, ARG_buf, ARG_format, ARG_step };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_start, MP_ARG_REQUIRED | MP_ARG_OBJ },
+        { MP_QSTR_buf, MP_ARG_REQUIRED | MP_ARG_OBJ },
+        { MP_QSTR_format, MP_ARG_OBJ, { .u_obj = MP_OBJ_NEW_QSTR(MP_QSTR_RGB888) } },
+        { MP_QSTR_step, MP_ARG_INT, { .u_int = 1 } },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args - 1, pos_args + 1, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
+    mp_obj_t self_in = pos_args[0];
+
+    const char *format_name = mp_obj_str_get_str(args[ARG_format].u_obj);
+    pixelbuf_buffer_format_t format;
+    size_t format_size;
+    if (strcmp(format_name, "RGB888") == 0) {
+        format = PIXELBUF_FORMAT_RGB888;
+        format_size = 3;
+    } else if (strcmp(format_name, "RGB565") == 0) {
+        format = PIXELBUF_FORMAT_RGB565;
+        format_size = 2;
+    } else if (strcmp(format_name, "uint32") == 0) {
+        format = PIXELBUF_FORMAT_UINT32;
+        format_size = 4;
+    } else {
+        mp_raise_ValueError_varg(translate("Invalid %q"), MP_QSTR_format);
+    }
+
+    mp_buffer_info_t bufinfo;
+    mp_get_buffer_raise(args[ARG_buf].u_obj, &bufinfo, MP_BUFFER_READ);
+    if (bufinfo.len % format_size != 0) {
+        mp_raise_ValueError(translate("Invalid buffer size"));
+    }
+    size_t count = bufinfo.len / format_size;
+
+    mp_int_t step = args[ARG_step].u_int;
+    if (step == 0) {
+        mp_raise_ValueError_varg(translate("%q out of range"), MP_QSTR_step);
+    }
+    size_t length = common_hal__pixelbuf_pixelbuf_get_len(self_in);
+    size_t start = mp_get_index(mp_obj_get_type(self_in), length, args[ARG_start].u_obj, false);
+    if (count == 0) {
+        return mp_const_none;
+    }
+    // The last pixel set has to be in the buffer too.
+    mp_int_t last = start + (mp_int_t)(count - 1) * step;
+    if (last < 0 || last >= (mp_int_t)length) {
+        mp_raise_ValueError_varg(translate("%q out of range"), MP_QSTR_buf);
+    }
+
+    common_hal__pixelbuf_pixelbuf_set_pixels_from_buffer(self_in, start, step, bufinfo.buf, count, format);
+    return mp_const_none;
+}
+STATIC MP_DEFINE_CONST_FUN_OBJ_KW(pixelbuf_pixelbuf_set_pixels_from_buffer_obj, 3, pixelbuf_pixelbuf_set_pixels_from_buffer);
+
 //|     @overload
 //|     def __getitem__(self, index: slice) -> Union[Tuple[Tuple[int, int, int], ...], Tuple[Tuple[int, int, int, float], ...]]: ...
 //|     @overload
@@ -371,8 +492,10 @@ STATIC const mp_rom_map_elem_t pixelbuf_pixelbuf_locals_dict_table[] = {
     { MP_ROM_QSTR(MP_QSTR_bpp), MP_ROM_PTR(&pixelbuf_pixelbuf_bpp_obj)},
     { MP_ROM_QSTR(MP_QSTR_brightness), MP_ROM_PTR(&pixelbuf_pixelbuf_brightness_obj)},
     { MP_ROM_QSTR(MP_QSTR_byteorder), MP_ROM_PTR(&pixelbuf_pixelbuf_byteorder_str)},
+    { MP_ROM_QSTR(MP_QSTR_gamma), MP_ROM_PTR(&pixelbuf_pixelbuf_gamma_obj)},
     { MP_ROM_QSTR(MP_QSTR_show), MP_ROM_PTR(&pixelbuf_pixelbuf_show_obj)},
     { MP_ROM_QSTR(MP_QSTR_fill), MP_ROM_PTR(&pixelbuf_pixelbuf_fill_obj)},
+    { MP_ROM_QSTR(MP_QSTR_set_pixels_from_buffer), MP_ROM_PTR(&pixelbuf_pixelbuf_set_pixels_from_buffer_obj)},
 };
 
 STATIC MP_DEFINE_CONST_DICT(pixelbuf_pixelbuf_locals_dict, pixelbuf_pixelbuf_locals_dict_table);
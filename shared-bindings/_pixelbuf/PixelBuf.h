@@ -32,13 +32,15 @@
 extern const mp_obj_type_t pixelbuf_pixelbuf_type;
 
 void common_hal__pixelbuf_pixelbuf_construct(pixelbuf_pixelbuf_obj_t *self, size_t n,
-    pixelbuf_byteorder_details_t* byteorder, mp_float_t brightness, bool auto_write, uint8_t* header,
+    pixelbuf_byteorder_details_t* byteorder, mp_float_t brightness, mp_float_t gamma, bool auto_write, uint8_t* header,
     size_t header_len, uint8_t* trailer, size_t trailer_len);
 
 // These take mp_obj_t because they are called on subclasses of PixelBuf.
 uint8_t common_hal__pixelbuf_pixelbuf_get_bpp(mp_obj_t self);
 mp_float_t common_hal__pixelbuf_pixelbuf_get_brightness(mp_obj_t self);
 void common_hal__pixelbuf_pixelbuf_set_brightness(mp_obj_t self, mp_float_t brightness);
+mp_float_t common_hal__pixelbuf_pixelbuf_get_gamma(mp_obj_t self);
+void common_hal__pixelbuf_pixelbuf_set_gamma(mp_obj_t self, mp_float_t gamma);
 bool common_hal__pixelbuf_pixelbuf_get_auto_write(mp_obj_t self);
 void common_hal__pixelbuf_pixelbuf_set_auto_write(mp_obj_t self, bool auto_write);
 size_t common_hal__pixelbuf_pixelbuf_get_len(mp_obj_t self_in);
@@ -48,5 +50,7 @@ void common_hal__pixelbuf_pixelbuf_show(mp_obj_t self);
 mp_obj_t common_hal__pixelbuf_pixelbuf_get_pixel(mp_obj_t self, size_t index);
 void common_hal__pixelbuf_pixelbuf_set_pixel(mp_obj_t self, size_t index, mp_obj_t item);
 void common_hal__pixelbuf_pixelbuf_set_pixels(mp_obj_t self_in, size_t start, mp_int_t step, size_t slice_len, mp_obj_t* values, mp_obj_tuple_t *flatten_to);
+void common_hal__pixelbuf_pixelbuf_set_pixels_from_buffer(mp_obj_t self_in, size_t start, mp_int_t step,
+    const uint8_t* buffer, size_t count, pixelbuf_buffer_format_t format);
 
 #endif  // CP_SHARED_BINDINGS_PIXELBUF_PIXELBUF_H
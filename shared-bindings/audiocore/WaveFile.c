@@ -40,11 +40,15 @@
 //|     be 8 bit unsigned or 16 bit signed. If a buffer is provided, it will be used instead of allocating
 //|     an internal buffer."""
 //|
-//|     def __init__(self, file: typing.BinaryIO, buffer: WriteableBuffer) -> None:
+//|     def __init__(self, file: typing.BinaryIO, buffer: WriteableBuffer, *, buffer_count: int = 2) -> None:
 //|         """Load a .wav file for playback with `audioio.AudioOut` or `audiobusio.I2SOut`.
 //|
 //|         :param typing.BinaryIO file: Already opened wave file
-//|         :param ~_typing.WriteableBuffer buffer: Optional pre-allocated buffer, that will be split in half and used for double-buffering of the data. If not provided, two 512 byte buffers are allocated internally.
+//|         :param ~_typing.WriteableBuffer buffer: Optional pre-allocated buffer, that will be split into ``buffer_count`` blocks of at least 4 bytes each. If not provided, ``buffer_count`` 256 byte blocks are allocated internally.
+//|         :param int buffer_count: The number of blocks to buffer the data in, from 2 to 8. Two blocks
+//|             are being played at a time and the rest are read from the file ahead of time in the
+//|             background, so that slow reads don't interrupt the audio. With the default of 2 each
+//|             block is read from the file just as it is needed.
 //|
 //|
 //|         Playing a wave file from flash::
@@ -69,24 +73,39 @@
 //|           print("stopped")"""
 //|         ...
 //|
-STATIC mp_obj_t audioio_wavefile_make_new(const mp_obj_type_t *type, size_t n_args, const mp_obj_t *args, mp_map_t *kw_args) {
-    mp_arg_check_num(n_args, kw_args, 1, 2, false);
+STATIC mp_obj_t audioio_wavefile_make_new(const mp_obj_type_t *type, size_t n_args, const mp_obj_t *pos_args, mp_map_t *kw_args) {
+    enum { ARG_file, ARG_buffer, ARG_buffer_count };
+    static const mp_arg_t allowed_args[] = {
+        { MP_QSTR_file, MP_ARG_REQUIRED | MP_ARG_OBJ },
+        { MP_QSTR_buffer, MP_ARG_OBJ, {.u_obj = mp_const_none} },
+        { MP_QSTR_buffer_count, MP_ARG_INT | MP_ARG_KW_ONLY, {.u_int = 2} },
+    };
+    mp_arg_val_t args[MP_ARRAY_SIZE(allowed_args)];
+    mp_arg_parse_all(n_args, pos_args, kw_args, MP_ARRAY_SIZE(allowed_args), allowed_args, args);
 
     audioio_wavefile_obj_t *self = m_new_obj(audioio_wavefile_obj_t);
     self->base.type = &audioio_wavefile_type;
-    if (!MP_OBJ_IS_TYPE(args[0], &mp_type_fileio)) {
+    if (!MP_OBJ_IS_TYPE(args[ARG_file].u_obj, &mp_type_fileio)) {
         mp_raise_TypeError(translate("file must be a file opened in byte mode"));
     }
+    mp_int_t buffer_count = args[ARG_buffer_count].u_int;
+    if (buffer_count < 2 || buffer_count > AUDIOIO_WAVEFILE_MAX_BUFFER_COUNT) {
+        mp_raise_ValueError_varg(translate("%q out of range"), MP_QSTR_buffer_count);
+    }
     uint8_t *buffer = NULL;
     size_t buffer_size = 0;
-    if (n_args >= 2) {
+    if (args[ARG_buffer].u_obj != mp_const_none) {
         mp_buffer_info_t bufinfo;
-        mp_get_buffer_raise(args[1], &bufinfo, MP_BUFFER_WRITE);
+        mp_get_buffer_raise(args[ARG_buffer].u_obj, &bufinfo, MP_BUFFER_WRITE);
         buffer = bufinfo.buf;
         buffer_size = bufinfo.len;
+        // Each block must hold at least one word of samples.
+        if (buffer_size < buffer_count * sizeof(uint32_t)) {
+            mp_raise_ValueError(translate("Buffer is too small"));
+        }
     }
-    common_hal_audioio_wavefile_construct(self, MP_OBJ_TO_PTR(args[0]),
-                                          buffer, buffer_size);
+    common_hal_audioio_wavefile_construct(self, MP_OBJ_TO_PTR(args[ARG_file].u_obj),
+                                          buffer, buffer_size, buffer_count);
 
     return MP_OBJ_FROM_PTR(self);
 }
@@ -185,6 +204,41 @@ const mp_obj_property_t audioio_wavefile_channel_count_obj = {
               (mp_obj_t)&mp_const_none_obj},
 };
 
+//|     underruns: int
+//|     """The number of blocks that hadn't been read ahead by the time they were needed and were
+//|     read from the file while the audio output waited. Only counted when ``buffer_count`` is
+//|     more than 2. (read-only)"""
+//|
+STATIC mp_obj_t audioio_wavefile_obj_get_underruns(mp_obj_t self_in) {
+    audioio_wavefile_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    check_for_deinit(self);
+    return mp_obj_new_int_from_uint(common_hal_audioio_wavefile_get_underruns(self));
+}
+MP_DEFINE_CONST_FUN_OBJ_1(audioio_wavefile_get_underruns_obj, audioio_wavefile_obj_get_underruns);
+
+const mp_obj_property_t audioio_wavefile_underruns_obj = {
+    .base.type = &mp_type_property,
+    .proxy = {(mp_obj_t)&audioio_wavefile_get_underruns_obj,
+              (mp_obj_t)&mp_const_none_obj,
+              (mp_obj_t)&mp_const_none_obj},
+};
+
+//|     max_read_time: float
+//|     """The longest time in seconds that a read from the file has taken. (read-only)"""
+//|
+STATIC mp_obj_t audioio_wavefile_obj_get_max_read_time(mp_obj_t self_in) {
+    audioio_wavefile_obj_t *self = MP_OBJ_TO_PTR(self_in);
+    check_for_deinit(self);
+    return mp_obj_new_float(common_hal_audioio_wavefile_get_max_read_time(self));
+}
+MP_DEFINE_CONST_FUN_OBJ_1(audioio_wavefile_get_max_read_time_obj, audioio_wavefile_obj_get_max_read_time);
+
+const mp_obj_property_t audioio_wavefile_max_read_time_obj = {
+    .base.type = &mp_type_property,
+    .proxy = {(mp_obj_t)&audioio_wavefile_get_max_read_time_obj,
+              (mp_obj_t)&mp_const_none_obj,
+              (mp_obj_t)&mp_const_none_obj},
+};
 
 STATIC const mp_rom_map_elem_t audioio_wavefile_locals_dict_table[] = {
     // Methods
@@ -196,6 +250,8 @@ STATIC const mp_rom_map_elem_t audioio_wavefile_locals_dict_table[] = {
     { MP_ROM_QSTR(MP_QSTR_sample_rate), MP_ROM_PTR(&audioio_wavefile_sample_rate_obj) },
     { MP_ROM_QSTR(MP_QSTR_bits_per_sample), MP_ROM_PTR(&audioio_wavefile_bits_per_sample_obj) },
     { MP_ROM_QSTR(MP_QSTR_channel_count), MP_ROM_PTR(&audioio_wavefile_channel_count_obj) },
+    { MP_ROM_QSTR(MP_QSTR_underruns), MP_ROM_PTR(&audioio_wavefile_underruns_obj) },
+    { MP_ROM_QSTR(MP_QSTR_max_read_time), MP_ROM_PTR(&audioio_wavefile_max_read_time_obj) },
 };
 STATIC MP_DEFINE_CONST_DICT(audioio_wavefile_locals_dict, audioio_wavefile_locals_dict_table);
 
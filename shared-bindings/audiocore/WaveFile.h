@@ -35,7 +35,7 @@
 extern const mp_obj_type_t audioio_wavefile_type;
 
 void common_hal_audioio_wavefile_construct(audioio_wavefile_obj_t* self,
-    pyb_file_obj_t* file, uint8_t *buffer, size_t buffer_size);
+    pyb_file_obj_t* file, uint8_t *buffer, size_t buffer_size, uint8_t buffer_count);
 
 void common_hal_audioio_wavefile_deinit(audioio_wavefile_obj_t* self);
 bool common_hal_audioio_wavefile_deinited(audioio_wavefile_obj_t* self);
@@ -43,5 +43,7 @@ uint32_t common_hal_audioio_wavefile_get_sample_rate(audioio_wavefile_obj_t* sel
 void common_hal_audioio_wavefile_set_sample_rate(audioio_wavefile_obj_t* self, uint32_t sample_rate);
 uint8_t common_hal_audioio_wavefile_get_bits_per_sample(audioio_wavefile_obj_t* self);
 uint8_t common_hal_audioio_wavefile_get_channel_count(audioio_wavefile_obj_t* self);
+uint32_t common_hal_audioio_wavefile_get_underruns(audioio_wavefile_obj_t* self);
+float common_hal_audioio_wavefile_get_max_read_time(audioio_wavefile_obj_t* self);
 
 #endif // MICROPY_INCLUDED_SHARED_BINDINGS_AUDIOIO_WAVEFILE_H
@@ -27,7 +27,6 @@
 #ifndef MICROPY_INCLUDED_SHARED_BINDINGS_AUDIOMIXER_MIXER_H
 #define MICROPY_INCLUDED_SHARED_BINDINGS_AUDIOMIXER_MIXER_H
 
-#include "common-hal/microcontroller/Pin.h"
 #include "shared-module/audiomixer/Mixer.h"
 #include "shared-bindings/audiocore/RawSample.h"
 
@@ -40,7 +39,8 @@ void common_hal_audiomixer_mixer_construct(audiomixer_mixer_obj_t* self,
                                            uint8_t bits_per_sample,
                                            bool samples_signed,
                                            uint8_t channel_count,
-                                           uint32_t sample_rate);
+                                           uint32_t sample_rate,
+                                           bool sinc_resampling);
 
 void common_hal_audiomixer_mixer_deinit(audiomixer_mixer_obj_t* self);
 bool common_hal_audiomixer_mixer_deinited(audiomixer_mixer_obj_t* self);
@@ -26,7 +26,6 @@
 #ifndef SHARED_BINDINGS_AUDIOMIXER_MIXERVOICE_H_
 #define SHARED_BINDINGS_AUDIOMIXER_MIXERVOICE_H_
 
-#include "common-hal/microcontroller/Pin.h"
 #include "shared-bindings/audiocore/RawSample.h"
 
 #include "shared-module/audiomixer/MixerVoice.h"
@@ -40,8 +40,55 @@ static pixelbuf_pixelbuf_obj_t* native_pixelbuf(mp_obj_t pixelbuf_obj) {
     return MP_OBJ_TO_PTR(native_pixelbuf);
 }
 
+// Rebuilds scale_table from the brightness and gamma and applies it to the whole buffer. Nothing is
+// allocated until a brightness or gamma changes what is sent.
+static void _pixelbuf_rescale(mp_obj_t self_in, pixelbuf_pixelbuf_obj_t* self) {
+// Turn off warning when comparing exactly with integral value 1.0
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wfloat-equal"
+    bool no_gamma = self->gamma == 1;
+#pragma GCC diagnostic pop
+    if (self->scaled_brightness == 0x100 && no_gamma && !self->pre_brightness_buffer) {
+        return;
+    }
+    size_t pixel_len = self->pixel_count * self->bytes_per_pixel;
+    if (self->scale_table == NULL) {
+        self->scale_table = m_malloc_no_scan(PIXELBUF_SCALE_TABLE_LEN, false);
+    }
+    uint8_t *table = self->scale_table;
+    uint8_t *dotstar_table = self->scale_table + 256;
+    for (size_t i = 0; i < 256; i++) {
+        uint32_t value = i;
+        if (!no_gamma) {
+            value = 255 * MICROPY_FLOAT_C_FUN(pow)(i / MICROPY_FLOAT_CONST(255.0), self->gamma) + MICROPY_FLOAT_CONST(0.5);
+        }
+        table[i] = (value * self->scaled_brightness) / 256;
+    }
+    // The per-pixel brightness of DotStars gets the gamma but not the global brightness.
+    for (size_t i = 0; i < 32; i++) {
+        dotstar_table[i] = 31 * MICROPY_FLOAT_C_FUN(pow)(i / MICROPY_FLOAT_CONST(31.0), self->gamma) + MICROPY_FLOAT_CONST(0.5);
+    }
+
+    if (self->pre_brightness_buffer == NULL) {
+        self->pre_brightness_buffer = m_malloc_no_scan(pixel_len, false);
+        memcpy(self->pre_brightness_buffer, self->post_brightness_buffer, pixel_len);
+    }
+    for (size_t i = 0; i < pixel_len; i++) {
+        uint8_t value = self->pre_brightness_buffer[i];
+        if (self->byteorder.is_dotstar && i % 4 == 0) {
+            self->post_brightness_buffer[i] = DOTSTAR_LED_START | dotstar_table[value & 0x1f];
+        } else {
+            self->post_brightness_buffer[i] = table[value];
+        }
+    }
+
+    if (self->auto_write) {
+        common_hal__pixelbuf_pixelbuf_show(self_in);
+    }
+}
+
 void common_hal__pixelbuf_pixelbuf_construct(pixelbuf_pixelbuf_obj_t *self, size_t n,
-        pixelbuf_byteorder_details_t* byteorder, mp_float_t brightness, bool auto_write,
+        pixelbuf_byteorder_details_t* byteorder, mp_float_t brightness, mp_float_t gamma, bool auto_write,
         uint8_t* header, size_t header_len, uint8_t* trailer, size_t trailer_len) {
 
     self->pixel_count = n;
@@ -68,10 +115,11 @@ void common_hal__pixelbuf_pixelbuf_construct(pixelbuf_pixelbuf_obj_t *self, size
             self->post_brightness_buffer[i] = DOTSTAR_LED_START_FULL_BRIGHT;
         }
     }
-    // Call set_brightness so that it can allocate a second buffer if needed.
-    self->brightness = 1.0;
-    self->scaled_brightness = 0x100;
-    common_hal__pixelbuf_pixelbuf_set_brightness(MP_OBJ_FROM_PTR(self), brightness);
+    // Rescale so that a second buffer is allocated if needed.
+    self->brightness = brightness;
+    self->scaled_brightness = (uint16_t)(brightness * 256);
+    self->gamma = gamma;
+    _pixelbuf_rescale(MP_OBJ_FROM_PTR(self), self);
 
     // Turn on auto_write. We don't want to do it with the above brightness call.
     self->auto_write = auto_write;
@@ -118,26 +166,24 @@ void common_hal__pixelbuf_pixelbuf_set_brightness(mp_obj_t self_in, mp_float_t b
         return;
     }
     self->scaled_brightness = new_scaled_brightness;
-    size_t pixel_len = self->pixel_count * self->bytes_per_pixel;
-    if (self->scaled_brightness == 0x100 && !self->pre_brightness_buffer) {
-        return;
-    } else {
-        if (self->pre_brightness_buffer == NULL) {
-            self->pre_brightness_buffer = m_malloc(pixel_len, false);
-            memcpy(self->pre_brightness_buffer, self->post_brightness_buffer, pixel_len);
-        }
-        for (size_t i = 0; i < pixel_len; i++) {
-            // Don't adjust per-pixel luminance bytes in dotstar mode
-            if (self->byteorder.is_dotstar && i % 4 == 0) {
-                continue;
-            }
-            self->post_brightness_buffer[i] = (self->pre_brightness_buffer[i] * self->scaled_brightness) / 256;
-        }
+    _pixelbuf_rescale(self_in, self);
+}
 
-        if (self->auto_write) {
-            common_hal__pixelbuf_pixelbuf_show(self_in);
-        }
+mp_float_t common_hal__pixelbuf_pixelbuf_get_gamma(mp_obj_t self_in) {
+    pixelbuf_pixelbuf_obj_t* self = native_pixelbuf(self_in);
+    return self->gamma;
+}
+
+void common_hal__pixelbuf_pixelbuf_set_gamma(mp_obj_t self_in, mp_float_t gamma) {
+    pixelbuf_pixelbuf_obj_t* self = native_pixelbuf(self_in);
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wfloat-equal"
+    if (gamma == self->gamma) {
+        return;
     }
+#pragma GCC diagnostic pop
+    self->gamma = gamma;
+    _pixelbuf_rescale(self_in, self);
 }
 
 uint8_t _pixelbuf_get_as_uint8(mp_obj_t obj) {
@@ -223,15 +269,18 @@ void _pixelbuf_set_pixel_color(pixelbuf_pixelbuf_obj_t* self, size_t index, uint
     unscaled_buffer[rgbw_order->b] = b;
 
     if (scaled_buffer) {
+        uint8_t *table = self->scale_table;
         if (self->bytes_per_pixel == 4) {
-            if (!self->byteorder.is_dotstar) {
-                w = (w * self->scaled_brightness) / 256;
+            if (self->byteorder.is_dotstar) {
+                w = DOTSTAR_LED_START | table[256 + (w & 0x1f)];
+            } else {
+                w = table[w];
             }
             scaled_buffer[rgbw_order->w] = w;
         }
-        scaled_buffer[rgbw_order->r] = (r * self->scaled_brightness) / 256;
-        scaled_buffer[rgbw_order->g] = (g * self->scaled_brightness) / 256;
-        scaled_buffer[rgbw_order->b] = (b * self->scaled_brightness) / 256;
+        scaled_buffer[rgbw_order->r] = table[r];
+        scaled_buffer[rgbw_order->g] = table[g];
+        scaled_buffer[rgbw_order->b] = table[b];
     }
 }
 
@@ -271,6 +320,83 @@ void common_hal__pixelbuf_pixelbuf_set_pixels(mp_obj_t self_in, size_t start, mp
     }
 }
 
+void common_hal__pixelbuf_pixelbuf_set_pixels_from_buffer(mp_obj_t self_in, size_t start, mp_int_t step,
+    const uint8_t* buffer, size_t count, pixelbuf_buffer_format_t format) {
+    pixelbuf_pixelbuf_obj_t* self = native_pixelbuf(self_in);
+    pixelbuf_rgbw_t *rgbw_order = &self->byteorder.byteorder;
+    uint8_t bytes_per_pixel = self->bytes_per_pixel;
+    bool is_dotstar = self->byteorder.is_dotstar;
+    bool to_white = !is_dotstar && bytes_per_pixel == 4 && self->byteorder.has_white;
+    // Packed colors can't give a per-pixel brightness so DotStars stay at full brightness, which is
+    // what _pixelbuf_set_pixel_color makes of the default w.
+    uint8_t default_w = is_dotstar ? DOTSTAR_LED_START_FULL_BRIGHT : 0;
+
+    uint8_t *scaled_buffer = NULL;
+    uint8_t *unscaled_buffer = self->post_brightness_buffer;
+    const uint8_t *scale = self->scale_table;
+    if (self->pre_brightness_buffer) {
+        scaled_buffer = self->post_brightness_buffer;
+        unscaled_buffer = self->pre_brightness_buffer;
+    }
+
+    for (size_t i = 0; i < count; i++) {
+        uint8_t r, g, b;
+        uint8_t w = default_w;
+        if (format == PIXELBUF_FORMAT_RGB888) {
+            r = buffer[0];
+            g = buffer[1];
+            b = buffer[2];
+            buffer += 3;
+        } else if (format == PIXELBUF_FORMAT_RGB565) {
+            uint16_t value;
+            memcpy(&value, buffer, sizeof(value));
+            buffer += sizeof(value);
+            // Repeat the top bits in the low ones so that full scale stays full scale.
+            r = (value >> 11) << 3;
+            r |= r >> 5;
+            g = ((value >> 5) & 0x3f) << 2;
+            g |= g >> 6;
+            b = (value & 0x1f) << 3;
+            b |= b >> 5;
+        } else {
+            uint32_t value;
+            memcpy(&value, buffer, sizeof(value));
+            buffer += sizeof(value);
+            r = value >> 16;
+            g = value >> 8;
+            b = value;
+        }
+        // Same as int colors: equal components are shown with the white LED.
+        if (to_white && r == g && r == b) {
+            w = r;
+            r = 0;
+            g = 0;
+            b = 0;
+        }
+
+        size_t offset = start * bytes_per_pixel;
+        uint8_t *pixel = unscaled_buffer + offset;
+        pixel[rgbw_order->r] = r;
+        pixel[rgbw_order->g] = g;
+        pixel[rgbw_order->b] = b;
+        if (bytes_per_pixel == 4) {
+            pixel[rgbw_order->w] = w;
+        }
+        if (scaled_buffer) {
+            pixel = scaled_buffer + offset;
+            pixel[rgbw_order->r] = scale[r];
+            pixel[rgbw_order->g] = scale[g];
+            pixel[rgbw_order->b] = scale[b];
+            if (bytes_per_pixel == 4) {
+                pixel[rgbw_order->w] = is_dotstar ? DOTSTAR_LED_START | scale[256 + (w & 0x1f)] : scale[w];
+            }
+        }
+        start += step;
+    }
+    if (self->auto_write) {
+        common_hal__pixelbuf_pixelbuf_show(self_in);
+    }
+}
 
 
 void common_hal__pixelbuf_pixelbuf_set_pixel(mp_obj_t self_in, size_t index, mp_obj_t value) {
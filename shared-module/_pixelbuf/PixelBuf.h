@@ -53,19 +53,32 @@ typedef struct {
     uint16_t scaled_brightness;
     pixelbuf_byteorder_details_t byteorder;
     mp_float_t brightness;
+    mp_float_t gamma;
     mp_obj_t transmit_buffer_obj;
     // The post_brightness_buffer is offset into the buffer allocated in transmit_buffer_obj to
     // account for any header.
     uint8_t *post_brightness_buffer;
     uint8_t *pre_brightness_buffer;
+    // Maps each color byte in pre_brightness_buffer to the one sent, followed by the same for the
+    // five bit DotStar per-pixel brightness. Allocated along with pre_brightness_buffer.
+    uint8_t *scale_table;
     bool auto_write;
 } pixelbuf_pixelbuf_obj_t;
 
+// Layouts of the packed buffers accepted by set_pixels_from_buffer.
+typedef enum {
+    PIXELBUF_FORMAT_RGB888,
+    PIXELBUF_FORMAT_RGB565,
+    PIXELBUF_FORMAT_UINT32,
+} pixelbuf_buffer_format_t;
+
 #define PIXEL_R 0
 #define PIXEL_G 1
 #define PIXEL_B 2
 #define PIXEL_W 3
 
+#define PIXELBUF_SCALE_TABLE_LEN (256 + 32)
+
 #define DOTSTAR_LED_START 0b11100000
 #define DOTSTAR_LED_START_FULL_BRIGHT 0xFF
 
@@ -33,6 +33,7 @@
 #include "py/runtime.h"
 
 #include "shared-module/audiocore/WaveFile.h"
+#include "supervisor/port.h"
 #include "supervisor/shared/translate.h"
 
 struct wave_format_chunk {
@@ -48,7 +49,8 @@ struct wave_format_chunk {
 void common_hal_audioio_wavefile_construct(audioio_wavefile_obj_t* self,
                                            pyb_file_obj_t* file,
                                            uint8_t *buffer,
-                                           size_t buffer_size) {
+                                           size_t buffer_size,
+                                           uint8_t buffer_count) {
     // Load the wave
     self->file = file;
     uint8_t chunk_header[16];
@@ -110,33 +112,31 @@ void common_hal_audioio_wavefile_construct(audioio_wavefile_obj_t* self,
     self->file_length = data_length;
     self->data_start = self->file->fp.fptr;
 
-    // Try to allocate two buffers, one will be loaded from file and the other
-    // DMAed to DAC.
+    // Split the buffer into blocks, one being DMAed to the DAC, one waiting to
+    // be and the rest loaded from the file ahead of time.
+    self->buffer_count = buffer_count;
     if (buffer_size) {
-        self->len = buffer_size / 2;
+        self->len = buffer_size / buffer_count / sizeof(uint32_t) * sizeof(uint32_t);
         self->buffer = buffer;
-        self->second_buffer = buffer + self->len;
     } else {
         self->len = 256;
-        self->buffer = m_malloc(self->len, false);
+        self->buffer = m_malloc_no_scan(self->len * buffer_count, false);
         if (self->buffer == NULL) {
             common_hal_audioio_wavefile_deinit(self);
             mp_raise_msg(&mp_type_MemoryError,
                          translate("Couldn't allocate first buffer"));
         }
-
-        self->second_buffer = m_malloc(self->len, false);
-        if (self->second_buffer == NULL) {
-            common_hal_audioio_wavefile_deinit(self);
-            mp_raise_msg(&mp_type_MemoryError,
-                         translate("Couldn't allocate second buffer"));
-        }
     }
+    self->fill_index = 0;
+    self->ready = 0;
+    self->current_block = buffer_count - 1;
+    self->previous_block = buffer_count - 2;
+    self->underruns = 0;
+    self->max_read_ticks = 0;
 }
 
 void common_hal_audioio_wavefile_deinit(audioio_wavefile_obj_t* self) {
     self->buffer = NULL;
-    self->second_buffer = NULL;
 }
 
 bool common_hal_audioio_wavefile_deinited(audioio_wavefile_obj_t* self) {
@@ -165,7 +165,86 @@ bool audioio_wavefile_samples_signed(audioio_wavefile_obj_t* self) {
 }
 
 uint32_t audioio_wavefile_max_buffer_length(audioio_wavefile_obj_t* self) {
-    return 512;
+    return self->len;
+}
+
+uint32_t common_hal_audioio_wavefile_get_underruns(audioio_wavefile_obj_t* self) {
+    return self->underruns;
+}
+
+float common_hal_audioio_wavefile_get_max_read_time(audioio_wavefile_obj_t* self) {
+    return self->max_read_ticks / 32768.0f;
+}
+
+STATIC uint64_t subticks(void) {
+    uint8_t subticks;
+    uint64_t ticks = port_get_raw_ticks(&subticks);
+    return ticks * 32 + subticks;
+}
+
+// Reads up to count blocks from the file into the free blocks starting at
+// fill_index, without wrapping around. Returns false if the read fails.
+STATIC bool read_blocks(audioio_wavefile_obj_t* self, uint8_t count) {
+    uint8_t first = self->fill_index;
+    count = MIN(count, self->buffer_count - first);
+    uint32_t num_bytes_to_load = MIN(count * self->len, self->bytes_remaining);
+    // End multi-sector reads on a sector boundary so that the following ones
+    // start on one and can go straight from the block device into the blocks.
+    uint32_t past_sector = (f_tell(&self->file->fp) + num_bytes_to_load) % _MIN_SS;
+    if (num_bytes_to_load > _MIN_SS && num_bytes_to_load < self->bytes_remaining &&
+        past_sector < self->len && past_sector % sizeof(uint32_t) == 0) {
+        num_bytes_to_load -= past_sector;
+    }
+    uint8_t *buffer = self->buffer + first * self->len;
+    UINT length_read;
+    uint64_t start = subticks();
+    if (f_read(&self->file->fp, buffer, num_bytes_to_load, &length_read) != FR_OK || length_read != num_bytes_to_load) {
+        return false;
+    }
+    uint32_t read_ticks = subticks() - start;
+    self->max_read_ticks = MAX(self->max_read_ticks, read_ticks);
+    self->bytes_remaining -= length_read;
+
+    uint8_t block = first;
+    for (; length_read > 0; block++) {
+        uint32_t block_length = MIN(length_read, self->len);
+        self->block_length[block] = block_length;
+        length_read -= block_length;
+    }
+    // Pad the last buffer to word align it.
+    uint32_t last_length = self->block_length[block - 1];
+    if (self->bytes_remaining == 0 && last_length % sizeof(uint32_t) != 0) {
+        uint8_t *last = self->buffer + (block - 1) * self->len;
+        uint8_t silence = self->bits_per_sample == 8 ? 0x80 : 0;
+        for (; last_length % sizeof(uint32_t) != 0; last_length++) {
+            last[last_length] = silence;
+        }
+        self->block_length[block - 1] = last_length;
+    }
+    self->fill_index = block % self->buffer_count;
+    self->ready += block - first;
+    return true;
+}
+
+// Reads into all of the free blocks from a background callback.
+STATIC void read_ahead(void *self_in) {
+    audioio_wavefile_obj_t* self = self_in;
+    if (common_hal_audioio_wavefile_deinited(self) || self->read_error) {
+        return;
+    }
+    while (self->bytes_remaining > 0 && self->ready < self->buffer_count - 2) {
+        if (!read_blocks(self, self->buffer_count - 2 - self->ready)) {
+            // Leave the error to be reported when the block is needed.
+            self->read_error = true;
+            return;
+        }
+    }
+}
+
+STATIC void schedule_read_ahead(audioio_wavefile_obj_t* self) {
+    if (self->buffer_count > 2 && self->bytes_remaining > 0) {
+        background_callback_add(&self->read_ahead_cb, read_ahead, self);
+    }
 }
 
 void audioio_wavefile_reset_buffer(audioio_wavefile_obj_t* self,
@@ -174,13 +253,16 @@ void audioio_wavefile_reset_buffer(audioio_wavefile_obj_t* self,
     if (single_channel && channel == 1) {
         return;
     }
-    // We don't reset the buffer index in case we're looping and we have an odd number of buffer
-    // loads
+    // Drop what was read ahead but keep the blocks being played.
+    self->fill_index = (self->fill_index + self->buffer_count - self->ready) % self->buffer_count;
+    self->ready = 0;
+    self->read_error = false;
     self->bytes_remaining = self->file_length;
     f_lseek(&self->file->fp, self->data_start);
     self->read_count = 0;
     self->left_read_count = 0;
     self->right_read_count = 0;
+    schedule_read_ahead(self);
 }
 
 audioio_get_buffer_result_t audioio_wavefile_get_buffer(audioio_wavefile_obj_t* self,
@@ -199,61 +281,33 @@ audioio_get_buffer_result_t audioio_wavefile_get_buffer(audioio_wavefile_obj_t*
 
     bool need_more_data = self->read_count == channel_read_count;
 
-    if (self->bytes_remaining == 0 && need_more_data) {
+    if (self->bytes_remaining == 0 && self->ready == 0 && need_more_data) {
         *buffer = NULL;
         *buffer_length = 0;
         return GET_BUFFER_DONE;
     }
 
     if (need_more_data) {
-        uint16_t num_bytes_to_load = self->len;
-        if (num_bytes_to_load > self->bytes_remaining) {
-            num_bytes_to_load = self->bytes_remaining;
-        }
-        UINT length_read;
-        if (self->buffer_index % 2 == 1) {
-            *buffer = self->second_buffer;
-        } else {
-            *buffer = self->buffer;
-        }
-        if (f_read(&self->file->fp, *buffer, num_bytes_to_load, &length_read) != FR_OK || length_read != num_bytes_to_load) {
-            return GET_BUFFER_ERROR;
-        }
-        self->bytes_remaining -= length_read;
-        // Pad the last buffer to word align it.
-        if (self->bytes_remaining == 0 && length_read % sizeof(uint32_t) != 0) {
-            uint32_t pad = length_read % sizeof(uint32_t);
-            length_read += pad;
-            if (self->bits_per_sample == 8) {
-                for (uint32_t i = 0; i < pad; i++) {
-                    ((uint8_t*) (*buffer))[length_read / sizeof(uint8_t) - i - 1] = 0x80;
-                }
-            } else if (self->bits_per_sample == 16) {
-                // We know the buffer is aligned because we allocated it onto the heap ourselves.
-                #pragma GCC diagnostic push
-                #pragma GCC diagnostic ignored "-Wcast-align"
-                ((int16_t*) (*buffer))[length_read / sizeof(int16_t) - 1] = 0;
-                #pragma GCC diagnostic pop
+        if (self->ready == 0) {
+            // Reading ahead didn't keep up so read while the output waits.
+            if (self->buffer_count > 2 && self->read_count > 0) {
+                self->underruns += 1;
+            }
+            if (!read_blocks(self, 1)) {
+                return GET_BUFFER_ERROR;
             }
         }
-        *buffer_length = length_read;
-        if (self->buffer_index % 2 == 1) {
-            self->second_buffer_length = length_read;
-        } else {
-            self->buffer_length = length_read;
-        }
-        self->buffer_index += 1;
+        self->previous_block = self->current_block;
+        self->current_block = (self->fill_index + self->buffer_count - self->ready) % self->buffer_count;
+        self->ready -= 1;
         self->read_count += 1;
+        schedule_read_ahead(self);
     }
 
     uint32_t buffers_back = self->read_count - 1 - channel_read_count;
-    if ((self->buffer_index - buffers_back) % 2 == 0) {
-        *buffer = self->second_buffer;
-        *buffer_length = self->second_buffer_length;
-    } else {
-        *buffer = self->buffer;
-        *buffer_length = self->buffer_length;
-    }
+    uint8_t block = buffers_back == 0 ? self->current_block : self->previous_block;
+    *buffer = self->buffer + block * self->len;
+    *buffer_length = self->block_length[block];
 
     if (channel == 0) {
         self->left_read_count += 1;
@@ -262,7 +316,7 @@ audioio_get_buffer_result_t audioio_wavefile_get_buffer(audioio_wavefile_obj_t*
         *buffer = *buffer + self->bits_per_sample / 8;
     }
 
-    return self->bytes_remaining == 0 ? GET_BUFFER_DONE : GET_BUFFER_MORE_DATA;
+    return self->bytes_remaining == 0 && self->ready == 0 ? GET_BUFFER_DONE : GET_BUFFER_MORE_DATA;
 }
 
 void audioio_wavefile_get_buffer_structure(audioio_wavefile_obj_t* self, bool single_channel,
@@ -270,7 +324,7 @@ void audioio_wavefile_get_buffer_structure(audioio_wavefile_obj_t* self, bool si
                                            uint32_t* max_buffer_length, uint8_t* spacing) {
     *single_buffer = false;
     *samples_signed = self->bits_per_sample > 8;
-    *max_buffer_length = 512;
+    *max_buffer_length = self->len;
     if (single_channel) {
         *spacing = self->channel_count;
     } else {
@@ -29,20 +29,29 @@
 
 #include "extmod/vfs_fat.h"
 #include "py/obj.h"
+#include "supervisor/background_callback.h"
 
 #include "shared-module/audiocore/__init__.h"
 
+#define AUDIOIO_WAVEFILE_MAX_BUFFER_COUNT (8)
+
 typedef struct {
     mp_obj_base_t base;
+    // buffer_count blocks of len bytes each. The two most recently handed out
+    // are being played, the next ready ones have been read ahead and the rest
+    // are free to read into.
     uint8_t* buffer;
-    uint32_t buffer_length;
-    uint8_t* second_buffer;
-    uint32_t second_buffer_length;
+    uint32_t block_length[AUDIOIO_WAVEFILE_MAX_BUFFER_COUNT];
     uint32_t file_length; // In bytes
     uint16_t data_start; // Where the data values start
     uint8_t bits_per_sample;
-    uint16_t buffer_index;
-    uint32_t bytes_remaining;
+    uint8_t buffer_count;
+    uint8_t fill_index; // The next block to read into
+    uint8_t ready; // Blocks read ahead and not handed out yet
+    uint8_t current_block;
+    uint8_t previous_block;
+    bool read_error;
+    uint32_t bytes_remaining; // Not read from the file yet
 
     uint8_t channel_count;
     uint32_t sample_rate;
@@ -53,6 +62,10 @@ typedef struct {
     uint32_t read_count;
     uint32_t left_read_count;
     uint32_t right_read_count;
+
+    background_callback_t read_ahead_cb;
+    uint32_t underruns;
+    uint32_t max_read_ticks; // In 1/32768ths of a second
 } audioio_wavefile_obj_t;
 
 // These are not available from Python because it may be called in an interrupt.
@@ -30,7 +30,9 @@
 #include "shared-bindings/audiomixer/MixerVoice.h"
 
 #include <stdint.h>
+#include <string.h>
 
+#include "py/mphal.h"
 #include "py/runtime.h"
 #include "shared-module/audiocore/__init__.h"
 #include "shared-module/audiocore/RawSample.h"
@@ -41,16 +43,17 @@ void common_hal_audiomixer_mixer_construct(audiomixer_mixer_obj_t* self,
                                            uint8_t bits_per_sample,
                                            bool samples_signed,
                                            uint8_t channel_count,
-                                           uint32_t sample_rate) {
+                                           uint32_t sample_rate,
+                                           bool sinc_resampling) {
     self->len = buffer_size / 2 / sizeof(uint32_t) * sizeof(uint32_t);
 
-    self->first_buffer = m_malloc(self->len, false);
+    self->first_buffer = m_malloc_no_scan(self->len, false);
     if (self->first_buffer == NULL) {
         common_hal_audiomixer_mixer_deinit(self);
         mp_raise_msg(&mp_type_MemoryError, translate("Couldn't allocate first buffer"));
     }
 
-    self->second_buffer = m_malloc(self->len, false);
+    self->second_buffer = m_malloc_no_scan(self->len, false);
     if (self->second_buffer == NULL) {
         common_hal_audiomixer_mixer_deinit(self);
         mp_raise_msg(&mp_type_MemoryError, translate("Couldn't allocate second buffer"));
@@ -60,12 +63,15 @@ void common_hal_audiomixer_mixer_construct(audiomixer_mixer_obj_t* self,
     self->samples_signed = samples_signed;
     self->channel_count = channel_count;
     self->sample_rate = sample_rate;
+    self->sinc_resampling = sinc_resampling;
+    self->convert_buffer = NULL;
     self->voice_count = voice_count;
 }
 
 void common_hal_audiomixer_mixer_deinit(audiomixer_mixer_obj_t* self) {
     self->first_buffer = NULL;
     self->second_buffer = NULL;
+    self->convert_buffer = NULL;
 }
 
 bool common_hal_audiomixer_mixer_deinited(audiomixer_mixer_obj_t* self) {
@@ -101,13 +107,29 @@ void audiomixer_mixer_reset_buffer(audiomixer_mixer_obj_t* self,
     }
 }
 
+// Mixing works on one "mix word" of samples at a time: 32 bits with the DSP
+// instructions of the Cortex-M4 and up, otherwise 64 bits with portable SWAR
+// (SIMD within a register) arithmetic.  Either way samples are 8- or 16-bit
+// lanes and the level is Q15 (1 << 15 is unity gain).
+#if defined(__ARM_FEATURE_DSP) && __ARM_FEATURE_DSP
+
+typedef uint32_t mixword_t;
+#define MIXWORD_WORDS (1)
+#define LANES8_MSB (0x80808080)
+#define LANES16_MSB (0x80008000)
+
 __attribute__((always_inline))
-static inline uint32_t add16signed(uint32_t a, uint32_t b) {
+static inline mixword_t add16signed(mixword_t a, mixword_t b) {
     return __QADD16(a, b);
 }
 
 __attribute__((always_inline))
-static inline uint32_t mult16signed(uint32_t val, int32_t mul) {
+static inline mixword_t add8signed(mixword_t a, mixword_t b) {
+    return __QADD8(a, b);
+}
+
+__attribute__((always_inline))
+static inline mixword_t mult16signed(mixword_t val, int32_t mul) {
     mul <<= 16;
     int32_t hi, lo;
     enum { bits = 16 }; // saturate to 16 bits
@@ -120,114 +142,263 @@ static inline uint32_t mult16signed(uint32_t val, int32_t mul) {
     return val;
 }
 
-static inline uint32_t tounsigned8(uint32_t val) {
-    return __UADD8(val, 0x80808080);
+static inline uint32_t unpack8(uint16_t val) {
+    return ((val & 0xff00) << 16) | ((val & 0x00ff) << 8);
 }
 
-static inline uint32_t tounsigned16(uint32_t val) {
-    return __UADD16(val, 0x80008000);
+static inline uint32_t pack8(uint32_t val) {
+    return ((val & 0xff000000) >> 16) | ((val & 0xff00) >> 8);
 }
 
-static inline uint32_t tosigned16(uint32_t val) {
-    return __UADD16(val, 0x80008000);
+__attribute__((always_inline))
+static inline mixword_t mult8signed(mixword_t val, int32_t mul) {
+    // scale each pair of bytes as the high bytes of 16-bit samples
+    uint32_t lo = pack8(mult16signed(unpack8(val), mul));
+    uint32_t hi = pack8(mult16signed(unpack8(val >> 16), mul));
+    return lo | (hi << 16);
 }
 
-static inline uint32_t unpack8(uint16_t val) {
-    return ((val & 0xff00) << 16) | ((val & 0x00ff) << 8);
+#else
+
+typedef uint64_t mixword_t;
+#define MIXWORD_WORDS (2)
+#define LANES8_MSB (0x8080808080808080ULL)
+#define LANES16_MSB (0x8000800080008000ULL)
+
+// Adds the signed lanes of a and b, saturating lanes that overflow. lane_msb
+// has the top bit of every lane set.
+__attribute__((always_inline))
+static inline mixword_t add_signed_lanes(mixword_t a, mixword_t b, mixword_t lane_msb, unsigned int lane_bits) {
+    // add without carrying between lanes
+    mixword_t sum = ((a & ~lane_msb) + (b & ~lane_msb)) ^ ((a ^ b) & lane_msb);
+    // a lane overflowed if a and b have the same sign and the sum has the other one
+    mixword_t overflow = ~(a ^ b) & (a ^ sum) & lane_msb;
+    if (MP_LIKELY(overflow == 0)) {
+        return sum;
+    }
+    mixword_t overflow_mask = (overflow >> (lane_bits - 1)) * ((1 << lane_bits) - 1);
+    // the maximum positive value, plus one to make the minimum when a is negative
+    mixword_t saturated = ~lane_msb + ((a & lane_msb) >> (lane_bits - 1));
+    return (sum & ~overflow_mask) | (saturated & overflow_mask);
 }
 
-static inline uint32_t pack8(uint32_t val) {
-    return ((val & 0xff000000) >> 16) | ((val & 0xff00) >> 8);
+__attribute__((always_inline))
+static inline mixword_t add16signed(mixword_t a, mixword_t b) {
+    return add_signed_lanes(a, b, LANES16_MSB, 16);
+}
+
+__attribute__((always_inline))
+static inline mixword_t add8signed(mixword_t a, mixword_t b) {
+    return add_signed_lanes(a, b, LANES8_MSB, 8);
+}
+
+// Levels never exceed unity, so scaling can't overflow a lane.
+__attribute__((always_inline))
+static inline mixword_t mult16signed(mixword_t val, int32_t mul) {
+    mixword_t result = 0;
+    for (unsigned int shift = 0; shift < 64; shift += 16) {
+        int32_t sample = (int16_t)(val >> shift);
+        result |= (mixword_t)(uint16_t)((sample * mul) >> 15) << shift;
+    }
+    return result;
+}
+
+__attribute__((always_inline))
+static inline mixword_t mult8signed(mixword_t val, int32_t mul) {
+    mixword_t result = 0;
+    for (unsigned int shift = 0; shift < 64; shift += 8) {
+        int32_t sample = (int8_t)(val >> shift);
+        result |= (mixword_t)(uint8_t)((sample * mul) >> 15) << shift;
+    }
+    return result;
+}
+
+#endif
+
+__attribute__((always_inline))
+static inline mixword_t load_mixword(const uint32_t *src) {
+    #if MIXWORD_WORDS == 1
+    return *src;
+    #else
+    return src[0] | ((mixword_t)src[1] << 32);
+    #endif
+}
+
+__attribute__((always_inline))
+static inline void store_mixword(uint32_t *dst, mixword_t val) {
+    dst[0] = val;
+    #if MIXWORD_WORDS == 2
+    dst[1] = val >> 32;
+    #endif
+}
+
+// Mixes one mix word of a voice into the output, with the sample format and
+// level known at compile time.
+__attribute__((always_inline))
+static inline mixword_t mix_one(mixword_t word, mixword_t out, int32_t level,
+    const bool bits8, const bool flip, const bool unity, const bool add) {
+    if (flip) {
+        // unsigned to signed
+        word ^= bits8 ? LANES8_MSB : LANES16_MSB;
+    }
+    if (!unity) {
+        word = bits8 ? mult8signed(word, level) : mult16signed(word, level);
+    }
+    if (add) {
+        word = bits8 ? add8signed(word, out) : add16signed(word, out);
+    }
+    return word;
+}
+
+__attribute__((always_inline))
+static inline void mix_words(uint32_t *dst, const uint32_t *src, uint32_t n, int32_t level,
+    const bool bits8, const bool flip, const bool unity, const bool add) {
+    if (unity && !flip && !add) {
+        memcpy(dst, src, n * sizeof(uint32_t));
+        return;
+    }
+    uint32_t i = 0;
+    for (; i + MIXWORD_WORDS <= n; i += MIXWORD_WORDS) {
+        mixword_t out = add ? load_mixword(dst + i) : 0;
+        store_mixword(dst + i, mix_one(load_mixword(src + i), out, level, bits8, flip, unity, add));
+    }
+    #if MIXWORD_WORDS == 2
+    if (i < n) {
+        // odd word at the end
+        dst[i] = mix_one(src[i], dst[i], level, bits8, flip, unity, add);
+    }
+    #endif
+}
+
+// Mixes n words of samples from src into dst. When add is false dst is overwritten.
+typedef void (*mix_kernel_t)(uint32_t *dst, const uint32_t *src, uint32_t n, int32_t level);
+
+#define MIX_KERNEL(name, bits8, flip, unity, add) \
+    static void name(uint32_t *dst, const uint32_t *src, uint32_t n, int32_t level) { \
+        mix_words(dst, src, n, level, bits8, flip, unity, add); \
+    }
+
+MIX_KERNEL(mix_s16_copy, false, false, false, false)
+MIX_KERNEL(mix_s16_add, false, false, false, true)
+MIX_KERNEL(mix_s16_unity_copy, false, false, true, false)
+MIX_KERNEL(mix_s16_unity_add, false, false, true, true)
+MIX_KERNEL(mix_u16_copy, false, true, false, false)
+MIX_KERNEL(mix_u16_add, false, true, false, true)
+MIX_KERNEL(mix_u16_unity_copy, false, true, true, false)
+MIX_KERNEL(mix_u16_unity_add, false, true, true, true)
+MIX_KERNEL(mix_s8_copy, true, false, false, false)
+MIX_KERNEL(mix_s8_add, true, false, false, true)
+MIX_KERNEL(mix_s8_unity_copy, true, false, true, false)
+MIX_KERNEL(mix_s8_unity_add, true, false, true, true)
+MIX_KERNEL(mix_u8_copy, true, true, false, false)
+MIX_KERNEL(mix_u8_add, true, true, false, true)
+MIX_KERNEL(mix_u8_unity_copy, true, true, true, false)
+MIX_KERNEL(mix_u8_unity_add, true, true, true, true)
+
+// Indexed by bits8 << 3 | unsigned << 2 | unity << 1 | add.
+STATIC const mix_kernel_t mix_kernels[16] = {
+    mix_s16_copy, mix_s16_add, mix_s16_unity_copy, mix_s16_unity_add,
+    mix_u16_copy, mix_u16_add, mix_u16_unity_copy, mix_u16_unity_add,
+    mix_s8_copy, mix_s8_add, mix_s8_unity_copy, mix_s8_unity_add,
+    mix_u8_copy, mix_u8_add, mix_u8_unity_copy, mix_u8_unity_add,
+};
+
+// Returns the kernel for mixing voice into the output, or NULL if it is muted.
+STATIC mix_kernel_t select_kernel(audiomixer_mixer_obj_t* self, uint16_t level, bool voices_active) {
+    if (level == 0) {
+        return NULL;
+    }
+    size_t index = (self->bits_per_sample == 8) << 3 | (!self->samples_signed) << 2 |
+        (level == (1 << 15)) << 1 | voices_active;
+    return mix_kernels[index];
+}
+
+// Gets the voice's next buffer from its sample, starting a looping sample over
+// at its end. Returns false when a non-looping sample has ended.
+STATIC bool load_next_buffer(audiomixer_mixervoice_obj_t* voice, uint8_t** buffer, uint32_t* buffer_length) {
+    if (!voice->more_data) {
+        if (!voice->loop) {
+            return false;
+        }
+        audiosample_reset_buffer(voice->sample, false, 0);
+    }
+    audioio_get_buffer_result_t result = audiosample_get_buffer(voice->sample, false, 0, buffer, buffer_length);
+    voice->more_data = result == GET_BUFFER_MORE_DATA;
+    return true;
+}
+
+// Converts up to length words of the voice's sample into the mixer's
+// convert_buffer and returns how many words were written.
+STATIC uint32_t convert_voice(audiomixer_mixer_obj_t* self, audiomixer_mixervoice_obj_t* voice, uint32_t length) {
+    audiomixer_resampler_t *resampler = voice->resampler;
+    uint8_t *out = (uint8_t*) self->convert_buffer;
+    uint32_t frame_size = self->channel_count * self->bits_per_sample / 8;
+    uint32_t frames = length * sizeof(uint32_t) / frame_size;
+    uint32_t produced = 0;
+    while (true) {
+        produced += audiomixer_resampler_run(resampler, out + produced * frame_size, frames - produced);
+        if (produced == frames) {
+            break;
+        }
+        uint8_t* buffer;
+        uint32_t buffer_length;
+        if (load_next_buffer(voice, &buffer, &buffer_length)) {
+            audiomixer_resampler_set_input(resampler, buffer, buffer_length);
+        } else if (!resampler->flushed) {
+            audiomixer_resampler_flush(resampler);
+        } else {
+            voice->sample = NULL;
+            break;
+        }
+    }
+    // Pad the last word with silence.
+    uint32_t bytes = produced * frame_size;
+    uint32_t words = (bytes + sizeof(uint32_t) - 1) / sizeof(uint32_t);
+    uint8_t silence = self->samples_signed ? 0 : 0x80;
+    for (; bytes < words * sizeof(uint32_t); bytes++) {
+        out[bytes] = self->bits_per_sample == 16 && bytes % 2 == 0 ? 0 : silence;
+    }
+    return words;
 }
 
 static void mix_down_one_voice(audiomixer_mixer_obj_t* self,
         audiomixer_mixervoice_obj_t* voice, bool voices_active,
         uint32_t* word_buffer, uint32_t length) {
-    while (length != 0) {
-        if (voice->buffer_length == 0) {
-            if (!voice->more_data) {
-                if (voice->loop) {
-                    audiosample_reset_buffer(voice->sample, false, 0);
-                } else {
+    uint16_t level = voice->level;
+    mix_kernel_t kernel = select_kernel(self, level, voices_active);
+
+    if (voice->resampler != NULL) {
+        uint32_t n = convert_voice(self, voice, length);
+        if (kernel != NULL) {
+            kernel(word_buffer, self->convert_buffer, n, level);
+        }
+        length -= n;
+        word_buffer += n;
+    } else {
+        while (length != 0) {
+            if (voice->buffer_length == 0) {
+                if (!load_next_buffer(voice, (uint8_t**) &voice->remaining_buffer, &voice->buffer_length)) {
                     voice->sample = NULL;
                     break;
                 }
-            }
-            if (voice->sample) {
-                // Load another buffer
-                audioio_get_buffer_result_t result = audiosample_get_buffer(voice->sample, false, 0, (uint8_t**) &voice->remaining_buffer, &voice->buffer_length);
                 // Track length in terms of words.
                 voice->buffer_length /= sizeof(uint32_t);
-                voice->more_data = result == GET_BUFFER_MORE_DATA;
             }
-        }
 
-        uint32_t n = MIN(voice->buffer_length, length);
-        uint32_t *src = voice->remaining_buffer;
-        uint16_t level = voice->level;
+            uint32_t n = MIN(voice->buffer_length, length);
 
-        // First active voice gets copied over verbatim.
-        if (!voices_active) {
-            if (MP_LIKELY(self->bits_per_sample == 16)) {
-                if (MP_LIKELY(self->samples_signed)) {
-                    for (uint32_t i = 0; i<n; i++) {
-                        uint32_t v = src[i];
-                        word_buffer[i] = mult16signed(v, level);
-                    }
-                } else {
-                    for (uint32_t i = 0; i<n; i++) {
-                        uint32_t v = src[i];
-                        v = tosigned16(v);
-                        word_buffer[i] = mult16signed(v, level);
-                    }
-                }
-            } else {
-                uint16_t *hword_buffer = (uint16_t*)word_buffer;
-                uint16_t *hsrc = (uint16_t*)src;
-                for (uint32_t i = 0; i<n*2; i++) {
-                    uint32_t word = unpack8(hsrc[i]);
-                    if (MP_LIKELY(!self->samples_signed)) {
-                        word = tosigned16(word);
-                    }
-                    word = mult16signed(word, level);
-                    hword_buffer[i] = pack8(word);
-                }
-            }
-        } else {
-            if (MP_LIKELY(self->bits_per_sample == 16)) {
-                if (MP_LIKELY(self->samples_signed)) {
-                    for (uint32_t i = 0; i<n; i++) {
-                        uint32_t word = src[i];
-                        word_buffer[i] = add16signed(mult16signed(word, level), word_buffer[i]);
-                    }
-                } else {
-                    for (uint32_t i = 0; i<n; i++) {
-                        uint32_t word = src[i];
-                        word = tosigned16(word);
-                        word_buffer[i] = add16signed(mult16signed(word, level), word_buffer[i]);
-                        }
-                }
-            } else {
-                uint16_t *hword_buffer = (uint16_t*)word_buffer;
-                uint16_t *hsrc = (uint16_t*)src;
-                for (uint32_t i = 0; i<n*2; i++) {
-                    uint32_t word = unpack8(hsrc[i]);
-                    if (MP_LIKELY(!self->samples_signed)) {
-                        word = tosigned16(word);
-                    }
-                    word = mult16signed(word, level);
-                    word = add16signed(word, unpack8(hword_buffer[i]));
-                    hword_buffer[i] = pack8(word);
-                }
+            // Muted voices still move through their samples to stay in time.
+            if (kernel != NULL) {
+                kernel(word_buffer, voice->remaining_buffer, n, level);
             }
+            length -= n;
+            word_buffer += n;
+            voice->remaining_buffer += n;
+            voice->buffer_length -= n;
         }
-        length -= n;
-        word_buffer += n;
-        voice->remaining_buffer += n;
-        voice->buffer_length -= n;
     }
 
-    if (length && !voices_active) {
+    if (length && !voices_active && kernel != NULL) {
         for (uint32_t i = 0; i<length; i++) {
             word_buffer[i] = 0;
         }
@@ -267,7 +438,8 @@ audioio_get_buffer_result_t audiomixer_mixer_get_buffer(audiomixer_mixer_obj_t*
             audiomixer_mixervoice_obj_t* voice = MP_OBJ_TO_PTR(self->voice[v]);
             if(voice->sample) {
                 mix_down_one_voice(self, voice, voices_active, word_buffer, length);
-                voices_active = true;
+                // Muted voices leave the output untouched.
+                voices_active = voices_active || voice->level != 0;
             }
         }
 
@@ -278,14 +450,10 @@ audioio_get_buffer_result_t audiomixer_mixer_get_buffer(audiomixer_mixer_obj_t*
         }
 
         if (!self->samples_signed) {
-            if (self->bits_per_sample == 16) {
-                for (uint32_t i = 0; i < length; i++) {
-                    word_buffer[i] = tounsigned16(word_buffer[i]);
-                }
-            } else {
-                for (uint32_t i = 0; i < length; i++) {
-                    word_buffer[i] = tounsigned8(word_buffer[i]);
-                }
+            // signed to unsigned
+            uint32_t msb = self->bits_per_sample == 16 ? 0x80008000 : 0x80808080;
+            for (uint32_t i = 0; i < length; i++) {
+                word_buffer[i] ^= msb;
             }
         }
 
@@ -42,6 +42,10 @@ typedef struct {
     bool samples_signed;
     uint8_t channel_count;
     uint32_t sample_rate;
+    // Resample with a windowed-sinc filter rather than linear interpolation.
+    bool sinc_resampling;
+    // Holds a voice's converted samples while it is mixed, for voices that need converting.
+    uint32_t* convert_buffer;
 
     uint32_t read_count;
     uint32_t left_read_count;
@@ -35,6 +35,7 @@
 void common_hal_audiomixer_mixervoice_construct(audiomixer_mixervoice_obj_t *self) {
     self->sample = NULL;
     self->level = 1 << 15;
+    self->resampler = NULL;
 }
 
 void common_hal_audiomixer_mixervoice_set_parent(audiomixer_mixervoice_obj_t* self, audiomixer_mixer_obj_t *parent) {
@@ -50,13 +51,17 @@ void common_hal_audiomixer_mixervoice_set_level(audiomixer_mixervoice_obj_t* sel
 }
 
 void common_hal_audiomixer_mixervoice_play(audiomixer_mixervoice_obj_t* self, mp_obj_t sample, bool loop) {
-    if (audiosample_sample_rate(sample) != self->parent->sample_rate) {
+    audiomixer_mixer_obj_t* parent = self->parent;
+    uint32_t sample_rate = audiosample_sample_rate(sample);
+    if (sample_rate == 0 || sample_rate / AUDIOMIXER_RESAMPLER_MAX_RATIO > parent->sample_rate) {
         mp_raise_ValueError(translate("The sample's sample rate does not match the mixer's"));
     }
-    if (audiosample_channel_count(sample) != self->parent->channel_count) {
+    uint8_t channel_count = audiosample_channel_count(sample);
+    if (channel_count < 1 || channel_count > 2) {
         mp_raise_ValueError(translate("The sample's channel count does not match the mixer's"));
     }
-    if (audiosample_bits_per_sample(sample) != self->parent->bits_per_sample) {
+    uint8_t bits_per_sample = audiosample_bits_per_sample(sample);
+    if (bits_per_sample != 8 && bits_per_sample != 16) {
         mp_raise_ValueError(translate("The sample's bits_per_sample does not match the mixer's"));
     }
     bool single_buffer;
@@ -65,17 +70,40 @@ void common_hal_audiomixer_mixervoice_play(audiomixer_mixervoice_obj_t* self, mp
     uint8_t spacing;
     audiosample_get_buffer_structure(sample, false, &single_buffer, &samples_signed,
                                      &max_buffer_length, &spacing);
-    if (samples_signed != self->parent->samples_signed) {
-        mp_raise_ValueError(translate("The sample's signedness does not match the mixer's"));
+
+    // Stop mixing the old sample while the voice is set up for the new one.
+    self->sample = NULL;
+    if (sample_rate != parent->sample_rate || channel_count != parent->channel_count ||
+        bits_per_sample != parent->bits_per_sample || samples_signed != parent->samples_signed) {
+        if (self->resampler == NULL) {
+            self->resampler = m_new_obj(audiomixer_resampler_t);
+            self->resampler->coefficients = NULL;
+        }
+        if (parent->convert_buffer == NULL) {
+            parent->convert_buffer = m_malloc_no_scan(parent->len, false);
+        }
+        audiomixer_resampler_init(self->resampler, sample_rate, parent->sample_rate,
+            channel_count, bits_per_sample, samples_signed,
+            parent->channel_count, parent->bits_per_sample, parent->samples_signed,
+            parent->sinc_resampling);
+    } else {
+        self->resampler = NULL;
     }
-    self->sample = sample;
     self->loop = loop;
 
     audiosample_reset_buffer(sample, false, 0);
-    audioio_get_buffer_result_t result = audiosample_get_buffer(sample, false, 0, (uint8_t**) &self->remaining_buffer, &self->buffer_length);
-    // Track length in terms of words.
-    self->buffer_length /= sizeof(uint32_t);
+    uint8_t* buffer;
+    uint32_t buffer_length;
+    audioio_get_buffer_result_t result = audiosample_get_buffer(sample, false, 0, &buffer, &buffer_length);
+    if (self->resampler != NULL) {
+        audiomixer_resampler_set_input(self->resampler, buffer, buffer_length);
+    } else {
+        self->remaining_buffer = (uint32_t*) buffer;
+        // Track length in terms of words.
+        self->buffer_length = buffer_length / sizeof(uint32_t);
+    }
     self->more_data = result == GET_BUFFER_MORE_DATA;
+    self->sample = sample;
 }
 
 bool common_hal_audiomixer_mixervoice_get_playing(audiomixer_mixervoice_obj_t* self) {
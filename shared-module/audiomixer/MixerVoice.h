@@ -30,6 +30,7 @@
 
 #include "shared-module/audiomixer/__init__.h"
 #include "shared-module/audiomixer/Mixer.h"
+#include "shared-module/audiomixer/Resampler.h"
 
 typedef struct {
 	mp_obj_base_t base;
@@ -40,6 +41,8 @@ typedef struct {
     uint32_t* remaining_buffer;
     uint32_t buffer_length;
     uint16_t level;
+    // Converts the sample when its rate or format differs from the mixer's, otherwise NULL.
+    audiomixer_resampler_t *resampler;
 } audiomixer_mixervoice_obj_t;
 
 
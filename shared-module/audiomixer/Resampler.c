@@ -0,0 +1,288 @@
+/*
+ * This file is part of the MicroPython project, http://micropython.org/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Adafruit Industries
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#include "shared-module/audiomixer/Resampler.h"
+
+#include <math.h>
+#include <string.h>
+
+#include "py/misc.h"
+#include "py/mpconfig.h"
+#include "shared-module/audiocore/__init__.h"
+
+#define FRAMES_CAPACITY (AUDIOMIXER_SINC_TAPS + AUDIOMIXER_RESAMPLER_MAX_RATIO + AUDIOMIXER_RESAMPLER_CHUNK)
+#define SINC_PHASES (1 << AUDIOMIXER_SINC_PHASE_BITS)
+
+// Zeroth order modified Bessel function of the first kind, for the Kaiser window.
+STATIC float bessel_i0(float x) {
+    float sum = 1;
+    float term = 1;
+    for (int k = 1; k < 20; k++) {
+        term *= (x / (2 * k)) * (x / (2 * k));
+        sum += term;
+    }
+    return sum;
+}
+
+// Fills in the filter for each phase: a sinc with its cutoff below the lower of
+// the two Nyquist frequencies, under a Kaiser window, scaled to unity gain.
+STATIC void make_sinc_coefficients(int16_t *coefficients, uint32_t in_rate, uint32_t out_rate) {
+    const float pi = 3.14159265f;
+    const float beta = 4;
+    const float half_width = AUDIOMIXER_SINC_TAPS / 2;
+    float cutoff = 0.9f * MIN(1.0f, (float)out_rate / in_rate);
+    float window_scale = 1 / bessel_i0(beta);
+    for (int p = 0; p < SINC_PHASES; p++) {
+        // The phase is truncated to pick a row, so design for the middle of its range.
+        float offset = (p + 0.5f) / SINC_PHASES;
+        float h[AUDIOMIXER_SINC_TAPS];
+        float sum = 0;
+        for (int k = 0; k < AUDIOMIXER_SINC_TAPS; k++) {
+            float t = k - (AUDIOMIXER_SINC_TAPS / 2 - 1) - offset;
+            float x = pi * cutoff * t;
+            float r = t / half_width;
+            float window = bessel_i0(beta * sqrtf(MAX(0.0f, 1 - r * r))) * window_scale;
+            h[k] = (fabsf(x) < 1e-6f ? 1.0f : sinf(x) / x) * window;
+            sum += h[k];
+        }
+        int16_t *row = coefficients + p * AUDIOMIXER_SINC_TAPS;
+        int32_t total = 0;
+        for (int k = 0; k < AUDIOMIXER_SINC_TAPS; k++) {
+            row[k] = roundf(h[k] / sum * (1 << 15));
+            total += row[k];
+        }
+        // Put the rounding error on the biggest tap so constant input passes through exactly.
+        row[AUDIOMIXER_SINC_TAPS / 2 - (p < SINC_PHASES / 2)] += (1 << 15) - total;
+    }
+}
+
+void audiomixer_resampler_init(audiomixer_resampler_t *self, uint32_t in_rate, uint32_t out_rate,
+    uint8_t in_channels, uint8_t in_bits, bool in_signed,
+    uint8_t out_channels, uint8_t out_bits, bool out_signed, bool sinc) {
+    self->step = ((uint64_t)in_rate << 16) / out_rate;
+    self->in_channels = in_channels;
+    self->in_bits = in_bits;
+    self->in_signed = in_signed;
+    self->out_channels = out_channels;
+    self->out_bits = out_bits;
+    self->out_signed = out_signed;
+    if (sinc) {
+        if (self->coefficients == NULL) {
+            self->coefficients = m_new_no_scan(int16_t, SINC_PHASES * AUDIOMIXER_SINC_TAPS);
+        }
+        make_sinc_coefficients(self->coefficients, in_rate, out_rate);
+        self->taps = AUDIOMIXER_SINC_TAPS;
+    } else {
+        self->coefficients = NULL;
+        self->taps = 2;
+    }
+    audiomixer_resampler_reset(self);
+}
+
+void audiomixer_resampler_reset(audiomixer_resampler_t *self) {
+    self->in = NULL;
+    self->in_frames = 0;
+    self->phase = 0;
+    self->pos = 0;
+    self->flushed = false;
+    // Start with silence before the first frame so the filter is centred on it.
+    self->available = self->taps / 2 - 1;
+    memset(self->frames, 0, self->available * self->out_channels * sizeof(int16_t));
+}
+
+void audiomixer_resampler_set_input(audiomixer_resampler_t *self, const uint8_t *buffer, uint32_t length) {
+    self->in = buffer;
+    self->in_frames = length / (self->in_channels * self->in_bits / 8);
+}
+
+// Drops the frames the filter has moved past.
+STATIC void discard_used_frames(audiomixer_resampler_t *self) {
+    if (self->pos >= self->available) {
+        self->pos -= self->available;
+        self->available = 0;
+        return;
+    }
+    uint32_t keep = self->available - self->pos;
+    memmove(self->frames, self->frames + self->pos * self->out_channels,
+        keep * self->out_channels * sizeof(int16_t));
+    self->available = keep;
+    self->pos = 0;
+}
+
+// Decodes n frames of input onto the end of frames.
+STATIC void decode(audiomixer_resampler_t *self, uint32_t n) {
+    int16_t *dst = self->frames + self->available * self->out_channels;
+    int16_t stereo[AUDIOMIXER_RESAMPLER_CHUNK * 2];
+    int16_t *s16s = self->out_channels == 2 ? dst : stereo;
+    const uint8_t *in = self->in;
+    bool mono = self->in_channels == 1;
+    if (self->in_bits == 8) {
+        if (self->in_signed) {
+            if (mono) {
+                audiosample_convert_s8m_s16s(s16s, (const int8_t *)in, n);
+            } else {
+                audiosample_convert_s8s_s16s(s16s, (const int8_t *)in, n);
+            }
+        } else {
+            if (mono) {
+                audiosample_convert_u8m_s16s(s16s, in, n);
+            } else {
+                audiosample_convert_u8s_s16s(s16s, in, n);
+            }
+        }
+    } else {
+        if (self->in_signed) {
+            if (mono) {
+                audiosample_convert_s16m_s16s(s16s, (const int16_t *)in, n);
+            } else {
+                memcpy(s16s, in, n * 2 * sizeof(int16_t));
+            }
+        } else {
+            if (mono) {
+                audiosample_convert_u16m_s16s(s16s, (const uint16_t *)in, n);
+            } else {
+                audiosample_convert_u16s_s16s(s16s, (const uint16_t *)in, n);
+            }
+        }
+    }
+    if (self->out_channels == 1) {
+        for (uint32_t i = 0; i < n; i++) {
+            dst[i] = (s16s[2 * i] + s16s[2 * i + 1]) >> 1;
+        }
+    }
+    self->in += n * self->in_channels * self->in_bits / 8;
+    self->in_frames -= n;
+    self->available += n;
+}
+
+// Makes more frames available to the filter. Returns false when the input is used up.
+STATIC bool refill(audiomixer_resampler_t *self) {
+    discard_used_frames(self);
+    if (self->in_frames == 0) {
+        return false;
+    }
+    uint32_t n = MIN(self->in_frames, MIN((uint32_t)FRAMES_CAPACITY - self->available, (uint32_t)AUDIOMIXER_RESAMPLER_CHUNK));
+    decode(self, n);
+    return true;
+}
+
+void audiomixer_resampler_flush(audiomixer_resampler_t *self) {
+    discard_used_frames(self);
+    uint32_t n = self->taps / 2;
+    memset(self->frames + self->available * self->out_channels, 0, n * self->out_channels * sizeof(int16_t));
+    self->available += n;
+    self->flushed = true;
+}
+
+__attribute__((always_inline))
+static inline void store_sample(uint8_t *out, uint32_t i, int32_t sample, const bool bits8, uint16_t flip) {
+    if (bits8) {
+        out[i] = (sample >> 8) ^ flip;
+    } else {
+        ((uint16_t *)out)[i] = sample ^ flip;
+    }
+}
+
+// Filters frames into up to out_frames output frames, with the filter and
+// formats known at compile time. Stops when the filter reaches the end of the
+// decoded frames.
+__attribute__((always_inline))
+static inline uint32_t resample(audiomixer_resampler_t *self, uint8_t *out, uint32_t out_frames,
+    const bool sinc, const uint8_t channels, const bool bits8) {
+    uint16_t flip = self->out_signed ? 0 : bits8 ? 0x80 : 0x8000;
+    uint32_t taps = sinc ? AUDIOMIXER_SINC_TAPS : 2;
+    uint32_t step = self->step;
+    uint32_t phase = self->phase;
+    uint32_t pos = self->pos;
+    uint32_t available = self->available;
+    uint32_t i = 0;
+    for (; i < out_frames && pos + taps <= available; i++) {
+        const int16_t *f = self->frames + pos * channels;
+        if (sinc) {
+            const int16_t *k = self->coefficients + (phase >> (16 - AUDIOMIXER_SINC_PHASE_BITS)) * AUDIOMIXER_SINC_TAPS;
+            int32_t acc[2] = { 1 << 14, 1 << 14 };
+            for (uint32_t t = 0; t < AUDIOMIXER_SINC_TAPS; t++) {
+                for (uint32_t c = 0; c < channels; c++) {
+                    acc[c] += f[t * channels + c] * k[t];
+                }
+            }
+            for (uint32_t c = 0; c < channels; c++) {
+                int32_t sample = acc[c] >> 15;
+                sample = sample > INT16_MAX ? INT16_MAX : sample < INT16_MIN ? INT16_MIN : sample;
+                store_sample(out, i * channels + c, sample, bits8, flip);
+            }
+        } else {
+            int32_t frac = phase >> 1;
+            for (uint32_t c = 0; c < channels; c++) {
+                int32_t a = f[c];
+                int32_t b = f[channels + c];
+                store_sample(out, i * channels + c, a + (((b - a) * frac) >> 15), bits8, flip);
+            }
+        }
+        phase += step;
+        pos += phase >> 16;
+        phase &= 0xffff;
+    }
+    self->phase = phase;
+    self->pos = pos;
+    return i;
+}
+
+#define RESAMPLER(name, sinc, channels, bits8) \
+    STATIC uint32_t name(audiomixer_resampler_t *self, uint8_t *out, uint32_t out_frames) { \
+        return resample(self, out, out_frames, sinc, channels, bits8); \
+    }
+
+RESAMPLER(linear_16m, false, 1, false)
+RESAMPLER(linear_16s, false, 2, false)
+RESAMPLER(linear_8m, false, 1, true)
+RESAMPLER(linear_8s, false, 2, true)
+RESAMPLER(sinc_16m, true, 1, false)
+RESAMPLER(sinc_16s, true, 2, false)
+RESAMPLER(sinc_8m, true, 1, true)
+RESAMPLER(sinc_8s, true, 2, true)
+
+typedef uint32_t (*resampler_fn_t)(audiomixer_resampler_t *self, uint8_t *out, uint32_t out_frames);
+
+// Indexed by sinc << 2 | bits8 << 1 | stereo.
+STATIC const resampler_fn_t resamplers[8] = {
+    linear_16m, linear_16s, linear_8m, linear_8s,
+    sinc_16m, sinc_16s, sinc_8m, sinc_8s,
+};
+
+uint32_t audiomixer_resampler_run(audiomixer_resampler_t *self, uint8_t *out, uint32_t out_frames) {
+    resampler_fn_t fn = resamplers[(self->coefficients != NULL) << 2 | (self->out_bits == 8) << 1 |
+        (self->out_channels == 2)];
+    uint32_t frame_size = self->out_channels * self->out_bits / 8;
+    uint32_t produced = 0;
+    while (produced < out_frames) {
+        produced += fn(self, out + produced * frame_size, out_frames - produced);
+        if (produced < out_frames && !refill(self)) {
+            break;
+        }
+    }
+    return produced;
+}
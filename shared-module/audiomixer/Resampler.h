@@ -0,0 +1,82 @@
+/*
+ * This file is part of the MicroPython project, http://micropython.org/
+ *
+ * The MIT License (MIT)
+ *
+ * Copyright (c) 2020 Adafruit Industries
+ *
+ * Permission is hereby granted, free of charge, to any person obtaining a copy
+ * of this software and associated documentation files (the "Software"), to deal
+ * in the Software without restriction, including without limitation the rights
+ * to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+ * copies of the Software, and to permit persons to whom the Software is
+ * furnished to do so, subject to the following conditions:
+ *
+ * The above copyright notice and this permission notice shall be included in
+ * all copies or substantial portions of the Software.
+ *
+ * THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+ * IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+ * FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+ * AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+ * LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+ * OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+ * THE SOFTWARE.
+ */
+
+#ifndef MICROPY_INCLUDED_SHARED_MODULE_AUDIOMIXER_RESAMPLER_H
+#define MICROPY_INCLUDED_SHARED_MODULE_AUDIOMIXER_RESAMPLER_H
+
+#include <stdbool.h>
+#include <stdint.h>
+
+// Input frames decoded at a time.
+#define AUDIOMIXER_RESAMPLER_CHUNK (64)
+// Length and number of phases of the windowed-sinc filter.
+#define AUDIOMIXER_SINC_TAPS (16)
+#define AUDIOMIXER_SINC_PHASE_BITS (5)
+// The largest input to output sample rate ratio that can be converted.
+#define AUDIOMIXER_RESAMPLER_MAX_RATIO (16)
+
+// Converts a voice's sample to the mixer's sample rate and format. Input is
+// decoded to signed 16-bit frames with the mixer's channel count, which are
+// then resampled in fixed point by linear interpolation or a polyphase
+// windowed-sinc filter.
+typedef struct {
+    // Input left in the sample's current buffer.
+    const uint8_t *in;
+    uint32_t in_frames;
+    // Input frames per output frame, and the position between frames[pos] and
+    // the frame after it, both Q16.
+    uint32_t step;
+    uint32_t phase;
+    uint16_t pos;
+    // Decoded frames in frames.
+    uint16_t available;
+    uint8_t taps;
+    uint8_t in_channels;
+    uint8_t in_bits;
+    bool in_signed;
+    uint8_t out_channels;
+    uint8_t out_bits;
+    bool out_signed;
+    // Set once the filter's tail has been padded with silence at the end of the sample.
+    bool flushed;
+    // Q15 sinc coefficients, AUDIOMIXER_SINC_TAPS for each phase. NULL for linear interpolation.
+    int16_t *coefficients;
+    int16_t frames[(AUDIOMIXER_SINC_TAPS + AUDIOMIXER_RESAMPLER_MAX_RATIO + AUDIOMIXER_RESAMPLER_CHUNK) * 2];
+} audiomixer_resampler_t;
+
+void audiomixer_resampler_init(audiomixer_resampler_t *self, uint32_t in_rate, uint32_t out_rate,
+    uint8_t in_channels, uint8_t in_bits, bool in_signed,
+    uint8_t out_channels, uint8_t out_bits, bool out_signed, bool sinc);
+void audiomixer_resampler_reset(audiomixer_resampler_t *self);
+// Sets the sample buffer to read input from.
+void audiomixer_resampler_set_input(audiomixer_resampler_t *self, const uint8_t *buffer, uint32_t length);
+// Pads the input with enough silence to play out the frames already given.
+void audiomixer_resampler_flush(audiomixer_resampler_t *self);
+// Writes up to out_frames frames in the output format to out and returns how
+// many were written. Fewer are written once the input runs out.
+uint32_t audiomixer_resampler_run(audiomixer_resampler_t *self, uint8_t *out, uint32_t out_frames);
+
+#endif  // MICROPY_INCLUDED_SHARED_MODULE_AUDIOMIXER_RESAMPLER_H
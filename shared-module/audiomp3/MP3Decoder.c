@@ -188,7 +188,7 @@ void common_hal_audiomp3_mp3file_construct(audiomp3_mp3file_obj_t* self,
 
     self->inbuf_length = 2048;
     self->inbuf_offset = self->inbuf_length;
-    self->inbuf = m_malloc(self->inbuf_length, false);
+    self->inbuf = m_malloc_no_scan(self->inbuf_length, false);
     if (self->inbuf == NULL) {
         common_hal_audiomp3_mp3file_deinit(self);
         mp_raise_msg(&mp_type_MemoryError,
@@ -208,14 +208,14 @@ void common_hal_audiomp3_mp3file_construct(audiomp3_mp3file_obj_t* self,
         self->buffers[0] = (int16_t*)(void*)buffer;
         self->buffers[1] = (int16_t*)(void*)(buffer + MAX_BUFFER_LEN);
     } else {
-        self->buffers[0] = m_malloc(MAX_BUFFER_LEN, false);
+        self->buffers[0] = m_malloc_no_scan(MAX_BUFFER_LEN, false);
         if (self->buffers[0] == NULL) {
             common_hal_audiomp3_mp3file_deinit(self);
             mp_raise_msg(&mp_type_MemoryError,
                          translate("Couldn't allocate first buffer"));
         }
 
-        self->buffers[1] = m_malloc(MAX_BUFFER_LEN, false);
+        self->buffers[1] = m_malloc_no_scan(MAX_BUFFER_LEN, false);
         if (self->buffers[1] == NULL) {
             common_hal_audiomp3_mp3file_deinit(self);
             mp_raise_msg(&mp_type_MemoryError,
@@ -42,7 +42,7 @@ void common_hal_displayio_bitmap_construct(displayio_bitmap_t *self, uint32_t wi
     }
     self->width = width;
     self->height = height;
-    self->data = m_malloc(self->stride * height * sizeof(size_t), false);
+    self->data = m_malloc_no_scan(self->stride * height * sizeof(size_t), false);
     self->read_only = false;
     self->bits_per_value = bits_per_value;
 
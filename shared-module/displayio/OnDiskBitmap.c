@@ -81,7 +81,7 @@ void common_hal_displayio_ondiskbitmap_construct(displayio_ondiskbitmap_t *self,
         uint16_t palette_size = number_of_colors * sizeof(uint32_t);
         uint16_t palette_offset = 0xe + header_size;
 
-        self->palette_data = m_malloc(palette_size, false);
+        self->palette_data = m_malloc_no_scan(palette_size, false);
 
         f_rewind(&self->file->fp);
         f_lseek(&self->file->fp, palette_offset);
@@ -117,8 +117,100 @@ void common_hal_displayio_ondiskbitmap_construct(displayio_ondiskbitmap_t *self,
         self->stride = (bit_stride / 8);
     }
 
+    #if CIRCUITPY_ONDISKBITMAP_CACHE_ROWS > 0
+    // A raw row is never longer than its decoded form so rows are read straight into the cache.
+    self->row_cache = m_malloc_no_scan_maybe(CIRCUITPY_ONDISKBITMAP_CACHE_ROWS * self->width * sizeof(uint32_t), false);
+    self->row_cache_clock = 0;
+    for (uint8_t i = 0; i < CIRCUITPY_ONDISKBITMAP_CACHE_ROWS; i++) {
+        self->cached_row[i] = -1;
+        self->row_last_used[i] = 0;
+    }
+    #endif
+}
+
+static uint32_t decode_16bit(displayio_ondiskbitmap_t *self, uint32_t pixel_data) {
+    uint8_t red;
+    uint8_t green;
+    uint8_t blue;
+    if (self->g_bitmask == 0x07e0) { // 565
+        red =((pixel_data & self->r_bitmask) >>11);
+        green = ((pixel_data & self->g_bitmask) >>5);
+        blue = ((pixel_data & self->b_bitmask) >> 0);
+    } else { // 555
+        red =((pixel_data & self->r_bitmask) >>10);
+        green = ((pixel_data & self->g_bitmask) >>4);
+        blue = ((pixel_data & self->b_bitmask) >> 0);
+    }
+    return red << 19 | green << 10 | blue << 3;
 }
 
+#if CIRCUITPY_ONDISKBITMAP_CACHE_ROWS > 0
+// Decodes a raw row held at the start of row in place. Pixels are decoded from the end of the row
+// because a decoded pixel is never smaller than its raw form.
+static void decode_row(displayio_ondiskbitmap_t *self, uint32_t* row) {
+    const uint8_t* raw = (const uint8_t*) row;
+    if (self->bits_per_pixel < 8) {
+        uint8_t pixels_per_byte = 8 / self->bits_per_pixel;
+        uint8_t mask = (1 << self->bits_per_pixel) - 1;
+        for (int32_t x = self->width - 1; x >= 0; x--) {
+            uint8_t offset = (x % pixels_per_byte) * self->bits_per_pixel;
+            uint8_t index = (raw[x / pixels_per_byte] >> ((8 - self->bits_per_pixel) - offset)) & mask;
+            if (self->bits_per_pixel == 1) {
+                row[x] = index == 1 ? 0xFFFFFF : 0x000000;
+            } else {
+                row[x] = self->palette_data[index];
+            }
+        }
+    } else if (self->bits_per_pixel == 8) {
+        for (int32_t x = self->width - 1; x >= 0; x--) {
+            row[x] = self->palette_data[raw[x]];
+        }
+    } else if (self->bits_per_pixel == 16) {
+        for (int32_t x = self->width - 1; x >= 0; x--) {
+            row[x] = decode_16bit(self, raw[2 * x] | raw[2 * x + 1] << 8);
+        }
+    } else if (self->bits_per_pixel == 24) {
+        for (int32_t x = self->width - 1; x >= 0; x--) {
+            row[x] = raw[3 * x] | raw[3 * x + 1] << 8 | raw[3 * x + 2] << 16;
+        }
+    } else if (self->bitfield_compressed) {
+        for (int32_t x = 0; x < self->width; x++) {
+            row[x] &= 0x00FFFFFF;
+        }
+    }
+}
+
+// Returns the decoded row y, reading it from the file if it isn't cached. Returns NULL if the row
+// couldn't be read.
+static uint32_t* get_row(displayio_ondiskbitmap_t *self, int16_t y) {
+    uint8_t slot = 0;
+    for (uint8_t i = 0; i < CIRCUITPY_ONDISKBITMAP_CACHE_ROWS; i++) {
+        if (self->cached_row[i] == y) {
+            self->row_last_used[i] = ++self->row_cache_clock;
+            return self->row_cache + i * self->width;
+        }
+        // Replace the least recently used row.
+        if (self->row_last_used[i] < self->row_last_used[slot]) {
+            slot = i;
+        }
+    }
+
+    uint32_t* row = self->row_cache + slot * self->width;
+    self->cached_row[slot] = -1;
+    f_lseek(&self->file->fp, self->data_offset + (self->height - y - 1) * self->stride);
+    UINT bytes_read;
+    if (f_read(&self->file->fp, row, self->stride, &bytes_read) != FR_OK) {
+        return NULL;
+    }
+    // Short rows at the end of a truncated file read as zero like single pixel reads.
+    memset(((uint8_t*) row) + bytes_read, 0, self->stride - bytes_read);
+    decode_row(self, row);
+    self->cached_row[slot] = y;
+    self->row_last_used[slot] = ++self->row_cache_clock;
+    return row;
+}
+#endif
+
 
 uint32_t common_hal_displayio_ondiskbitmap_get_pixel(displayio_ondiskbitmap_t *self,
         int16_t x, int16_t y) {
@@ -126,6 +218,16 @@ uint32_t common_hal_displayio_ondiskbitmap_get_pixel(displayio_ondiskbitmap_t *s
         return 0;
     }
 
+    #if CIRCUITPY_ONDISKBITMAP_CACHE_ROWS > 0
+    if (self->row_cache != NULL) {
+        uint32_t* row = get_row(self, y);
+        if (row == NULL) {
+            return 0;
+        }
+        return row[x];
+    }
+    #endif
+
     uint32_t location;
     uint8_t bytes_per_pixel = (self->bits_per_pixel / 8)  ? (self->bits_per_pixel /8) : 1;
     uint8_t pixels_per_byte = 8 / self->bits_per_pixel;
@@ -134,16 +236,11 @@ uint32_t common_hal_displayio_ondiskbitmap_get_pixel(displayio_ondiskbitmap_t *s
     } else {
         location = self->data_offset + (self->height - y - 1) * self->stride + x / pixels_per_byte;
     }
-    // We don't cache here because the underlying FS caches sectors.
     f_lseek(&self->file->fp, location);
     UINT bytes_read;
     uint32_t pixel_data = 0;
     uint32_t result = f_read(&self->file->fp, &pixel_data, bytes_per_pixel, &bytes_read);
     if (result == FR_OK) {
-        uint32_t tmp = 0;
-        uint8_t red;
-        uint8_t green;
-        uint8_t blue;
         if (bytes_per_pixel == 1) {
             uint8_t offset = (x % pixels_per_byte) * self->bits_per_pixel;
             uint8_t mask = (1 << self->bits_per_pixel) - 1;
@@ -158,17 +255,7 @@ uint32_t common_hal_displayio_ondiskbitmap_get_pixel(displayio_ondiskbitmap_t *s
             }
             return self->palette_data[index];
         } else if (bytes_per_pixel == 2) {
-            if (self->g_bitmask == 0x07e0) { // 565
-                red =((pixel_data & self->r_bitmask) >>11);
-                green = ((pixel_data & self->g_bitmask) >>5);
-                blue = ((pixel_data & self->b_bitmask) >> 0);
-            } else { // 555
-                red =((pixel_data & self->r_bitmask) >>10);
-                green = ((pixel_data & self->g_bitmask) >>4);
-                blue = ((pixel_data & self->b_bitmask) >> 0);
-            }
-            tmp = (red << 19 | green << 10 | blue << 3);
-            return tmp;
+            return decode_16bit(self, pixel_data);
         } else if ((bytes_per_pixel == 4) && (self->bitfield_compressed)) {
             return pixel_data & 0x00FFFFFF;
         } else {
@@ -47,6 +47,13 @@ typedef struct {
     pyb_file_obj_t* file;
     uint8_t bits_per_pixel;
     uint32_t* palette_data;
+    #if CIRCUITPY_ONDISKBITMAP_CACHE_ROWS > 0
+    // Decoded rows of pixels, width pixels per row. NULL when the cache couldn't be allocated.
+    uint32_t* row_cache;
+    uint32_t row_cache_clock;
+    uint32_t row_last_used[CIRCUITPY_ONDISKBITMAP_CACHE_ROWS];
+    int16_t cached_row[CIRCUITPY_ONDISKBITMAP_CACHE_ROWS]; // -1 when the slot is empty.
+    #endif
 } displayio_ondiskbitmap_t;
 
 #endif // MICROPY_INCLUDED_SHARED_MODULE_DISPLAYIO_ONDISKBITMAP_H
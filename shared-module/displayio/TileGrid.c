@@ -48,7 +48,7 @@ void common_hal_displayio_tilegrid_construct(displayio_tilegrid_t *self, mp_obj_
         }
         self->inline_tiles = true;
     } else {
-        self->tiles = (uint8_t*) m_malloc(total_tiles, false);
+        self->tiles = (uint8_t*) m_malloc_no_scan(total_tiles, false);
         for (uint32_t i = 0; i < total_tiles; i++) {
             self->tiles[i] = default_tile;
         }
@@ -316,6 +316,119 @@ void common_hal_displayio_tilegrid_set_top_left(displayio_tilegrid_t *self, uint
     self->full_change = true;
 }
 
+// Layer types resolved once per fill so the per-pixel loops don't re-check them.
+typedef enum {
+    TILEGRID_SOURCE_NONE,
+    TILEGRID_SOURCE_BITMAP,
+    TILEGRID_SOURCE_SHAPE,
+    TILEGRID_SOURCE_ONDISKBITMAP,
+} tilegrid_source_t;
+
+typedef enum {
+    TILEGRID_SHADER_NONE,
+    TILEGRID_SHADER_PALETTE,
+    TILEGRID_SHADER_COLORCONVERTER,
+} tilegrid_shader_t;
+
+STATIC tilegrid_source_t _source_type(mp_obj_t bitmap) {
+    if (MP_OBJ_IS_TYPE(bitmap, &displayio_bitmap_type)) {
+        return TILEGRID_SOURCE_BITMAP;
+    } else if (MP_OBJ_IS_TYPE(bitmap, &displayio_shape_type)) {
+        return TILEGRID_SOURCE_SHAPE;
+    } else if (MP_OBJ_IS_TYPE(bitmap, &displayio_ondiskbitmap_type)) {
+        return TILEGRID_SOURCE_ONDISKBITMAP;
+    }
+    return TILEGRID_SOURCE_NONE;
+}
+
+STATIC tilegrid_shader_t _shader_type(mp_obj_t pixel_shader) {
+    if (MP_OBJ_IS_TYPE(pixel_shader, &displayio_palette_type)) {
+        return TILEGRID_SHADER_PALETTE;
+    } else if (MP_OBJ_IS_TYPE(pixel_shader, &displayio_colorconverter_type)) {
+        return TILEGRID_SHADER_COLORCONVERTER;
+    }
+    return TILEGRID_SHADER_NONE;
+}
+
+// True when every value the bitmap can hold maps to an opaque palette entry. Only checked for
+// narrow bitmaps so the scan stays cheap.
+STATIC bool _palette_opaque_for(displayio_palette_t *palette, displayio_bitmap_t *bitmap) {
+    if (bitmap->bits_per_value > 8 || palette->color_count <= bitmap->bitmask) {
+        return false;
+    }
+    for (uint32_t i = 0; i <= bitmap->bitmask; i++) {
+        if (palette->colors[i].transparent) {
+            return false;
+        }
+    }
+    return true;
+}
+
+STATIC inline uint32_t _bitmap_row_pixel(const displayio_bitmap_t *bitmap, const size_t *row, uint16_t x) {
+    if (bitmap->bits_per_value < 8) {
+        size_t word = row[x >> bitmap->x_shift];
+        return (word >> (sizeof(size_t) * 8 - ((x & bitmap->x_mask) + 1) * bitmap->bits_per_value)) & bitmap->bitmask;
+    } else if (bitmap->bits_per_value == 8) {
+        return ((const uint8_t*) row)[x];
+    } else if (bitmap->bits_per_value == 16) {
+        return ((const uint16_t*) row)[x];
+    }
+    return ((const uint32_t*) row)[x];
+}
+
+// Renders one run of pixels that lie within a single tile and map to consecutive buffer offsets.
+// Only used for Bitmap sources with Palette shaders on 8 and 16 bit colorspaces. Returns false if
+// any pixel was transparent.
+STATIC bool _fill_run(displayio_bitmap_t *bitmap, displayio_palette_t *palette,
+        const _displayio_colorspace_t* colorspace, bool opaque, uint16_t bitmap_x, uint16_t bitmap_y,
+        uint32_t offset, uint16_t length, uint32_t* mask, uint32_t *buffer) {
+    const size_t* row = bitmap->data + bitmap_y * bitmap->stride;
+    // Plain RGB565 can be read straight out of the palette.
+    bool direct565 = colorspace->depth == 16 && !colorspace->grayscale && !colorspace->tricolor;
+    bool covered = true;
+    uint32_t end = offset + length;
+    while (offset < end) {
+        // Work a mask word at a time so that uncovered words skip the per pixel mask test.
+        uint32_t word_end = (offset | 31) + 1;
+        if (word_end > end) {
+            word_end = end;
+        }
+        uint32_t bits = 0xffffffff << (offset % 32);
+        if (word_end % 32 != 0) {
+            bits &= ~(0xffffffff << (word_end % 32));
+        }
+        bool bulk = opaque && (mask[offset / 32] & bits) == 0;
+        for (; offset < word_end; offset++, bitmap_x++) {
+            if (!bulk && (mask[offset / 32] & (1 << (offset % 32))) != 0) {
+                continue;
+            }
+            uint32_t value = _bitmap_row_pixel(bitmap, row, bitmap_x);
+            uint32_t pixel;
+            if (direct565 && value < palette->color_count && !palette->colors[value].transparent) {
+                pixel = palette->colors[value].rgb565;
+                if (colorspace->reverse_bytes_in_word) {
+                    pixel = __builtin_bswap16(pixel);
+                }
+            } else if (!displayio_palette_get_color(palette, colorspace, value, &pixel)) {
+                covered = false;
+                continue;
+            }
+            if (!bulk) {
+                mask[offset / 32] |= 1 << (offset % 32);
+            }
+            if (colorspace->depth == 16) {
+                ((uint16_t*) buffer)[offset] = pixel;
+            } else {
+                ((uint8_t*) buffer)[offset] = pixel;
+            }
+        }
+        if (bulk) {
+            mask[(word_end - 1) / 32] |= bits;
+        }
+    }
+    return covered;
+}
+
 bool displayio_tilegrid_fill_area(displayio_tilegrid_t *self, const _displayio_colorspace_t* colorspace, const displayio_area_t* area, uint32_t* mask, uint32_t *buffer) {
     // If no tiles are present we have no impact.
     uint8_t* tiles = self->tiles;
@@ -365,8 +478,6 @@ bool displayio_tilegrid_fill_area(displayio_tilegrid_t *self, const _displayio_c
     // TODO(tannewt): Skip coverage tracking if all pixels outside the overlap have already been
     // set and our palette is all opaque.
 
-    // TODO(tannewt): Check to see if the pixel_shader has any transparency. If it doesn't then we
-    // can either return full coverage or bulk update the mask.
     displayio_area_t transformed;
     displayio_area_transform_within(flip_x != (self->absolute_transform->dx < 0), flip_y != (self->absolute_transform->dy < 0), self->transpose_xy != self->absolute_transform->transpose_xy,
                                     &overlap,
@@ -401,6 +512,65 @@ bool displayio_tilegrid_fill_area(displayio_tilegrid_t *self, const _displayio_c
         y_shift = temp_shift;
     }
 
+    tilegrid_source_t source_type = _source_type(self->bitmap);
+    tilegrid_shader_t shader_type = TILEGRID_SHADER_NONE;
+    if (self->pixel_shader != mp_const_none) {
+        shader_type = _shader_type(self->pixel_shader);
+    }
+
+    // Bitmaps shaded by a Palette into 8 or 16 bit pixels are rendered as runs along a bitmap row
+    // as long as neighbouring pixels stay neighbours in the buffer.
+    if (source_type == TILEGRID_SOURCE_BITMAP && shader_type == TILEGRID_SHADER_PALETTE &&
+        (colorspace->depth == 16 || colorspace->depth == 8) &&
+        x_stride == 1 && self->absolute_transform->scale == 1) {
+        displayio_bitmap_t *bitmap = self->bitmap;
+        displayio_palette_t *palette = self->pixel_shader;
+        bool opaque = _palette_opaque_for(palette, bitmap);
+        for (int16_t y = start_y; y < end_y; ++y) {
+            int32_t row_start = start + (y - start_y + y_shift) * y_stride; // in pixels
+            uint16_t tile_row = ((y / self->tile_height + self->top_left_y) % self->height_in_tiles) * self->width_in_tiles;
+            uint16_t tile_y = y % self->tile_height;
+            int16_t x = start_x;
+            while (x < end_x) {
+                uint16_t tile_x = x % self->tile_width;
+                uint16_t length = self->tile_width - tile_x;
+                if (length > end_x - x) {
+                    length = end_x - x;
+                }
+                uint8_t tile = tiles[tile_row + (x / self->tile_width + self->top_left_x) % self->width_in_tiles];
+                uint16_t bitmap_x = (tile % self->bitmap_width_in_tiles) * self->tile_width + tile_x;
+                uint16_t bitmap_y = (tile / self->bitmap_width_in_tiles) * self->tile_height + tile_y;
+                uint32_t offset = row_start + (x - start_x + x_shift);
+                if (bitmap_y < bitmap->height && bitmap_x + length <= bitmap->width) {
+                    if (!_fill_run(bitmap, palette, colorspace, opaque, bitmap_x, bitmap_y, offset, length, mask, buffer)) {
+                        full_coverage = false;
+                    }
+                } else {
+                    // Out of range tiles read as zero just like common_hal_displayio_bitmap_get_pixel.
+                    for (uint16_t i = 0; i < length; i++, offset++) {
+                        if ((mask[offset / 32] & (1 << (offset % 32))) != 0) {
+                            continue;
+                        }
+                        uint32_t pixel;
+                        uint32_t value = common_hal_displayio_bitmap_get_pixel(bitmap, bitmap_x + i, bitmap_y);
+                        if (!displayio_palette_get_color(palette, colorspace, value, &pixel)) {
+                            full_coverage = false;
+                            continue;
+                        }
+                        mask[offset / 32] |= 1 << (offset % 32);
+                        if (colorspace->depth == 16) {
+                            *(((uint16_t*) buffer) + offset) = pixel;
+                        } else {
+                            *(((uint8_t*) buffer) + offset) = pixel;
+                        }
+                    }
+                }
+                x += length;
+            }
+        }
+        return full_coverage;
+    }
+
     uint8_t pixels_per_byte = 8 / colorspace->depth;
 
     displayio_input_pixel_t input_pixel;
@@ -434,20 +604,20 @@ bool displayio_tilegrid_fill_area(displayio_tilegrid_t *self, const _displayio_c
 
             // We always want to read bitmap pixels by row first and then transpose into the destination
             // buffer because most bitmaps are row associated.
-            if (MP_OBJ_IS_TYPE(self->bitmap, &displayio_bitmap_type)) {
+            if (source_type == TILEGRID_SOURCE_BITMAP) {
                 input_pixel.pixel = common_hal_displayio_bitmap_get_pixel(self->bitmap, input_pixel.tile_x, input_pixel.tile_y);
-            } else if (MP_OBJ_IS_TYPE(self->bitmap, &displayio_shape_type)) {
+            } else if (source_type == TILEGRID_SOURCE_SHAPE) {
                 input_pixel.pixel = common_hal_displayio_shape_get_pixel(self->bitmap, input_pixel.tile_x, input_pixel.tile_y);
-            } else if (MP_OBJ_IS_TYPE(self->bitmap, &displayio_ondiskbitmap_type)) {
+            } else if (source_type == TILEGRID_SOURCE_ONDISKBITMAP) {
                 input_pixel.pixel = common_hal_displayio_ondiskbitmap_get_pixel(self->bitmap, input_pixel.tile_x, input_pixel.tile_y);
             }
 
             output_pixel.opaque = true;
             if (self->pixel_shader == mp_const_none) {
                 output_pixel.pixel = input_pixel.pixel;
-            } else if (MP_OBJ_IS_TYPE(self->pixel_shader, &displayio_palette_type)) {
+            } else if (shader_type == TILEGRID_SHADER_PALETTE) {
                 output_pixel.opaque = displayio_palette_get_color(self->pixel_shader, colorspace, input_pixel.pixel, &output_pixel.pixel);
-            } else if (MP_OBJ_IS_TYPE(self->pixel_shader, &displayio_colorconverter_type)) {
+            } else if (shader_type == TILEGRID_SHADER_COLORCONVERTER) {
                 displayio_colorconverter_convert(self->pixel_shader, colorspace, &input_pixel, &output_pixel);
             }
             if (!output_pixel.opaque) {
@@ -135,6 +135,13 @@ uint32_t supervisor_ticks_ms32() {
     return supervisor_ticks_ms64();
 }
 
+uint32_t supervisor_ticks_us32() {
+    uint8_t subticks;
+    uint64_t result = port_get_raw_ticks(&subticks);
+    result = (result * 32 + subticks) * 1000000 / 32768;
+    return result;
+}
+
 
 void PLACE_IN_ITCM(supervisor_run_background_tasks_if_tick)() {
     background_callback_run_all();
@@ -51,6 +51,13 @@ extern uint32_t supervisor_ticks_ms32(void);
  * then it may be possible to use supervisor_ticks_ms64 instead.
  */
 extern uint64_t supervisor_ticks_ms64(void);
+
+/** @brief Get the lower 32 bits of the time in microseconds
+ *
+ * The resolution is that of the port's subticks, 1/32768 of a second. This wraps
+ * around after ~71.5 minutes, so use it only to time short durations.
+ */
+extern uint32_t supervisor_ticks_us32(void);
 /** @brief Run background ticks, but only about every millisecond.
  *
  * Normally, this is not called directly.  Instead use the RUN_BACKGROUND_TASKS
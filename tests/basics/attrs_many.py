@@ -0,0 +1,12 @@
+# intern enough attribute names to fill several qstr pools, then look them up again
+
+class A:
+    pass
+
+a = A()
+for i in range(500):
+    setattr(a, "attr%d" % i, i)
+
+print(all(getattr(a, "attr%d" % i) == i for i in range(500)))
+print(sum(hasattr(a, "attr%d" % i) for i in range(0, 1000, 7)))
+print(getattr(a, "attr" + "499"), getattr(a, "attr" + "0"))
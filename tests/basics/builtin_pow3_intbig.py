@@ -20,3 +20,8 @@ print(hex(pow(2, x-1, x))) # Should be 1, since x is prime
 print(hex(pow(y, x-1, x))) # Should be 1, since x is prime
 print(hex(pow(y, y-1, x))) # Should be a 'big value'
 print(hex(pow(y, y-1, y))) # Should be a 'big value'
+
+# odd and even moduli, negative base and modulus
+for m in (x, x + 1, 3 ** 200, 2 ** 127 - 1):
+    print(hex(pow(y, 65537, m)), hex(pow(-y, 65537, m)), hex(pow(y, 65537, -m)))
+    print(pow(m - 1, 3, m), pow(m, 3, m), pow(m + 2, 5, m))
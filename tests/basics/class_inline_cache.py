@@ -0,0 +1,87 @@
+# test that attribute lookups through the class see changes to the class
+
+class A:
+    x = 1
+
+    def f(self):
+        return "A.f"
+
+    @staticmethod
+    def s():
+        return "A.s"
+
+    @classmethod
+    def c(cls):
+        return cls.__name__
+
+class B(A):
+    pass
+
+def get(o):
+    return o.x, o.f(), o.s(), o.c(), o.f
+
+a = A()
+b = B()
+
+# same call sites with different types
+for o in (a, b, a, b):
+    r = get(o)
+    print(r[:4], r[4]())
+
+# instance member shadows class attribute
+a.f = lambda: "member f"
+a.x = 2
+print(get(a)[:2])
+del a.f
+del a.x
+print(get(a)[:2])
+
+# change the class after the call sites have been used
+def g(self):
+    return "A.g"
+
+A.f = g
+A.x = 3
+print(get(a)[:2], get(b)[:2])
+
+# change only the subclass
+B.f = lambda self: "B.f"
+B.x = 4
+print(get(a)[:2], get(b)[:2])
+
+# delete from the subclass so the base class is found again
+del B.f
+del B.x
+print(get(a)[:2], get(b)[:2])
+
+# attribute that disappears
+del A.x
+for o in (a, b):
+    try:
+        o.x
+    except AttributeError:
+        print("AttributeError")
+
+# method through a loop
+class Counter:
+    def __init__(self):
+        self.n = 0
+
+    def inc(self):
+        self.n += 1
+
+c = Counter()
+for i in range(10):
+    c.inc()
+    if i == 5:
+        Counter.inc = lambda self: setattr(self, "n", self.n + 10)
+print(c.n)
+
+# classes created in a loop, each at a call site used before
+def make(v):
+    class C:
+        def m(self):
+            return v
+    return C()
+
+print([make(i).m() for i in range(5)])
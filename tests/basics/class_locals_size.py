@@ -0,0 +1,32 @@
+# test class bodies whose locals dict is allocated from a count made by the compiler
+
+g = 0
+
+class A:
+    a = 1
+    b = 2
+    c, d = 3, 4
+    for i in range(3):
+        pass
+    del i
+    global g
+    g = 5
+    def f(self):
+        return self.a + self.b
+    e = a + b
+    e += 1
+
+print(A.a, A.b, A.c, A.d, A.e, A().f(), g, hasattr(A, "i"))
+
+# more names than the count, added through locals()
+class B:
+    x = 1
+    for i in range(20):
+        locals()["n" + str(i)] = i
+
+print(B.x, B.n0, B.n19)
+
+# dict() with keyword arguments and another dict
+d = dict(a=1, b=2)
+print(sorted(dict(d, c=3, d=4).items()))
+print(sorted(dict(d).items()), sorted(dict(**d).items()))
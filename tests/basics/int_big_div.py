@@ -8,3 +8,7 @@ x = 0x8000000000000000
 print((x + 1) // x)
 x = 0x86c60128feff5330
 print((x + 1) // x)
+
+# divisors whose digits are all ones
+for m in (2 ** 127 - 1, 2 ** 128 - 1, 2 ** 256 - 1):
+    print(divmod((m - 1) * (m - 1), m), divmod(m << 100, m - 2))
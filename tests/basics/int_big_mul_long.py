@@ -0,0 +1,26 @@
+# test multiplication of long ints, long enough to be split into parts
+
+# deterministic pseudo-random numbers of the given number of bits
+seed = 1
+def rnd(bits):
+    global seed
+    r = 0
+    for i in range((bits + 15) // 16):
+        seed = (seed * 1103515245 + 12345) & 0x7fffffff
+        r = r << 16 | seed >> 8 & 0xffff
+    return r >> (-bits % 16) | 1 << (bits - 1)
+
+for a_bits in (200, 1000, 2048, 3001, 10000):
+    for b_bits in (30, 600, 1024, 2050, 4100, 10000):
+        a = rnd(a_bits)
+        b = rnd(b_bits)
+        for x, y in ((a, b), (-a, b), (a, a), ((1 << a_bits) - 1, (1 << b_bits) - 1)):
+            p = x * y
+            print(a_bits, b_bits, p % 1000000007, p >> (a_bits + b_bits - 30), p == y * x)
+
+# result checked through division
+a = rnd(20000)
+b = rnd(12345)
+p = a * b
+print(p // a == b, p // b == a, p % a, p % b)
+print(hex(rnd(3000) * rnd(3000))[-40:])
@@ -0,0 +1,15 @@
+# test conversion of long ints to strings, long enough to be split into parts
+
+for e in (100, 1000, 2000, 4000):
+    for x in (10 ** e, 10 ** e - 1, 10 ** e + 1, 10 ** (e // 2) * (10 ** (e // 2) + 7)):
+        s = str(x)
+        print(len(s), s.count("0"), s[:5], s[-5:], int(s) == x)
+        print(str(-x)[:5], repr(x)[-5:])
+
+x = 3 ** 8000
+s = str(x)
+print(len(s), s[:30], s[-30:], sum(ord(c) for c in s))
+print(hex(x)[-20:], oct(x)[-20:], bin(x)[-20:], "%x" % x == hex(x)[2:])
+print("{:,}".format(x)[:20], len("{:,}".format(x)))
+print("{:,}".format(10 ** 299), "{:,}".format(-(10 ** 300 - 1))[:10])
+print("{:,}".format(123456789012345678901234567890))
@@ -0,0 +1,32 @@
+# test find, rfind, count, split, replace and "in" on haystacks long enough
+# for the skip-table search
+
+def check(h, n):
+    return (h.find(n), h.rfind(n), h.count(n), len(h.split(n)), h.replace(n, "#") == h, n in h)
+
+h = "".join("ab"[(i * 7) % 3 == 0] for i in range(300)) + "abcabd" + "x" * 100
+for n in ("a", "ab", "abd", "abcabd", "ba" * 10, "xx", "x" * 100, "x" * 101, "abdx", "zz", "b" * 300):
+    print(n[:12], check(h, n))
+
+# matches at the very start and end
+h = "needle" + "-" * 200 + "needle"
+print(h.find("needle"), h.rfind("needle"), h.find("needle", 1), h.rfind("needle", 0, -1))
+print(h.index("e-"), h.rindex("-n"))
+
+# repeated characters and overlapping matches
+h = "a" * 200
+print(h.find("aaa"), h.rfind("aaa"), h.count("aaa"), h.count("a" * 200), h.count("a" * 201))
+
+# needle longer than 255 bytes
+h = "xy" * 400 + "z" + "xy" * 200
+n = "xy" * 150 + "z"
+print(h.find(n), h.rfind(n), h.count(n))
+
+# bytes, including bytes that aren't valid utf-8
+h = bytes(range(256)) * 2
+print(h.find(b"\x80\x81"), h.rfind(b"\x80\x81"), h.count(b"\xff\x00"), h.count(b"\x80"))
+print(len(h.split(b"\xfe\xff")), h.replace(b"\x00\x01\x02", b"") == h)
+
+# non-ascii str
+h = "é" * 100 + "αβγ" + "é" * 100
+print(h.find("αβ"), h.rfind("γé"), h.count("é"), h.split("β")[1][:3])
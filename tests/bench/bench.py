@@ -1,10 +1,31 @@
-import time
+try:
+    import utime
+
+    def elapsed(f, n):
+        t = utime.ticks_us()
+        f(n)
+        return utime.ticks_diff(utime.ticks_us(), t) / 1000000
+
+except ImportError:
+    import time
+
+    # CircuitPython has no time.perf_counter, and only some boards have monotonic_ns
+    if hasattr(time, "monotonic_ns"):
+        def elapsed(f, n):
+            t = time.monotonic_ns()
+            f(n)
+            return (time.monotonic_ns() - t) / 1000000000
+
+    else:
+        clock = getattr(time, "monotonic", time.time)
+
+        def elapsed(f, n):
+            t = clock()
+            f(n)
+            return clock() - t
 
 
 ITERS = 20000000
 
 def run(f):
-    t = time.time()
-    f(ITERS)
-    t = time.time() - t
-    print(t)
+    print(elapsed(f, ITERS))
@@ -0,0 +1,8 @@
+import bench
+
+def test(num):
+    for i in iter(range(num // 1000)):
+        bytearray(512)
+        bytearray(48)
+
+bench.run(test)
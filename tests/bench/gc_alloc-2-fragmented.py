@@ -0,0 +1,14 @@
+import bench
+
+# Fill much of the heap with small objects and drop every other one, so that the
+# free space in that area is split into runs too short for the allocations below.
+keep = [bytearray(16 + (i % 4) * 16) for i in range(15000)]
+for i in range(0, len(keep), 2):
+    keep[i] = None
+
+def test(num):
+    for i in iter(range(num // 1000)):
+        bytearray(512)
+        bytearray(48)
+
+bench.run(test)
@@ -0,0 +1,12 @@
+import bench
+
+# Multiply pairs of 1k- to 64k-bit integers.
+NUMS = [(3 ** (631 * n) - 1, 7 ** (356 * n) + 1) for n in (1, 4, 16, 64)]
+
+def test(num):
+    for i in iter(range(num // 2000000)):
+        for a, b in NUMS:
+            a * b
+            a * a
+
+bench.run(test)
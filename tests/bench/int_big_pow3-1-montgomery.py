@@ -0,0 +1,13 @@
+import bench
+
+# RSA-style modular exponentiation with a 2048-bit odd modulus.
+M = 7 ** 730 * 2 - 1
+X = 3 ** 1290 + 12345
+E = 5 ** 880 + 3
+
+def test(num):
+    for i in iter(range(num // 2000000)):
+        pow(X, E, M)
+        pow(X, 65537, M)
+
+bench.run(test)
@@ -0,0 +1,11 @@
+import bench
+
+# Format 1k- to 64k-bit integers in decimal.
+NUMS = [3 ** (631 * n) - 1 for n in (1, 4, 16, 64)]
+
+def test(num):
+    for i in iter(range(num // 10000000)):
+        for a in NUMS:
+            str(a)
+
+bench.run(test)
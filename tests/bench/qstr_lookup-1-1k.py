@@ -0,0 +1,15 @@
+import bench
+
+# Intern 1000 names, then look up a sample spread across all of them; each
+# getattr() with a str that isn't interned has to search the qstr pools.
+N = 1000
+for i in range(N):
+    getattr(bench, "q%d" % i, None)
+names = ["q%d" % (i * N // 100) for i in range(100)]
+
+def test(num):
+    for i in iter(range(num // 2000)):
+        for name in names:
+            getattr(bench, name, None)
+
+bench.run(test)
@@ -0,0 +1,14 @@
+import bench
+
+# Look for a header that is near the end of a few KB of HTTP-like text.
+HAYSTACK = "".join("X-Header-%d: value number %d for this line\r\n" % (i, i) for i in range(100))
+HAYSTACK += "Content-Length: 1234\r\n\r\n"
+
+def test(num):
+    h = HAYSTACK
+    for i in iter(range(num // 2000)):
+        h.find("Content-Length:")
+        h.rfind("X-Header-0:")
+        "\r\n\r\n" in h
+
+bench.run(test)
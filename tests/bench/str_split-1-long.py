@@ -0,0 +1,13 @@
+import bench
+
+# Split a few KB of log lines on a multi-byte separator.
+HAYSTACK = "".join("2021-01-01 12:00:%02d INFO some message number %d\r\n" % (i % 60, i) for i in range(100))
+
+def test(num):
+    h = HAYSTACK
+    for i in iter(range(num // 20000)):
+        h.split("\r\n")
+        h.count("INFO")
+        h.replace("INFO", "WARN")
+
+bench.run(test)
@@ -0,0 +1,12 @@
+import bench
+
+# Index every character of a non-ASCII string.
+S = "Température extérieure: 21,5 °C — humidité 40 % " * 20
+
+def test(num):
+    s = S
+    for i in iter(range(num // 100000)):
+        for j in range(len(s)):
+            s[j]
+
+bench.run(test)
@@ -0,0 +1,14 @@
+import bench
+import ure
+
+# Backtracking tries each of the Fibonacci(32) ways of splitting the a's between
+# the two alternatives before giving up, so this relies on the pattern being
+# matched without backtracking.
+RE = ure.compile("(a|aa)*b")
+S = "a" * 32
+
+def test(num):
+    for i in iter(range(num // 2000)):
+        RE.match(S)
+
+bench.run(test)
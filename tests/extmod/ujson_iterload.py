@@ -0,0 +1,58 @@
+# test reading JSON a piece at a time with iterload
+
+try:
+    from uio import StringIO
+    import ujson as json
+    json.iterload
+except (ImportError, AttributeError):
+    print("SKIP")
+    raise SystemExit
+
+doc = '{"list": [{"dt": 1, "main": {"temp": 280.5, "hum": 80}}, {"dt": 2, "main": {"temp": 281, "hum": 70}}], "city": {"name": "X"}}'
+
+# events
+for event in json.iterload(StringIO('{"a": [1, "b", null], "c": {}}')):
+    print(event)
+print(list(json.iterload("5")))
+
+# values selected by a path
+print(list(json.iterload(doc, "list[*].main.temp")))
+print(list(json.iterload(doc, "list[1].main.hum")))
+print(list(json.iterload(doc, "list[0].main")))
+print(list(json.iterload(doc, "list[*].*")))
+print(list(json.iterload(doc, "city.name")))
+print(list(json.iterload(doc, "missing")))
+print(list(json.iterload("[1, [2, 3], {}]", "[*]")))
+print(list(json.iterload("[1, 2]", "")))
+
+# from an object with readinto, a few bytes at a time
+class Buffer:
+    def __init__(self, data):
+        self._data = data
+        self._i = 0
+
+    def readinto(self, buf):
+        n = min(len(buf), len(self._data) - self._i, 5)
+        buf[:n] = self._data[self._i:self._i + n]
+        self._i += n
+        return n
+
+print(list(json.iterload(Buffer(doc.encode()), "list[*].dt")))
+
+# data after the JSON is left in the stream
+f = StringIO('[1] [2]')
+print(list(json.iterload(f, "[*]")), f.read())
+
+# bad JSON
+for s in ("", "[1, 2", '{"a": 1]', '{[1]: 2}'):
+    try:
+        list(json.iterload(s))
+    except ValueError:
+        print("ValueError")
+
+# bad paths
+for path in ("a..b", "[", "[]", ".a", "a[x]"):
+    try:
+        json.iterload("1", path)
+    except ValueError:
+        print("ValueError")
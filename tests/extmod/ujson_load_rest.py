@@ -0,0 +1,19 @@
+# test that load() leaves the data after the JSON in a seekable stream
+
+try:
+    from uio import StringIO
+    import ujson as json
+except ImportError:
+    print("SKIP")
+    raise SystemExit
+
+f = StringIO('{"a": 1} [2, 3]  "x"4 rest')
+print(json.load(f))
+print(json.load(f))
+print(json.load(f))
+print(json.load(f))
+print(f.read())
+
+# longer than the read chunk
+f = StringIO('["%s"] tail' % ("y" * 100))
+print(len(json.load(f)[0]), f.read())
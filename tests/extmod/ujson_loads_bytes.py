@@ -0,0 +1,31 @@
+# test loading from bytes-like objects, and strings longer than the read chunk
+
+try:
+    import ujson as json
+except ImportError:
+    try:
+        import json
+    except ImportError:
+        print("SKIP")
+        raise SystemExit
+
+print(json.loads(b'[1, "abc", {"a": null}]'))
+print(json.loads(bytearray(b'{"a": [true, false]}')))
+
+# long strings, with and without escapes at different positions
+for n in (0, 1, 63, 64, 65, 200):
+    s = "x" * n
+    print(len(json.loads('"%s"' % s)), len(json.loads('"%s\\n%s"' % (s, s))), json.loads('"\\t%s"' % s) == "\t" + s)
+
+# many objects with the same keys
+data = json.loads("[" + ",".join('{"id": %d, "name": "n%d", "ok": true}' % (i, i) for i in range(100)) + "]")
+print(len(data), data[0]["name"], data[99]["id"], sorted(data[50].keys()))
+
+# keys that collide or differ only slightly
+print(sorted(json.loads('{"a": 1, "b": 2, "ab": 3, "ba": 4, "": 5}').items()))
+
+# string that is not closed at the end of the buffer
+try:
+    json.loads(b'["abc')
+except ValueError:
+    print("ValueError")
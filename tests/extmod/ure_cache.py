@@ -0,0 +1,42 @@
+# test the module-level functions with patterns used more than once
+
+try:
+    import ure as re
+except ImportError:
+    try:
+        import re
+    except ImportError:
+        print("SKIP")
+        raise SystemExit
+
+try:
+    re.purge
+except AttributeError:
+    print("SKIP")
+    raise SystemExit
+
+# same pattern object in a loop
+for i in range(5):
+    print(re.match(r"(\d+)-(\d+)", "%d-%d" % (i, i * 2)).group(2))
+
+# more patterns than the cache holds, used in turn
+pats = ["a%d+" % i for i in range(20)]
+for k in range(2):
+    print([re.search(p, "x" + p[:-1] + "y").group(0) for p in pats])
+
+# new pattern objects with the same contents
+for c in "bbc":
+    print(re.match(c + "+", c * 3).group(0))
+
+# str and bytes patterns with the same contents
+print(re.match("x+", "xxy").group(0), re.match(b"x+", b"xxy").group(0))
+
+# a bad pattern raises every time
+for i in range(2):
+    try:
+        re.match("(", "x")
+    except Exception:
+        print("error")
+
+print(re.purge())
+print(re.search(r"\d+", "ab12c").group(0))
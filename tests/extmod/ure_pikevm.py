@@ -0,0 +1,40 @@
+# test matching without backtracking
+
+try:
+    import ure as re
+except ImportError:
+    print("SKIP")
+    raise SystemExit
+
+try:
+    re.NOBACKTRACK
+except AttributeError:
+    print("SKIP")
+    raise SystemExit
+
+# the same groups as the backtracking matcher
+for pat, s in (
+    (r"(a+)(b*)", "aaab"),
+    (r"(a+?)(a*)", "aaa"),
+    (r"(a|ab)(c|bcd)(d*)", "abcd"),
+    (r"a(b*?)(b*)c?", "abbc"),
+    (r"x(\d+)|(\w+)", "ab12"),
+    (r"^([^ ]+) +(\S+)$", "key  value"),
+    (r"([ab]+)(c)?$", "abba"),
+):
+    for f in ("match", "search"):
+        m1 = getattr(re.compile(pat), f)(s)
+        m2 = getattr(re.compile(pat, re.NOBACKTRACK), f)(s)
+        g1 = m1 and [m1.group(i) for i in range(pat.count("(") + 1)]
+        g2 = m2 and [m2.group(i) for i in range(pat.count("(") + 1)]
+        print(f, g2, g1 == g2)
+
+r = re.compile(r"\s*,\s*", re.NOBACKTRACK)
+print(r.split("a , b,c ,d"))
+
+# patterns that loop around alternatives or loops go exponential when backtracking,
+# or use more C stack than there is, so they don't backtrack
+print(re.match("(a|aa)*b", "a" * 200))
+print(re.search("(a*)*b", "a" * 1000 + "b").group(0) == "a" * 1000 + "b")
+print(re.search("(x+x+)+y", "x" * 100 + "y").group(1))
+print(re.match("(a|aa)*c", "a" * 41 + "c").group(1))
@@ -7,7 +7,8 @@ except ImportError:
         print("SKIP")
         raise SystemExit
 
+# backtracking recurses for each repeat, so a long enough string uses up the stack
 try:
-    re.match("(a*)*", "aaa")
+    re.match("(a)*", "a" * 10000)
 except RuntimeError:
     print("RuntimeError")
@@ -0,0 +1,73 @@
+# Test that FAT files dropped without being closed are closed by their finaliser
+# when collected, including when many of them are collected at once.
+
+try:
+    import gc
+    import uos
+except ImportError:
+    print("SKIP")
+    raise SystemExit
+
+try:
+    uos.VfsFat
+except AttributeError:
+    print("SKIP")
+    raise SystemExit
+
+
+class RAMBlockDevice:
+
+    SEC_SIZE = 512
+
+    def __init__(self, blocks):
+        self.data = bytearray(blocks * self.SEC_SIZE)
+
+    # These run from finalisers, while the heap is locked, so mustn't allocate.
+    def readblocks(self, n, buf):
+        for i in range(len(buf)):
+            buf[i] = self.data[n * self.SEC_SIZE + i]
+
+    def writeblocks(self, n, buf):
+        for i in range(len(buf)):
+            self.data[n * self.SEC_SIZE + i] = buf[i]
+
+    def ioctl(self, op, arg):
+        if op == 4:  # BP_IOCTL_SEC_COUNT
+            return len(self.data) // self.SEC_SIZE
+        if op == 5:  # BP_IOCTL_SEC_SIZE
+            return self.SEC_SIZE
+
+
+try:
+    bdev = RAMBlockDevice(64)
+except MemoryError:
+    print("SKIP")
+    raise SystemExit
+
+uos.VfsFat.mkfs(bdev)
+vfs = uos.VfsFat(bdev)
+
+N = 24
+
+
+def write_files():
+    for i in range(N):
+        n = "x%d" % i
+        f = vfs.open(n, "w")
+        f.write(n)
+        f = None  # release f without closing
+        [0, 1, 2, 3]  # use up Python stack so f is really gone
+
+
+write_files()
+gc.collect()  # should finalise all N files by closing them
+
+# The collector is conservative, so a stale pointer left on the C stack may keep
+# one or two of the files alive, and those have no contents yet.
+closed = 0
+for i in range(N):
+    with vfs.open("x%d" % i, "r") as f:
+        data = f.read()
+    if data:
+        closed += data == "x%d" % i
+print(closed >= N - 2)
@@ -0,0 +1,89 @@
+# Test that large reads of a FAT file go to the block device in as few calls as
+# possible, and that they still follow the cluster chain of fragmented files.
+
+try:
+    import uos
+except ImportError:
+    print("SKIP")
+    raise SystemExit
+
+try:
+    uos.VfsFat
+except AttributeError:
+    print("SKIP")
+    raise SystemExit
+
+
+class RAMBDevSparse:
+
+    SEC_SIZE = 512
+
+    def __init__(self, blocks):
+        self.blocks = blocks
+        self.data = bytearray(blocks * self.SEC_SIZE)
+        self.reads = []
+
+    def readblocks(self, n, buf):
+        self.reads.append(len(buf) // self.SEC_SIZE)
+        start = n * self.SEC_SIZE
+        buf[:] = self.data[start:start + len(buf)]
+
+    def writeblocks(self, n, buf):
+        start = n * self.SEC_SIZE
+        self.data[start:start + len(buf)] = buf
+
+    def ioctl(self, op, arg):
+        if op == 4:  # BP_IOCTL_SEC_COUNT
+            return self.blocks
+        if op == 5:  # BP_IOCTL_SEC_SIZE
+            return self.SEC_SIZE
+
+
+try:
+    bdev = RAMBDevSparse(200)
+except MemoryError:
+    print("SKIP")
+    raise SystemExit
+
+uos.VfsFat.mkfs(bdev)
+vfs = uos.VfsFat(bdev)
+uos.mount(vfs, "/ramdisk")
+uos.chdir("/ramdisk")
+
+
+def pattern(seed, n):
+    return bytes((seed + i * 7) & 0xff for i in range(n))
+
+
+# a file written in one go has contiguous clusters
+with open("whole", "wb") as f:
+    f.write(pattern(1, 16 * 512))
+
+# two files written a sector at a time get interleaved clusters
+with open("frag1", "wb") as f1:
+    with open("frag2", "wb") as f2:
+        for i in range(8):
+            f1.write(pattern(i, 512))
+            f1.flush()
+            f2.write(pattern(100 + i, 512))
+            f2.flush()
+
+# files opened read-only find their clusters from a fast seek table, others from the FAT
+for mode in ("rb", "r+b"):
+    for name, expected in (
+        ("whole", pattern(1, 16 * 512)),
+        ("frag1", b"".join(pattern(i, 512) for i in range(8))),
+        ("frag2", b"".join(pattern(100 + i, 512) for i in range(8))),
+    ):
+        with open(name, mode) as f:
+            bdev.reads = []
+            data = f.read(len(expected))
+            print(mode, name, len(data), data == expected, max(bdev.reads))
+
+# reads that start part way through a sector and end part way through another
+with open("whole", "rb") as f:
+    f.seek(100)
+    print(f.read(5000) == pattern(1, 16 * 512)[100:5100])
+    print(f.read() == pattern(1, 16 * 512)[5100:])
+
+uos.umount(vfs)
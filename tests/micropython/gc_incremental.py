@@ -0,0 +1,51 @@
+# test the sweep being done a slice at a time after automatic collections
+
+import gc
+
+try:
+    gc.sweep_budget
+    gc.threshold
+except AttributeError:
+    print("SKIP")
+    raise SystemExit
+
+budget = gc.sweep_budget()
+
+# the budget is rounded up to whole blocks, and 0 sweeps the whole heap at once
+gc.sweep_budget(1)
+print(gc.sweep_budget() > 0)
+gc.sweep_budget(0)
+print(gc.sweep_budget())
+gc.sweep_budget(-1)
+print(gc.sweep_budget())
+
+# sweep as little as possible at a time and collect often, so that objects are
+# used, resized and freed while the sweep that follows a collection is pending
+gc.sweep_budget(1)
+gc.threshold(4096)
+live = [[i] for i in range(64)]
+d = {}
+s = ""
+for n in range(4000):
+    garbage = [n, str(n), (n, n)]
+    live[n % 64].append(n)
+    d[n % 97] = garbage
+    s += str(n % 10)
+    if n % 500 == 499:
+        live[n % 64] = live[n % 64][:1]
+        s = s[-100:]
+        exec("def f():\n return %d" % n)
+        print(f())
+gc.threshold(-1)
+print(sum(len(l) for l in live), sum(sum(l) for l in live))
+print(sorted(d)[:5], d[3], d[96][:2])
+print(len(s), s[:20])
+
+# an explicit collection finishes its sweep, and the pauses are counted
+gc.pause_stats(True)
+gc.collect()
+pauses, longest, total = gc.pause_stats()
+print(pauses >= 1, 0 <= longest <= total)
+print(gc.pause_stats(True)[0] == pauses, gc.pause_stats())
+
+gc.sweep_budget(budget)
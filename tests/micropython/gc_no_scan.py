@@ -0,0 +1,59 @@
+# test that data allocated without GC scanning survives collections, and
+# that containers of objects are still scanned
+
+try:
+    import gc, array
+except ImportError:
+    print("SKIP")
+    raise SystemExit
+
+
+def churn():
+    gc.collect()
+    for i in range(2000):
+        [i, i, i, i]
+    gc.collect()
+
+
+# str, bytes, bytearray, array and long int data
+s = "".join(str(i) for i in range(200))
+b = bytes(range(256)) * 4
+ba = bytearray(b)
+a = array.array("i", range(300))
+n = 7 ** 300
+churn()
+print(s == "".join(str(i) for i in range(200)), b == bytes(range(256)) * 4, ba == b)
+print(list(a) == list(range(300)), n == 7 ** 300)
+
+# bytearray and array grown from empty, and moved by growing
+ba = bytearray()
+a = array.array("H")
+for i in range(500):
+    ba.append(i & 0xFF)
+    a.append(i)
+    if i % 100 == 0:
+        churn()
+churn()
+print(len(ba), sum(ba), len(a), sum(a))
+ba.extend(bytes(1000))
+a *= 3
+churn()
+print(len(ba), sum(ba), len(a), sum(a))
+
+# bytearray holding data that looks like pointers doesn't keep objects alive
+# and doesn't lose objects that are kept alive elsewhere
+keep = [[i] * 4 for i in range(50)]
+ba = bytearray(4096)
+churn()
+print(all(k == [i] * 4 for i, k in enumerate(keep)))
+
+# arrays of objects are scanned
+try:
+    ao = array.array("O")
+except ValueError:
+    print(True, 100)
+else:
+    for i in range(100):
+        ao.append([i, str(i) * 10])
+    churn()
+    print(all(ao[i] == [i, str(i) * 10] for i in range(100)), len(ao))
@@ -0,0 +1,14 @@
+# test indexing, slicing, len and find on long non-ASCII and ASCII strings
+
+for s in ("aé€😀" * 50, "x" * 200, "é" * 31 + "a" * 70, "abc" * 30 + "€"):
+    n = len(s)
+    print(n, s[0], s[1], s[31], s[32], s[33], s[n - 1], s[-1], s[-n], s[-33])
+    print(s[30:35], s[-40:-30], s[n - 2:], s[:3], s[100:90], len(s[5:-5]))
+    print(s[-1000:2], s[n - 1:1000], s[n:], s[-n - 1:1])
+    for i in (n, -n - 1, 1000):
+        try:
+            s[i]
+        except IndexError:
+            print("IndexError")
+    print(all(s[i] == c for i, c in enumerate(s)))
+    print(s.find(s[40:43]), s.rfind(s[40:43]), s.index(s[n - 3:]), s.find("z"))
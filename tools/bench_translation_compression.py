@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2014 MicroPython & CircuitPython contributors (https://github.com/adafruit/circuitpython/graphs/contributors)
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Time makeqstrdata.compute_huffman_coding on every translation in locale/.
+
+Each line reports the time taken, the number of dictionary words chosen and a
+digest of the generated compression header, so the digests can be compared
+between commits to check that the output hasn't changed.
+
+    python3 tools/bench_translation_compression.py [locale files...]
+"""
+
+import contextlib
+import glob
+import hashlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+import polib
+
+top = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(top, "py"))
+sys.path.append(os.path.join(top, "tools/huffman"))
+
+import makeqstrdata
+
+
+def load_translations(filename):
+    # Mirror makeqstrdata.translate but read the .po directly instead of a compiled .mo.
+    translations = []
+    for entry in sorted(polib.pofile(filename), key=lambda e: e.msgid):
+        if entry.obsolete:
+            continue
+        translation = entry.msgstr or entry.msgid
+        translations.append((entry.msgid, translation.replace("\n", "\r\n")))
+    return translations
+
+
+def main():
+    filenames = sys.argv[1:] or sorted(glob.glob(os.path.join(top, "locale", "*.po*")))
+    total = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        compression_filename = os.path.join(tmp, "compression.generated.h")
+        for filename in filenames:
+            translations = load_translations(filename)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                (_, _, words, _, _) = makeqstrdata.compute_huffman_coding(
+                    translations, compression_filename
+                )
+            elapsed = time.perf_counter() - start
+            total += elapsed
+            with open(compression_filename, "rb") as f:
+                digest = hashlib.sha1(f.read()).hexdigest()[:12]
+            print(
+                "{:24} {:7.3f} s {:4} words {}".format(
+                    os.path.basename(filename), elapsed, len(words), digest
+                )
+            )
+    print("{:24} {:7.3f} s".format("total", total))
+
+
+if __name__ == "__main__":
+    main()
@@ -536,6 +536,15 @@ def freeze_mpy(base_qstrs, raw_codes):
             print('    MP_QSTR_%s,' % new[i][1])
     print('};')
 
+    print()
+    print('#if MICROPY_QSTR_HASH_INDEX')
+    print('STATIC const uint16_t mp_qstr_frozen_const_hash_index[] = {')
+    hash_index = qstrutil.make_hash_index([qstr for _, _, qstr in new])
+    for i in range(0, len(hash_index), 16):
+        print('    %s,' % ', '.join(str(n) for n in hash_index[i:i + 16]))
+    print('};')
+    print('#endif')
+
     print()
     print('extern const qstr_pool_t mp_qstr_const_pool;');
     print('const qstr_pool_t mp_qstr_frozen_const_pool = {')
@@ -543,6 +552,10 @@ def freeze_mpy(base_qstrs, raw_codes):
     print('    MP_QSTRnumber_of, // previous pool size')
     print('    %u, // allocated entries' % len(new))
     print('    %u, // used entries' % len(new))
+    print('    #if MICROPY_QSTR_HASH_INDEX')
+    print('    mp_qstr_frozen_const_hash_index,')
+    print('    MP_ARRAY_SIZE(mp_qstr_frozen_const_hash_index),')
+    print('    #endif')
     print('    {')
     qstr_size = {"metadata": 0, "data": 0}
     for _, _, qstr in new:
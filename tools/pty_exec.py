@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+# SPDX-FileCopyrightText: 2014 MicroPython & CircuitPython contributors (https://github.com/adafruit/circuitpython/graphs/contributors)
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Run a command on a pseudo-terminal and print the path of a second, linked
+pseudo-terminal on stderr, the same way QEMU's "-serial pty" does. This lets
+pyboard.py talk to the unix port as if it were a board:
+
+    ./pyboard.py --device "execpty:python3 pty_exec.py ../ports/unix/micropython" test.py
+"""
+
+import os
+import select
+import subprocess
+import sys
+import tty
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("usage: pty_exec.py command [args...]", file=sys.stderr)
+        sys.exit(1)
+
+    # The command gets one terminal and the host another, with bytes relayed between them. This
+    # keeps both ends in raw mode and lets the host open and close its end freely.
+    cmd_master, cmd_slave = os.openpty()
+    host_master, host_slave = os.openpty()
+    tty.setraw(cmd_slave)
+    tty.setraw(host_slave)
+
+    proc = subprocess.Popen(sys.argv[1:], stdin=cmd_slave, stdout=cmd_slave, stderr=cmd_slave)
+    os.close(cmd_slave)
+
+    peers = {cmd_master: host_master, host_master: cmd_master}
+    announced = False
+    started = False
+    while proc.poll() is None:
+        ready, _, _ = select.select(list(peers), [], [], 0.1)
+        if not ready and started and not announced:
+            # The unix port flushes pending input when it sets up its terminal, so only hand out
+            # the host terminal once the command has printed its banner and gone quiet.
+            print(os.ttyname(host_slave), file=sys.stderr)
+            sys.stderr.flush()
+            announced = True
+        for fd in ready:
+            try:
+                data = os.read(fd, 4096)
+            except OSError:
+                # The command closed its terminal.
+                return proc.wait()
+            os.write(peers[fd], data)
+            started = started or fd == cmd_master
+    return proc.returncode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
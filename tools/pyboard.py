@@ -50,6 +50,7 @@ Or:
 import sys
 import time
 import os
+import struct
 
 try:
     stdout = sys.stdout.buffer
@@ -209,6 +210,8 @@ class ProcessPtyToTerminal:
 
 class Pyboard:
     def __init__(self, device, baudrate=115200, user='micro', password='python', wait=0):
+        self.use_raw_paste = True
+        self._unread = b''
         if device.startswith("exec:"):
             self.serial = ProcessToSerial(device[len("exec:"):])
         elif device.startswith("execpty:"):
@@ -242,31 +245,57 @@ class Pyboard:
     def close(self):
         self.serial.close()
 
+    def _read(self, size):
+        # Bytes read past the end of a previous read_until are handed out first.
+        data = self._unread[:size]
+        self._unread = self._unread[size:]
+        if len(data) < size:
+            data += self.serial.read(size - len(data))
+        return data
+
+    def _in_waiting(self):
+        return len(self._unread) + self.serial.inWaiting()
+
     def read_until(self, min_num_bytes, ending, timeout=10, data_consumer=None):
-        data = self.serial.read(min_num_bytes)
-        if data_consumer:
-            data_consumer(data)
-        timeout_count = 0
+        # Read whatever the device has ready and only search the new bytes (plus enough of the old
+        # ones to catch an ending split between reads).
+        data = b''
+        new_data = self._read(min_num_bytes)
+        last_data_time = time.time()
         while True:
-            if data.endswith(ending):
-                break
-            elif self.serial.inWaiting() > 0:
-                new_data = self.serial.read(1)
-                data = data + new_data
+            if new_data:
+                search_start = max(0, len(data) - len(ending) + 1)
+                data += new_data
+                found = data.find(ending, search_start)
+                if found >= 0:
+                    # Keep anything after the ending for the next read.
+                    end = found + len(ending)
+                    self._unread = data[end:] + self._unread
+                    new_data = new_data[:len(new_data) - (len(data) - end)]
+                    data = data[:end]
                 if data_consumer:
                     data_consumer(new_data)
-                timeout_count = 0
-            else:
-                timeout_count += 1
-                if timeout is not None and timeout_count >= 100 * timeout:
+                if found >= 0:
                     break
-                time.sleep(0.01)
+                last_data_time = time.time()
+            elif timeout is not None and time.time() - last_data_time >= timeout:
+                break
+            else:
+                time.sleep(0.001)
+            new_data = b''
+            if self._unread:
+                new_data = self._read(len(self._unread))
+            else:
+                n = self.serial.inWaiting()
+                if n > 0:
+                    new_data = self.serial.read(n)
         return data
 
     def enter_raw_repl(self):
         self.serial.write(b'\r\x03\x03') # ctrl-C twice: interrupt any running program
 
         # flush input (without relying on serial.flushInput())
+        self._unread = b''
         n = self.serial.inWaiting()
         while n > 0:
             self.serial.read(n)
@@ -309,6 +338,41 @@ class Pyboard:
         # return normal and error output
         return data, data_err
 
+    def raw_paste_write(self, command_bytes):
+        # Read initial header, with window size.
+        data = self._read(2)
+        window_size = struct.unpack('<H', data)[0]
+        window_remain = window_size
+
+        # Write out the command_bytes data.
+        i = 0
+        while i < len(command_bytes):
+            while window_remain == 0 or self._in_waiting():
+                data = self._read(1)
+                if data == b'\x01':
+                    # Device indicated that a new window of data can be sent.
+                    window_remain += window_size
+                elif data == b'\x04':
+                    # Device indicated abrupt end.  Acknowledge it and finish.
+                    self.serial.write(b'\x04')
+                    return
+                else:
+                    # Unexpected data from device.
+                    raise PyboardError('unexpected read during raw paste: {}'.format(data))
+            # Send out as much data as possible that fits within the allowed window.
+            b = command_bytes[i:min(i + window_remain, len(command_bytes))]
+            self.serial.write(b)
+            window_remain -= len(b)
+            i += len(b)
+
+        # Indicate end of data.
+        self.serial.write(b'\x04')
+
+        # Wait for device to acknowledge end of data.
+        data = self.read_until(1, b'\x04')
+        if not data.endswith(b'\x04'):
+            raise PyboardError('could not complete raw paste: {}'.format(data))
+
     def exec_raw_no_follow(self, command):
         if isinstance(command, bytes):
             command_bytes = command
@@ -320,14 +384,33 @@ class Pyboard:
         if not data.endswith(b'>'):
             raise PyboardError('could not enter raw repl')
 
-        # write command
+        if self.use_raw_paste:
+            # Try to enter raw-paste mode.
+            self.serial.write(b'\x05A\x01')
+            data = self._read(2)
+            if data == b'R\x00':
+                # Device understood raw-paste command but doesn't support it.
+                pass
+            elif data == b'R\x01':
+                # Device supports raw-paste mode, write out the command using this mode.
+                return self.raw_paste_write(command_bytes)
+            else:
+                # Device doesn't support raw-paste, fall back to normal raw REPL.
+                data = self.read_until(1, b'w REPL; CTRL-B to exit\r\n>')
+                if not data.endswith(b'w REPL; CTRL-B to exit\r\n>'):
+                    print(data)
+                    raise PyboardError('could not enter raw repl')
+            # Don't try to use raw-paste mode again for this connection.
+            self.use_raw_paste = False
+
+        # Write command using standard raw REPL, 256 bytes every 10ms.
         for i in range(0, len(command_bytes), 256):
             self.serial.write(command_bytes[i:min(i + 256, len(command_bytes))])
             time.sleep(0.01)
         self.serial.write(b'\x04')
 
         # check if we could exec command
-        data = self.serial.read(2)
+        data = self._read(2)
         if data != b'OK':
             raise PyboardError('could not exec command (response: %r)' % data)
 